@@ -0,0 +1,13 @@
+"""
+hwpapi benchmark suite — hot paths against a simulated HWP engine.
+
+:mod:`benchmarks.sim` stands in for the COM server and charges a
+configurable latency per call; :mod:`benchmarks.cases` registers one
+case per hot path; :mod:`benchmarks.run` times them, counts their COM
+calls and gates on a saved JSON baseline (``benchmarks/baseline.json``)::
+
+    python -m benchmarks --compare benchmarks/baseline.json
+
+No HWP installation is needed. The one-off scripts in ``tests/bench_*.py``
+measure single optimisations; this suite is the regression baseline.
+"""
@@ -0,0 +1,272 @@
+"""
+Benchmark cases — one per hot path.
+
+A case is a setup function registered with :func:`case`. It receives a
+fresh :class:`~hwpapi.core.app.App` adopted over a
+:class:`~benchmarks.sim.SimEngine` and returns the zero-argument
+callable that is one *op*. The runner warms the op up once, then times
+it and counts the COM calls it makes, so every number is steady-state:
+caches that hwpapi keeps across calls are expected to be warm.
+
+Cases registered with ``memory=True`` also report the bytes each op's
+return value keeps alive (``tracemalloc``) — for objects hwpapi creates
+by the thousand, such as one ``ParameterSet`` per paragraph in an audit.
+"""
+from __future__ import annotations
+
+import itertools
+from typing import Callable, Dict
+
+from hwpapi.collections.bookmarks import BookmarkCollection
+from hwpapi.collections.documents import DocumentCollection
+from hwpapi.collections.fields import FieldCollection
+from hwpapi.collections.hyperlinks import HyperlinkCollection
+from hwpapi.collections.images import ImageCollection
+from hwpapi.collections.paragraphs import ParagraphCollection
+from hwpapi.collections.styles import StyleCollection
+from hwpapi.collections.tables import TableCollection
+from hwpapi.context.scopes import charshape_scope
+from hwpapi.document import Document
+from hwpapi.logging import get_logger
+from hwpapi.low.parametersets.backends import hparameterset_backend
+from hwpapi.presets import Presets
+
+__all__ = ["CASES", "Case", "case"]
+
+
+class Case:
+    """A registered benchmark: ``setup(app) -> op``."""
+
+    __slots__ = ("name", "setup", "doc", "memory")
+
+    def __init__(self, name: str, setup: Callable, doc: str, memory: bool = False) -> None:
+        self.name = name
+        self.setup = setup
+        self.doc = doc
+        self.memory = memory
+
+    def __repr__(self) -> str:
+        return f"Case({self.name!r})"
+
+
+CASES: Dict[str, Case] = {}
+
+
+def case(name: str, doc: str = "", memory: bool = False):
+    """Register the decorated setup function as benchmark ``name``.
+
+    ``memory`` — also measure the bytes retained by each op's result.
+    """
+    def register(setup):
+        CASES[name] = Case(name, setup, doc or (setup.__doc__ or "").strip(), memory)
+        return setup
+    return register
+
+
+# ── actions / parameter sets ──────────────────────────────────────
+
+@case("actions.getattr")
+def _actions_getattr(app):
+    """``app.actions.InsertText`` on a warm action cache."""
+    actions = app.actions
+    actions.InsertText
+    return lambda: actions.InsertText
+
+
+@case("actions.getattr.cold")
+def _actions_getattr_cold(app):
+    """First ``app.actions.CharShape`` — builds the ``_Action`` and its pset."""
+    actions = app.actions
+
+    def op():
+        actions.refresh("CharShape")
+        return actions.CharShape
+    return op
+
+
+@case("action.run")
+def _action_run(app):
+    """``_Action.run`` of ``BreakPara`` with the cached pset."""
+    return app.actions.BreakPara.run
+
+
+@case("pset.construct", memory=True)
+def _pset_construct(app):
+    """``CharShape(raw)`` — wrap a fresh ``CreateSet()`` pset."""
+    from hwpapi.low.parametersets import CharShape
+
+    raw = app.api.CreateAction("CharShape").CreateSet()
+    return lambda: CharShape(raw)
+
+
+@case("pset.construct.apply", memory=True)
+def _pset_construct_apply(app):
+    """Bound ``CharShape`` after one staged-and-applied write."""
+    from hwpapi.low.parametersets import CharShape
+
+    raw = app.api.CreateAction("CharShape").CreateSet()
+
+    def op():
+        pset = CharShape(raw)
+        pset.Height = 1000
+        pset.apply()
+        return pset
+    return op
+
+
+@case("pset.construct.unbound", memory=True)
+def _pset_construct_unbound(app):
+    """Unbound ``CharShape()`` holding two staged values."""
+    from hwpapi.low.parametersets import CharShape
+
+    def op():
+        pset = CharShape()
+        pset.Height = 1000
+        pset.Bold = 1
+        return pset
+    return op
+
+
+@case("pset.apply")
+def _pset_apply(app):
+    """Stage two ``CharShape`` values and ``apply()`` them."""
+    pset = app.actions.CharShape.pset
+    heights = itertools.cycle((1000, 1200))
+
+    def op():
+        pset.Height = next(heights)
+        pset.Bold = True
+        pset.apply()
+    return op
+
+
+@case("hparam.set")
+def _hparam_set(app):
+    """``HParamBackend.set("HCharShape.Height", ...)`` after the first write."""
+    backend = hparameterset_backend(app)
+    backend.set("HCharShape.Height", 1000)
+    return lambda: backend.set("HCharShape.Height", 1200)
+
+
+# ── collections ───────────────────────────────────────────────────
+
+_COLLECTIONS = {
+    "fields": (FieldCollection, "field3"),
+    "bookmarks": (BookmarkCollection, "mark3"),
+    "hyperlinks": (HyperlinkCollection, 3),
+    "images": (ImageCollection, 3),
+    "tables": (TableCollection, 3),
+    "paragraphs": (ParagraphCollection, 100),
+    "styles": (StyleCollection, "스타일 3"),
+    "documents": (DocumentCollection, 0),
+}
+
+
+def _collection_cases(label: str, cls: type, key) -> None:
+    @case(f"{label}.len", f"``len()`` of the {label} collection.")
+    def _len(app):
+        coll = cls(app)
+        return lambda: len(coll)
+
+    @case(f"{label}.getitem", f"``{label}[{key!r}]``.")
+    def _getitem(app):
+        coll = cls(app)
+        return lambda: coll[key]
+
+    @case(f"{label}.iter", f"``list()`` over the {label} collection.")
+    def _iter(app):
+        coll = cls(app)
+        return lambda: list(coll)
+
+
+for _label, (_cls, _key) in _COLLECTIONS.items():
+    _collection_cases(_label, _cls, _key)
+
+
+# ── document editing ──────────────────────────────────────────────
+
+_LINES = "\n".join(f"{i}번째 줄 — 벤치마크 본문" for i in range(20))
+
+
+@case("scope.charshape")
+def _scope_charshape(app):
+    """``with charshape_scope(bold, size): insert_text(...)`` — one cycle."""
+    doc = Document(app, _raw=app.api.XHwpDocuments.Active_XHwpDocument)
+
+    def op():
+        with charshape_scope(app, bold=True, size=1400):
+            doc.insert_text("강조")
+    return op
+
+
+def _insert_case(mode: str) -> None:
+    @case(f"document.insert_text.{mode}",
+          f"``Document.insert_text`` of 20 lines, ``mode={mode!r}``.")
+    def _insert(app):
+        doc = Document(app, _raw=app.api.XHwpDocuments.Active_XHwpDocument)
+        return lambda: doc.insert_text(_LINES, mode=mode)
+
+
+for _mode in ("auto", "lines", "chunked", "file"):
+    _insert_case(_mode)
+
+
+# ── legacy Document → App proxy ───────────────────────────────────
+
+def _legacy_doc(app):
+    from hwpapi.core.document import Documents
+
+    return Documents(app).active
+
+
+@case("document.proxy.method")
+def _proxy_method(app):
+    """``doc.gc_report(verify=False)`` through ``core.document.Document``."""
+    doc = _legacy_doc(app)
+    return lambda: doc.gc_report(verify=False)
+
+
+@case("document.proxy.method.direct")
+def _proxy_method_direct(app):
+    """``app.gc_report(verify=False)`` — baseline for the proxied call."""
+    return lambda: app.gc_report(verify=False)
+
+
+@case("document.proxy.property")
+def _proxy_property(app):
+    """``doc.api`` through ``core.document.Document``."""
+    doc = _legacy_doc(app)
+    return lambda: doc.api
+
+
+@case("document.proxy.property.direct")
+def _proxy_property_direct(app):
+    """``app.api`` — baseline for the proxied property."""
+    return lambda: app.api
+
+
+# ── presets ───────────────────────────────────────────────────────
+
+class _PresetHost:
+    """What :class:`~hwpapi.presets.Presets` needs from its app."""
+
+    def __init__(self, app) -> None:
+        self.api = app.api
+        self.engine = app.engine
+        self.actions = app.actions
+        self.logger = get_logger("benchmarks")
+
+    def in_table(self) -> bool:
+        return bool(self.api.KeyIndicator()[6])
+
+
+@case("presets.striped_rows")
+def _striped_rows(app):
+    """``Presets.striped_rows()`` over a 12 × 4 table, cursor in B4."""
+    presets = Presets(_PresetHost(app))
+    impl = app.api
+
+    def op():
+        impl._enter_table(3, 1)
+        presets.striped_rows()
+    return op
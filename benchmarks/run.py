@@ -0,0 +1,262 @@
+"""
+Benchmark runner — times every case, counts its COM calls, gates on a baseline.
+
+    python -m benchmarks                          # run and print
+    python -m benchmarks --save benchmarks/baseline.json
+    python -m benchmarks --compare benchmarks/baseline.json
+    python -m benchmarks -k insert_text --latency-us 0 --member Execute=200
+
+``--compare`` exits with status 1 when a case makes more COM calls per
+op than the baseline (beyond ``--count-threshold``), or its best time
+per op over ``--repeat`` rounds grows by more than ``--time-threshold``
+and ``--time-floor-us``, or — for ``memory`` cases — the bytes its op
+result retains grow by more than ``--memory-threshold``. COM call counts are deterministic and machine independent; times are
+only comparable against a baseline saved on the same machine with the
+same latency model (``--no-time`` gates on counts and memory alone);
+retained bytes only against a baseline saved on the same Python version.
+"""
+from __future__ import annotations
+
+import argparse
+import collections
+import json
+import os
+import platform
+import gc
+import statistics
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional
+
+if __package__ in (None, ""):  # ``python benchmarks/run.py``
+    sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from benchmarks.cases import CASES, Case  # noqa: E402
+from benchmarks.sim import LatencyModel, SimEngine  # noqa: E402
+from hwpapi.core.app import App  # noqa: E402
+
+__all__ = ["compare", "main", "run_case", "run_cases"]
+
+FORMAT = "hwpapi-bench"
+VERSION = 1
+COUNT_OPS = 4  # ops whose COM calls are averaged — fixed, so counts are stable
+MEMORY_OPS = 200  # op results held alive to measure retained bytes
+
+
+def _retained_bytes(op) -> int:
+    """Traced bytes per op while ``MEMORY_OPS`` op results are kept alive."""
+    gc.collect()
+    tracemalloc.start()
+    try:
+        held = [op() for _ in range(MEMORY_OPS)]
+        size, _ = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    del held
+    return round(size / MEMORY_OPS)
+
+
+def run_case(case: Case, latency: LatencyModel, *, repeat: int = 5,
+             min_time: float = 0.05, time_ops: bool = True) -> Dict:
+    """
+    Run one case on a fresh simulated engine.
+
+    Returns ``{"us", "min_us", "calls", "members", "bytes"}`` — median
+    and best wall time per op (µs), COM calls per op, the three busiest
+    members and, for ``memory`` cases, the bytes each op result retains
+    (``None`` otherwise). Without ``time_ops`` the times are skipped.
+    """
+    engine = SimEngine(latency)
+    op = case.setup(App._adopt(engine))
+    op()  # warm-up: fill hwpapi's caches
+
+    meter = engine.meter
+    meter.reset()
+    for _ in range(COUNT_OPS):
+        op()
+    calls = meter.total / COUNT_OPS
+    members = collections.Counter(
+        {name: n / COUNT_OPS for name, n in meter.calls.most_common(3)}
+    )
+    retained = _retained_bytes(op) if case.memory else None
+
+    times: List[float] = []
+    if time_ops:
+        t0 = time.perf_counter()
+        op()
+        one = time.perf_counter() - t0
+        number = max(1, min(10_000, int(min_time / max(one, 1e-7))))
+        for _ in range(repeat):
+            t0 = time.perf_counter()
+            for _ in range(number):
+                op()
+            times.append((time.perf_counter() - t0) / number)
+    return {
+        "us": round(statistics.median(times) * 1e6, 2) if times else None,
+        "min_us": round(min(times) * 1e6, 2) if times else None,
+        "calls": round(calls, 2),
+        "members": {k: round(v, 2) for k, v in members.items()},
+        "bytes": retained,
+    }
+
+
+def run_cases(names: Iterable[str], latency: LatencyModel, **opts) -> Dict:
+    """Run ``names`` and return a results document (the baseline format)."""
+    return {
+        "format": FORMAT,
+        "version": VERSION,
+        "latency": {"call_us": latency.call_us, "members": latency.members},
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "cases": {name: run_case(CASES[name], latency, **opts) for name in names},
+    }
+
+
+def load(path) -> Dict:
+    data = json.loads(Path(path).read_text(encoding="utf-8"))
+    if data.get("format") != FORMAT:
+        raise SystemExit(f"{path}: not an {FORMAT} file")
+    return data
+
+
+def _python_minor(data: Dict) -> str:
+    return ".".join(str(data.get("python", "")).split(".")[:2])
+
+
+def compare(baseline: Dict, results: Dict, *, time_threshold: float = 0.25,
+            time_floor_us: float = 10.0, count_threshold: float = 0.0,
+            memory_threshold: float = 0.10, check_time: bool = True) -> List[str]:
+    """
+    Regressions of ``results`` against ``baseline``, one line each.
+
+    A case regresses on counts when ``calls > base * (1 + count_threshold)``,
+    on time when its best time grows by more than ``time_threshold``
+    (a fraction) *and* ``time_floor_us`` — the minimum is far less noisy
+    than the median for µs-scale ops — and on memory when its retained
+    bytes grow by more than ``memory_threshold``. Cases missing from
+    either side are skipped. Time is not compared when the latency
+    models differ, memory not when the Python versions do.
+    """
+    if baseline.get("latency") != results.get("latency"):
+        check_time = False
+    check_memory = _python_minor(baseline) == _python_minor(results)
+    problems = []
+    for name, cur in results["cases"].items():
+        base = baseline["cases"].get(name)
+        if base is None:
+            continue
+        if cur["calls"] > base["calls"] * (1 + count_threshold) + 1e-9:
+            problems.append(f"{name}: COM calls/op {base['calls']} -> {cur['calls']}")
+        old, new = base.get("min_us"), cur.get("min_us")
+        if check_time and old is not None and new is not None:
+            if new - old > time_floor_us and new > old * (1 + time_threshold):
+                problems.append(f"{name}: time/op {old:.1f} us -> {new:.1f} us")
+        old, new = base.get("bytes"), cur.get("bytes")
+        if check_memory and old is not None and new is not None:
+            if new > old * (1 + memory_threshold):
+                problems.append(f"{name}: retained bytes/op {old} -> {new}")
+    return problems
+
+
+def _format_row(name: str, cur: Dict, base: Optional[Dict]) -> str:
+    us = "-" if cur["us"] is None else f"{cur['us']:.1f}"
+    size = "-" if cur.get("bytes") is None else str(cur["bytes"])
+    line = f"{name:32} {us:>10} {cur['calls']:>8g} {size:>8}"
+    if base is not None:
+        d_calls = cur["calls"] - base["calls"]
+        line += f" {d_calls:>+8g}"
+        if cur["min_us"] is not None and base.get("min_us"):
+            line += f" {100 * (cur['min_us'] / base['min_us'] - 1):>+7.0f}%"
+    busiest = ", ".join(f"{k}×{v:g}" for k, v in cur["members"].items())
+    return f"{line}   {busiest}"
+
+
+def _member(text: str):
+    name, _, us = text.partition("=")
+    try:
+        return name, float(us)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"expected NAME=MICROSECONDS, got {text!r}")
+
+
+def main(argv=None) -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("-k", "--filter", action="append", default=[],
+                        help="run cases whose name contains this (repeatable)")
+    parser.add_argument("--list", action="store_true", help="list cases and exit")
+    parser.add_argument("--latency-us", type=float, default=20.0,
+                        help="simulated cost of one COM call (default 20 µs)")
+    parser.add_argument("--member", type=_member, action="append", default=[],
+                        help="per-member cost, NAME=MICROSECONDS (repeatable)")
+    parser.add_argument("--latency-trace", metavar="PATH",
+                        help="per-member p50 costs from a hwpapi.low.replay trace")
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--min-time", type=float, default=0.05,
+                        help="seconds per timing round (default 0.05)")
+    parser.add_argument("--no-time", action="store_true",
+                        help="count COM calls only; skip timing and time gates")
+    parser.add_argument("--save", metavar="PATH", help="write results as a baseline")
+    parser.add_argument("--compare", metavar="PATH", help="gate against a baseline")
+    parser.add_argument("--time-threshold", type=float, default=0.25,
+                        help="allowed growth of the best time, fraction (default 0.25)")
+    parser.add_argument("--time-floor-us", type=float, default=10.0,
+                        help="ignore time growth below this (default 10 µs)")
+    parser.add_argument("--count-threshold", type=float, default=0.0,
+                        help="allowed COM call growth, fraction (default 0)")
+    parser.add_argument("--memory-threshold", type=float, default=0.10,
+                        help="allowed retained-bytes growth, fraction (default 0.10)")
+    args = parser.parse_args(argv)
+
+    names = [n for n in CASES if not args.filter or any(f in n for f in args.filter)]
+    if args.list:
+        for name in names:
+            print(f"{name:32} {CASES[name].doc}")
+        return 0
+
+    if args.latency_trace:
+        latency = LatencyModel.from_trace(args.latency_trace, args.latency_us)
+    else:
+        latency = LatencyModel(args.latency_us)
+    latency.members.update(dict(args.member))
+
+    baseline = load(args.compare) if args.compare else None
+    results = run_cases(names, latency, repeat=args.repeat, min_time=args.min_time,
+                        time_ops=not args.no_time)
+
+    header = f"{'case':32} {'us/op':>10} {'COM/op':>8} {'B/op':>8}"
+    if baseline is not None:
+        header += f" {'dCOM':>8} {'dtime':>8}"
+    print(f"{latency!r}")
+    print(header)
+    for name, cur in results["cases"].items():
+        base = baseline["cases"].get(name) if baseline is not None else None
+        print(_format_row(name, cur, base))
+
+    if args.save:
+        Path(args.save).write_text(
+            json.dumps(results, indent=1, ensure_ascii=False, sort_keys=True) + "\n",
+            encoding="utf-8",
+        )
+        print(f"saved {len(names)} cases to {args.save}")
+
+    if baseline is None:
+        return 0
+    if baseline.get("latency") != results.get("latency") and not args.no_time:
+        print("latency model differs from the baseline: comparing COM counts only")
+    problems = compare(
+        baseline, results,
+        time_threshold=args.time_threshold,
+        time_floor_us=args.time_floor_us,
+        count_threshold=args.count_threshold,
+        memory_threshold=args.memory_threshold,
+        check_time=not args.no_time,
+    )
+    for line in problems:
+        print(f"REGRESSION {line}")
+    return 1 if problems else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
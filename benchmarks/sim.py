@@ -0,0 +1,403 @@
+"""
+Simulated HWP engine for the benchmark suite.
+
+Every public member access on a simulated COM object — property get,
+property set or method lookup — is one *COM call*: it is counted on the
+:class:`Meter` and costs the :class:`LatencyModel`'s time for that
+member (spin-waited, so µs-scale costs are honoured). Underscore names
+are Python-side bookkeeping and free.
+
+The document behind :class:`SimImpl` is small but complete enough for
+every hwpapi hot path: fields, a ``HeadCtrl`` chain of tables / images /
+bookmarks / hyperlinks, sections of paragraphs, an HWPML head with a
+style table, ``HAction`` / ``HParameterSet``, ``CreateAction`` psets and
+a cursor that can sit in a table cell (``KeyIndicator``).
+"""
+from __future__ import annotations
+
+import collections
+import time
+from typing import Dict, Optional
+
+__all__ = ["LatencyModel", "Meter", "SimEngine", "SimImpl"]
+
+
+class LatencyModel:
+    """
+    Per-COM-call cost: ``call_us`` for every member, overridden per name.
+
+    Parameters
+    ----------
+    call_us : float
+        Default cost of one member access, in µs.
+    members : dict, optional
+        ``{"Execute": 200.0, "GetTextFile": 2000.0}`` — µs per access.
+    """
+
+    def __init__(self, call_us: float = 20.0, members: Optional[Dict[str, float]] = None) -> None:
+        self.call_us = call_us
+        self.members = dict(members or {})
+
+    def seconds(self, name: str) -> float:
+        return self.members.get(name, self.call_us) / 1e6
+
+    @classmethod
+    def from_trace(cls, path, call_us: float = 20.0) -> "LatencyModel":
+        """Per-member p50 from a recorded :class:`~hwpapi.low.replay.ComTrace`."""
+        from hwpapi.low.replay import ComTrace
+
+        summary = ComTrace.load(path).summary()
+        return cls(call_us, {name: row["p50_ms"] * 1e3 for name, row in summary.items()})
+
+    def __repr__(self) -> str:
+        return f"LatencyModel(call_us={self.call_us}, members={len(self.members)})"
+
+
+class Meter:
+    """COM call counter shared by every object of one simulated engine."""
+
+    def __init__(self, latency: Optional[LatencyModel] = None) -> None:
+        self.latency = latency or LatencyModel(0.0)
+        self.calls: collections.Counter = collections.Counter()
+        self.total = 0
+
+    def tick(self, name: str) -> None:
+        self.total += 1
+        self.calls[name] += 1
+        cost = self.latency.seconds(name)
+        if cost:
+            end = time.perf_counter() + cost
+            while time.perf_counter() < end:
+                pass
+
+    def reset(self) -> None:
+        self.calls.clear()
+        self.total = 0
+
+
+class _Com:
+    """Base for simulated COM objects — public member access is metered."""
+
+    _oleobj_ = True
+
+    def __init__(self, meter: Meter) -> None:
+        object.__setattr__(self, "_meter", meter)
+
+    def __getattribute__(self, name):
+        if name[0] != "_":
+            object.__getattribute__(self, "_meter").tick(name)
+        return object.__getattribute__(self, name)
+
+    def __setattr__(self, name, value):
+        if name[0] != "_":
+            self._meter.tick(name)
+        object.__setattr__(self, name, value)
+
+
+class _Node(_Com):
+    """``HParameterSet`` node: ``H*`` / container children appear on first use."""
+
+    _CONTAINERS = frozenset({"SelCellsBorderFill", "FillAttr", "BorderFill", "HSet"})
+
+    def __getattr__(self, name):
+        if name.startswith("_"):
+            raise AttributeError(name)
+        if (name[:1] == "H" and name[1:2].isupper()) or name in self._CONTAINERS:
+            child = _Node(self._meter)
+        else:
+            child = 0
+        object.__setattr__(self, name, child)
+        return child
+
+
+class _Pset(_Com):
+    """``CreateSet()`` result — ``Item`` / ``SetItem`` over a dict."""
+
+    def __init__(self, meter: Meter, set_id: str) -> None:
+        super().__init__(meter)
+        object.__setattr__(self, "_items", {})
+        object.__setattr__(self, "SetID", set_id)
+
+    def Item(self, key):
+        return self._items.get(key, 0)  # as if GetDefault filled every item
+
+    def SetItem(self, key, value):
+        self._items[key] = value
+
+    def ItemExist(self, key):
+        return key in self._items
+
+    def RemoveItem(self, key):
+        self._items.pop(key, None)
+
+    def CreateItemSet(self, key, set_id):
+        child = _Pset(self._meter, set_id)
+        self._items[key] = child
+        return child
+
+
+class _Action(_Com):
+    def __init__(self, meter: Meter, impl: "SimImpl", key: str) -> None:
+        super().__init__(meter)
+        object.__setattr__(self, "_impl", impl)
+        object.__setattr__(self, "_key", key)
+
+    def CreateSet(self):
+        # Like HWP, actions without a parameter set hand back nothing.
+        from hwpapi.low.actions import _action_info
+
+        set_id = _action_info.get(self._key, (self._key, None))[0]
+        return _Pset(self._meter, set_id) if set_id else None
+
+    def GetDefault(self, pset):
+        return None
+
+    def Execute(self, pset):
+        if self._key == "InsertText":
+            self._impl._inserted += 1
+        return True
+
+    def Run(self):
+        return True
+
+
+class _HAction(_Com):
+    def GetDefault(self, name, hset):
+        return True
+
+    def Execute(self, name, hset):
+        return True
+
+    def Run(self, name):
+        return True
+
+
+class _Ctrl(_Com):
+    def __init__(self, meter: Meter, ctrl_id: str, desc: str, props: Optional[dict] = None) -> None:
+        super().__init__(meter)
+        pset = _Pset(meter, "Ctrl")
+        pset._items.update(props or {})
+        object.__setattr__(self, "CtrlID", ctrl_id)
+        object.__setattr__(self, "CtrlCh", desc if ctrl_id == "bokm" else 0)
+        object.__setattr__(self, "UserDesc", desc)
+        object.__setattr__(self, "Properties", pset)
+        object.__setattr__(self, "Next", None)
+
+    def GetAnchorPos(self, kind=0):
+        return None
+
+
+class _Paragraph(_Com):
+    def __init__(self, meter: Meter, text: str, style: str) -> None:
+        super().__init__(meter)
+        object.__setattr__(self, "Text", text)
+        object.__setattr__(self, "StyleName", style)
+
+
+class _Section(_Com):
+    def __init__(self, meter: Meter, paragraphs) -> None:
+        super().__init__(meter)
+        object.__setattr__(self, "_paragraphs", paragraphs)
+        object.__setattr__(self, "Paragraphs", len(paragraphs))
+
+    def Paragraph(self, i):
+        return self._paragraphs[i]
+
+
+class _Document(_Com):
+    def __init__(self, meter: Meter, doc_id: int, sections) -> None:
+        super().__init__(meter)
+        object.__setattr__(self, "_sections", sections)
+        object.__setattr__(self, "DocumentID", doc_id)
+        object.__setattr__(self, "SectionCount", len(sections))
+        object.__setattr__(self, "Path", f"C:/docs/sim{doc_id}.hwp")
+        object.__setattr__(self, "FullName", f"C:/docs/sim{doc_id}.hwp")
+        object.__setattr__(self, "Modified", False)
+
+    def Section(self, i):
+        return self._sections[i]
+
+    def SetActive_XHwpDocument(self):
+        return True
+
+    def Save(self):
+        return True
+
+    def Close(self, save=False):
+        return True
+
+
+class _Documents(_Com):
+    def __init__(self, meter: Meter, docs) -> None:
+        super().__init__(meter)
+        object.__setattr__(self, "_docs", docs)
+        object.__setattr__(self, "Count", len(docs))
+        object.__setattr__(self, "Active_XHwpDocument", docs[0])
+
+    def Item(self, i):
+        return self._docs[i]
+
+
+def _column(col: int) -> str:
+    return chr(ord("A") + col)
+
+
+_HEAD = """<?xml version="1.0" encoding="UTF-16" standalone="no" ?>
+<HWPML Version="2.8"><HEAD><MAPPINGTABLE>
+  <CHARSHAPELIST Count="2">
+    <CHARSHAPE Id="0" Height="1000"/>
+    <CHARSHAPE Id="1" Height="1600"><BOLD/></CHARSHAPE>
+  </CHARSHAPELIST>
+  <PARASHAPELIST Count="2">
+    <PARASHAPE Id="0" Align="Justify"><PARAMARGIN Left="0" LineSpacing="160"/></PARASHAPE>
+    <PARASHAPE Id="1" Align="Center" HeadingType="Outline" Level="0"/>
+  </PARASHAPELIST>
+  <STYLELIST Count="{count}">
+{styles}
+  </STYLELIST>
+</MAPPINGTABLE></HEAD>
+<BODY><SECTION Id="0">{body}</SECTION></BODY>
+</HWPML>
+"""
+
+
+class SimImpl(_Com):
+    """
+    ``HwpObject`` stand-in.
+
+    Parameters
+    ----------
+    meter : Meter
+    fields, tables, images, bookmarks, hyperlinks, paragraphs, styles : int
+        Document size. Paragraphs are split over two sections.
+    table_rows, table_cols : int
+        Size of the table the cursor can be put in (:meth:`_enter_table`).
+    """
+
+    def __init__(self, meter: Meter, *, fields: int = 20, tables: int = 5, images: int = 5,
+                 bookmarks: int = 10, hyperlinks: int = 10, paragraphs: int = 200,
+                 styles: int = 20, table_rows: int = 12, table_cols: int = 4) -> None:
+        super().__init__(meter)
+        set_ = lambda k, v: object.__setattr__(self, k, v)  # noqa: E731
+        set_("_fields", {f"field{i}": f"value {i}" for i in range(fields)})
+        set_("_inserted", 0)
+        set_("_pos", 0)
+        set_("_cell", None)
+        set_("_rows", table_rows)
+        set_("_cols", table_cols)
+
+        ctrls = [_Ctrl(meter, "secd", "")]
+        ctrls += [_Ctrl(meter, "tbl ", f"표 {i}") for i in range(tables)]
+        ctrls += [_Ctrl(meter, "gso ", f"그림 {i}") for i in range(images)]
+        ctrls += [_Ctrl(meter, "bokm", f"mark{i}") for i in range(bookmarks)]
+        ctrls += [_Ctrl(meter, "%hlk", f"link {i}",
+                        {"Text": f"link {i}", "Path": f"https://example.com/{i}"})
+                  for i in range(hyperlinks)]
+        for a, b in zip(ctrls, ctrls[1:]):
+            object.__setattr__(a, "Next", b)
+        set_("HeadCtrl", ctrls[0])
+
+        half = paragraphs // 2
+        paras = [_Paragraph(meter, f"문단 {i} 본문 텍스트", "바탕글") for i in range(paragraphs)]
+        sections = [_Section(meter, paras[:half]), _Section(meter, paras[half:])]
+        set_("XHwpDocuments", _Documents(meter, [_Document(meter, 1, sections)]))
+        set_("HAction", _HAction(meter))
+        set_("HParameterSet", _Node(meter))
+        # No ``Version``: the on-disk GetDefault cache stays off, so counts
+        # do not depend on what an earlier run left in the user's cache.
+
+        style_rows = "\n".join(
+            f'    <STYLE Id="{i}" Type="Para" Name="스타일 {i}" EngName="Style {i}" '
+            f'ParaShape="{i % 2}" CharShape="{i % 2}"/>' for i in range(styles)
+        )
+        body = "".join(
+            f'<P Style="0"><TEXT CharShape="{i % 2}"><CHAR>문단 {i}</CHAR></TEXT></P>'
+            for i in range(paragraphs)
+        )
+        set_("_hwpml", _HEAD.format(count=styles, styles=style_rows, body=body))
+
+    # ── cursor / table ────────────────────────────────────────────
+
+    def _enter_table(self, row: int = 1, col: int = 1) -> None:
+        """Put the cursor in cell (row, col) of the simulated table (free)."""
+        object.__setattr__(self, "_cell", (row, col))
+
+    def KeyIndicator(self):
+        cell = self._cell
+        status = "" if cell is None else f"({_column(cell[1])}{cell[0] + 1}): 문단"
+        return (True, 1, 1, 1, 1, 1, cell is not None, 0, status)
+
+    def GetPos(self):
+        return (0, 0, self._pos)
+
+    def SetPos(self, lst, para, pos):
+        object.__setattr__(self, "_pos", pos)
+        return True
+
+    def MovePos(self, move_id=0, para=0, pos=0):
+        return True
+
+    def Run(self, name):
+        cell = self._cell
+        if cell is not None:
+            row, col = cell
+            moves = {
+                "TableColBegin": (row, 0),
+                "TableUpperCell": (max(row - 1, 0), col),
+                "TableLowerCell": (min(row + 1, self._rows - 1), col),
+                "TableRightCell": (row, min(col + 1, self._cols - 1)),
+            }
+            if name in moves:
+                object.__setattr__(self, "_cell", moves[name])
+            elif name == "MoveRight" and cell == (self._rows - 1, self._cols - 1):
+                object.__setattr__(self, "_cell", None)
+        if name == "BreakPara":
+            object.__setattr__(self, "_pos", 0)
+        return True
+
+    def RGBColor(self, r, g, b):
+        return r | (g << 8) | (b << 16)
+
+    # ── actions / text ────────────────────────────────────────────
+
+    def CreateAction(self, key):
+        return _Action(self._meter, self, key)
+
+    def GetTextFile(self, fmt, option=""):
+        if fmt == "HWPML2X":
+            return self._hwpml
+        return "\r\n".join(f"문단 {i}" for i in range(10))
+
+    def SetTextFile(self, text, fmt, option=""):
+        return True
+
+    # ── fields ────────────────────────────────────────────────────
+
+    def GetFieldList(self, number=0, option=0):
+        return "\x02".join(self._fields)
+
+    def GetFieldText(self, name):
+        return self._fields.get(name, "")
+
+    def PutFieldText(self, name, value):
+        self._fields[name] = value
+
+    def MoveToField(self, name, text=True, start=True, select=False):
+        return name in self._fields
+
+    def SelectCtrl(self, ctrl, option=0):
+        return True
+
+    def ExistBookMark(self, name):
+        return True
+
+
+class SimEngine:
+    """``Engine`` stand-in: ``impl`` is a :class:`SimImpl` on a fresh :class:`Meter`."""
+
+    def __init__(self, latency: Optional[LatencyModel] = None, **doc) -> None:
+        self.meter = Meter(latency)
+        self.impl = SimImpl(self.meter, **doc)
+
+    def quit(self) -> None:
+        pass
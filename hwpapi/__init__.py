@@ -11,15 +11,53 @@ Public surface is intentionally tiny. Everything else lives in submodules:
 - :mod:`hwpapi.io`              — open_file, new_document, export_*
 - :mod:`hwpapi.errors`          — HwpApiError hierarchy + wrap_com_error
 - :mod:`hwpapi.units`           — mm/cm/inch/pt ↔ HWPUNIT helpers
+- :mod:`hwpapi.tracing`         — opt-in spans, ring buffer, JSONL / Chrome-trace export
 - :mod:`hwpapi.low`             — raw actions / parametersets / engine (escape hatch)
 
 See https://JunDamin.github.io/hwpapi for the full documentation site.
+
+Everything is loaded lazily (PEP 562): ``import hwpapi`` touches neither
+pywin32 nor the ParameterSet / action tables — they load on first use of
+:class:`App` (or the submodule that needs them).
 """
 from __future__ import annotations
 
-__version__ = "2.0.0"
+import importlib
+
+TYPE_CHECKING = False  # avoid importing ``typing`` just for this flag
 
-from .core.app import App
-from .document import Document
+__version__ = "2.0.0"
 
 __all__ = ["App", "Document", "__version__"]
+
+# public name → defining module
+_LAZY_ATTRS = {
+    "App": "hwpapi.core.app",
+    "Document": "hwpapi.document",
+}
+
+_LAZY_SUBMODULES = frozenset({
+    "collections", "constants", "context", "core", "document", "errors",
+    "functions", "io", "logging", "low", "presets", "search", "selection",
+    "snapshot", "tracing", "units",
+})
+
+if TYPE_CHECKING:
+    from .core.app import App
+    from .document import Document
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRS.get(name)
+    if module is not None:
+        value = getattr(importlib.import_module(module), name)
+    elif name in _LAZY_SUBMODULES:
+        value = importlib.import_module(f"{__name__}.{name}")
+    else:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_LAZY_ATTRS) | _LAZY_SUBMODULES)
@@ -52,3 +52,17 @@ class Collection(Protocol):
 
     def filter(self, predicate: Callable[..., bool]) -> list:  # pragma: no cover
         ...
+
+
+def _note_edit(app) -> None:
+    """
+    Tell the edit caches that ``app``'s document or caret may have changed.
+
+    Collections call the raw COM handle (``PutFieldText``, ``SelectCtrl``,
+    ``HAction.Execute`` …) instead of ``_Action.run``, so they bump the
+    edit epoch themselves — :func:`hwpapi.io.hwpml.hwpml_for` and the
+    cursor-format cache of the formatting scopes are keyed on it.
+    """
+    from hwpapi.low.actions import bump_edit_epoch
+
+    bump_edit_epoch()
@@ -12,6 +12,8 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Callable, Iterator, List, Optional
 
+from hwpapi.collections import _note_edit
+
 if TYPE_CHECKING:
     from hwpapi.core.app import App
 
@@ -24,11 +26,13 @@ _BOOKMARK_CTRL_ID = "bokm"
 class Bookmark:
     """Value object for a single HWP bookmark."""
 
-    __slots__ = ("_app", "name")
+    __slots__ = ("_app", "name", "_on_edit")
 
-    def __init__(self, app: "App", name: str):
+    def __init__(self, app: "App", name: str,
+                 on_edit: Optional[Callable[[], None]] = None):
         self._app = app
         self.name = name
+        self._on_edit = on_edit
 
     def goto(self) -> bool:
         """Move the cursor to this bookmark. Returns success."""
@@ -36,13 +40,19 @@ class Bookmark:
             return bool(self._app.engine.impl.SelectBookMark(self.name))
         except Exception:
             return False
+        finally:
+            _note_edit(self._app)
 
     def remove(self) -> bool:
         """Delete this bookmark. Returns success."""
+        if self._on_edit is not None:
+            self._on_edit()
         try:
             return bool(self._app.engine.impl.DeleteBookMark(self.name))
         except Exception:
             return False
+        finally:
+            _note_edit(self._app)
 
     def __repr__(self) -> str:
         return f"Bookmark({self.name!r})"
@@ -64,12 +74,16 @@ class BookmarkCollection:
 
     Enumerates the document's ``HeadCtrl`` → ``Next`` chain, yielding a
     :class:`Bookmark` for each control whose ``CtrlID`` is ``"bokm"``.
+    ``on_edit`` is called before :meth:`add` / :meth:`remove` (the
+    owning document's transaction hook).
     """
 
-    __slots__ = ("_app",)
+    __slots__ = ("_app", "_on_edit")
 
-    def __init__(self, app: "App") -> None:
+    def __init__(self, app: "App",
+                 on_edit: Optional[Callable[[], None]] = None) -> None:
         self._app = app
+        self._on_edit = on_edit
 
     # ------------------------------------------------------------------
     # Internal iteration
@@ -125,7 +139,7 @@ class BookmarkCollection:
 
     def __iter__(self) -> Iterator[Bookmark]:
         for n in self._raw_names():
-            yield Bookmark(self._app, n)
+            yield Bookmark(self._app, n, self._on_edit)
 
     def __len__(self) -> int:
         return len(self._raw_names())
@@ -141,11 +155,11 @@ class BookmarkCollection:
     def __getitem__(self, key) -> Bookmark:
         names = self._raw_names()
         if isinstance(key, int):
-            return Bookmark(self._app, names[key])
+            return Bookmark(self._app, names[key], self._on_edit)
         if isinstance(key, str):
             if key not in names and not self._exists(key):
                 raise KeyError(f"Bookmark {key!r} not found")
-            return Bookmark(self._app, key)
+            return Bookmark(self._app, key, self._on_edit)
         raise TypeError(
             f"Bookmark key must be str or int, got {type(key).__name__}"
         )
@@ -165,6 +179,8 @@ class BookmarkCollection:
 
     def add(self, name: str) -> bool:
         """Insert a bookmark at the current cursor position."""
+        if self._on_edit is not None:
+            self._on_edit()
         impl = self._app.engine.impl
         try:
             pset = impl.HParameterSet.HBookMark
@@ -173,18 +189,26 @@ class BookmarkCollection:
             return bool(impl.HAction.Execute("InsertBookMark", pset.HSet))
         except Exception:
             return False
+        finally:
+            _note_edit(self._app)
 
     def remove(self, name: str) -> bool:
+        if self._on_edit is not None:
+            self._on_edit()
         try:
             return bool(self._app.engine.impl.DeleteBookMark(name))
         except Exception:
             return False
+        finally:
+            _note_edit(self._app)
 
     def goto(self, name: str) -> bool:
         try:
             return bool(self._app.engine.impl.SelectBookMark(name))
         except Exception:
             return False
+        finally:
+            _note_edit(self._app)
 
     def __repr__(self) -> str:
         try:
@@ -12,6 +12,8 @@ from __future__ import annotations
 from pathlib import Path
 from typing import TYPE_CHECKING, Iterator, Optional, Union
 
+from hwpapi import tracing as _tracing
+
 if TYPE_CHECKING:
     from hwpapi.core.app import App
     from hwpapi.document import Document
@@ -59,10 +61,30 @@ class DocumentCollection:
         from hwpapi.document import Document
 
         name = get_absolute_path(path)
-        if format:
-            self._app.api.Open(name, format, arg)
-        else:
-            self._app.api.Open(name)
+        with _tracing.span("documents.open", document=name, format=format) as sp:
+            if format:
+                sp.call(self._app.api.Open, name, format, arg)
+            else:
+                sp.call(self._app.api.Open, name)
+            return Document(self._app, _raw=self._active_raw())
+
+    def open_bytes(
+        self,
+        data: Union[bytes, bytearray, memoryview],
+        format: Optional[str] = None,
+    ) -> "Document":
+        """
+        ``bytes`` 를 새 문서로 열고 :class:`Document` 반환 — 업로드 처리용.
+
+        ``format`` 을 생략하면 내용으로 추정 (``.hwp`` / ``.hwpx`` / HWPML /
+        HTML). ``HWP`` · ``HWPML2X`` · ``HTML`` 등은 ``SetTextFile`` 로
+        메모리에서 바로, 나머지는 RAM disk / 임시 파일을 거칩니다
+        (:mod:`hwpapi.io.memory`).
+        """
+        from hwpapi.document import Document
+        from hwpapi.io.memory import load_bytes
+
+        load_bytes(self._app, data, format)
         return Document(self._app, _raw=self._active_raw())
 
     def add(self) -> "Document":
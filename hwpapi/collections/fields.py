@@ -12,6 +12,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Callable, Iterator, List, Optional
 
+from hwpapi import tracing as _tracing
+from hwpapi.collections import _note_edit
+
 if TYPE_CHECKING:
     from hwpapi.core.app import App
 
@@ -36,11 +39,13 @@ def _split_field_list(raw: str) -> List[str]:
 class Field:
     """Value object for a single HWP field (누름틀)."""
 
-    __slots__ = ("_app", "name")
+    __slots__ = ("_app", "name", "_on_edit")
 
-    def __init__(self, app: "App", name: str):
+    def __init__(self, app: "App", name: str,
+                 on_edit: Optional[Callable[[], None]] = None):
         self._app = app
         self.name = name
+        self._on_edit = on_edit
 
     @property
     def value(self) -> str:
@@ -49,8 +54,13 @@ class Field:
 
     @value.setter
     def value(self, v) -> None:
+        if self._on_edit is not None:
+            self._on_edit()
         impl = self._app.engine.impl
-        impl.PutFieldText(self.name, "" if v is None else str(v))
+        try:
+            impl.PutFieldText(self.name, "" if v is None else str(v))
+        finally:
+            _note_edit(self._app)
 
     def goto(self) -> bool:
         impl = self._app.engine.impl
@@ -58,6 +68,8 @@ class Field:
             return bool(impl.MoveToField(self.name, True, True, False))
         except Exception:
             return False
+        finally:
+            _note_edit(self._app)
 
     def __repr__(self) -> str:
         try:
@@ -85,12 +97,18 @@ class FieldCollection:
     Iterates as :class:`Field` value objects (not bare strings, unlike
     the v1 list-compat surface). Dict-like subscript by name; numeric
     subscript gives the nth :class:`Field` in document order.
+
+    ``on_edit`` is called before every write — :class:`~hwpapi.document.Document`
+    passes its transaction hook so ``with doc.transaction():`` snapshots
+    before the first field change.
     """
 
-    __slots__ = ("_app",)
+    __slots__ = ("_app", "_on_edit")
 
-    def __init__(self, app: "App") -> None:
+    def __init__(self, app: "App",
+                 on_edit: Optional[Callable[[], None]] = None) -> None:
         self._app = app
+        self._on_edit = on_edit
 
     # ------------------------------------------------------------------
     # Core protocol
@@ -120,7 +138,7 @@ class FieldCollection:
 
     def __iter__(self) -> Iterator[Field]:
         for n in self._raw_names():
-            yield Field(self._app, n)
+            yield Field(self._app, n, self._on_edit)
 
     def __len__(self) -> int:
         return len(self._raw_names())
@@ -133,13 +151,13 @@ class FieldCollection:
     def __getitem__(self, key) -> Field:
         names = self._raw_names()
         if isinstance(key, int):
-            return Field(self._app, names[key])
+            return Field(self._app, names[key], self._on_edit)
         if isinstance(key, slice):
-            return [Field(self._app, n) for n in names[key]]  # type: ignore[return-value]
+            return [Field(self._app, n, self._on_edit) for n in names[key]]  # type: ignore[return-value]
         if isinstance(key, str):
             if key not in names:
                 raise KeyError(f"Field {key!r} not found")
-            return Field(self._app, key)
+            return Field(self._app, key, self._on_edit)
         raise TypeError(
             f"Field key must be str or int, got {type(key).__name__}"
         )
@@ -149,8 +167,13 @@ class FieldCollection:
             raise TypeError(
                 f"Field name must be str, got {type(name).__name__}"
             )
+        if self._on_edit is not None:
+            self._on_edit()
         impl = self._app.engine.impl
-        impl.PutFieldText(name, "" if value is None else str(value))
+        try:
+            impl.PutFieldText(name, "" if value is None else str(value))
+        finally:
+            _note_edit(self._app)
 
     def __delitem__(self, name) -> None:
         raise NotImplementedError(
@@ -169,7 +192,7 @@ class FieldCollection:
     def find(self, name: str) -> Optional[Field]:
         """Return the :class:`Field` with ``name`` or ``None``."""
         if name in self._raw_names():
-            return Field(self._app, name)
+            return Field(self._app, name, self._on_edit)
         return None
 
     def get(self, name: str, default: str = "") -> str:
@@ -183,11 +206,10 @@ class FieldCollection:
 
     def update(self, mapping=None, **kwargs) -> None:
         """Dict-style batch assignment."""
-        if mapping:
-            for k, v in dict(mapping).items():
-                self[k] = v
-        for k, v in kwargs.items():
-            self[k] = v
+        items = dict(mapping or {}, **kwargs)
+        with _tracing.span("fields.update", fields=len(items)) as sp:
+            for k, v in items.items():
+                sp.call(self.__setitem__, k, v)
 
     def __repr__(self) -> str:
         try:
@@ -9,7 +9,9 @@ All COM access goes through ``self._app.engine.impl``.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, Iterator, List
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional
+
+from hwpapi.collections import _note_edit
 
 if TYPE_CHECKING:
     from hwpapi.core.app import App
@@ -49,13 +51,16 @@ class HyperlinkCollection:
 
     Iteration yields :class:`Hyperlink` value objects extracted from the
     ``HeadCtrl`` chain. Named subscript matches on link ``text``; ordinal
-    subscript returns the nth link in document order.
+    subscript returns the nth link in document order. ``on_edit`` is
+    called before :meth:`add` (the owning document's transaction hook).
     """
 
-    __slots__ = ("_app",)
+    __slots__ = ("_app", "_on_edit")
 
-    def __init__(self, app: "App") -> None:
+    def __init__(self, app: "App",
+                 on_edit: Optional[Callable[[], None]] = None) -> None:
         self._app = app
+        self._on_edit = on_edit
 
     # ------------------------------------------------------------------
     # Internal iteration
@@ -163,6 +168,8 @@ class HyperlinkCollection:
 
     def add(self, text: str, url: str) -> Hyperlink:
         """Insert a hyperlink at the current cursor position."""
+        if self._on_edit is not None:
+            self._on_edit()
         impl = self._app.engine.impl
         try:
             pset = impl.HParameterSet.HHyperLink
@@ -172,6 +179,8 @@ class HyperlinkCollection:
             impl.HAction.Execute("Hyperlink", pset.HSet)
         except Exception:
             pass
+        finally:
+            _note_edit(self._app)
         return Hyperlink(text, url)
 
     def __repr__(self) -> str:
@@ -10,7 +10,10 @@ All COM access goes through ``self._app.engine.impl``.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, Iterator, List
+from typing import TYPE_CHECKING, Callable, Iterator, List, Optional
+
+from hwpapi.collections import _note_edit
+from hwpapi.low.lifetime import active_document_id, track as _track
 
 if TYPE_CHECKING:
     from hwpapi.core.app import App
@@ -25,12 +28,15 @@ _IMAGE_DESC_KEYWORDS = ("그림", "picture", "image", "photo", "사진")
 class Image:
     """Value object for a single image control."""
 
-    __slots__ = ("_app", "_ctrl", "index")
+    __slots__ = ("_app", "_ctrl", "index", "__weakref__")
 
-    def __init__(self, app: "App", ctrl, index: int) -> None:
+    def __init__(self, app: "App", ctrl, index: int,
+                 doc_id: Optional[int] = None) -> None:
         self._app = app
         self._ctrl = ctrl
         self.index = index
+        if ctrl is not None:
+            _track(app, self, "image", "_ctrl", doc_id)
 
     @property
     def name(self) -> str:
@@ -48,6 +54,8 @@ class Image:
             return True
         except Exception:
             return False
+        finally:
+            _note_edit(self._app)
 
     def __repr__(self) -> str:
         return f"Image(#{self.index}, {self.name!r})"
@@ -102,9 +110,12 @@ class ImageCollection:
     def _raw(self) -> List[Image]:
         out: List[Image] = []
         idx = 0
+        doc_id = None
         for ctrl in self._iter_ctrls():
             if self._is_image(ctrl):
-                out.append(Image(self._app, ctrl, idx))
+                if idx == 0:  # the document these handles belong to (lifetime)
+                    doc_id = active_document_id(self._app)
+                out.append(Image(self._app, ctrl, idx, doc_id))
                 idx += 1
         return out
 
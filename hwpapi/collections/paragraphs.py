@@ -2,9 +2,15 @@
 :mod:`hwpapi.collections.paragraphs` — ParagraphCollection.
 
 HWP exposes paragraphs through ``XHwpDocuments.Active_XHwpDocument.
-Section(0).Paragraph(i)``. Length is computed via section paragraph
-counts; ordinal subscript returns a lightweight :class:`Paragraph`
-value object.
+Section(s).Paragraph(i)``. Ordinals run across every section in order;
+length is the sum of the section paragraph counts and ordinal subscript
+returns a lightweight :class:`Paragraph` value object.
+
+For bulk reads, :meth:`ParagraphCollection.records` walks the sections
+once and yields compact :class:`ParagraphRecord` values (text and style,
+no COM handle) one at a time, resolving each section handle once.
+Which attribute name the runtime answers to (``Text`` vs ``GetText``, ``StyleName`` vs
+``Style``, …) is probed once and memoised in :class:`_AttrProbe`.
 
 Named enumeration is intentionally not supported — HWP paragraphs have
 no natural names. ``names()`` returns index strings (``"0"``, ``"1"``,
@@ -14,7 +20,8 @@ Phase 4 enriches :class:`Paragraph` with ``.style``, ``.charshape``,
 ``.parashape`` and ``.runs``. Shape properties delegate to
 :mod:`hwpapi.low.parametersets` via the ``CharShape`` and
 ``ParagraphShape`` actions on the owning :class:`App`. :class:`Run`
-is a lightweight slice of a paragraph's text + charshape.
+is a slice of a paragraph's text with its own CharShape, split from a
+single HWPML export (:mod:`hwpapi.io.hwpml`).
 
 All COM access goes through ``self._app.engine.impl``.
 """
@@ -22,10 +29,70 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Callable, Iterator, List, Optional
 
+from hwpapi.low.lifetime import document_id, track as _track
+
 if TYPE_CHECKING:
     from hwpapi.core.app import App
 
-__all__ = ["Paragraph", "ParagraphCollection", "Run"]
+__all__ = ["Paragraph", "ParagraphCollection", "ParagraphRecord", "Run"]
+
+
+class _AttrProbe:
+    """
+    Read one of several candidate attribute names off a COM object.
+
+    The name that last answered is tried first on the next read, so a
+    runtime that speaks ``Text`` pays one ``getattr`` per read instead
+    of walking the whole candidate list. Callables are invoked; ``None``
+    and exceptions fall through to the next candidate.
+    """
+
+    __slots__ = ("names", "_hit")
+
+    def __init__(self, *names: str) -> None:
+        self.names = names
+        self._hit = names[0]
+
+    def _read(self, raw, attr):
+        v = getattr(raw, attr, None)
+        if callable(v):
+            v = v()
+        return v
+
+    def __call__(self, raw, default=None):
+        if raw is None:
+            return default
+        hit = self._hit
+        try:
+            v = self._read(raw, hit)
+            if v is not None:
+                return v
+        except Exception:
+            pass
+        for attr in self.names:
+            if attr == hit:
+                continue
+            try:
+                v = self._read(raw, attr)
+            except Exception:
+                continue
+            if v is not None:
+                self._hit = attr
+                return v
+        return default
+
+
+_TEXT = _AttrProbe("Text", "GetText")
+_STYLE = _AttrProbe("StyleName", "Style")
+_PARA_COUNT = _AttrProbe("Paragraphs", "ParagraphCount")
+_SECTION_COUNT = _AttrProbe("SectionCount", "Sections")
+
+
+def _as_count(v) -> int:
+    try:
+        return max(0, int(v or 0))
+    except Exception:
+        return 0
 
 
 class Run:
@@ -33,9 +100,11 @@ class Run:
     A run — contiguous slice of a :class:`Paragraph` sharing a
     :class:`~hwpapi.low.parametersets.CharShape`.
 
-    Phase 4 ships a single-run stub covering the whole paragraph; a
-    future phase can split on CharShape boundaries by walking the
-    characters.
+    Runs built by :attr:`Paragraph.runs` / :meth:`ParagraphCollection.runs`
+    come from one HWPML export of the document (see
+    :mod:`hwpapi.io.hwpml`) and carry their own text and CharShape
+    values. A :class:`Run` constructed by hand has neither and falls
+    back to slicing the paragraph text and to the caret CharShape.
 
     Parameters
     ----------
@@ -44,17 +113,30 @@ class Run:
     start, end : int
         Character offsets into :attr:`Paragraph.text` (Python slice
         semantics). ``end == -1`` means "to end of paragraph".
+    text : str, optional
+        Run text, when already known.
+    shape : dict, optional
+        CharShape values (``{"Bold": 1, "Height": 1200, ...}``).
 
     Attributes are evaluated lazily; constructing a :class:`Run` does
     not touch COM.
     """
 
-    __slots__ = ("_paragraph", "start", "end")
+    __slots__ = ("_paragraph", "start", "end", "_text", "_shape")
 
-    def __init__(self, paragraph: "Paragraph", start: int = 0, end: int = -1) -> None:
+    def __init__(
+        self,
+        paragraph: "Paragraph",
+        start: int = 0,
+        end: int = -1,
+        text: Optional[str] = None,
+        shape: Optional[dict] = None,
+    ) -> None:
         self._paragraph = paragraph
         self.start = int(start)
         self.end = int(end)
+        self._text = text
+        self._shape = shape
 
     @property
     def paragraph(self) -> "Paragraph":
@@ -64,6 +146,8 @@ class Run:
     @property
     def text(self) -> str:
         """Substring of the paragraph text covered by this run."""
+        if self._text is not None:
+            return self._text
         text = self._paragraph.text
         if self.end == -1:
             return text[self.start:]
@@ -71,10 +155,20 @@ class Run:
 
     @property
     def charshape(self):
-        """Best-effort :class:`CharShape` — currently the paragraph's."""
-        return self._paragraph.charshape
+        """
+        :class:`~hwpapi.low.parametersets.CharShape` of this run.
+
+        Unbound (no COM) and built from the exported values when the run
+        came from HWPML; otherwise the paragraph's caret CharShape.
+        """
+        if self._shape is None:
+            return self._paragraph.charshape
+        from hwpapi.low.parametersets import CharShape
+        return CharShape(initial=dict(self._shape))
 
     def __len__(self) -> int:
+        if self._text is not None:
+            return len(self._text)
         if self.end == -1:
             return max(0, len(self._paragraph.text) - self.start)
         return max(0, self.end - self.start)
@@ -84,15 +178,28 @@ class Run:
         return f"Run(para=#{self._paragraph.index}, {self.start}:{end})"
 
 
+def _hwpml_runs(paragraph: "Paragraph", hp, charshapes) -> List[Run]:
+    runs = []
+    pos = 0
+    for text, shape_id in hp.spans:
+        end = pos + len(text)
+        runs.append(Run(paragraph, pos, end, text, charshapes.get(shape_id)))
+        pos = end
+    return runs or [Run(paragraph, 0, -1, "", None)]
+
+
 class Paragraph:
     """Value object for a single paragraph (ordinal only)."""
 
-    __slots__ = ("_app", "index", "_raw")
+    __slots__ = ("_app", "index", "_raw", "__weakref__")
 
-    def __init__(self, app: "App", index: int, raw=None) -> None:
+    def __init__(self, app: "App", index: int, raw=None,
+                 doc_id: Optional[int] = None) -> None:
         self._app = app
         self.index = index
         self._raw = raw
+        if raw is not None:
+            _track(app, self, "paragraph", "_raw", doc_id)
 
     # ------------------------------------------------------------------
     # Text / style
@@ -101,37 +208,12 @@ class Paragraph:
     @property
     def text(self) -> str:
         """Paragraph text. Returns ``""`` when the backend cannot resolve it."""
-        raw = self._raw
-        if raw is None:
-            return ""
-        for attr in ("Text", "GetText"):
-            try:
-                v = getattr(raw, attr, None)
-                if callable(v):
-                    return str(v() or "")
-                if v is not None:
-                    return str(v)
-            except Exception:
-                continue
-        return ""
+        return str(_TEXT(self._raw, ""))
 
     @property
     def style(self) -> str:
         """Paragraph style name (e.g. "바탕글"). Empty string on failure."""
-        raw = self._raw
-        if raw is None:
-            return ""
-        for attr in ("StyleName", "Style"):
-            try:
-                v = getattr(raw, attr, None)
-                if callable(v):
-                    v = v()
-                if v is None:
-                    continue
-                return str(v)
-            except Exception:
-                continue
-        return ""
+        return str(_STYLE(self._raw, ""))
 
     # ------------------------------------------------------------------
     # Shape delegation to hwpapi.low.parametersets
@@ -171,26 +253,60 @@ class Paragraph:
     @property
     def runs(self) -> List[Run]:
         """
-        Runs covering this paragraph. Phase 4 returns a single-element
-        list spanning the full paragraph; later phases may split on
-        CharShape boundaries.
+        Runs of this paragraph, split on CharShape boundaries.
+
+        Read from one HWPML export of the active document (cached until
+        the next hwpapi edit — see :func:`hwpapi.io.hwpml.hwpml_for`), so
+        the caret is never moved. Falls back to a single run spanning the
+        paragraph when the export is unavailable.
         """
-        # Phase 4+: refine by walking characters and emitting a Run per
-        # CharShape-contiguous region. Single run is correct for the
-        # common case of uniformly-formatted paragraphs.
-        return [Run(self, 0, -1)]
+        from hwpapi.io.hwpml import hwpml_for
+
+        view = hwpml_for(self._app)
+        if view is None or not (0 <= self.index < len(view.paragraphs)):
+            return [Run(self, 0, -1)]
+        return _hwpml_runs(self, view.paragraphs[self.index], view.charshapes)
 
     def __repr__(self) -> str:
         return f"Paragraph(#{self.index})"
 
 
+class ParagraphRecord:
+    """
+    Paragraph values read by :meth:`ParagraphCollection.records`.
+
+    Plain data — holds no COM handle, so a record stays valid after the
+    document changes and costs four slots of memory.
+
+    Attributes
+    ----------
+    index : int
+        Document-wide ordinal (same numbering as ``doc.paragraphs[i]``).
+    section : int
+        Section the paragraph lives in.
+    text, style : str
+        Paragraph text and style name (``""`` when unavailable).
+    """
+
+    __slots__ = ("index", "section", "text", "style")
+
+    def __init__(self, index: int, section: int, text: str, style: str) -> None:
+        self.index = index
+        self.section = section
+        self.text = text
+        self.style = style
+
+    def __repr__(self) -> str:
+        return f"ParagraphRecord(#{self.index}, section={self.section}, text={self.text[:20]!r})"
+
+
 class ParagraphCollection:
     """
     ``doc.paragraphs`` — ordinal-access paragraph collection.
 
-    Iteration uses ``Section(0).Paragraph(i)`` on the active HWP
-    document. When the underlying handle can't enumerate (e.g. no
-    document open), the collection behaves as empty.
+    Iteration walks ``Section(s).Paragraph(i)`` across every section of
+    the active HWP document. When the underlying handle can't enumerate
+    (e.g. no document open), the collection behaves as empty.
     """
 
     __slots__ = ("_app",)
@@ -202,36 +318,100 @@ class ParagraphCollection:
     # Internal COM access
     # ------------------------------------------------------------------
 
-    def _section(self):
+    def _document(self):
         impl = self._app.engine.impl
         try:
-            return impl.XHwpDocuments.Active_XHwpDocument.Section(0)
+            return impl.XHwpDocuments.Active_XHwpDocument
         except Exception:
             return None
 
-    def _count(self) -> int:
-        sec = self._section()
-        if sec is None:
-            return 0
-        for attr in ("Paragraphs", "ParagraphCount"):
+    def _sections(self, doc=None) -> Iterator[tuple]:
+        """Yield ``(section_no, section, paragraph_count)`` — one resolve per section.
+
+        Runtimes that do not report a section count are treated as
+        single-section documents.
+        """
+        if doc is None:
+            doc = self._document()
+        if doc is None:
+            return
+        n_sections = _as_count(_SECTION_COUNT(doc, 1)) or 1
+        for s in range(n_sections):
             try:
-                n = getattr(sec, attr, None)
-                if callable(n):
-                    return int(n() or 0)
-                if n is not None:
-                    return int(n)
+                sec = doc.Section(s)
             except Exception:
+                sec = None
+            if sec is None:
                 continue
-        return 0
+            yield s, sec, _as_count(_PARA_COUNT(sec, 0))
 
-    def _raw_paragraph(self, i: int):
-        sec = self._section()
-        if sec is None:
-            return None
-        try:
-            return sec.Paragraph(i)
-        except Exception:
-            return None
+    def _count(self) -> int:
+        return sum(n for _, _, n in self._sections())
+
+    def _locate(self, i: int, sections) -> Optional[object]:
+        """Map a document-wide ordinal to its raw paragraph (or ``None``).
+
+        ``sections`` — the ``(section_no, section, paragraph_count)`` list
+        from :meth:`_sections`, so the caller's count and lookup share one
+        walk.
+        """
+        for _, sec, n in sections:
+            if i < n:
+                try:
+                    return sec.Paragraph(i)
+                except Exception:
+                    return None
+            i -= n
+        return None
+
+    def _walk(self, doc=None) -> Iterator[tuple]:
+        """Yield ``(index, section_no, raw)`` for every paragraph in order."""
+        index = 0
+        for s, sec, n in self._sections(doc):
+            for i in range(n):
+                try:
+                    raw = sec.Paragraph(i)
+                except Exception:
+                    raw = None
+                yield index, s, raw
+                index += 1
+
+    # ------------------------------------------------------------------
+    # Bulk read
+    # ------------------------------------------------------------------
+
+    def records(self) -> Iterator[ParagraphRecord]:
+        """
+        Iterate every paragraph as a :class:`ParagraphRecord`.
+
+        A plain generator: each paragraph's text and style are read when
+        its record is yielded, and no COM handle outlives the step. Runs
+        in time linear in the paragraph count with constant memory.
+
+        Examples
+        --------
+        >>> headings = [r.text for r in doc.paragraphs.records()
+        ...             if r.style.startswith("개요")]
+        """
+        for index, s, raw in self._walk():
+            yield ParagraphRecord(index, s, str(_TEXT(raw, "")), str(_STYLE(raw, "")))
+
+    def runs(self) -> Iterator[Run]:
+        """
+        Every run of the document, in order, split on CharShape boundaries.
+
+        Costs one ``GetTextFile("HWPML2X")`` call plus parse time, no
+        matter how many paragraphs or runs there are. ``run.paragraph``
+        carries only the ordinal (``.index``); use ``doc.paragraphs[i]``
+        for a live paragraph handle.
+        """
+        from hwpapi.io.hwpml import hwpml_for
+
+        view = hwpml_for(self._app)
+        if view is None:
+            return
+        for index, hp in enumerate(view.paragraphs):
+            yield from _hwpml_runs(Paragraph(self._app, index), hp, view.charshapes)
 
     # ------------------------------------------------------------------
     # Collection protocol
@@ -242,29 +422,35 @@ class ParagraphCollection:
         return [str(i) for i in range(self._count())]
 
     def __iter__(self) -> Iterator[Paragraph]:
-        for i in range(self._count()):
-            yield Paragraph(self._app, i, self._raw_paragraph(i))
+        doc = self._document()
+        doc_id = document_id(doc)  # the document these handles belong to (lifetime)
+        for index, _, raw in self._walk(doc):
+            yield Paragraph(self._app, index, raw, doc_id)
 
     def __len__(self) -> int:
         return self._count()
 
     def __contains__(self, key) -> bool:
         if isinstance(key, Paragraph):
-            return 0 <= key.index < self._count()
+            key = key.index
+        elif isinstance(key, str):
+            if not key.isdigit() or str(int(key)) != key:
+                return False
+            key = int(key)
         if isinstance(key, int):
             return 0 <= key < self._count()
-        if isinstance(key, str):
-            return key in self.names()
         return False
 
     def __getitem__(self, key) -> Paragraph:
         if isinstance(key, int):
-            n = self._count()
+            doc = self._document()
+            sections = list(self._sections(doc))
+            n = sum(c for _, _, c in sections)
             if key < 0:
                 key += n
             if not (0 <= key < n):
                 raise IndexError(f"Paragraph index {key} out of range")
-            return Paragraph(self._app, key, self._raw_paragraph(key))
+            return Paragraph(self._app, key, self._locate(key, sections), document_id(doc))
         raise TypeError(
             f"Paragraph key must be int, got {type(key).__name__}"
         )
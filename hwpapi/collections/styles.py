@@ -1,45 +1,216 @@
 """
-:mod:`hwpapi.collections.styles` — StyleCollection (minimal).
+:mod:`hwpapi.collections.styles` — StyleCollection.
 
 HWP's COM surface does **not** expose a first-class paragraph style
-enumeration; the v1 :mod:`hwpapi.classes.styles` accessor resorts to
-HWPML export + XML regex parsing for its names list. That strategy
-needs a live HWP runtime and a selection, so the Phase 3 collection
-provides a **Protocol-compliant stub**:
+enumeration, so the collection exports the document once as HWPML
+(``GetTextFile("HWPML2X")``), parses only the head — style, char-shape
+and para-shape tables — and keeps the result as an immutable
+:class:`StyleIndex`:
 
-* ``names()`` returns ``[]`` by default.
-* Iteration yields nothing, ``len(...)`` is 0.
-* ``__getitem__`` by string returns the :class:`Style` wrapper anyway —
-  HWP's ``Style`` action accepts a style name and validates lazily, so
-  callers can still ``doc.styles["제목 1"].apply()`` without enumeration.
+* ``names()``, ``len()``, iteration, ``filter()`` and index → name
+  mapping are served from the index with no further COM.
+* Lookups by name (``"제목 1" in doc.styles``, ``doc.styles["제목 1"]``)
+  are dict hits.
+* The index is cached per document and dropped when hwpapi runs a
+  style-table action (``StyleAdd`` / ``StyleEdit`` / ``StyleDelete`` …,
+  see :func:`hwpapi.low.actions.style_epoch`). Edits made through raw
+  ``app.api`` need :meth:`StyleCollection.refresh`.
 
-Port the XML-parsing enumeration from ``hwpapi/classes/styles.py``
-in a later phase when an HWP runtime is guaranteed.
+When the export is unavailable (no HWP runtime, no document) the
+collection behaves as empty; ``__getitem__`` by string still returns a
+:class:`Style` wrapper — HWP's ``Style`` action accepts a style name and
+validates lazily, so ``doc.styles["제목 1"].apply()`` keeps working.
 
 All COM access goes through ``self._app.engine.impl``.
 """
 from __future__ import annotations
 
-from typing import TYPE_CHECKING, Callable, Iterator, List, Optional
+import weakref
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, List, Optional, Tuple
+
+from hwpapi.collections import _note_edit
+from hwpapi.logging import get_logger
 
 if TYPE_CHECKING:
     from hwpapi.core.app import App
+    from hwpapi.io.hwpml import HwpmlStyle
+
+__all__ = ["Style", "StyleCollection", "StyleIndex"]
+
+logger = get_logger("collections.styles")
+
+
+class StyleIndex:
+    """
+    Immutable snapshot of a document's style table.
+
+    Built from one HWPML head parse; holds the style records plus the
+    char-shape / para-shape values they reference.
+    """
+
+    __slots__ = ("_styles", "_by_name", "_charshapes", "_parashapes")
+
+    def __init__(self, styles=(), charshapes=None, parashapes=None) -> None:
+        self._styles: Tuple["HwpmlStyle", ...] = tuple(styles)
+        self._by_name: Dict[str, int] = {}
+        for i, st in enumerate(self._styles):
+            self._by_name.setdefault(st.name, i)
+        self._charshapes = dict(charshapes or {})
+        self._parashapes = dict(parashapes or {})
+
+    @classmethod
+    def from_hwpml(cls, view) -> "StyleIndex":
+        return cls(view.styles, view.charshapes, view.parashapes)
+
+    def __len__(self) -> int:
+        return len(self._styles)
 
-__all__ = ["Style", "StyleCollection"]
+    def __getitem__(self, index: int) -> "HwpmlStyle":
+        return self._styles[index]
+
+    def __iter__(self) -> Iterator["HwpmlStyle"]:
+        return iter(self._styles)
+
+    def names(self) -> List[str]:
+        return [st.name for st in self._styles]
+
+    def position(self, name: str) -> Optional[int]:
+        """Position of the style called ``name`` (``None`` if absent)."""
+        return self._by_name.get(name)
+
+    def charshape(self, style: "HwpmlStyle") -> Optional[dict]:
+        values = self._charshapes.get(style.charshape)
+        return dict(values) if values is not None else None
+
+    def parashape(self, style: "HwpmlStyle") -> Optional[dict]:
+        values = self._parashapes.get(style.parashape)
+        return dict(values) if values is not None else None
+
+    def __repr__(self) -> str:
+        return f"StyleIndex({len(self._styles)} styles)"
+
+
+_EMPTY = StyleIndex()
+_indexes: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+@contextmanager
+def _active(app: "App", raw):
+    """Make ``raw`` the active document for the block, then switch back.
+
+    A read-only export must not leave the user's document switched, so
+    the previously active document is restored. No switch happens when
+    ``raw`` already is the active one (or is ``None``).
+    """
+    from hwpapi.low.lifetime import document_id
+
+    if raw is None:
+        yield
+        return
+    try:
+        previous = app.engine.impl.XHwpDocuments.Active_XHwpDocument
+    except Exception:
+        previous = None
+    doc_id = document_id(raw)
+    if doc_id is not None and document_id(previous) == doc_id:
+        yield
+        return
+    raw.SetActive_XHwpDocument()
+    try:
+        yield
+    finally:
+        if previous is not None:
+            try:
+                previous.SetActive_XHwpDocument()
+            except Exception as exc:
+                logger.debug("could not restore the active document: %r", exc)
+
+
+def _style_index(app: "App", raw=None, refresh: bool = False) -> StyleIndex:
+    """Cached :class:`StyleIndex` for document ``raw`` (or ``app``'s active one)."""
+    from hwpapi.low.actions import style_epoch
+
+    owner = raw if raw is not None else app
+    epoch = style_epoch()
+    try:
+        cached = _indexes.get(owner)
+    except TypeError:  # not weak-referenceable — no caching
+        cached = None
+    if cached is not None and cached[0] == epoch and not refresh:
+        return cached[1]
+
+    from hwpapi.io.hwpml import export_hwpml, parse_hwpml
+    try:
+        with _active(app, raw):  # export reads the active document
+            index = StyleIndex.from_hwpml(parse_hwpml(export_hwpml(app), head_only=True))
+    except Exception as exc:
+        logger.debug("style table export failed: %r", exc)
+        return _EMPTY
+    try:
+        _indexes[owner] = (epoch, index)
+    except TypeError:
+        pass
+    return index
 
 
 class Style:
     """Value object for a single paragraph style."""
 
-    __slots__ = ("_app", "name", "index")
+    __slots__ = ("_app", "name", "index", "_info", "_table", "_on_edit")
 
-    def __init__(self, app: "App", name: str, index: Optional[int] = None) -> None:
+    def __init__(
+        self,
+        app: "App",
+        name: str,
+        index: Optional[int] = None,
+        info: Optional["HwpmlStyle"] = None,
+        table: Optional[StyleIndex] = None,
+        on_edit: Optional[Callable[[], None]] = None,
+    ) -> None:
         self._app = app
         self.name = name
         self.index = index
+        self._info = info
+        self._table = table
+        self._on_edit = on_edit
+
+    @property
+    def eng_name(self) -> str:
+        """English style name (``""`` when not enumerated)."""
+        return self._info.eng_name if self._info is not None else ""
+
+    @property
+    def kind(self) -> str:
+        """``"Para"`` or ``"Char"`` (``""`` when not enumerated)."""
+        return self._info.kind if self._info is not None else ""
+
+    @property
+    def charshape(self):
+        """Unbound :class:`~hwpapi.low.parametersets.CharShape` of the style, or ``None``."""
+        if self._info is None or self._table is None:
+            return None
+        values = self._table.charshape(self._info)
+        if values is None:
+            return None
+        from hwpapi.low.parametersets import CharShape
+        return CharShape(initial=values)
+
+    @property
+    def parashape(self):
+        """Unbound :class:`~hwpapi.low.parametersets.ParaShape` of the style, or ``None``."""
+        if self._info is None or self._table is None:
+            return None
+        values = self._table.parashape(self._info)
+        if values is None:
+            return None
+        from hwpapi.low.parametersets import ParaShape
+        return ParaShape(initial=values)
 
     def apply(self) -> bool:
         """Apply this style to the current cursor paragraph."""
+        if self._on_edit is not None:
+            self._on_edit()
         impl = self._app.engine.impl
         try:
             pset = impl.HParameterSet.HStyle
@@ -51,6 +222,8 @@ class Style:
             return bool(impl.HAction.Execute("Style", pset.HSet))
         except Exception:
             return False
+        finally:
+            _note_edit(self._app)
 
     def __repr__(self) -> str:
         if self.index is not None:
@@ -60,48 +233,75 @@ class Style:
 
 class StyleCollection:
     """
-    ``doc.styles`` — paragraph-style collection (minimal Phase 3 impl).
+    ``doc.styles`` — paragraph-style collection.
 
-    Enumeration requires a live HWP runtime because HWP COM doesn't
-    expose a direct style list. This stub is Protocol-compliant; full
-    enumeration will land after Phase 4 when the HWPML-export path
-    is ported over from ``hwpapi/classes/styles.py``.
+    Enumeration is served from a cached :class:`StyleIndex` (one HWPML
+    head export per document per style-table change). Without a live
+    HWP runtime the collection is empty but still Protocol-compliant.
+    ``on_edit`` is called before :meth:`Style.apply` (the owning
+    document's transaction hook).
     """
 
-    __slots__ = ("_app",)
+    __slots__ = ("_app", "_raw", "_on_edit")
 
-    def __init__(self, app: "App") -> None:
+    def __init__(self, app: "App", raw=None,
+                 on_edit: Optional[Callable[[], None]] = None) -> None:
         self._app = app
+        self._raw = raw
+        self._on_edit = on_edit
+
+    # ------------------------------------------------------------------
+    # Index access
+    # ------------------------------------------------------------------
+
+    def _index(self) -> StyleIndex:
+        return _style_index(self._app, self._raw)
+
+    def _style_at(self, table: StyleIndex, i: int) -> Style:
+        info = table[i]
+        return Style(self._app, info.name, index=info.id, info=info, table=table,
+                     on_edit=self._on_edit)
+
+    def refresh(self) -> "StyleCollection":
+        """Re-export the style table (after edits made through raw ``app.api``)."""
+        _style_index(self._app, self._raw, refresh=True)
+        return self
 
     # ------------------------------------------------------------------
     # Collection protocol
     # ------------------------------------------------------------------
 
     def names(self) -> List[str]:
-        """Empty until HWPML-based enumeration is ported."""
-        return []
+        """Style names in style-table order."""
+        return self._index().names()
 
     def __iter__(self) -> Iterator[Style]:
-        return iter(())
+        table = self._index()
+        for i in range(len(table)):
+            yield self._style_at(table, i)
 
     def __len__(self) -> int:
-        return 0
+        return len(self._index())
 
     def __contains__(self, key) -> bool:
         if isinstance(key, Style):
-            return False
+            key = key.name
         if isinstance(key, str):
-            return key in self.names()
+            return self._index().position(key) is not None
         return False
 
     def __getitem__(self, key) -> Style:
         if isinstance(key, str):
+            table = self._index()
+            i = table.position(key)
+            if i is not None:
+                return self._style_at(table, i)
             # HWP validates the name on apply(); the wrapper is cheap.
-            return Style(self._app, key)
+            return Style(self._app, key, on_edit=self._on_edit)
         if isinstance(key, int):
-            names = self.names()
-            if 0 <= key < len(names):
-                return Style(self._app, names[key], index=key)
+            table = self._index()
+            if 0 <= key < len(table):
+                return self._style_at(table, key)
             raise IndexError(f"Style index {key} out of range")
         raise TypeError(
             f"Style key must be str or int, got {type(key).__name__}"
@@ -118,9 +318,15 @@ class StyleCollection:
             pset = impl.HParameterSet.HStyle
             impl.HAction.GetDefault("Style", pset.HSet)
             idx = int(pset.Apply)
-            return Style(self._app, f"style_{idx}", index=idx)
         except Exception:
             return None
+        table = self._index()
+        if 0 <= idx < len(table):
+            return self._style_at(table, idx)
+        return Style(self._app, f"style_{idx}", index=idx, on_edit=self._on_edit)
 
     def __repr__(self) -> str:
-        return "StyleCollection(<enumeration requires HWP runtime>)"
+        n = len(self._index())
+        if not n:
+            return "StyleCollection(<enumeration requires HWP runtime>)"
+        return f"StyleCollection(count={n})"
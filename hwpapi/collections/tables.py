@@ -16,6 +16,9 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING, Callable, Iterator, List, Optional
 
+from hwpapi.collections import _note_edit
+from hwpapi.low.lifetime import active_document_id, track as _track
+
 if TYPE_CHECKING:
     from hwpapi.core.app import App
 
@@ -83,6 +86,7 @@ class Cell:
                 impl.Run("Cancel")
             except Exception:
                 pass
+            _note_edit(self._app)
         return text.rstrip("\r\n")
 
     def select(self) -> bool:
@@ -95,7 +99,12 @@ class Cell:
         # lands inside it.
         if not self._table.select():
             return False
-        impl = self._app.engine.impl
+        try:
+            return self._navigate(self._app.engine.impl)
+        finally:
+            _note_edit(self._app)
+
+    def _navigate(self, impl) -> bool:
         try:
             # Prefer SetCellAddr when the runtime exposes it.
             setter = getattr(impl, "SetCellAddr", None)
@@ -122,12 +131,15 @@ class Cell:
 class Table:
     """Value object for a single table control."""
 
-    __slots__ = ("_app", "_ctrl", "index")
+    __slots__ = ("_app", "_ctrl", "index", "__weakref__")
 
-    def __init__(self, app: "App", ctrl, index: int) -> None:
+    def __init__(self, app: "App", ctrl, index: int,
+                 doc_id: Optional[int] = None) -> None:
         self._app = app
         self._ctrl = ctrl
         self.index = index
+        if ctrl is not None:
+            _track(app, self, "table", "_ctrl", doc_id)
 
     # ------------------------------------------------------------------
     # Metadata
@@ -215,6 +227,8 @@ class Table:
             return True
         except Exception:
             return False
+        finally:
+            _note_edit(self._app)
 
     def __repr__(self) -> str:
         cap = self.caption
@@ -257,6 +271,7 @@ class TableCollection:
     def _raw(self) -> List[Table]:
         out: List[Table] = []
         idx = 0
+        doc_id = None
         for ctrl in self._iter_ctrls():
             try:
                 cid = str(getattr(ctrl, "CtrlID", "") or "")
@@ -264,7 +279,9 @@ class TableCollection:
                 continue
             if cid != _TABLE_CTRL_ID:
                 continue
-            out.append(Table(self._app, ctrl, idx))
+            if idx == 0:  # the document these handles belong to (lifetime)
+                doc_id = active_document_id(self._app)
+            out.append(Table(self._app, ctrl, idx, doc_id))
             idx += 1
         return out
 
@@ -11,11 +11,19 @@ Re-exported names::
     charshape_scope   # context manager — char formatting block
     parashape_scope   # context manager — paragraph formatting block
     styled_text       # one-shot — insert styled text then restore
+    styled_runs       # one-shot — many (text, fmt) runs, delta-applied
+    invalidate_cursor_format  # drop the cached cursor format after raw api edits
 
 See :mod:`hwpapi.context.scopes` for details and the decision tree.
 """
 from __future__ import annotations
 
-from .scopes import charshape_scope, parashape_scope, styled_text
+from .scopes import (
+    charshape_scope, invalidate_cursor_format, parashape_scope, styled_runs,
+    styled_text,
+)
 
-__all__ = ["charshape_scope", "parashape_scope", "styled_text"]
+__all__ = [
+    "charshape_scope", "parashape_scope", "styled_text", "styled_runs",
+    "invalidate_cursor_format",
+]
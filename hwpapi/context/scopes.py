@@ -1,7 +1,7 @@
 """
 :mod:`hwpapi.context.scopes` — formatting context managers + one-shot helper.
 
-Three public names, all module-level (so they work uniformly whether
+Four public names, all module-level (so they work uniformly whether
 the caller is driving an :class:`~hwpapi.core.app.App`, a nested
 :class:`~hwpapi.document.Document` facade, or something else):
 
@@ -15,6 +15,11 @@ the caller is driving an :class:`~hwpapi.core.app.App`, a nested
      - one-shot (plain function, returns ``None``)
      - You want to insert a short run of text with a different style and
        have the cursor formatting snap back immediately afterwards.
+   * - :func:`styled_runs`
+     - one-shot (plain function, returns ``None``)
+     - A sequence of differently formatted runs (a paragraph with many
+       bold / coloured fragments). Only the format delta between
+       consecutive runs is applied; the baseline is restored once.
    * - :func:`charshape_scope`
      - ``with`` block
      - You're doing several char-level operations (insert_text,
@@ -28,10 +33,11 @@ the caller is driving an :class:`~hwpapi.core.app.App`, a nested
 Decision tree — "what should I pick?"::
 
     Single line of text with a tweak?            → styled_text(app, "...", ...)
+    Many runs with different tweaks?             → styled_runs(app, [(text, fmt), ...])
     Multiple ops sharing char format?            → with charshape_scope(app, ...):
     Paragraph alignment/line-spacing block?      → with parashape_scope(app, ...):
 
-All three drive formatting through the public escape hatch
+All of them drive formatting through the public escape hatch
 ``app.actions`` and the raw HWP COM ``HParameterSet`` / ``HAction`` —
 no reliance on removed v1 App members.
 
@@ -39,9 +45,20 @@ Implementation notes
 --------------------
 Both scopes snapshot the cursor's current char/para shape by running
 ``HAction.GetDefault("CharShape", hset)`` and reading back the keys the
-caller is about to override. On exit the snapshot is re-applied
-verbatim, so the user's baseline formatting survives the block even
-if the caller's code raised inside.
+caller is about to override. On exit the snapshot is re-applied, so the
+user's baseline formatting survives the block even if the caller's code
+raised inside.
+
+What hwpapi knows about the cursor format is cached per App
+(:class:`_CursorFormat`). Only keys that are not cached are read, only
+keys whose value actually changes are written, and no ``Execute`` is
+issued when the effective shape is unchanged — nested scopes therefore
+cost one delta each, and restoring only touches the keys that differ.
+The cache is trusted while the cursor position (``GetPos``) and the
+edit epoch (bumped by every ``_Action.run`` and by ``Document`` edits)
+are unchanged; text inserted through hwpapi keeps it. Code that
+changes formatting through raw ``app.api`` calls without moving the
+cursor should call :func:`invalidate_cursor_format`.
 
 ``styled_text`` is a plain function (not a context manager) — it opens
 a :func:`charshape_scope`, issues a single ``InsertText`` action, then
@@ -49,8 +66,9 @@ lets the scope's ``__exit__`` restore.
 """
 from __future__ import annotations
 
+import weakref
 from contextlib import contextmanager
-from typing import Any, Dict, Iterable, Mapping, Optional
+from typing import Any, Dict, Iterable, Mapping, Optional, Tuple
 
 from hwpapi.logging import get_logger
 
@@ -119,49 +137,194 @@ def _normalise_align(value: Any) -> Any:
 # ---------------------------------------------------------------------
 
 def _hparameterset(app, slot: str):
-    """Return ``app.api.HParameterSet.H<slot>`` — one place to fail early."""
+    """Return ``app.api.HParameterSet.H<slot>`` — one place to fail early.
+
+    The node proxy is cached on the App's shared ``HParamBackend``, so
+    repeated scopes do not re-walk ``HParameterSet`` over COM.
+    """
+    from hwpapi.low.parametersets.backends import hparameterset_backend
+
     try:
-        return getattr(app.api.HParameterSet, f"H{slot}")
+        return hparameterset_backend(app).node(f"H{slot}")
     except Exception as exc:  # pragma: no cover — defensive, HWP should have it
-        logger.debug(f"_hparameterset({slot!r}): {exc!r}")
+        logger.debug("_hparameterset(%r): %r", slot, exc)
         raise
 
 
+def _hset(app, slot: str):
+    """``H<slot>.HSet`` — cached alongside the node itself."""
+    from hwpapi.low.parametersets.backends import hparameterset_backend
+
+    return hparameterset_backend(app).node(f"H{slot}.HSet")
+
+
 def _snapshot(app, action_name: str, slot: str, keys: Iterable[str]) -> Dict[str, Any]:
     """Capture the cursor's current values for the named COM keys."""
     hpset = _hparameterset(app, slot)
     try:
-        app.api.HAction.GetDefault(action_name, hpset.HSet)
+        app.api.HAction.GetDefault(action_name, _hset(app, slot))
     except Exception as exc:
-        logger.debug(f"_snapshot GetDefault {action_name!r}: {exc!r}")
+        logger.debug("_snapshot GetDefault %r: %r", action_name, exc)
 
     snap: Dict[str, Any] = {}
     for k in keys:
         try:
             snap[k] = getattr(hpset, k)
         except Exception as exc:
-            logger.debug(f"_snapshot read {k!r}: {exc!r}")
+            logger.debug("_snapshot read %r: %r", k, exc)
     return snap
 
 
-def _apply(app, action_name: str, slot: str, values: Mapping[str, Any]) -> None:
-    """Set values on the HParameterSet slot and Execute the action."""
+def _apply(app, action_name: str, slot: str, values: Mapping[str, Any],
+           load_default: bool = True) -> bool:
+    """Set values on the HParameterSet slot and Execute the action.
+
+    ``load_default=False`` skips the ``GetDefault`` reload when the caller
+    knows the slot already mirrors the cursor format (e.g. right after a
+    previous ``_apply`` in the same :func:`styled_runs` sequence).
+
+    Returns ``True`` only if ``Execute`` reported success — callers update
+    the cursor-format cache only then.
+    """
     hpset = _hparameterset(app, slot)
-    try:
-        app.api.HAction.GetDefault(action_name, hpset.HSet)
-    except Exception as exc:
-        logger.debug(f"_apply GetDefault {action_name!r}: {exc!r}")
+    if load_default:
+        try:
+            app.api.HAction.GetDefault(action_name, _hset(app, slot))
+        except Exception as exc:
+            logger.debug("_apply GetDefault %r: %r", action_name, exc)
 
     for k, v in values.items():
         try:
             setattr(hpset, k, v)
         except Exception as exc:
-            logger.debug(f"_apply set {k!r}={v!r}: {exc!r}")
+            logger.debug("_apply set %r=%r: %r", k, v, exc)
 
     try:
-        app.api.HAction.Execute(action_name, hpset.HSet)
+        return bool(app.api.HAction.Execute(action_name, _hset(app, slot)))
     except Exception as exc:
-        logger.debug(f"_apply Execute {action_name!r}: {exc!r}")
+        logger.debug("_apply Execute %r: %r", action_name, exc)
+        return False
+
+
+def _record(known: Dict[str, Any], values: Mapping[str, Any], ok: bool) -> None:
+    """Cache ``values`` as the cursor format if the Execute went through.
+
+    A failed Execute leaves the cursor format unknown for those keys, so
+    they are dropped and re-read by the next scope.
+    """
+    if ok:
+        known.update(values)
+    else:
+        for k in values:
+            known.pop(k, None)
+
+
+# ---------------------------------------------------------------------
+# Cursor-format cache
+# ---------------------------------------------------------------------
+
+class _CursorFormat:
+    """hwpapi's view of the cursor char/para shape for one App.
+
+    ``values`` is ``{slot: {com_key: value}}`` — only keys that were read
+    or written by a scope. ``token`` is ``(edit_epoch, GetPos())`` at the
+    time ``values`` was last known to be right; ``doc`` the id of the raw
+    document hwpapi last activated.
+    """
+
+    __slots__ = ("token", "values", "doc")
+
+    def __init__(self) -> None:
+        self.token: Any = None
+        self.values: Dict[str, Dict[str, Any]] = {}
+        self.doc: Optional[int] = None
+
+
+_states: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+_MISSING = object()
+
+
+def _token(app) -> Any:
+    from hwpapi.low.actions import edit_epoch
+
+    try:
+        pos = tuple(app.api.GetPos())
+    except Exception:
+        return None  # unknown position — never matches
+    return (edit_epoch(), pos)
+
+
+def _state(app) -> _CursorFormat:
+    """The App's cursor-format cache, revalidated against the cursor (1 COM call)."""
+    state = _states.get(app)
+    if state is None:
+        state = _states[app] = _CursorFormat()
+    token = _token(app)
+    if token is None or token != state.token:
+        state.values.clear()
+    state.token = token
+    return state
+
+
+def invalidate_cursor_format(app) -> None:
+    """Forget the cached cursor format of ``app`` (next scope re-reads it)."""
+    state = _states.get(app)
+    if state is not None:
+        state.values.clear()
+        state.token = None
+
+
+def _note_active_document(app, raw) -> None:
+    """Called by ``Document.activate`` — switching documents drops the cache."""
+    state = _states.get(app)
+    if state is not None and state.doc != id(raw):
+        state.values.clear()
+        state.token = None
+        state.doc = id(raw)
+
+
+def _format_cache_valid(app, raw=None) -> bool:
+    """True if ``app`` has a cached cursor format that still holds (1 COM call).
+
+    ``raw`` — the document about to be edited; the cache must belong to it.
+    """
+    state = _states.get(app)
+    if state is None or state.token is None or not state.values:
+        return False
+    if raw is not None and state.doc not in (None, id(raw)):
+        return False
+    return _token(app) == state.token
+
+
+def _carry_format(app) -> None:
+    """After inserting text through hwpapi: same format, new cursor position."""
+    state = _states.get(app)
+    if state is not None:
+        state.token = _token(app)
+
+
+@contextmanager
+def _format_scope(app, action_name: str, slot: str, values: Mapping[str, Any]):
+    """Apply the delta ``values`` makes to the cached format; undo it on exit."""
+    state = _state(app)
+    known = state.values.setdefault(slot, {})
+    missing = [k for k in values if k not in known]
+    if missing:
+        known.update(_snapshot(app, action_name, slot, missing))
+
+    changes = {k: v for k, v in values.items() if known.get(k, _MISSING) != v}
+    saved = {k: known[k] for k in changes if k in known}
+    if changes:
+        _record(known, changes, _apply(app, action_name, slot, changes))
+    try:
+        yield
+    finally:
+        if saved:
+            current = _state(app).values.get(slot, {})
+            restore = {k: v for k, v in saved.items() if current.get(k, _MISSING) != v}
+            if restore:
+                ok = _apply(app, action_name, slot, restore)
+                _record(state.values.setdefault(slot, {}), restore, ok)
 
 
 # ---------------------------------------------------------------------
@@ -194,13 +357,8 @@ def charshape_scope(app, **fmt: Any):
     _ = app.actions.CharShape
 
     translated = _translate(fmt, _CHAR_ALIAS)
-    snap = _snapshot(app, "CharShape", "CharShape", translated.keys())
-    _apply(app, "CharShape", "CharShape", translated)
-    try:
+    with _format_scope(app, "CharShape", "CharShape", translated):
         yield
-    finally:
-        if snap:
-            _apply(app, "CharShape", "CharShape", snap)
 
 
 @contextmanager
@@ -226,13 +384,8 @@ def parashape_scope(app, **fmt: Any):
     if "AlignType" in translated:
         translated["AlignType"] = _normalise_align(translated["AlignType"])
 
-    snap = _snapshot(app, "ParaShape", "ParaShape", translated.keys())
-    _apply(app, "ParaShape", "ParaShape", translated)
-    try:
+    with _format_scope(app, "ParaShape", "ParaShape", translated):
         yield
-    finally:
-        if snap:
-            _apply(app, "ParaShape", "ParaShape", snap)
 
 
 def styled_text(app, text: str, **fmt: Any) -> None:
@@ -260,6 +413,82 @@ def styled_text(app, text: str, **fmt: Any) -> None:
     """
     with charshape_scope(app, **fmt):
         _insert_text(app, text)
+        _carry_format(app)
+
+
+def styled_runs(app, runs: Iterable[Tuple[str, Mapping[str, Any]]]) -> None:
+    """Insert a sequence of ``(text, fmt)`` runs with minimal shape executions.
+
+    Each run is formatted as *baseline + fmt* — exactly what calling
+    :func:`styled_text` once per run would produce — but only the keys
+    that differ from the previous run are applied, one ``InsertText``
+    action / pset is reused for every run, and the caller's baseline is
+    restored once at the end (only for keys that actually changed).
+
+    Parameters
+    ----------
+    app : hwpapi.App
+    runs : iterable of (str, mapping)
+        Text and its char-shape overrides (same friendly keys as
+        :func:`charshape_scope`; ``{}`` / ``None`` means baseline).
+
+    Example
+    -------
+    >>> styled_runs(app, [
+    ...     ("합계: ", {}),
+    ...     ("1,250", {"bold": True, "color": 0x0000FF}),
+    ...     (" 원 (", {}),
+    ...     ("+12%", {"color": 0x00AA00}),
+    ...     (")", {}),
+    ... ])
+    """
+    _ = app.actions.CharShape
+    state = _state(app)
+    known = state.values.setdefault("CharShape", {})
+    baseline: Dict[str, Any] = {}   # caller's value of every key a run touched
+
+    action = app.actions.InsertText
+    pset = action.pset
+    # After the first GetDefault / Execute the HCharShape slot mirrors the
+    # cursor format, and InsertText does not touch it — later deltas skip
+    # the reload.
+    slot_current = False
+    try:
+        for text, fmt in runs:
+            if not text:
+                continue
+            translated = _translate(fmt or {}, _CHAR_ALIAS)
+            desired = {k: v for k, v in baseline.items() if k not in translated}
+            desired.update(translated)
+
+            missing = [k for k in desired if k not in known]
+            if missing:
+                known.update(_snapshot(app, "CharShape", "CharShape", missing))
+                slot_current = True
+            for k in translated:
+                if k not in baseline and k in known:
+                    baseline[k] = known[k]
+
+            changes = {k: v for k, v in desired.items() if known.get(k, _MISSING) != v}
+            if changes:
+                ok = _apply(app, "CharShape", "CharShape", changes,
+                            load_default=not slot_current)
+                _record(known, changes, ok)
+                # A failed Execute leaves our values in the slot, not the
+                # cursor's — reload it before the next delta.
+                slot_current = ok
+
+            try:
+                pset.Text = text
+                action.run(pset)
+            except Exception as exc:
+                logger.debug("styled_runs InsertText failed: %r", exc)
+    finally:
+        restore = {k: v for k, v in baseline.items() if known.get(k, _MISSING) != v}
+        if restore:
+            ok = _apply(app, "CharShape", "CharShape", restore, load_default=not slot_current)
+            _record(known, restore, ok)
+        _carry_format(app)
 
 
 def _insert_text(app, text: str) -> None:
@@ -276,4 +505,4 @@ def _insert_text(app, text: str) -> None:
                 continue
         action.run(pset)
     except Exception as exc:
-        logger.debug(f"_insert_text failed: {exc!r}")
+        logger.debug("_insert_text failed: %r", exc)
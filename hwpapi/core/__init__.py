@@ -3,6 +3,8 @@ Core API for hwpapi v2: :class:`App` and re-exported engine handles.
 
 - :mod:`hwpapi.low.engine`  — :class:`Engine`, :class:`Engines`, :class:`Apps`
 - :mod:`hwpapi.core.app`   — :class:`App` (slim v2 facade, ≤15 public members)
+- :mod:`hwpapi.core.pool`  — :class:`~hwpapi.core.pool.EnginePool` (warm
+  standby engines behind ``App.acquire()`` / ``app.release()``)
 
 All public names are re-exported at package root:
 
@@ -11,7 +13,32 @@ All public names are re-exported at package root:
 """
 from __future__ import annotations
 
-from hwpapi.low.engine import Engine, Engines, Apps
-from .app import App
+import importlib
+
+TYPE_CHECKING = False  # avoid importing ``typing`` just for this flag
 
 __all__ = ["Engine", "Engines", "Apps", "App"]
+
+_LAZY_ATTRS = {
+    "Engine": "hwpapi.low.engine",
+    "Engines": "hwpapi.low.engine",
+    "Apps": "hwpapi.low.engine",
+    "App": "hwpapi.core.app",
+}
+
+if TYPE_CHECKING:
+    from hwpapi.low.engine import Engine, Engines, Apps
+    from .app import App
+
+
+def __getattr__(name: str):
+    module = _LAZY_ATTRS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module), name)
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
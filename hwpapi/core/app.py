@@ -20,6 +20,7 @@ Public surface (14 kept members + ``actions``)::
     __init__  __enter__  __exit__
     api  close  doc  engine  new  open  quit  reload  save  save_as  visible
     actions   # low-level escape hatch per audit §1.5
+    acquire  release   # warm standby pool (hwpapi.core.pool)
 """
 from __future__ import annotations
 
@@ -32,6 +33,7 @@ from hwpapi.low.actions import _Actions
 from hwpapi.low.engine import Engine, Engines, Apps
 from hwpapi.functions import check_dll, get_absolute_path
 from hwpapi.logging import get_logger
+from hwpapi import tracing as _tracing
 
 __all__ = ["Engine", "Engines", "Apps", "App"]
 
@@ -78,18 +80,19 @@ class App:
     ) -> None:
         self._logger = get_logger("core")
         self._logger.debug(
-            f"Initializing App (new_app={new_app}, is_visible={is_visible}, "
-            f"dll_path={dll_path})"
+            "Initializing App (new_app=%s, is_visible=%s, dll_path=%s)",
+            new_app, is_visible, dll_path,
         )
 
-        self._load(new_app=new_app, dll_path=dll_path, engine=engine)
+        with _tracing.span("app.start", new_app=new_app, attach=engine is not None):
+            self._load(new_app=new_app, dll_path=dll_path, engine=engine)
 
         # Low-level action dispatcher — escape hatch per audit §1.5.
         self.actions = _Actions(self)
 
         # Window visibility via the canonical property setter.
         self.visible = is_visible
-        self._logger.info(f"App window visibility set to: {is_visible}")
+        self._logger.info("App window visibility set to: %s", is_visible)
 
         # Lazy DocumentCollection cache (see `.docs`).
         self._docs_cache = None
@@ -120,7 +123,55 @@ class App:
             # Ensure a blank document exists (``FileNew`` is idempotent).
             app.api.Run("FileNew")
         except Exception as exc:  # pragma: no cover — logged, non-fatal
-            app._logger.warning(f"new(): FileNew failed: {exc}")
+            app._logger.warning("new(): FileNew failed: %s", exc)
+        return app
+
+    @classmethod
+    def acquire(cls, wait: float = 0.0) -> "App":
+        """
+        Check out a warm, hidden :class:`App` from the standby pool.
+
+        Skips the seconds-long engine launch + DLL registration of
+        ``App(new_app=True)`` — engines are launched ahead of time by
+        :func:`hwpapi.core.pool.default_pool` (``HWPAPI_POOL_SIZE``
+        standby engines, default 2). Hand it back with :meth:`release`.
+
+        Parameters
+        ----------
+        wait : float, optional
+            Seconds to wait for a standby engine before launching one
+            inline.
+        """
+        from hwpapi.core.pool import default_pool
+
+        return default_pool().acquire(wait)
+
+    def release(self) -> None:
+        """
+        Return an :meth:`acquire`-d App to its pool.
+
+        Open documents are closed **without saving**; the App must not
+        be used afterwards.
+
+        Raises
+        ------
+        InvalidArgumentError
+            This App did not come from :meth:`acquire`.
+        """
+        pool = getattr(self, "_pool", None)
+        if pool is None:
+            from hwpapi.errors import InvalidArgumentError
+            raise InvalidArgumentError("release(): App was not acquired from a pool")
+        pool.release(self)
+
+    @classmethod
+    def _adopt(cls, engine: Engine) -> "App":
+        """Wrap an already launched + registered engine (pool checkout)."""
+        app = cls.__new__(cls)
+        app._logger = get_logger("core")
+        app.engine = engine
+        app.actions = _Actions(app)
+        app._docs_cache = None
         return app
 
     def __enter__(self) -> "App":
@@ -128,11 +179,14 @@ class App:
 
     def __exit__(self, exc_type, exc, tb) -> None:
         # Close the document cleanly; propagate any exception raised
-        # inside the `with` block.
+        # inside the `with` block. Pooled Apps go back to their pool.
         try:
-            self.quit()
+            if getattr(self, "_pool", None) is not None:
+                self.release()
+            else:
+                self.quit()
         except Exception as close_exc:  # pragma: no cover
-            self._logger.warning(f"__exit__: quit() raised: {close_exc}")
+            self._logger.warning("__exit__: quit() raised: %s", close_exc)
 
     # ------------------------------------------------------------------
     # Internal plumbing — not part of the public surface.
@@ -153,9 +207,7 @@ class App:
             engine = Engine()
             self._logger.debug("Created new engine for new_app")
         if not engine:
-            engines = Engines()
-            engine = engines[-1] if len(engines) > 0 else Engine()
-            self._logger.debug("Selected engine from engines collection")
+            engine = self._select_engine()
 
         self.engine = engine
         self._logger.info("Engine loaded successfully")
@@ -166,7 +218,7 @@ class App:
             dll_path = get_hwp_dll_path()
 
         if dll_path is not None:
-            self._logger.info(f"Registering DLL: {dll_path}")
+            self._logger.info("Registering DLL: %s", dll_path)
             check_dll(dll_path)
         else:
             self._logger.warning(
@@ -180,12 +232,27 @@ class App:
             self._logger.debug("Registered FilePathCheckDLL module")
         except Exception as exc:
             self._logger.warning(
-                f"Failed to register FilePathCheckDLL module: {exc}"
+                "Failed to register FilePathCheckDLL module: %s", exc
             )
             warnings.warn(
                 f"Failed to register FilePathCheckDLL module: {exc}"
             )
 
+    def _select_engine(self) -> Engine:
+        """
+        Newest running engine that binds, or a fresh :class:`Engine`.
+
+        ROT entries bind lazily, so a process that exited after the ROT
+        walk only shows up here as ``impl is None`` — skip it and try the
+        previous entry instead of wrapping a dead engine.
+        """
+        for candidate in reversed(Engines().engines):
+            if candidate.impl is not None:
+                self._logger.debug("Selected engine from engines collection")
+                return candidate
+            self._logger.warning("Skipping engine that failed to bind: %r", candidate)
+        return Engine()
+
     # ------------------------------------------------------------------
     # Properties
     # ------------------------------------------------------------------
@@ -228,8 +295,13 @@ class App:
 
     def quit(self) -> None:
         """Terminate the HWP engine (``FileQuit`` command)."""
+        from hwpapi.functions import invalidate_rot_cache
+        from hwpapi.low.lifetime import release_all
+
         self._logger.debug("quit()")
         self.api.Run("FileQuit")
+        release_all(self)
+        invalidate_rot_cache()
 
     def reload(self, new_app: bool = False, dll_path: Optional[str] = None) -> None:
         """
@@ -239,11 +311,59 @@ class App:
         out from under the Python binding. Also invalidates the cached
         :attr:`docs` collection.
         """
-        self._logger.debug(f"reload(new_app={new_app})")
+        self._logger.debug("reload(new_app=%s)", new_app)
+        from hwpapi.low.lifetime import release_all
+
+        release_all(self)  # handles into the old engine are dead
         self._load(new_app=new_app, dll_path=dll_path)
         # Reset DocumentCollection cache so `.docs` rebinds to the new engine.
         self._docs_cache = None
 
+    def gc_report(self, verify: bool = True) -> dict:
+        """
+        Live COM proxies hwpapi created for this App, and what leaked.
+
+        Returns a dict with
+
+        - ``live`` — tracked proxies still holding a handle, by kind
+          (``"table"``, ``"image"``, ``"paragraph"``, ``"document"``,
+          ``"action"``);
+        - ``by_document`` — handles per document ID, by kind (``"action"``
+          / ``"pset"`` count ``_Action`` cache entries); ``None`` collects
+          proxies made before hwpapi saw an active document;
+        - ``created`` / ``collected`` / ``released`` — lifetime counters:
+          proxies made, garbage-collected while holding a handle, and
+          handles dropped by ``Document.close`` / :meth:`quit`;
+        - ``closed_documents`` — documents released so far;
+        - ``open_documents`` / ``leaks`` — with ``verify`` (one
+          ``DocumentID`` read per open document), the open IDs and the
+          handles, by kind, that still point into a document no longer
+          open. Both are ``None`` without ``verify`` or when the engine
+          cannot be queried.
+
+        Examples
+        --------
+        >>> report = app.gc_report()
+        >>> report["live"]
+        {'action': 12, 'paragraph': 200}
+        >>> report["leaks"]
+        {}
+        """
+        from hwpapi.low.lifetime import LifetimeRegistry, lifetime_registry
+
+        open_documents = None
+        if verify:
+            try:
+                docs = self.api.XHwpDocuments
+                open_documents = [int(docs.Item(i).DocumentID)
+                                  for i in range(int(docs.Count))]
+            except Exception as e:
+                self._logger.debug("gc_report: open documents: %s", e)
+        registry = lifetime_registry(self, create=False)
+        if registry is None:
+            registry = LifetimeRegistry()
+        return registry.report(open_documents)
+
     # ------------------------------------------------------------------
     # Private helpers
     # ------------------------------------------------------------------
@@ -13,8 +13,101 @@ Public types re-exported from :mod:`hwpapi.core`:
 """
 from __future__ import annotations
 
+import inspect
+import weakref
+
+from hwpapi.logging import get_logger
+from hwpapi.low.lifetime import active_document_id, release_document
+from hwpapi.low.lifetime import document_id as _raw_document_id
+
 __all__ = ["Document", "Documents"]
 
+_MISSING = object()
+
+# {App type: {name: _AppMember}} — how Document.__getattr__ proxies each
+# App attribute, classified once per App type instead of on every access.
+_APP_MEMBERS: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+class _AppMember:
+    """App 속성 하나의 프록시 방식 — ``property`` / ``method`` / ``attribute``."""
+
+    __slots__ = ("name", "kind", "prop", "doc")
+
+    def __init__(self, name: str, kind: str, prop=None, doc: str = "") -> None:
+        self.name = name
+        self.kind = kind
+        self.prop = prop
+        self.doc = doc
+
+
+def _classify(app_type: type, name: str) -> _AppMember:
+    static = inspect.getattr_static(app_type, name, _MISSING)
+    if isinstance(static, property):
+        return _AppMember(name, "property", prop=static)
+    if isinstance(static, (staticmethod, classmethod)) or (
+        static is not _MISSING and (
+            inspect.isroutine(static) or inspect.ismethoddescriptor(static)
+        )
+    ):
+        return _AppMember(name, "method", doc=_proxied_doc(name, static))
+    # Class-level accessor/data, or an instance attribute (app.actions,
+    # app.engine) — resolved on the App at access time.
+    return _AppMember(name, "attribute")
+
+
+def _proxied_doc(name: str, func) -> str:
+    if isinstance(func, (staticmethod, classmethod)):
+        func = func.__func__
+    return (
+        f"[Proxied from App.{name}] — 호출 시 이 문서가 활성 문서가 아니면 "
+        f"활성창으로 전환한 뒤 App.{name} 을 실행합니다.\n\n"
+        f"{getattr(func, '__doc__', '') or ''}"
+    )
+
+
+def _app_member(app_type: type, name: str) -> _AppMember:
+    """``app_type`` 의 ``name`` 분류 — App 타입마다 이름당 한 번만 계산."""
+    members = _APP_MEMBERS.get(app_type)
+    if members is None:
+        members = _APP_MEMBERS[app_type] = {}
+    member = members.get(name)
+    if member is None:
+        member = members[name] = _classify(app_type, name)
+    return member
+
+
+class _ProxiedMethod:
+    """
+    ``doc.<App 메소드>`` — 호출 시 문서를 (필요하면) 활성화하고 App 메소드 실행.
+
+    문서마다 이름당 한 번 만들어 ``Document`` 인스턴스에 캐시되므로 이후
+    접근은 ``__getattr__`` 을 거치지 않습니다.
+    """
+
+    __slots__ = ("_doc", "_func", "_member")
+
+    def __init__(self, doc: "Document", func, member: _AppMember) -> None:
+        self._doc = doc
+        self._func = func
+        self._member = member
+
+    def __call__(self, *args, **kwargs):
+        self._doc._ensure_active()
+        return self._func(*args, **kwargs)
+
+    @property
+    def __name__(self) -> str:
+        return self._member.name
+
+    @property
+    def __doc__(self) -> str:
+        return self._member.doc
+
+    def __repr__(self) -> str:
+        return f"<proxied App.{self._member.name} of {self._doc!r}>"
+
+
 class Document:
     """
     여러 HWP 문서 중 **하나** 를 감싼 핸들.
@@ -41,9 +134,14 @@ class Document:
     #
     # Document 자체에 정의된 속성/메소드 (file I/O, 상태 조회) 는 그대로
     # 쓰고, 그 외의 이름 — insert_text, set_charshape, find_text, move,
-    # actions 등 — 을 ``doc.foo`` 로 접근하면 자동으로 (1) 이 문서를 활성
-    # 창으로 전환, (2) App 의 동일 이름 메소드/속성 호출, (3) 원래 활성
-    # 문서로 복원 후 결과 반환하도록 프록시합니다.
+    # actions 등 — 을 ``doc.foo`` 로 접근하면 자동으로 (1) 이 문서가 활성
+    # 문서가 아니면 활성창으로 전환, (2) App 의 동일 이름 메소드/속성을
+    # 호출하도록 프록시합니다. 활성 여부는 호출마다 HWP 의 활성 문서 ID
+    # 를 읽어 판단합니다 (전환 + 대기보다 훨씬 쌈).
+    #
+    # App 속성의 분류 (property / method / 그 외) 는 App 타입마다 이름당
+    # 한 번만 계산하고 (``_APP_MEMBERS``), 메소드 프록시는 문서 인스턴스에
+    # 캐시해 두 번째 접근부터는 ``__getattr__`` 을 거치지 않습니다.
     #
     # 예:
     #     doc.insert_text("...")        # app.insert_text 와 동일하지만
@@ -54,6 +152,8 @@ class Document:
     #     doc.actions.SelectAll.run()   # activate → 접근자 반환
     #     doc.move.top_of_file()
 
+    logger = get_logger("core.document")
+
     def __init__(self, raw_doc, documents=None):
         # NOTE: set via object.__setattr__ to avoid __getattr__ recursion
         # during init (before attributes exist).
@@ -74,11 +174,10 @@ class Document:
             return
         app = getattr(self, "_app", None)
         if app is not None:
-            import inspect as _inspect
-            cls_attr = _inspect.getattr_static(type(app), name, None)
-            if isinstance(cls_attr, property) and cls_attr.fset is not None:
-                self.activate()
-                cls_attr.fset(app, value)
+            member = _app_member(type(app), name)
+            if member.kind == "property" and member.prop.fset is not None:
+                self._ensure_active()
+                member.prop.fset(app, value)
                 return
         object.__setattr__(self, name, value)
 
@@ -86,9 +185,11 @@ class Document:
         """
         Proxy to ``self._app`` for any name not defined on Document itself.
 
-        Callable → wrapped to auto-activate the document before calling.
-        Non-callable (e.g. ``app.move`` accessor) → activate then return
-        the attribute (caller should use it immediately).
+        Method → cached proxy that activates the document (if it is not
+        already the active one) before calling. Property → activate, then
+        run the getter. Anything else (e.g. ``app.move`` accessor) →
+        activate then return the attribute (caller should use it
+        immediately).
         """
         # Python calls __getattr__ only when normal lookup fails,
         # so we won't interfere with Document's own attrs.
@@ -105,54 +206,56 @@ class Document:
         # If it's a PROPERTY on App, activate this doc FIRST, then
         # evaluate the getter — so ``doc.text`` returns THIS doc's text,
         # not the previously-active doc's.
-        import inspect as _inspect
-        cls_attr = _inspect.getattr_static(type(app), name, None)
-        if isinstance(cls_attr, property):
-            self.activate()
-            if cls_attr.fget is None:
+        member = _app_member(type(app), name)
+        if member.kind == "property":
+            self._ensure_active()
+            if member.prop.fget is None:
                 raise AttributeError(f"property {name!r} has no getter")
-            return cls_attr.fget(app)
+            return member.prop.fget(app)
 
-        if not hasattr(app, name):
+        attr = getattr(app, name, _MISSING)
+        if attr is _MISSING:
             raise AttributeError(
                 f"{type(self).__name__!r} has no attribute {name!r}; "
                 f"App also does not have it"
             )
 
-        attr = getattr(app, name)
-
-        # Distinguish REAL methods/functions from callable accessor
-        # instances (MoveAccessor, _Actions etc. have __call__ in some
-        # cases, but we should NOT wrap those — the user wants
-        # `doc.move.top_of_file()`, not `doc.move()`).
-        import inspect as _inspect
-        is_routine = (
-            _inspect.isroutine(attr) or                   # function/method/builtin
-            _inspect.ismethoddescriptor(attr) or
-            _inspect.isbuiltin(attr)
-        )
-
-        if is_routine:
-            # Method → wrap with auto-activation
-            def wrapped(*args, **kwargs):
-                with app.use_document(self):
-                    return attr(*args, **kwargs)
-            wrapped.__name__ = name
-            wrapped.__qualname__ = f"Document.{name} (proxied)"
-            wrapped.__doc__ = (
-                f"[Proxied from App.{name}] — 호출 시 이 문서를 활성창으로 "
-                f"전환한 뒤 App.{name} 을 실행하고 원래 활성 문서로 복원합니다.\n\n"
-                f"{getattr(attr, '__doc__', '') or ''}"
-            )
-            return wrapped
+        # Only REAL methods/functions are wrapped — callable accessor
+        # instances (MoveAccessor, _Actions etc.) are returned as-is so
+        # the user writes `doc.move.top_of_file()`, not `doc.move()`.
+        if member.kind == "method":
+            proxied = _ProxiedMethod(self, attr, member)
+            object.__setattr__(self, name, proxied)  # later hits skip __getattr__
+            return proxied
 
         # Accessor object (app.move, app.actions, app.cell, app.table,
-        # app.page, app.documents) or plain attribute (app.api,
+        # app.page, app.documents) or plain attribute (app.engine,
         # app.parameters): activate this doc FIRST so subsequent
         # calls on the returned object go to this doc's context.
-        self.activate()
+        self._ensure_active()
         return attr
 
+    def _ensure_active(self) -> None:
+        """
+        이 문서가 지금 HWP 의 활성 문서가 아니면 :meth:`activate`.
+
+        활성 문서의 ``DocumentID`` 를 매번 읽어 (COM 3회) 비교하므로
+        ``docs.add()`` / raw COM / HWP UI 로 활성 문서가 바뀌어도 맞고,
+        이미 활성이면 ``SetActive_XHwpDocument`` + 50 ms 대기를 건너뜁니다.
+        """
+        doc_id = self._document_id()
+        if doc_id is None or active_document_id(self._app) != doc_id:
+            self.activate()
+
+    def _document_id(self):
+        """``document_id`` 를 int 로 — 처음 한 번만 읽어 캐시. 실패 시 ``None``."""
+        doc_id = self.__dict__.get("_doc_id")
+        if doc_id is None:
+            doc_id = _raw_document_id(self.raw)
+            if doc_id is not None:
+                object.__setattr__(self, "_doc_id", doc_id)
+        return doc_id
+
     # ── 조회용 속성 ──────────────────────────────────────────
 
     @property
@@ -231,7 +334,7 @@ class Document:
             self.raw.SetActive_XHwpDocument()
         except Exception as e:
             self.logger.debug(
-                f"activate: {type(e).__name__}: {e}",
+                "activate: %s: %s", type(e).__name__, e,
                 exc_info=True,
             )
 
@@ -241,7 +344,7 @@ class Document:
             pythoncom.PumpWaitingMessages()
         except Exception as e:
             self.logger.debug(
-                f"activate: {type(e).__name__}: {e}",
+                "activate: %s: %s", type(e).__name__, e,
                 exc_info=True,
             )
         _time.sleep(0.05)
@@ -265,10 +368,14 @@ class Document:
 
     def close(self, save: bool = False) -> bool:
         """이 문서만 닫기. ``save=True`` 면 저장 후 닫기."""
+        doc_id = self._document_id()
         try:
-            return bool(self.raw.Close(save))
+            closed = bool(self.raw.Close(save))
         except Exception:
             return False
+        if self._app is not None and doc_id is not None:
+            release_document(self._app, doc_id, self.raw)
+        return closed
 
     def clear(self) -> bool:
         """문서 내용 비우기 (새 문서처럼)."""
@@ -325,6 +432,8 @@ class Documents:
     >>> app.documents.close_all()
     """
 
+    logger = get_logger("core.document")
+
     def __init__(self, app):
         self._app = app
 
@@ -394,7 +503,7 @@ class Documents:
                     closed += 1
             except Exception as e:
                 self.logger.debug(
-                    f"close_all: {type(e).__name__}: {e}",
+                    "close_all: %s: %s", type(e).__name__, e,
                     exc_info=True,
                 )
         return closed
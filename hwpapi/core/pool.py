@@ -0,0 +1,440 @@
+"""
+:mod:`hwpapi.core.pool` — warm standby engines for fast :class:`App` checkout.
+
+Launching ``HWPFrame.HwpObject`` and registering ``FilePathCheckDLL``
+takes seconds. :class:`EnginePool` keeps ``size`` hidden, DLL-registered
+engines launched ahead of time by a background thread, so a request only
+pays for the hand-over:
+
+    app = App.acquire()          # warm engine from the default pool
+    try:
+        app.docs.open(path)...
+    finally:
+        app.release()            # documents closed, engine back in the pool
+
+* **Checkout** — the engine passes a health check (``XHwpDocuments``
+  answers) or is discarded and the next one is tried. An empty pool
+  launches an engine inline (a *miss*) rather than failing.
+* **Release** — every open document is closed without saving and the
+  window hidden again; an engine that cannot be reset is quit. Surplus
+  engines beyond ``size`` are quit too.
+* **Replenishment** — the background thread relaunches whatever was
+  handed out or discarded, backing off when launches fail.
+
+COM objects belong to the apartment (thread) that created them. On
+Windows the pool moves each engine between the launcher thread and the
+acquiring thread with ``CoMarshalInterThreadInterfaceInStream``; without
+pywin32 the engine object is passed as is.
+
+:meth:`EnginePool.stats` reports hits, misses and acquisition latency
+(p50 / p99) — see ``tests/bench_engine_pool.py``.
+"""
+from __future__ import annotations
+
+import atexit
+import collections
+import math
+import os
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Deque, Optional
+
+from hwpapi.errors import InvalidArgumentError
+from hwpapi.logging import get_logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from hwpapi.core.app import App
+    from hwpapi.low.engine import Engine
+
+__all__ = ["EnginePool", "PoolStats", "configure_pool", "default_pool"]
+
+logger = get_logger("core.pool")
+
+_LATENCY_WINDOW = 4096
+_MAX_BACKOFF = 30.0
+
+
+# ── apartment hand-over ───────────────────────────────────────────
+
+class _Handoff:
+    """An engine parked in the pool — marshalled when pywin32 is present."""
+
+    __slots__ = ("engine", "stream")
+
+    def __init__(self, engine: "Engine") -> None:
+        self.engine = engine
+        self.stream = None
+        oleobj = getattr(getattr(engine, "impl", None), "_oleobj_", None)
+        if oleobj is None:
+            return
+        try:
+            import pythoncom
+        except ImportError:
+            return
+        self.stream = pythoncom.CoMarshalInterThreadInterfaceInStream(
+            pythoncom.IID_IDispatch, oleobj)
+        self.engine = None  # only the stream may cross threads
+
+    def take(self) -> "Engine":
+        """The engine, usable from the calling thread (once)."""
+        if self.stream is None:
+            return self.engine
+        import pythoncom
+        from hwpapi.low.engine import Engine
+
+        dispatch = pythoncom.CoGetInterfaceAndReleaseStream(self.stream, pythoncom.IID_IDispatch)
+        self.stream = None
+        return Engine(dispatch)
+
+
+def _com_initialize():
+    try:
+        import pythoncom
+    except ImportError:
+        return None
+    pythoncom.CoInitialize()
+    return pythoncom
+
+
+# ── default hooks ─────────────────────────────────────────────────
+
+def _launch_engine() -> "Engine":
+    """New hidden HWP with FilePathCheckDLL registered (``App._load``)."""
+    from hwpapi.core.app import App
+    return App(new_app=True, is_visible=False).engine
+
+
+def _healthy(engine: "Engine") -> bool:
+    impl = getattr(engine, "impl", None)
+    if impl is None:
+        return False
+    try:
+        int(impl.XHwpDocuments.Count)
+    except Exception:
+        return False
+    return True
+
+
+def _reset(app: "App") -> None:
+    """Close every document without saving; leave one blank, hidden window."""
+    from hwpapi.low.actions import bump_edit_epoch, bump_style_epoch
+    from hwpapi.low.lifetime import release_all
+
+    docs = app.api.XHwpDocuments
+    for i in reversed(range(int(docs.Count))):
+        docs.Item(i).Close(False)
+    release_all(app)
+    if int(docs.Count) == 0:
+        app.api.Run("FileNew")
+    app.visible = False
+    bump_edit_epoch()
+    bump_style_epoch()
+
+
+def _percentile(values, q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, max(0, math.ceil(q * len(ordered)) - 1))]
+
+
+class PoolStats:
+    """Counters and acquisition latency of an :class:`EnginePool`."""
+
+    __slots__ = ("idle", "acquired", "hits", "misses", "launched", "discarded", "p50", "p99")
+
+    def __init__(self, **values) -> None:
+        for name in self.__slots__:
+            setattr(self, name, values.get(name, 0))
+
+    def __repr__(self) -> str:
+        return (
+            f"PoolStats(idle={self.idle}, acquired={self.acquired}, hits={self.hits}, "
+            f"misses={self.misses}, launched={self.launched}, discarded={self.discarded}, "
+            f"p50={self.p50 * 1e3:.1f}ms, p99={self.p99 * 1e3:.1f}ms)"
+        )
+
+
+class EnginePool:
+    """
+    ``size`` warm standby engines, handed out as :class:`App` objects.
+
+    Parameters
+    ----------
+    size : int, optional
+        Idle engines to keep ready. ``0`` disables standby (every
+        :meth:`acquire` launches inline).
+    launch : callable, optional
+        Returns a ready :class:`~hwpapi.low.engine.Engine`; runs on the
+        background thread. Default: hidden ``App(new_app=True)``'s engine.
+    health_check : callable, optional
+        ``health_check(engine) -> bool`` on checkout.
+    reset : callable, optional
+        ``reset(app)`` on release; raising discards the engine.
+    replenish : bool, optional
+        Start the background launcher (``False`` — fill only via
+        :meth:`fill` / :meth:`release`, mainly for tests).
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        *,
+        launch: Optional[Callable[[], "Engine"]] = None,
+        health_check: Optional[Callable[["Engine"], bool]] = None,
+        reset: Optional[Callable[["App"], None]] = None,
+        replenish: bool = True,
+    ) -> None:
+        if size < 0:
+            raise InvalidArgumentError(f"pool size must be >= 0, got {size}")
+        self.size = size
+        self._launch = launch or _launch_engine
+        self._health_check = health_check or _healthy
+        self._reset = reset or _reset
+        self._idle: Deque[_Handoff] = collections.deque()
+        self._cond = threading.Condition()
+        self._launching = 0
+        self._closed = False
+        self._latencies: Deque[float] = collections.deque(maxlen=_LATENCY_WINDOW)
+        self._counts = dict(acquired=0, hits=0, misses=0, launched=0, discarded=0)
+        self._thread: Optional[threading.Thread] = None
+        if replenish and size:
+            self._thread = threading.Thread(target=self._replenish, name="hwpapi-pool", daemon=True)
+            self._thread.start()
+
+    # ------------------------------------------------------------------
+    # Background launcher
+    # ------------------------------------------------------------------
+
+    def _launch_one(self) -> Optional[_Handoff]:
+        try:
+            engine = self._launch()
+        except Exception as exc:
+            logger.warning("pool: engine launch failed: %r", exc)
+            return None
+        with self._cond:
+            self._counts["launched"] += 1
+        return _Handoff(engine)
+
+    def _replenish(self) -> None:
+        pythoncom = _com_initialize()
+        backoff = 0.5
+        try:
+            while True:
+                with self._cond:
+                    while not self._closed and len(self._idle) + self._launching >= self.size:
+                        self._cond.wait()
+                    if self._closed:
+                        return
+                    self._launching += 1
+                handoff = self._launch_one()
+                with self._cond:
+                    self._launching -= 1
+                    surplus = handoff is not None and not self._park(handoff)
+                if surplus:  # releases refilled the pool meanwhile
+                    self._drop(handoff)
+                if handoff is None:
+                    time.sleep(backoff)
+                    backoff = min(backoff * 2, _MAX_BACKOFF)
+                else:
+                    backoff = 0.5
+        finally:
+            if pythoncom is not None:
+                pythoncom.CoUninitialize()
+
+    def fill(self) -> "EnginePool":
+        """Launch standby engines on the calling thread until ``size`` are idle."""
+        while True:
+            with self._cond:
+                if self._closed or len(self._idle) >= self.size:
+                    return self
+            handoff = self._launch_one()
+            if handoff is None:
+                return self
+            with self._cond:
+                parked = self._park(handoff)
+            if not parked:
+                self._drop(handoff)
+                return self
+
+    # ------------------------------------------------------------------
+    # Checkout / return
+    # ------------------------------------------------------------------
+
+    def acquire(self, wait: float = 0.0) -> "App":
+        """
+        Hand out a warm :class:`App`.
+
+        Parameters
+        ----------
+        wait : float, optional
+            Seconds to wait for a standby engine when none is idle before
+            launching one inline (default: launch immediately).
+
+        Raises
+        ------
+        InvalidArgumentError
+            The pool is closed.
+        """
+        from hwpapi.core.app import App
+
+        t0 = time.perf_counter()
+        deadline = time.monotonic() + wait
+        while True:
+            with self._cond:
+                if self._closed:
+                    raise InvalidArgumentError("engine pool is closed")
+                while not self._idle and self._thread is not None and time.monotonic() < deadline:
+                    self._cond.wait(deadline - time.monotonic())
+                handoff = self._idle.popleft() if self._idle else None
+                self._cond.notify_all()  # wake the launcher
+            if handoff is None:
+                engine, hit = self._launch(), False
+                with self._cond:
+                    self._counts["launched"] += 1
+            else:
+                try:
+                    engine = handoff.take()
+                except Exception as exc:
+                    logger.warning("pool: standby engine lost: %r", exc)
+                    engine = None
+                hit = True
+                if engine is None or not self._health_check(engine):
+                    self._discard(engine)
+                    continue
+            app = App._adopt(engine)
+            app._pool = self
+            with self._cond:
+                self._counts["acquired"] += 1
+                self._counts["hits" if hit else "misses"] += 1
+                self._latencies.append(time.perf_counter() - t0)
+            return app
+
+    def release(self, app: "App", reset: bool = True) -> None:
+        """
+        Return ``app`` (from :meth:`acquire`) to the pool.
+
+        Open documents are closed without saving; the engine is quit
+        instead when the reset fails, the pool is full or closed.
+
+        Raises
+        ------
+        InvalidArgumentError
+            ``app`` was not acquired from this pool.
+        """
+        if getattr(app, "_pool", None) is not self:
+            raise InvalidArgumentError("release(): App was not acquired from this pool")
+        app._pool = None
+        try:
+            if reset:
+                self._reset(app)
+        except Exception as exc:
+            logger.warning("pool: reset failed, discarding engine: %r", exc)
+            self._discard(app.engine, app)
+            return
+        handoff = _Handoff(app.engine)
+        with self._cond:
+            parked = self._park(handoff)
+        if not parked:
+            self._drop(handoff)
+
+    def _park(self, handoff: _Handoff) -> bool:
+        """Add to the idle queue if there is room (caller holds the lock)."""
+        if self._closed or len(self._idle) >= self.size:
+            return False
+        self._idle.append(handoff)
+        self._cond.notify_all()
+        return True
+
+    def _drop(self, handoff: _Handoff) -> None:
+        from hwpapi.core.app import App
+        try:
+            self._quit(App._adopt(handoff.take()))
+        except Exception as exc:
+            logger.debug("pool: dropping standby engine: %r", exc)
+
+    def _discard(self, engine: Optional["Engine"], app: Optional["App"] = None) -> None:
+        with self._cond:
+            self._counts["discarded"] += 1
+            self._cond.notify_all()
+        if engine is not None and getattr(engine, "impl", None) is not None:
+            from hwpapi.core.app import App
+            self._quit(app or App._adopt(engine))
+
+    @staticmethod
+    def _quit(app: "App") -> None:
+        try:
+            app.quit()
+        except Exception as exc:
+            logger.debug("pool: quit failed: %r", exc)
+
+    # ------------------------------------------------------------------
+    # Introspection / shutdown
+    # ------------------------------------------------------------------
+
+    @property
+    def idle(self) -> int:
+        """Standby engines ready right now."""
+        return len(self._idle)
+
+    def stats(self) -> PoolStats:
+        """Counters plus p50 / p99 acquisition latency (seconds, last 4096)."""
+        with self._cond:
+            latencies = list(self._latencies)
+            counts = dict(self._counts)
+            idle = len(self._idle)
+        return PoolStats(idle=idle, p50=_percentile(latencies, 0.5),
+                         p99=_percentile(latencies, 0.99), **counts)
+
+    def close(self) -> None:
+        """Stop replenishing and quit the idle engines (checked-out ones stay)."""
+        with self._cond:
+            self._closed = True
+            idle, self._idle = list(self._idle), collections.deque()
+            self._cond.notify_all()
+        if self._thread is not None:
+            self._thread.join(timeout=5.0)
+        for handoff in idle:
+            self._drop(handoff)
+
+    def __enter__(self) -> "EnginePool":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        state = "closed" if self._closed else f"idle={self.idle}/{self.size}"
+        return f"EnginePool({state})"
+
+
+# ── process-wide default (App.acquire) ────────────────────────────
+
+_default: Optional[EnginePool] = None
+_default_lock = threading.Lock()
+
+
+def default_pool() -> EnginePool:
+    """The pool behind :meth:`App.acquire` — created on first use with
+    ``HWPAPI_POOL_SIZE`` (default 2) standby engines."""
+    global _default
+    with _default_lock:
+        if _default is None:
+            _default = EnginePool(int(os.environ.get("HWPAPI_POOL_SIZE", "2")))
+        return _default
+
+
+def configure_pool(size: int = 2, **options) -> EnginePool:
+    """Replace the default pool (closing the old one); see :class:`EnginePool`."""
+    global _default
+    with _default_lock:
+        old, _default = _default, EnginePool(size, **options)
+    if old is not None:
+        old.close()
+    return _default
+
+
+@atexit.register
+def _close_default() -> None:
+    if _default is not None:
+        _default.close()
@@ -21,9 +21,15 @@ HWP 프로세스 lifecycle 만.
 """
 from __future__ import annotations
 
+import weakref
+from contextlib import contextmanager
 from functools import cached_property
 from pathlib import Path
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Callable, Dict, Iterator, Optional
+
+from hwpapi import tracing as _tracing
+from hwpapi.logging import get_logger
+from hwpapi.low import lifetime as _lifetime
 
 if TYPE_CHECKING:
     from hwpapi.core.app import App
@@ -34,9 +40,13 @@ if TYPE_CHECKING:
     from hwpapi.collections.paragraphs import ParagraphCollection
     from hwpapi.collections.styles import StyleCollection
     from hwpapi.collections.tables import TableCollection
+    from hwpapi.search import Match
+    from hwpapi.snapshot import DocumentSnapshot, Transaction
 
 __all__ = ["Document"]
 
+logger = get_logger("document")
+
 
 # ── format maps (mirror App's) ────────────────────────────────────
 _SAVE_FORMAT_MAP = {
@@ -56,6 +66,41 @@ def _format_from_suffix(suffix: str) -> Optional[str]:
     return _SAVE_FORMAT_MAP.get(suffix.lower())
 
 
+# ── insert_text paths ─────────────────────────────────────────────
+# 기준값은 tests/bench_insert_text.py 로 측정 (줄 수 / 글자 수 교차점).
+_INSERT_MODES = ("lines", "chunked", "file")
+_INSERT_CHUNKED_MIN_BREAKS = 8      # 짧은 글은 기존 줄 단위 경로 유지
+_INSERT_FILE_MIN_CHARS = 64 * 1024  # 이 이상이면 SetTextFile 한 번
+_INSERT_CHUNK_CHARS = 16 * 1024     # InsertText 한 번에 넘기는 최대 글자 수
+
+
+def _insert_mode_for(s: str) -> str:
+    if len(s) >= _INSERT_FILE_MIN_CHARS:
+        return "file"
+    if s.count("\n") >= _INSERT_CHUNKED_MIN_BREAKS:
+        return "chunked"
+    return "lines"
+
+
+def _text_chunks(s: str, size: int) -> Iterator[str]:
+    """``"\\n"`` 을 ``"\\r\\n"`` 으로 바꿔 줄 경계에서 ``size`` 이하로 묶음.
+
+    한 줄이 ``size`` 보다 길면 그 줄은 통째로 한 조각이 됩니다.
+    """
+    buf: list = []
+    n = 0
+    for line in s.replace("\r\n", "\n").split("\n"):
+        piece = len(line) + 2
+        if buf and n + piece > size:
+            yield "\r\n".join(buf) + "\r\n"
+            buf, n = [], 0
+        buf.append(line)
+        n += piece
+    tail = "\r\n".join(buf)
+    if tail:
+        yield tail
+
+
 # ── Document-scoped actions proxy ────────────────────────────────
 class _DocCursor:
     """Per-document cursor — 이동 / 위치 검사."""
@@ -104,7 +149,8 @@ class _DocActions:
 
     def __getattr__(self, name: str):
         # 활성화는 여기서 — pset 을 만지기 전에 doc 컨텍스트를 잡음.
-        self._doc.activate()
+        # 어떤 action 이 편집인지 알 수 없으므로 편집으로 취급 (transaction).
+        self._doc._edit()
         return getattr(self._doc._app.actions, name)
 
     def __repr__(self) -> str:
@@ -131,7 +177,7 @@ class Document:
     ...     doc.close()
     """
 
-    __slots__ = ("_app", "_raw", "__dict__")
+    __slots__ = ("_app", "_raw", "__dict__", "__weakref__")
 
     def __init__(self, app: "App", _raw=None, _index: Optional[int] = None) -> None:
         """``_raw`` (IXHwpDocument 핸들) 우선. 없으면 ``_index`` 로 즉시 resolve."""
@@ -142,6 +188,8 @@ class Document:
             except Exception:
                 _raw = None
         self._raw = _raw
+        if _raw is not None:
+            _lifetime.track(app, self, "document", "_raw", doc_id=None)
 
     # ── meta ─────────────────────────────────────────────────────
 
@@ -191,17 +239,64 @@ class Document:
         """``IXHwpDocument`` COM 핸들 (escape hatch)."""
         return self._raw
 
+    def _document_id(self) -> Optional[int]:
+        """HWP 문서 ID — 처음 한 번만 읽어 캐시. 읽지 못하면 ``None``."""
+        doc_id = self.__dict__.get("_doc_id")
+        if doc_id is None:
+            doc_id = _lifetime.document_id(self._raw)
+            if doc_id is not None:
+                self.__dict__["_doc_id"] = doc_id
+        return doc_id
+
     # ── lifecycle ────────────────────────────────────────────────
 
     def activate(self) -> "Document":
-        """이 문서를 HWP 의 활성 문서로 만듦. 자기 자신 반환 (chain)."""
+        """이 문서를 HWP 의 활성 문서로 만듦. 자기 자신 반환 (chain).
+
+        모든 Document 작업의 진입점이므로 커서 서식 캐시
+        (:mod:`hwpapi.context.scopes`) 를 무효화합니다.
+        """
+        from hwpapi.context.scopes import _note_active_document
+        from hwpapi.low.actions import bump_edit_epoch
+
+        bump_edit_epoch()
+        _note_active_document(self._app, self._raw)
         if self._raw is not None:
+            _lifetime.bind_document(self._app, self, self._document_id())
             try:
                 self._raw.SetActive_XHwpDocument()
             except Exception:
                 pass
         return self
 
+    def _edit(self) -> "Document":
+        """편집하는 진입점의 :meth:`activate`.
+
+        열린 :meth:`transaction` 이 있으면 첫 편집 직전에 스냅샷을 뜬 뒤
+        활성화합니다. 읽기만 하는 진입점은 :meth:`activate` 를 씁니다.
+        """
+        self._before_edit()
+        return self.activate()
+
+    def _before_edit(self) -> None:
+        txn = self.__dict__.get("_txn")
+        if txn is not None:
+            txn._before_edit()
+
+    def _edit_hook(self) -> Callable[[], None]:
+        """컬렉션 (``fields`` / ``bookmarks`` …) 이 쓰기 직전에 부르는 :meth:`_before_edit`.
+
+        약한 참조로 잡아 ``Document`` ↔ 컬렉션 순환을 만들지 않습니다.
+        """
+        ref = weakref.ref(self)
+
+        def before_edit() -> None:
+            doc = ref()
+            if doc is not None:
+                doc._before_edit()
+
+        return before_edit
+
     def save(
         self,
         path: Optional[str] = None,
@@ -217,11 +312,15 @@ class Document:
 
         self.activate()
         if not path:
-            self._app.api.Save()
+            with _tracing.span("document.save") as sp:
+                if sp:
+                    sp.set(document=self.path)
+                sp.call(self._app.api.Save)
             return self.path
         name = get_absolute_path(path)
         fmt = format or _format_from_suffix(Path(name).suffix)
-        self._app.api.SaveAs(name, fmt)
+        with _tracing.span("document.save", document=name, format=fmt) as sp:
+            sp.call(self._app.api.SaveAs, name, fmt)
         return name
 
     def save_as(
@@ -232,21 +331,162 @@ class Document:
         """:meth:`save` 의 명시 alias — 항상 ``path`` 인자 필수."""
         return self.save(path, format)
 
+    def to_bytes(self, format: str = "HWP") -> bytes:
+        """
+        문서를 ``bytes`` 로 — 디스크 왕복 없음.
+
+        ``HWP`` / ``HWPML2X`` / ``HTML`` / ``TEXT`` / ``UNICODE`` 는
+        ``GetTextFile`` 로 메모리에서 바로, 그 외 (``PDF``, ``HWPX`` …) 는
+        RAM disk / 임시 파일을 거쳐 읽은 뒤 지웁니다
+        (:mod:`hwpapi.io.memory`).
+
+        Raises
+        ------
+        FileIOError
+            export 실패.
+        """
+        from hwpapi.io.memory import document_to_bytes
+
+        self.activate()
+        return document_to_bytes(self._app, format)
+
     def close(self, save: bool = False) -> bool:
         """
         문서 닫기. ``save=False`` (기본) 면 변경사항 버리고 닫음.
 
         직접 ``IXHwpDocument.Close(save)`` 호출 — dialog 가 안 뜨므로
-        :func:`SetMessageBoxMode` 영향 없음.
+        :func:`SetMessageBoxMode` 영향 없음. 닫은 뒤 이 문서의 action/pset
+        캐시와 표·그림·문단 핸들을 놓습니다 (:mod:`hwpapi.low.lifetime`).
         """
         if self._raw is None:
             return False
+        raw, doc_id = self._raw, self._document_id()
         try:
-            self._raw.Close(save)
-            self._raw = None  # 핸들 무효화
-            return True
+            raw.Close(save)
         except Exception:
             return False
+        _lifetime.release_document(self._app, doc_id, raw)
+        self._raw = None  # 핸들 무효화
+        return True
+
+    # ── snapshot / transaction ───────────────────────────────────
+
+    def snapshot(
+        self,
+        format: str = "HWP",
+        compress: bool = True,
+        max_bytes: Optional[int] = None,
+    ) -> "DocumentSnapshot":
+        """
+        문서 전체를 메모리 스냅샷으로 — 파일 시스템을 거치지 않음.
+
+        Parameters
+        ----------
+        format : {"HWP", "HWPML2X"}
+            ``GetTextFile`` 포맷.
+        compress : bool
+            zlib 압축 여부 (기본 True).
+        max_bytes : int, optional
+            보관 크기 (압축 후) 상한. 넘으면 :class:`FileIOError`.
+
+        Raises
+        ------
+        InvalidArgumentError
+            지원하지 않는 ``format``.
+        FileIOError
+            export 실패 또는 ``max_bytes`` 초과.
+        """
+        from hwpapi.errors import FileIOError, InvalidArgumentError
+        from hwpapi.snapshot import SNAPSHOT_FORMATS, DocumentSnapshot
+
+        format = format.upper()
+        if format not in SNAPSHOT_FORMATS:
+            raise InvalidArgumentError(
+                f"snapshot format must be one of {SNAPSHOT_FORMATS}, got {format!r}"
+            )
+        self.activate()
+        try:
+            data = self._app.api.GetTextFile(format, "")
+        except Exception as exc:
+            raise FileIOError(f"snapshot({format}) failed: {exc!r}") from exc
+        if not isinstance(data, str) or not data:
+            raise FileIOError(f"snapshot({format}) returned no data")
+        snap = DocumentSnapshot(format, data, compress=compress)
+        if max_bytes is not None and snap.nbytes > max_bytes:
+            raise FileIOError(
+                f"snapshot is {snap.nbytes} bytes, over max_bytes={max_bytes}"
+            )
+        logger.debug("snapshot taken: %r", snap)
+        return snap
+
+    def restore(self, snapshot: "DocumentSnapshot") -> "Document":
+        """
+        :meth:`snapshot` 시점으로 문서 전체를 되돌림 (``SetTextFile``).
+
+        커서 서식 / 스타일 캐시는 무효화됩니다.
+
+        Raises
+        ------
+        FileIOError
+            ``SetTextFile`` 실패.
+        """
+        from hwpapi.context.scopes import invalidate_cursor_format
+        from hwpapi.errors import FileIOError
+        from hwpapi.low.actions import bump_style_epoch
+
+        self.activate()
+        try:
+            ok = self._app.api.SetTextFile(snapshot.text(), snapshot.format, "")
+        except Exception as exc:
+            raise FileIOError(f"restore({snapshot.format}) failed: {exc!r}") from exc
+        finally:
+            invalidate_cursor_format(self._app)
+            bump_style_epoch()
+        if not ok:
+            raise FileIOError(f"restore({snapshot.format}) returned {ok!r}")
+        return self
+
+    @contextmanager
+    def transaction(
+        self,
+        format: str = "HWP",
+        compress: bool = True,
+        max_bytes: Optional[int] = None,
+    ) -> Iterator["Transaction"]:
+        """
+        All-or-nothing 편집 블록.
+
+        첫 편집 직전에 :meth:`snapshot` 을 한 번 뜨고, 블록이 예외로
+        끝나면 :meth:`restore` 후 예외를 다시 올립니다. 이 ``Document``
+        인스턴스의 편집 메서드 (``insert_text`` / ``replace_*`` /
+        ``set_*shape`` / ``doc.actions.X`` 등) 과 컬렉션 쓰기
+        (``doc.fields[...] = ...`` / ``doc.bookmarks.add`` /
+        ``doc.styles[...].apply()`` 등) 만 "편집" 으로 감지하고,
+        ``text`` / ``find_all`` / ``save`` 같은 읽기는 스냅샷을 뜨지
+        않습니다 (raw ``app.api`` 편집 전에는 ``txn.begin()``). 안쪽
+        트랜잭션은 바깥 스냅샷 이후 편집이 없으면 그 스냅샷을 공유합니다.
+
+        Examples
+        --------
+        >>> with doc.transaction() as txn:
+        ...     doc.replace_all("초안", "최종")
+        ...     doc.fields["date"] = today
+        """
+        from hwpapi.snapshot import Transaction
+
+        outer = self.__dict__.get("_txn")
+        txn = Transaction(
+            self, outer, format=format, compress=compress, max_bytes=max_bytes,
+        )
+        self.__dict__["_txn"] = txn
+        try:
+            yield txn
+        except BaseException:
+            self.__dict__["_txn"] = None  # restore() 의 activate 가 새 스냅샷을 뜨지 않게
+            txn.rollback()
+            raise
+        finally:
+            self.__dict__["_txn"] = outer
 
     # ── text I/O ─────────────────────────────────────────────────
 
@@ -259,20 +499,92 @@ class Document:
         except Exception:
             return ""
 
-    def insert_text(self, s: str) -> "Document":
+    def insert_text(self, s: str, mode: str = "auto") -> "Document":
         """
-        커서 위치에 텍스트 삽입. ``"\\n"`` 은 ``BreakPara`` 로 변환.
+        커서 위치에 텍스트 삽입. ``"\\n"`` 은 문단 나눔으로 변환.
+
+        Parameters
+        ----------
+        s : str
+            삽입할 텍스트.
+        mode : {"auto", "lines", "chunked", "file"}
+            삽입 경로.
+
+            - ``"lines"`` — 줄마다 ``InsertText`` + ``BreakPara`` (짧은 글).
+            - ``"chunked"`` — ``"\\r\\n"`` 으로 이은 여러 줄을 줄 경계에서
+              ``_INSERT_CHUNK_CHARS`` 단위로 끊어 ``InsertText`` 한 번씩.
+            - ``"file"`` — ``SetTextFile(text, "TEXT", "insertfile")`` 한 번.
+            - ``"auto"`` — 길이 / 줄 수로 위 셋 중 선택. 기준값은
+              ``tests/bench_insert_text.py`` 로 측정.
+
+        삽입은 커서 서식을 바꾸지 않으므로 유효하던 서식 캐시는 유지됩니다
+        (``"file"`` 경로는 예외 — HWP 가 TEXT 를 자체 서식으로 붙입니다).
+
+        Raises
+        ------
+        InvalidArgumentError
+            알 수 없는 ``mode``.
         """
-        self.activate()
+        from hwpapi.context.scopes import (
+            _carry_format,
+            _format_cache_valid,
+            invalidate_cursor_format,
+        )
+
+        if mode == "auto":
+            mode = _insert_mode_for(s)
+        elif mode not in _INSERT_MODES:
+            from hwpapi.errors import InvalidArgumentError
+            raise InvalidArgumentError(
+                f"unknown insert_text mode {mode!r}; "
+                f"expected one of {('auto',) + _INSERT_MODES}"
+            )
+
+        keep_format = _format_cache_valid(self._app, self._raw)
+        self._edit()
+        if mode == "file" and self._insert_text_file(s):
+            invalidate_cursor_format(self._app)
+            return self
+        if mode == "lines":
+            self._insert_text_lines(s)
+        else:
+            self._insert_text_chunked(s)
+        if keep_format:
+            _carry_format(self._app)
+        return self
+
+    def _insert_text_lines(self, s: str) -> None:
+        act = self._app.actions.InsertText
+        pset = act.pset
+        run = self._app.api.Run
         parts = s.split("\n")
+        last = len(parts) - 1
         for i, part in enumerate(parts):
             if part:
-                act = self._app.actions.InsertText
-                act.pset.Text = part
+                pset.Text = part
                 act.run()
-            if i < len(parts) - 1:
-                self._app.api.Run("BreakPara")
-        return self
+            if i < last:
+                run("BreakPara")
+
+    def _insert_text_chunked(self, s: str) -> None:
+        act = self._app.actions.InsertText
+        pset = act.pset
+        for chunk in _text_chunks(s, _INSERT_CHUNK_CHARS):
+            pset.Text = chunk
+            act.run()
+
+    def _insert_text_file(self, s: str) -> bool:
+        """``SetTextFile`` 한 번으로 삽입. 실패하면 False (호출자가 chunked 로)."""
+        text = s.replace("\r\n", "\n").replace("\n", "\r\n")
+        try:
+            ok = self._app.api.SetTextFile(text, "TEXT", "insertfile")
+        except Exception as exc:
+            logger.warning("SetTextFile insert failed (%r); falling back to InsertText", exc)
+            return False
+        if not ok:
+            logger.warning("SetTextFile insert returned %r; falling back to InsertText", ok)
+            return False
+        return True
 
     def select_all(self) -> "Document":
         """전체 선택."""
@@ -290,7 +602,7 @@ class Document:
 
     def clear(self) -> "Document":
         """문서 내용 전체 삭제."""
-        self.activate()
+        self._edit()
         self._app.api.Run("SelectAll")
         self._app.api.Run("Delete")
         return self
@@ -315,10 +627,13 @@ class Document:
         >>> doc.set_charshape(bold=True)
         >>> doc.insert_text("이 줄은 굵게")
         """
-        from hwpapi.context.scopes import _CHAR_ALIAS, _translate, _apply
-        self.activate()
+        from hwpapi.context.scopes import (
+            _CHAR_ALIAS, _translate, _apply, invalidate_cursor_format,
+        )
+        self._edit()
         translated = _translate(fmt, _CHAR_ALIAS)
         _apply(self._app, "CharShape", "CharShape", translated)
+        invalidate_cursor_format(self._app)
         return self
 
     def set_parashape(self, **fmt) -> "Document":
@@ -334,12 +649,14 @@ class Document:
         """
         from hwpapi.context.scopes import (
             _PARA_ALIAS, _translate, _apply, _normalise_align,
+            invalidate_cursor_format,
         )
-        self.activate()
+        self._edit()
         translated = _translate(fmt, _PARA_ALIAS)
         if "AlignType" in translated:
             translated["AlignType"] = _normalise_align(translated["AlignType"])
         _apply(self._app, "ParaShape", "ParaShape", translated)
+        invalidate_cursor_format(self._app)
         return self
 
     def find_text(self, query: str) -> bool:
@@ -351,24 +668,100 @@ class Document:
         except Exception:
             return False
 
-    def replace_all(self, find: str, replace: str) -> int:
-        """``find`` → ``replace`` 일괄 치환. 치환된 개수 반환 (대략)."""
+    def replace_all(self, find: str, replace: str) -> Optional[int]:
+        """``find`` → ``replace`` 일괄 치환. 치환된 개수 반환.
+
+        :meth:`replace_many` 의 단일 규칙 버전 — 개수는 사전 스캔으로
+        계산한 값이고, 스캔에서 찾지 못해 ``AllReplace`` 를 그냥 실행한
+        경우 ``None`` (개수 모름) 입니다.
+        """
+        return self.replace_many({find: replace}).get(str(find), 0)
+
+    def replace_many(self, rules, regex: bool = False) -> Dict[str, Optional[int]]:
+        """여러 치환 규칙을 한 번의 스캔으로 계획해 일괄 실행.
+
+        문서 텍스트를 한 번만 export 해서 (:class:`hwpapi.search.TextScan`)
+
+        * 앞 규칙의 결과를 뒤 규칙이 다시 바꾸지 않도록 순서를 정하며
+          (순환은 임시 sentinel 경유),
+        * 규칙별 정확한 치환 개수를 계산합니다.
+
+        TEXT export 에 보이지 않는 곳 (export 실패, 글상자 등) 에만 있는
+        규칙을 놓치지 않도록, 스캔에서 매치가 없는 규칙도 계획된 단계
+        앞에서 ``AllReplace`` 를 한 번 실행하고 개수는 ``None`` 으로
+        돌려줍니다.
+
+        ``AllReplace`` action / pset 은 한 번만 준비하고, 단계마다
+        ``FindString`` / ``ReplaceString`` 만 바꿔 실행합니다.
+
+        Parameters
+        ----------
+        rules : dict | iterable of (str, str)
+            ``{find: replace}`` 또는 ``(find, replace)`` 쌍.
+        regex : bool, optional
+            ``find`` 를 정규식으로 취급 (``FindRegExp``). 치환 문자열은
+            항상 literal.
+
+        Returns
+        -------
+        dict
+            ``{find: 치환 개수}`` — 입력 순서. 스캔 없이 실행한 규칙은
+            ``None``. 실행 중 COM 오류가 나면 그 이전 단계까지의 개수만
+            반영되고, 실행하지 못한 규칙은 ``0`` 입니다.
+
+        Examples
+        --------
+        >>> doc.replace_many({"{name}": "홍길동", "{date}": "2026-04-29"})
+        {'{name}': 3, '{date}': 1}
+        """
+        from hwpapi.search import TextScan, _normalise_rules, plan_replacements
+
         self.activate()
-        # AllReplace action — ParameterSet 기반.
+        try:
+            raw = str(self._app.api.GetTextFile("TEXT", ""))
+        except Exception as e:  # 스캔 실패 — 모든 규칙을 그냥 실행
+            logger.debug("replace_many: text scan failed: %s", e)
+            raw = ""
+        pairs = _normalise_rules(rules)
+        plan = plan_replacements(TextScan(raw).text, pairs, regex=regex)
+        blind = [(find, replace) for find, replace in pairs if not plan.counts[find]]
+        counts: Dict[str, Optional[int]] = {find: 0 for find in plan.counts}
+        if not (blind or plan.steps):
+            return counts
+        self._before_edit()
+
         try:
             act = self._app.actions.AllReplace
             pset = act.pset
-            pset.FindString = find
-            pset.ReplaceString = replace
-            pset.Direction = 0          # forward
+            pset.Direction = 2          # all — 커서 위치와 무관하게 문서 전체
             pset.WholeWordOnly = 0
             pset.IgnoreMessage = 1
             pset.MatchCase = 1
-            act.run()
-            # HWP 가 정확한 개수를 돌려주지 않음 — 호출 성공 여부만.
-            return 1
-        except Exception:
-            return 0
+            pset.FindRegExp = 1 if regex else 0
+        except Exception as e:
+            logger.debug("replace_many: AllReplace unavailable: %s", e)
+            return counts
+
+        steps = [((find, replace), regex) for find, replace in blind]
+        steps += zip(plan.steps, plan.regex)
+        done = 0
+        for (find, replace), step_regex in steps:
+            try:
+                if step_regex != regex:  # sentinel steps are always literal
+                    pset.FindRegExp = 1 if step_regex else 0
+                    regex = step_regex
+                pset.FindString = find
+                pset.ReplaceString = replace
+                act.run()
+            except Exception as e:
+                logger.debug("replace_many[%r]: %s", find, e)
+                break
+            done += 1
+        for find, _ in blind[:done]:
+            counts[find] = None
+        counts.update((find, n) for find, n in
+                      plan.counts_through(max(done - len(blind), 0)).items() if n)
+        return counts
 
     def select_text(self, start: int, end: int) -> "Document":
         """문자 위치 ``start..end`` 를 선택."""
@@ -390,70 +783,70 @@ class Document:
         return self
 
     def cut(self) -> "Document":
-        self.activate()
+        self._edit()
         self._app.api.Run("Cut")
         return self
 
     def paste(self) -> "Document":
-        self.activate()
+        self._edit()
         self._app.api.Run("Paste")
         return self
 
     def delete(self) -> "Document":
-        self.activate()
+        self._edit()
         self._app.api.Run("Delete")
         return self
 
     def undo(self) -> "Document":
-        self.activate()
+        self._edit()
         self._app.api.Run("Undo")
         return self
 
     def redo(self) -> "Document":
-        self.activate()
+        self._edit()
         self._app.api.Run("Redo")
         return self
 
     def insert_line_break(self) -> "Document":
-        self.activate()
+        self._edit()
         self._app.api.Run("BreakLine")
         return self
 
     def insert_page_break(self) -> "Document":
-        self.activate()
+        self._edit()
         self._app.api.Run("BreakPage")
         return self
 
     def insert_paragraph_break(self) -> "Document":
-        self.activate()
+        self._edit()
         self._app.api.Run("BreakPara")
         return self
 
     def insert_tab(self) -> "Document":
-        self.activate()
+        self._edit()
         self._app.api.Run("InsertTab")
         return self
 
     def insert_picture(self, path: str) -> "Document":
         """그림 삽입 — `path` 의 그림 파일을 커서 위치에 삽입."""
         from hwpapi.functions import get_absolute_path
-        self.activate()
+        self._edit()
         try:
             self._app.api.InsertPicture(get_absolute_path(path), True, 0, 0)
         except Exception as e:
-            self._app.logger.debug(f"insert_picture: {e}")
+            self._app.logger.debug("insert_picture: %s", e)
         return self
 
     def insert_table(self, rows: int, cols: int) -> "Document":
         """``rows × cols`` 표 삽입."""
-        self.activate()
+        self._edit()
         try:
             act = self._app.actions.TableCreate
             act.pset.Rows = rows
             act.pset.Cols = cols
             act.run()
         except Exception as e:
-            self._app.logger.debug(f"insert_table: {e}")
+            self._app.logger.debug("insert_table: %s", e)
         return self
 
     # ── cursor sub-accessor ─────────────────────────────────────
@@ -486,45 +879,65 @@ class Document:
 
     # ── find_all / replace_brackets ─────────────────────────────
 
-    def find_all(self, query: str, max_matches: int = 1000) -> list:
-        """문서 전체에서 ``query`` 의 모든 위치를 찾아 list 반환.
+    def find_all(self, patterns, max_matches: Optional[int] = 1000, *,
+                 regex: bool = False) -> "List[Match]":
+        """문서 전체에서 ``patterns`` 의 모든 위치를 찾아 list 로 반환.
+
+        :meth:`iter_matches` 의 결과를 최대 ``max_matches`` 개까지 모은
+        list 입니다. 결과가 많으면 :meth:`iter_matches` 로 stream 하세요.
 
-        반환값은 (start_pos, end_pos) 튜플 리스트 — HWP 의 GetPos
-        반환 형태. 다음 작업의 base 로 사용 (예: 일괄 서식 변경).
+        Parameters
+        ----------
+        patterns : str | iterable of str
+            검색어 하나 또는 여러 개.
+        max_matches : int, optional
+            최대 결과 개수 (기본 1000). ``None`` 이면 제한 없음.
+        regex : bool, optional
+            정규식으로 취급 (keyword 전용).
+
+        Returns
+        -------
+        list of hwpapi.search.Match
+            ``start`` / ``end`` 가 ``(list, para, pos)`` 인 범위 —
+            ``start, end = m`` 으로 풀어 쓸 수 있습니다.
 
         Examples
         --------
-        >>> for pos in doc.find_all("강조"):
-        ...     # 각 위치에서 일괄 처리
-        ...     pass
+        >>> for m in doc.find_all(["강조", "중요"]):
+        ...     m.select()
+        ...     doc.set_charshape(bold=True)
         """
-        self.activate()
-        api = self._app.api
-        results: list = []
-        try:
-            # MoveTopOfFile
-            api.MovePos(2, 0, 0)
-            for _ in range(max_matches):
-                # FindCtrl 류는 dialog 띄움 — 직접 탐색은 GetText 후 파싱이
-                # 더 안정적이지만 spike 단계에선 raw 사용.
-                # 실제 동작 검증 필요 — placeholder 구현.
-                ok = bool(api.Run("RepeatFind") if results else api.Run("FindDlg"))
-                if not ok:
-                    break
-                try:
-                    pos = api.GetPos()
-                    results.append(tuple(pos))
-                except Exception:
-                    break
-        except Exception as e:
-            self._app.logger.debug(f"find_all: {e}")
-        return results
+        return list(self.iter_matches(patterns, regex=regex, max_matches=max_matches))
+
+    def iter_matches(self, patterns, *, regex: bool = False,
+                     max_matches: Optional[int] = None) -> "Iterator[Match]":
+        """:meth:`find_all` 의 stream 버전 — 매치를 찾는 대로 yield.
+
+        문서 텍스트를 한 번만 export 한 뒤 Python 에서 검색합니다 —
+        literal 패턴은 Aho–Corasick automaton 한 번의 통과
+        (:class:`hwpapi.search.PatternMatcher`), ``regex=True`` 면
+        :mod:`re`. 매치당 COM 호출이 없으므로 사전 10k 단어도 스캔 1회
+        + CPU 시간.
+
+        Yields
+        ------
+        hwpapi.search.Match
+            :meth:`~hwpapi.search.Match.select` 로 선택 가능.
+        """
+        from itertools import islice
+        from hwpapi.search import TextScan, iter_matches
+
+        scan = TextScan(self.text)
+        hits = iter_matches(scan, patterns, regex=regex, doc=self)
+        if max_matches is not None:
+            hits = islice(hits, max_matches)
+        yield from hits
 
     def replace_brackets(self, mapping: dict) -> int:
         """``{key}`` 형태의 placeholder 를 ``mapping`` 의 값으로 일괄 치환.
 
         메일 머지의 가장 흔한 패턴 — 템플릿에 ``{name}``, ``{date}`` 등
-        의 마커가 있을 때.
+        의 마커가 있을 때. :meth:`replace_many` 로 위임합니다.
 
         Parameters
         ----------
@@ -534,8 +947,8 @@ class Document:
         Returns
         -------
         int
-            치환을 시도한 키 개수 (성공/실패 구분 없음 — HWP 가
-            정확한 카운트 미제공).
+            전체 치환 개수 (모든 키의 합). 개수를 모르는 (``None``) 키는
+            합에서 빠집니다.
 
         Examples
         --------
@@ -545,14 +958,7 @@ class Document:
         ...     "{amount}": "1,200,000원",
         ... })
         """
-        count = 0
-        for key, value in mapping.items():
-            try:
-                self.replace_all(str(key), str(value))
-                count += 1
-            except Exception as e:
-                self._app.logger.debug(f"replace_brackets[{key}]: {e}")
-        return count
+        return sum(n or 0 for n in self.replace_many(mapping).values())
 
     # ── action proxy ─────────────────────────────────────────────
 
@@ -573,17 +979,17 @@ class Document:
     @cached_property
     def fields(self) -> "FieldCollection":
         from hwpapi.collections.fields import FieldCollection
-        return FieldCollection(self._app)
+        return FieldCollection(self._app, self._edit_hook())
 
     @cached_property
     def bookmarks(self) -> "BookmarkCollection":
         from hwpapi.collections.bookmarks import BookmarkCollection
-        return BookmarkCollection(self._app)
+        return BookmarkCollection(self._app, self._edit_hook())
 
     @cached_property
     def hyperlinks(self) -> "HyperlinkCollection":
         from hwpapi.collections.hyperlinks import HyperlinkCollection
-        return HyperlinkCollection(self._app)
+        return HyperlinkCollection(self._app, self._edit_hook())
 
     @cached_property
     def images(self) -> "ImageCollection":
@@ -593,7 +999,7 @@ class Document:
     @cached_property
     def styles(self) -> "StyleCollection":
         from hwpapi.collections.styles import StyleCollection
-        return StyleCollection(self._app)
+        return StyleCollection(self._app, self._raw, self._edit_hook())
 
     @cached_property
     def paragraphs(self) -> "ParagraphCollection":
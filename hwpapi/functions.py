@@ -1,5 +1,5 @@
 __all__ = ['logger', 'VALUE_NAME', 'HWPUNIT_PER_MM', 'HWPUNIT_PER_PT', 'HWPUNIT_PER_CM', 'HWPUNIT_PER_INCH', 'get_font_name',
-           'dispatch', 'get_hwp_objects', 'get_absolute_path', 'get_appdata_path', 'get_hwp_dll_path', 'get_dll_path',
+           'dispatch', 'get_hwp_objects', 'get_hwp_monikers', 'invalidate_rot_cache', 'RotEntry', 'get_absolute_path', 'get_appdata_path', 'get_hwp_dll_path', 'get_dll_path',
            'add_dll_to_registry', 'get_registry_value', 'check_dll', 'get_value', 'get_key', 'convert2int', 'set_pset',
            'get_charshape_pset', 'set_charshape_pset', 'get_parashape_pset', 'set_parashape_pset', 'hex_to_rgb',
            'get_rgb_tuple', 'convert_to_hwp_color', 'convert_hwp_color_to_hex', 'mili2unit', 'unit2mili', 'point2unit',
@@ -9,38 +9,34 @@ import importlib.resources
 import os
 import shutil
 import sys
-import winreg
+import threading
 from pathlib import Path
 import re
-import win32com.client as win32
-import pythoncom
-import pywintypes
-from win32com.client import Dispatch
-from win32com import client
+
+# Windows-only modules (winreg / pywin32) are imported inside the functions
+# that talk to COM or the registry, so ``import hwpapi`` stays cheap and
+# works on machines without pywin32 (offline tooling, CI on Linux).
 
 from .constants import char_fields, para_fields
 from .logging import get_logger
 logger = get_logger("functions")
 
 def get_font_name(text):
-    logger.debug(f"get_font_name called")
-    logger.debug(f"Calling get_font_name")
     m = re.search(r"(^.+?)\s[A-Z0-9]+\.HFT", text)
     return m.group(1) if m else None
 
 def dispatch(app_name):
     """캐시가 충돌하는 문제를 해결하기 위해 실행합니다. 에러가 발생할 경우 기존 캐시를 삭제하고 다시 불러옵니다."""
-    logger.debug(f"dispatch called")
-    logger.debug(f"Attempting to dispatch: {app_name}")
+    logger.debug("Attempting to dispatch: %s", app_name)
     
     try:
         from win32com import client
 
         app = client.gencache.EnsureDispatch(app_name)
-        logger.info(f"Successfully dispatched: {app_name}")
+        logger.info("Successfully dispatched: %s", app_name)
         return app
     except AttributeError as e:
-        logger.warning(f"AttributeError occurred, clearing cache: {e}")
+        logger.warning("AttributeError occurred, clearing cache: %s", e)
         # Corner case dependencies.
         import os
         import re
@@ -56,23 +52,50 @@ def dispatch(app_name):
         cache_path = os.path.join(os.environ.get("LOCALAPPDATA"), "Temp", "gen_py")
         if os.path.exists(cache_path):
             shutil.rmtree(cache_path)
-            logger.debug(f"Removed cache directory: {cache_path}")
+            logger.debug("Removed cache directory: %s", cache_path)
         
         from win32com import client
 
         app = client.gencache.EnsureDispatch(app_name)
-        logger.info(f"Successfully dispatched after cache clear: {app_name}")
+        logger.info("Successfully dispatched after cache clear: %s", app_name)
         return app
 
-def get_hwp_objects():
-    logger.debug(f"get_hwp_objects called")
-    logger.debug("Searching for running HWP objects")
-    
-    hwp_objects = []
-    
+# ROT enumeration is cached per thread (monikers belong to the thread's COM
+# apartment) for ``ROT_CACHE_TTL`` seconds: back-to-back ``App()`` /
+# ``Engines()`` calls share one walk of the Running Object Table.
+ROT_CACHE_TTL = 2.0
+_rot_cache = threading.local()
+
+
+class RotEntry:
+    """A running HWP instance found in the ROT — not yet dispatched."""
+
+    __slots__ = ("name", "_rot", "_moniker")
+
+    def __init__(self, name, rot, moniker):
+        self.name = name
+        self._rot = rot
+        self._moniker = moniker
+
+    def bind(self):
+        """``IDispatch`` of the instance (one ``GetObject`` + ``QueryInterface``)."""
+        import pythoncom
+
+        obj = self._rot.GetObject(self._moniker)
+        return obj.QueryInterface(pythoncom.IID_IDispatch)
+
+    def __repr__(self):
+        return f"RotEntry({self.name!r})"
+
+
+def _enumerate_rot():
+    import pythoncom
+    import pywintypes
+
+    entries = []
     try:
         context = pythoncom.CreateBindCtx(0)
-        
+
         # 현재 실행중인 프로세스를 가져옵니다. 
         running_coms = pythoncom.GetRunningObjectTable()
         monikers = running_coms.EnumRunning()
@@ -83,42 +106,71 @@ def get_hwp_objects():
                 # moniker의 DisplayName을 통해 한글을 가져옵니다
                 # 한글의 경우 HwpObject.버전으로 각 버전별 실행 이름을 설정합니다. 
                 if re.match("!HwpObject", name):
-                    logger.debug(f"Found HWP object: {name}")
-                    # 120은 한글 2022의 경우입니다. 
-                    # 현재 moniker를 통해 ROT에서 한글의 object를 가져옵니다. 
-                    try:
-                        obje = running_coms.GetObject(moniker)
-                        # 가져온 object를 Dispatch를 통해 사용할수 있는 객체로 변환시킵니다. 
-                        hwp_obj = obje.QueryInterface(pythoncom.IID_IDispatch)
-                        hwp_objects.append(hwp_obj)
-                        logger.debug(f"Successfully added HWP object: {name}")
-                    except pywintypes.com_error as e:
-                        logger.warning(f"COM error when accessing object {name}: {e}")
-                        continue
-                    except Exception as e:
-                        logger.warning(f"Unexpected error when accessing object {name}: {e}")
-                        continue
+                    logger.debug("Found HWP object: %s", name)
+                    entries.append(RotEntry(name, running_coms, moniker))
             except pywintypes.com_error as e:
-                logger.warning(f"COM error when processing moniker: {e}")
+                logger.warning("COM error when processing moniker: %s", e)
                 continue
             except Exception as e:
-                logger.warning(f"Unexpected error when processing moniker: {e}")
+                logger.warning("Unexpected error when processing moniker: %s", e)
                 continue
-                
+
     except pywintypes.com_error as e:
-        logger.error(f"COM error when accessing Running Object Table: {e}")
+        logger.error("COM error when accessing Running Object Table: %s", e)
         return []
     except Exception as e:
-        logger.error(f"Unexpected error when accessing Running Object Table: {e}")
+        logger.error("Unexpected error when accessing Running Object Table: %s", e)
         return []
-    
-    logger.info(f"Found {len(hwp_objects)} running HWP objects")
+    return entries
+
+
+def get_hwp_monikers(max_age=None):
+    """
+    Running HWP instances as :class:`RotEntry` (nothing dispatched yet).
+
+    Results younger than ``max_age`` seconds (default
+    :data:`ROT_CACHE_TTL`) are reused; ``max_age=0`` forces a fresh walk.
+    """
+    import time
+
+    if max_age is None:
+        max_age = ROT_CACHE_TTL
+    cached = getattr(_rot_cache, "value", None)
+    now = time.monotonic()
+    if cached is not None and now - cached[0] < max_age:
+        return list(cached[1])
+    entries = _enumerate_rot()
+    _rot_cache.value = (now, entries)
+    logger.debug("ROT walk found %s HWP objects", len(entries))
+    return list(entries)
+
+
+def invalidate_rot_cache():
+    """Drop this thread's cached ROT walk (after starting/quitting HWP)."""
+    _rot_cache.value = None
+
+
+def get_hwp_objects():
+    logger.debug("Searching for running HWP objects")
+    import pywintypes
+
+    hwp_objects = []
+    for entry in get_hwp_monikers():
+        # 현재 moniker를 통해 ROT에서 한글의 object를 가져와
+        # Dispatch를 통해 사용할수 있는 객체로 변환시킵니다.
+        try:
+            hwp_objects.append(entry.bind())
+            logger.debug("Successfully added HWP object: %s", entry.name)
+        except pywintypes.com_error as e:
+            logger.warning("COM error when accessing object %s: %s", entry.name, e)
+        except Exception as e:
+            logger.warning("Unexpected error when accessing object %s: %s", entry.name, e)
+
+    logger.info("Found %s running HWP objects", len(hwp_objects))
     return hwp_objects
 
 def get_absolute_path(path):
     """파일 절대 경로를 반환합니다."""
-    logger.debug(f"get_absolute_path called")
-    logger.debug(f"Calling get_absolute_path")
     name = Path(path)
     return name.absolute().as_posix()
 
@@ -131,7 +183,7 @@ def get_appdata_path():
     """
     appdata = Path.home() / 'AppData' / 'Roaming' / 'hwpapi'
     appdata.mkdir(parents=True, exist_ok=True)
-    logger.debug(f"AppData path: {appdata}")
+    logger.debug("AppData path: %s", appdata)
     return appdata
 
 def get_hwp_dll_path():
@@ -153,7 +205,7 @@ def get_hwp_dll_path():
 
     # If already in appdata, use it
     if appdata_dll.exists():
-        logger.debug(f"DLL found in appdata: {appdata_dll}")
+        logger.debug("DLL found in appdata: %s", appdata_dll)
         return appdata_dll
 
     # Otherwise, find source and copy to appdata
@@ -165,13 +217,13 @@ def get_hwp_dll_path():
         bundled = Path(sys._MEIPASS) / 'hwpapi' / DLL_NAME
         if bundled.exists():
             source_dll = bundled
-            logger.debug(f"Found DLL in PyInstaller bundle (hwpapi/): {bundled}")
+            logger.debug("Found DLL in PyInstaller bundle (hwpapi/): %s", bundled)
         else:
             # Check in root (when hwpapi is main app)
             bundled = Path(sys._MEIPASS) / DLL_NAME
             if bundled.exists():
                 source_dll = bundled
-                logger.debug(f"Found DLL in PyInstaller bundle (root): {bundled}")
+                logger.debug("Found DLL in PyInstaller bundle (root): %s", bundled)
 
     # 2. Check package directory (development or pip install)
     if source_dll is None:
@@ -179,7 +231,7 @@ def get_hwp_dll_path():
             package_dll = Path(__file__).parent / DLL_NAME
             if package_dll.exists():
                 source_dll = package_dll
-                logger.debug(f"Found DLL in package directory: {package_dll}")
+                logger.debug("Found DLL in package directory: %s", package_dll)
         except NameError:
             pass  # __file__ not defined in some contexts
 
@@ -189,7 +241,7 @@ def get_hwp_dll_path():
             with importlib.resources.path("hwpapi", DLL_NAME) as dll_path:
                 if Path(dll_path).exists():
                     source_dll = Path(dll_path)
-                    logger.debug(f"Found DLL via importlib.resources: {source_dll}")
+                    logger.debug("Found DLL via importlib.resources: %s", source_dll)
         except (FileNotFoundError, TypeError):
             pass
 
@@ -198,10 +250,10 @@ def get_hwp_dll_path():
         try:
             appdata_dll.parent.mkdir(parents=True, exist_ok=True)
             shutil.copy2(source_dll, appdata_dll)
-            logger.info(f"Copied DLL to appdata: {appdata_dll}")
+            logger.info("Copied DLL to appdata: %s", appdata_dll)
             return appdata_dll
         except Exception as e:
-            logger.error(f"Failed to copy DLL to appdata: {e}")
+            logger.error("Failed to copy DLL to appdata: %s", e)
             # Fall back to source location
             return source_dll
 
@@ -210,8 +262,6 @@ def get_hwp_dll_path():
 
 def get_dll_path(package_name, dll_filename):
     """패키지에서 dll 경로를 확보합니다."""
-    logger.debug(f"get_dll_path called")
-    logger.debug(f"Calling get_dll_path")
     try:
         with importlib.resources.path(package_name, dll_filename) as dll_path:
             return str(dll_path)
@@ -251,7 +301,7 @@ VALUE_NAME = "FilePathCheckerModule"
 
 def add_dll_to_registry(dll_path, key_path, value_name=VALUE_NAME):
     """레지스트리에 dll을 등록/업데이트합니다."""
-    logger.debug("add_dll_to_registry called")
+    import winreg
 
     dll_path = _normalize_path_to_str(dll_path)
 
@@ -265,7 +315,7 @@ def add_dll_to_registry(dll_path, key_path, value_name=VALUE_NAME):
         ) as key:
             winreg.SetValueEx(key, value_name, 0, winreg.REG_SZ, dll_path)
 
-        logger.info(f"Registry updated: {key_path}\\{value_name} = {dll_path}")
+        logger.info("Registry updated: %s\\%s = %s", key_path, value_name, dll_path)
         return True
 
     except OSError as e:
@@ -276,7 +326,7 @@ def add_dll_to_registry(dll_path, key_path, value_name=VALUE_NAME):
 
 def get_registry_value(key_path, value_name=VALUE_NAME):
     """레지스트리에 값이 있는지 확인해 봅니다."""
-    logger.debug("get_registry_value called")
+    import winreg
 
     try:
         with winreg.OpenKey(
@@ -293,14 +343,24 @@ def get_registry_value(key_path, value_name=VALUE_NAME):
         # includes missing value_name under an existing key
         return None
 
-def check_dll(dll_path=None):
+# dll_path argument → True once the registry is known to be correct, so
+# repeated App() / Engines() construction skips the registry round trip.
+_dll_checked = {}
+
+
+def check_dll(dll_path=None, refresh=False):
     """
     Register DLL module in Windows registry.
 
     If dll_path is not provided, automatically finds and copies DLL to
     stable AppData location for reliable PyInstaller support.
+
+    A successful check is remembered for the rest of the process;
+    ``refresh=True`` re-reads the registry.
     """
-    logger.debug("check_dll called")
+    memo_key = None if dll_path is None else str(dll_path)
+    if not refresh and _dll_checked.get(memo_key):
+        return True
 
     # Get stable DLL path (copies to appdata if needed)
     if dll_path is None:
@@ -320,17 +380,17 @@ def check_dll(dll_path=None):
 
     # Update if different or not set
     if current_value != dll_path:
-        logger.info(f"Updating registry: {dll_path}")
-        add_dll_to_registry(dll_path, key_path)
+        logger.info("Updating registry: %s", dll_path)
+        if not add_dll_to_registry(dll_path, key_path):
+            return True  # not memoised — retried next time
     else:
-        logger.debug(f"Registry already correct: {dll_path}")
+        logger.debug("Registry already correct: %s", dll_path)
 
+    _dll_checked[memo_key] = True
     return True
 
 def get_value(dict_, key):
     """딕셔너리에서 키를 찾아 값을 반환합니다. 반환할 값이 없으면 키에러와 함께 가능한 키를 알려줍니다."""
-    logger.debug(f"get_value called")
-    logger.debug(f"Calling get_value")
     if key is None:
         return None
     try:
@@ -342,8 +402,6 @@ def get_value(dict_, key):
 
 def get_key(dict_, value):
     """딕셔너리에서 값를 찾아 키를 반환합니다. 반환할 값이 없으면 키에러와 함께 가능한 키를 알려줍니다."""
-    logger.debug(f"get_key called")
-    logger.debug(f"Calling get_key")
     if value is None:
         return None
     try:
@@ -354,8 +412,6 @@ def get_key(dict_, value):
         )
 
 def convert2int(_dict, value):
-    logger.debug(f"convert2int called")
-    logger.debug(f"Calling convert2int")
     if value is None:
         return value
     if isinstance(value, str):
@@ -366,8 +422,6 @@ def convert2int(_dict, value):
         return int(value)
 
 def set_pset(p, value_dict:dict):
-    logger.debug(f"set_pset called")
-    logger.debug(f"Calling set_pset")
     for field in dir(p):
         value = value_dict.get(field, None)
         if value is None:
@@ -377,8 +431,6 @@ def set_pset(p, value_dict:dict):
     return p
 
 def get_charshape_pset(p):
-    logger.debug(f"get_charshape_pset called")
-    logger.debug(f"Calling get_charshape_pset")
     return {field: getattr(p, field) for field in char_fields}
 
 def set_charshape_pset(
@@ -390,7 +442,6 @@ def set_charshape_pset(
     """
     
     
-    logger.debug(f"Calling set_charshape_pset")
 
     for field in char_fields:
         value = value_dict.get(field, None)
@@ -402,8 +453,6 @@ def set_charshape_pset(
 
 def get_parashape_pset(p):
 
-    logger.debug(f"get_parashape_pset called")
-    logger.debug(f"Calling get_parashape_pset")
     return {field: getattr(p, field) for field in para_fields}
 
 def set_parashape_pset(
@@ -411,7 +460,6 @@ def set_parashape_pset(
 ):
 
     
-    logger.debug(f"Calling set_parashape_pset")
  
     for field in para_fields:
         value = value_dict.get(field, None)
@@ -424,8 +472,6 @@ def set_parashape_pset(
 
 def hex_to_rgb(hex_string):
     # Remove the "#" symbol if it exists
-    logger.debug(f"hex_to_rgb called")
-    logger.debug(f"Calling hex_to_rgb")
     if hex_string.startswith("#"):
         hex_string = hex_string[1:]
 
@@ -440,7 +486,6 @@ def hex_to_rgb(hex_string):
 
 def get_rgb_tuple(color):
     # check if the input is already a tuple
-    logger.debug(f"get_rgb_tuple called")
     if isinstance(color, tuple):
         # validate each color
         if len(color) > 3:
@@ -484,8 +529,6 @@ def get_rgb_tuple(color):
 
 def convert_to_hwp_color(color):
     
-    logger.debug(f"convert_to_hwp_color called")
-    logger.debug(f"Calling convert_to_hwp_color")
     if isinstance(color, int):
         return color 
     
@@ -526,8 +569,6 @@ def convert_to_hwp_color(color):
         raise ValueError(f"Unsupported color format: {color}")
 
 def convert_hwp_color_to_hex(color:int):
-    logger.debug(f"convert_hwp_color_to_hex called")
-    logger.debug(f"Calling convert_hwp_color_to_hex")
     if not color:
         return color
     text = f"{color:06x}"
@@ -535,28 +576,20 @@ def convert_hwp_color_to_hex(color:int):
 
 def mili2unit(value):
     """
-    logger.debug(f"mili2unit called")
     1 밀리는 283 hwpunit 입니다.
     """
-    logger.debug(f"Calling mili2unit")
     return int(round(value*283, 0)) if value else value
 
 def unit2mili(value):
-    logger.debug(f"unit2mili called")
-    logger.debug(f"Calling unit2mili")
     return value/283 if value else value
 
 def point2unit(value):
     """
-    logger.debug(f"point2unit called")
     1point는 100 hwpunit입니다.
     """
-    logger.debug(f"Calling point2unit")
     return int(round(value*100, 0)) if value else value
 
 def unit2point(value):
-    logger.debug(f"unit2point called")
-    logger.debug(f"Calling unit2point")
     return value / 100 if value else value
 
 from typing import Union, Tuple
@@ -602,7 +635,7 @@ def parse_unit_string(value: Union[str, int, float], default_unit: str = "mm") -
                 unit = 'in'
             elif unit in ['point']:
                 unit = 'pt'
-            logger.debug(f"Parsed: number={number}, unit={unit}")
+            logger.debug("Parsed: number=%s, unit=%s", number, unit)
             return (number, unit)
 
     raise ValueError(f"Invalid unit value: {value}")
@@ -677,12 +710,9 @@ def from_hwpunit(hwpunit_value: int, target_unit: str = "mm") -> float:
 
 def block_input(func):
     """
-    logger.debug(f"block_input called")
     함수가 실행될 동안 다른 입력을 할 수 없게 하는 기능을 가진 데코레이터입니다.
     """
-    logger.debug(f"Calling block_input")
     def wrapper(app, *args, **kwargs):
-        logger.debug(f"wrapper called")
         app.api.EditMode = 0
         result = func(app, *args, **kwargs)
         app.api.EditMode = 1
@@ -10,16 +10,33 @@ The canonical open/save APIs still live on :class:`hwpapi.App` (``open``,
 2. **Export shortcuts** — named helpers for the common export targets
    (PDF / image / text) so callers don't have to remember HWP's
    magic format strings.
+3. **In-memory I/O** — documents to and from ``bytes`` without temp
+   files where HWP can stream the format (``doc.to_bytes()``,
+   ``app.docs.open_bytes()``).
+4. **Structured export** — the whole document as parsed HWPML (char
+   shapes + paragraph spans) from one COM call, or from an ``.hml`` file.
+5. **Batch conversion** — glob → ``dst_dir`` with a content-hash
+   manifest, so re-runs only convert what changed.
+6. **Page images** — page N (or a range) of one or many documents as
+   images, fanned out over engines behind a hash + page cache.
 
 Public names::
 
     from hwpapi.io.open   import open_file, new_document
     from hwpapi.io.export import export_pdf, export_image, export_text
+    from hwpapi.io.hwpml  import export_hwpml, parse_hwpml, read_hwpml, hwpml_for
+    from hwpapi.io.memory import document_to_bytes, load_bytes
+    from hwpapi.io.convert import convert, ConvertReport
+    from hwpapi.io.pages  import page_image, export_page_images, render_pages
 """
 from __future__ import annotations
 
 from .open import open_file, new_document
 from .export import export_pdf, export_image, export_text
+from .hwpml import export_hwpml, hwpml_for, parse_hwpml, read_hwpml
+from .memory import document_to_bytes, load_bytes
+from .convert import ConvertReport, convert
+from .pages import export_page_images, page_image, render_pages
 
 __all__ = [
     "open_file",
@@ -27,4 +44,15 @@ __all__ = [
     "export_pdf",
     "export_image",
     "export_text",
+    "export_hwpml",
+    "hwpml_for",
+    "parse_hwpml",
+    "read_hwpml",
+    "document_to_bytes",
+    "load_bytes",
+    "convert",
+    "ConvertReport",
+    "page_image",
+    "export_page_images",
+    "render_pages",
 ]
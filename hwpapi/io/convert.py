@@ -0,0 +1,466 @@
+"""
+:mod:`hwpapi.io.convert` — incremental batch conversion.
+
+:func:`convert` turns every file matched by a glob into ``format`` under
+``dst_dir`` and remembers what it did in a JSON manifest next to the
+outputs. A re-run only converts sources whose content changed:
+
+    report = convert("archive/**/*.hwp", "out/pdf", format="PDF", engines=4)
+    print(report)    # ConvertReport(converted=12, skipped=4810, failed=1, ...)
+
+* **Content hash** — each entry records the source's SHA-256 plus its
+  size / ``mtime_ns``. Unchanged ``stat`` means the hash is not even
+  recomputed; a touched-but-identical file costs one hash and no COM.
+* **Engines** — pending files are fanned out over ``engines`` worker
+  threads, each with its own HWP instance (COM objects belong to the
+  thread that created them, so an engine is never shared). Pass
+  ``app=`` to convert sequentially on an existing :class:`App` instead.
+* **Atomic outputs** — HWP writes to a hidden temp file in ``dst_dir``
+  that is ``os.replace``-d over the target, so a crash never leaves a
+  half-written file that the manifest would then call up to date.
+* **Per-file errors** — a failed file is recorded in the report (and
+  dropped from the manifest so the next run retries it); the batch
+  carries on. After a failure the engine is health-checked and, if HWP
+  stopped answering, relaunched (``App.reload(new_app=True)``) before
+  the next file.
+* **Checkpoints** — the manifest is rewritten every
+  ``_CHECKPOINT_FILES`` finished files or ``_CHECKPOINT_SECONDS``, so a
+  killed run keeps most of its progress.
+* **Collisions** — two sources that map to one output (``a.hwp`` and
+  ``a.hwpx`` → ``a.pdf``) are not both written: the first in match order
+  is converted, the others are reported as failed.
+"""
+from __future__ import annotations
+
+import glob
+import hashlib
+import json
+import math
+import os
+import queue
+import threading
+import time
+import uuid
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Union
+
+from hwpapi import tracing as _tracing
+from hwpapi.errors import InvalidArgumentError
+from hwpapi.logging import get_logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from hwpapi.core.app import App
+
+__all__ = ["ConvertReport", "ConvertResult", "MANIFEST_NAME", "convert", "file_digest"]
+
+logger = get_logger("io.convert")
+
+#: Manifest file written into ``dst_dir``.
+MANIFEST_NAME = ".hwpapi-convert.json"
+_MANIFEST_VERSION = 1
+
+# Output suffix per HWP format string.
+_SUFFIX = {
+    "HWP": ".hwp", "HWPX": ".hwpx", "HWPML2X": ".hml", "HML": ".hml",
+    "PDF": ".pdf", "DOCX": ".docx", "ODT": ".odt", "HTML": ".html",
+    "TEXT": ".txt", "UNICODE": ".txt", "RTF": ".rtf",
+}
+
+_HASH_BLOCK = 1 << 20
+
+# Manifest checkpoint: after this many finished files or seconds.
+_CHECKPOINT_FILES = 100
+_CHECKPOINT_SECONDS = 30.0
+
+
+def file_digest(path: Union[str, Path]) -> str:
+    """SHA-256 hex digest of ``path``, read in 1 MiB blocks."""
+    h = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(_HASH_BLOCK), b""):
+            h.update(block)
+    return h.hexdigest()
+
+
+class ConvertResult:
+    """Outcome for one source file."""
+
+    __slots__ = ("source", "output", "status", "seconds", "error")
+
+    def __init__(self, source: str, output: str, status: str,
+                 seconds: float = 0.0, error: Optional[str] = None) -> None:
+        self.source = source
+        self.output = output
+        self.status = status      # "converted" | "skipped" | "failed"
+        self.seconds = seconds    # open + save + close wall time
+        self.error = error
+
+    def __repr__(self) -> str:
+        extra = f", error={self.error!r}" if self.error else ""
+        return f"ConvertResult({self.source!r}, {self.status}{extra})"
+
+
+class ConvertReport:
+    """
+    What :func:`convert` did.
+
+    Attributes
+    ----------
+    results : list of ConvertResult
+        One per matched source, in match order.
+    elapsed : float
+        Wall time of the whole run (seconds), hashing included.
+    engines : int
+        Number of engines that actually started.
+    """
+
+    __slots__ = ("results", "elapsed", "engines")
+
+    def __init__(self, results: List[ConvertResult], elapsed: float, engines: int) -> None:
+        self.results = results
+        self.elapsed = elapsed
+        self.engines = engines
+
+    def _with(self, status: str) -> List[ConvertResult]:
+        return [r for r in self.results if r.status == status]
+
+    @property
+    def converted(self) -> List[ConvertResult]:
+        return self._with("converted")
+
+    @property
+    def skipped(self) -> List[ConvertResult]:
+        return self._with("skipped")
+
+    @property
+    def failed(self) -> List[ConvertResult]:
+        return self._with("failed")
+
+    @property
+    def ok(self) -> bool:
+        """``True`` when no file failed."""
+        return not self.failed
+
+    @property
+    def throughput(self) -> float:
+        """Converted files per second of wall time."""
+        return len(self.converted) / self.elapsed if self.elapsed > 0 else 0.0
+
+    def latency(self, q: float = 0.5) -> float:
+        """``q``-quantile of per-file conversion time (seconds, nearest rank)."""
+        times = sorted(r.seconds for r in self.converted)
+        if not times:
+            return 0.0
+        return times[min(len(times) - 1, max(0, math.ceil(q * len(times)) - 1))]
+
+    def __repr__(self) -> str:
+        return (
+            f"ConvertReport(converted={len(self.converted)}, "
+            f"skipped={len(self.skipped)}, failed={len(self.failed)}, "
+            f"elapsed={self.elapsed:.2f}s, {self.throughput:.2f} files/s, "
+            f"p50={self.latency(0.5) * 1e3:.0f}ms, p95={self.latency(0.95) * 1e3:.0f}ms)"
+        )
+
+
+# ── manifest ──────────────────────────────────────────────────────
+
+def _load_manifest(path: Path) -> Dict[str, dict]:
+    try:
+        data = json.loads(path.read_text(encoding="utf-8"))
+    except FileNotFoundError:
+        return {}
+    except (OSError, ValueError) as exc:
+        logger.warning("ignoring unreadable manifest %s: %r", path, exc)
+        return {}
+    if not isinstance(data, dict) or data.get("version") != _MANIFEST_VERSION:
+        return {}
+    entries = data.get("entries")
+    return entries if isinstance(entries, dict) else {}
+
+
+def _atomic_write(path: Path, write: Callable[[str], None]) -> None:
+    """Let ``write(tmp_name)`` produce the file, then move it over ``path``."""
+    tmp = path.with_name(f".{path.stem}.{uuid.uuid4().hex[:8]}.part{path.suffix}")
+    try:
+        write(str(tmp))
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            try:
+                tmp.unlink()
+            except OSError:  # HWP may still hold it open
+                pass
+
+
+def _save_manifest(path: Path, entries: Dict[str, dict]) -> None:
+    body = json.dumps({"version": _MANIFEST_VERSION, "entries": entries},
+                      ensure_ascii=False, indent=1, sort_keys=True)
+    _atomic_write(path, lambda name: Path(name).write_text(body, encoding="utf-8"))
+
+
+# ── planning ──────────────────────────────────────────────────────
+
+def _sources(src: Union[str, Iterable]) -> List[Path]:
+    if isinstance(src, (str, Path)):
+        names = sorted(glob.glob(str(src), recursive=True))
+    else:
+        names = [str(p) for p in src]
+    return [Path(n).resolve() for n in names if os.path.isfile(n)]
+
+
+def _common_root(paths: List[Path]) -> Path:
+    if not paths:
+        return Path.cwd()
+    return Path(os.path.commonpath([str(p.parent) for p in paths]))
+
+
+class _Job:
+    __slots__ = ("source", "output", "key", "entry")
+
+    def __init__(self, source: Path, output: Path, key: str, entry: dict) -> None:
+        self.source = source
+        self.output = output
+        self.key = key
+        self.entry = entry
+
+
+def _up_to_date(entry: Optional[dict], stat: os.stat_result, output: Path,
+                format: str, source: Path) -> Optional[str]:
+    """Digest to record if the output is current (``None`` → convert)."""
+    if not entry or entry.get("format") != format or not output.exists():
+        return None
+    if entry.get("size") == stat.st_size and entry.get("mtime_ns") == stat.st_mtime_ns:
+        return entry.get("sha256")
+    digest = file_digest(source)
+    return digest if digest == entry.get("sha256") else None
+
+
+# ── workers ───────────────────────────────────────────────────────
+
+def _default_app_factory() -> "App":
+    from hwpapi.core.app import App
+    return App(new_app=True, is_visible=False)
+
+
+def _convert_one(app: "App", job: _Job, format: str) -> None:
+    with _tracing.span("convert.file", source=str(job.source), format=format):
+        doc = app.docs.open(str(job.source))
+        try:
+            _atomic_write(job.output, lambda name: doc.save(name, format=format))
+        finally:
+            doc.close(save=False)
+
+
+def _engine_alive(app: "App") -> bool:
+    """One cheap COM read — ``False`` when HWP no longer answers."""
+    try:
+        app.api.XHwpDocuments.Count
+    except Exception:
+        return False
+    return True
+
+
+def _recover(app: "App") -> bool:
+    """After a failed file: ``True`` if ``app`` is usable (relaunched if needed)."""
+    if _engine_alive(app):
+        return True
+    logger.warning("engine stopped answering; relaunching")
+    try:
+        app.reload(new_app=True)
+    except Exception as exc:
+        logger.warning("engine relaunch failed: %r", exc)
+        return False
+    return _engine_alive(app)
+
+
+def _run_jobs(app: "App", jobs: "queue.Queue", format: str, done: Callable) -> None:
+    while True:
+        try:
+            job = jobs.get_nowait()
+        except queue.Empty:
+            return
+        t0 = time.perf_counter()
+        try:
+            _convert_one(app, job, format)
+        except Exception as exc:  # per-file capture — the batch goes on
+            logger.warning("convert %s failed: %r", job.source, exc)
+            done(job, "failed", time.perf_counter() - t0, repr(exc))
+            if not _recover(app):
+                return  # leave the rest to other engines ("no engine available")
+        else:
+            done(job, "converted", time.perf_counter() - t0, None)
+
+
+def _worker(factory: Callable[[], "App"], body: Callable[["App"], None],
+            started: List[int]) -> None:
+    try:
+        import pythoncom
+        pythoncom.CoInitialize()
+    except ImportError:
+        pythoncom = None
+    try:
+        try:
+            app = factory()
+        except Exception as exc:
+            logger.warning("engine start failed: %r", exc)
+            return
+        started.append(1)
+        try:
+            body(app)
+        finally:
+            try:
+                app.quit()
+            except Exception as exc:
+                logger.debug("quit failed: %r", exc)
+    finally:
+        if pythoncom is not None:
+            pythoncom.CoUninitialize()
+
+
+def _fan_out(body: Callable[["App"], None], pending: int, engines: int,
+             app: Optional["App"], app_factory: Optional[Callable[[], "App"]],
+             name: str) -> int:
+    """Run ``body(app)`` on ``app`` or on up to ``engines`` fresh engines.
+
+    ``body`` drains a shared queue; every worker thread builds (and quits)
+    its own App. Returns the number of engines that started.
+    """
+    if not pending:
+        return 0
+    if app is not None:
+        body(app)
+        return 1
+    started: List[int] = []
+    factory = app_factory or _default_app_factory
+    threads = [
+        threading.Thread(target=_worker, args=(factory, body, started),
+                         name=f"hwpapi-{name}-{i}", daemon=True)
+        for i in range(min(engines, pending))
+    ]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    return len(started)
+
+
+# ── public entry point ────────────────────────────────────────────
+
+def convert(
+    src: Union[str, Path, Iterable],
+    dst_dir: Union[str, Path],
+    format: str = "PDF",
+    *,
+    engines: int = 1,
+    app: Optional["App"] = None,
+    app_factory: Optional[Callable[[], "App"]] = None,
+    force: bool = False,
+) -> ConvertReport:
+    """
+    Convert every file matched by ``src`` into ``dst_dir``, skipping
+    outputs whose manifest entry still matches the source.
+
+    Parameters
+    ----------
+    src : str | Path | iterable of paths
+        Glob (``**`` recurses) or explicit file list. Outputs mirror the
+        sources' directory layout below their common parent.
+    dst_dir : str | Path
+        Output directory (created if missing). Holds the manifest
+        :data:`MANIFEST_NAME`.
+    format : str, optional
+        HWP save format (``"PDF"``, ``"HWPX"``, ``"DOCX"``, ``"TEXT"`` …).
+    engines : int, optional
+        Worker threads, each with its own HWP instance from
+        ``app_factory``. Ignored when ``app`` is given.
+    app : App, optional
+        Convert on this :class:`App` in the calling thread; it is not quit
+        (but is reloaded onto a new engine if HWP dies mid-batch).
+    app_factory : callable, optional
+        Builds one :class:`App` per worker (default
+        ``App(new_app=True, is_visible=False)``); each is quit at the end.
+    force : bool, optional
+        Convert everything, ignoring the manifest.
+
+    Returns
+    -------
+    ConvertReport
+
+    Raises
+    ------
+    InvalidArgumentError
+        Unknown ``format`` or ``engines < 1``.
+    """
+    started_at = time.perf_counter()
+    format = format.upper()
+    if format not in _SUFFIX:
+        raise InvalidArgumentError(
+            f"convert: unsupported format {format!r} (expected one of {sorted(_SUFFIX)})"
+        )
+    if engines < 1:
+        raise InvalidArgumentError(f"convert: engines must be >= 1, got {engines}")
+
+    dst = Path(dst_dir).resolve()
+    dst.mkdir(parents=True, exist_ok=True)
+    manifest_path = dst / MANIFEST_NAME
+    manifest = {} if force else _load_manifest(manifest_path)
+
+    sources = _sources(src)
+    root = _common_root(sources)
+    results: Dict[str, ConvertResult] = {}   # by source, in match order
+    owners: Dict[str, Path] = {}             # output key → the source that writes it
+    jobs: "queue.Queue[_Job]" = queue.Queue()
+    for source in sources:
+        output = dst / source.relative_to(root).with_suffix(_SUFFIX[format])
+        key = output.relative_to(dst).as_posix()
+        owner = owners.setdefault(key, source)
+        if owner != source:
+            results[str(source)] = ConvertResult(
+                str(source), str(output), "failed",
+                error=f"output {key!r} collides with {owner}")
+            continue
+        stat = source.stat()
+        entry = {"source": str(source), "format": format,
+                 "size": stat.st_size, "mtime_ns": stat.st_mtime_ns}
+        digest = _up_to_date(manifest.get(key), stat, output, format, source)
+        if digest is not None:
+            manifest[key] = dict(entry, sha256=digest)
+            results[str(source)] = ConvertResult(str(source), str(output), "skipped")
+            continue
+        output.parent.mkdir(parents=True, exist_ok=True)
+        entry["sha256"] = file_digest(source)
+        jobs.put(_Job(source, output, key, entry))
+        results[str(source)] = ConvertResult(str(source), str(output), "failed",
+                                             error="no engine available")
+
+    lock = threading.Lock()
+    unsaved = 0
+    saved_at = time.monotonic()
+
+    def done(job: _Job, status: str, seconds: float, error: Optional[str]) -> None:
+        nonlocal unsaved, saved_at
+        with lock:
+            results[str(job.source)] = ConvertResult(str(job.source), str(job.output),
+                                                     status, seconds, error)
+            if status == "converted":
+                manifest[job.key] = job.entry
+            else:
+                manifest.pop(job.key, None)
+            unsaved += 1
+            if (unsaved >= _CHECKPOINT_FILES
+                    or time.monotonic() - saved_at >= _CHECKPOINT_SECONDS):
+                _save_manifest(manifest_path, manifest)
+                unsaved, saved_at = 0, time.monotonic()
+
+    started = 0
+    try:
+        started = _fan_out(lambda a: _run_jobs(a, jobs, format, done), jobs.qsize(),
+                           engines, app, app_factory, "convert")
+    finally:
+        with lock:
+            _save_manifest(manifest_path, manifest)
+
+    report = ConvertReport(list(results.values()), time.perf_counter() - started_at,
+                           started)
+    logger.info("convert: %r", report)
+    return report
@@ -58,9 +58,9 @@ def export_image(
         ``.png`` path passes ``format="PNG"`` to HWP, everything else
         falls through to ``BMP`` which HWP always supports.
     page : int, optional
-        Reserved for future per-page export. Currently HWP's
-        ``SaveBlockAction`` path doesn't accept a page index, so we log
-        the request and delegate to the whole-document export.
+        1-based page to render alone via ``CreatePageImage``
+        (:func:`hwpapi.io.pages.page_image`). ``None`` keeps the
+        whole-document ``SaveAs`` export.
 
     Raises
     ------
@@ -72,10 +72,8 @@ def export_image(
     fmt = "PNG" if lower.endswith(".png") else "BMP"
 
     if page is not None:
-        logger.debug(
-            f"export_image: per-page export not yet wired; "
-            f"ignoring page={page!r}"
-        )
+        from hwpapi.io.pages import page_image
+        return page_image(app, path, page, format=fmt)
 
     return _save_as(app, path, fmt, "export_image")
 
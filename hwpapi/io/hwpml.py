@@ -0,0 +1,419 @@
+"""
+:mod:`hwpapi.io.hwpml` — one-shot structured export (HWPML 2.x) and parser.
+
+A single ``GetTextFile("HWPML2X", "")`` call returns the whole active
+document as HWPML XML: the char-shape table (``CHARSHAPELIST``) plus every
+paragraph as ``<P>`` / ``<TEXT CharShape="n">`` / ``<CHAR>`` spans. Parsing
+that once is far cheaper than walking the caret and querying the
+``CharShape`` action per character, so document-wide run enumeration costs
+one COM call plus parse time.
+
+``.hml`` files are the same format on disk, so :func:`read_hwpml` gives the
+same view offline without HWP.
+
+    from hwpapi.io.hwpml import hwpml_for
+    view = hwpml_for(app)            # cached until the next hwpapi edit
+    for para in view.paragraphs:
+        for text, shape_id in para.spans:
+            print(text, view.charshapes[shape_id].get("Bold", 0))
+
+Only top-level body paragraphs are listed (those under ``<SECTION>``);
+paragraphs nested inside controls (table cells, text boxes, …) are
+skipped, matching ``Section(s).Paragraph(i)`` numbering.
+"""
+from __future__ import annotations
+
+import io
+import weakref
+import xml.etree.ElementTree as ET
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Dict, List, Optional, Tuple, Union
+
+from hwpapi.logging import get_logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from hwpapi.core.app import App
+
+__all__ = [
+    "HwpmlDocument",
+    "HwpmlParagraph",
+    "HwpmlStyle",
+    "export_hwpml",
+    "hwpml_for",
+    "parse_hwpml",
+    "read_hwpml",
+]
+
+logger = get_logger("io.hwpml")
+
+_LANGS = ("Hangul", "Latin", "Hanja", "Japanese", "Other", "Symbol", "User")
+
+# Per-language child element → CharShape key prefix.
+_LANG_ELEMENTS = {
+    "RATIO": "Ratio",
+    "CHARSPACING": "Spacing",
+    "RELSIZE": "Size",
+    "CHAROFFSET": "Offset",
+}
+# Empty marker elements → CharShape on/off keys.
+_FLAG_ELEMENTS = {
+    "BOLD": "Bold",
+    "ITALIC": "Italic",
+    "EMBOSS": "Emboss",
+    "ENGRAVE": "Engrave",
+    "SUPERSCRIPT": "SuperScript",
+    "SUBSCRIPT": "SubScript",
+}
+_UNDERLINE_TYPES = {"Bottom": 1, "Center": 2, "Top": 3}
+_OUTLINE_TYPES = {"Solid": 1, "Dot": 2, "Thick": 3, "Dash": 4, "DashDot": 5, "DashDotDot": 6}
+_SHADOW_TYPES = {"Drop": 1, "Cont": 2}
+_FONT_TYPES = {"TTF": 1, "HFT": 2}
+_ALIGN_TYPES = {
+    "Justify": 0, "Left": 1, "Right": 2, "Center": 3, "Distribute": 4, "DistributeSpace": 5,
+}
+_LINE_SPACING_TYPES = {"Percent": 0, "Fixed": 1, "BetweenLines": 2, "AtLeast": 3}
+_HEADING_TYPES = {"None": 0, "Outline": 1, "Number": 2, "Bullet": 3}
+# PARASHAPE on/off attributes → ParaShape keys.
+_PARA_FLAGS = {
+    "KeepWithNext": "KeepWithNext",
+    "KeepLines": "KeepLinesTogether",
+    "PageBreakBefore": "PagebreakBefore",
+    "WidowOrphan": "WidowOrphan",
+    "SnapToGrid": "SnapToGrid",
+    "FontLineHeight": "FontLineHeight",
+}
+# PARAMARGIN attributes → ParaShape keys.
+_PARA_MARGINS = {
+    "Left": "LeftMargin",
+    "Right": "RightMargin",
+    "Indent": "Indentation",
+    "Prev": "PrevSpacing",
+    "Next": "NextSpacing",
+    "LineSpacing": "LineSpacing",
+}
+# Inline elements inside <CHAR>.
+_INLINE_TEXT = {
+    "TAB": "\t",
+    "LINEBREAK": "\n",
+    "NBSPACE": "\u00a0",
+    "FWSPACE": "\u3000",
+    "HYPHEN": "-",
+}
+
+
+class HwpmlParagraph:
+    """
+    One top-level body paragraph.
+
+    Attributes
+    ----------
+    section : int
+        Section number.
+    style : int
+        ``STYLELIST`` id of the paragraph style.
+    spans : list of (str, int)
+        ``(text, charshape_id)`` in order; adjacent spans never share an id.
+    """
+
+    __slots__ = ("section", "style", "spans")
+
+    def __init__(self, section: int, style: int) -> None:
+        self.section = section
+        self.style = style
+        self.spans: List[Tuple[str, int]] = []
+
+    @property
+    def text(self) -> str:
+        return "".join(t for t, _ in self.spans)
+
+    def __repr__(self) -> str:
+        return f"HwpmlParagraph(section={self.section}, spans={len(self.spans)})"
+
+
+class HwpmlStyle:
+    """
+    One ``STYLELIST`` entry.
+
+    Attributes
+    ----------
+    id : int
+        Style index (what the ``Style`` action's ``Apply`` takes).
+    name, eng_name : str
+        Local and English style names.
+    kind : str
+        ``"Para"`` or ``"Char"``.
+    parashape, charshape, next_style : int
+        Ids into the para-shape / char-shape tables and the follow-on style.
+    """
+
+    __slots__ = ("id", "name", "eng_name", "kind", "parashape", "charshape", "next_style")
+
+    def __init__(self, id: int, name: str, eng_name: str = "", kind: str = "Para",
+                 parashape: int = 0, charshape: int = 0, next_style: int = 0) -> None:
+        self.id = id
+        self.name = name
+        self.eng_name = eng_name
+        self.kind = kind
+        self.parashape = parashape
+        self.charshape = charshape
+        self.next_style = next_style
+
+    def __repr__(self) -> str:
+        return f"HwpmlStyle({self.id}, {self.name!r})"
+
+
+class HwpmlDocument:
+    """
+    Parsed HWPML document.
+
+    Attributes
+    ----------
+    charshapes : dict
+        ``{charshape_id: {CharShape key: value}}`` — keys follow
+        :class:`~hwpapi.low.parametersets.CharShape` (``Height``, ``Bold``,
+        ``TextColor``, ``FaceNameHangul``, …).
+    parashapes : dict
+        ``{parashape_id: {ParaShape key: value}}`` (``AlignType``,
+        ``LeftMargin``, ``LineSpacing``, …).
+    styles : list of HwpmlStyle
+        ``STYLELIST`` in id order.
+    paragraphs : list of HwpmlParagraph
+        Top-level body paragraphs, document order (empty for a
+        ``head_only`` parse).
+    """
+
+    __slots__ = ("charshapes", "parashapes", "styles", "paragraphs")
+
+    def __init__(self) -> None:
+        self.charshapes: Dict[int, Dict[str, Any]] = {}
+        self.parashapes: Dict[int, Dict[str, Any]] = {}
+        self.styles: List[HwpmlStyle] = []
+        self.paragraphs: List[HwpmlParagraph] = []
+
+    def __repr__(self) -> str:
+        return (
+            f"HwpmlDocument(charshapes={len(self.charshapes)}, "
+            f"paragraphs={len(self.paragraphs)})"
+        )
+
+
+# ── parsing ──────────────────────────────────────────────────────
+
+def _local(tag: str) -> str:
+    return tag.rpartition("}")[2]
+
+
+def _int(value, default: int = 0) -> int:
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        return default
+
+
+def _charshape_values(elem, faces: Dict[str, Dict[int, Tuple[str, int]]]) -> Dict[str, Any]:
+    a = elem.attrib
+    values: Dict[str, Any] = {
+        "Height": _int(a.get("Height"), 1000),
+        "TextColor": _int(a.get("TextColor")),
+        "ShadeColor": _int(a.get("ShadeColor"), 0xFFFFFFFF),
+        "UseFontSpace": int(a.get("UseFontSpace") == "true"),
+        "UseKerning": int(a.get("UseKerning") == "true"),
+    }
+    for key in _FLAG_ELEMENTS.values():
+        values[key] = 0
+    values["UnderlineType"] = values["OutlineType"] = values["ShadowType"] = 0
+    values["StrikeOutType"] = 0
+
+    for child in elem:
+        tag = _local(child.tag)
+        ca = child.attrib
+        if tag == "FONTID":
+            for lang in _LANGS:
+                face = faces.get(lang, {}).get(_int(ca.get(lang), -1))
+                if face is not None:
+                    values["FaceName" + lang], values["FontType" + lang] = face
+        elif tag in _LANG_ELEMENTS:
+            prefix = _LANG_ELEMENTS[tag]
+            for lang in _LANGS:
+                if lang in ca:
+                    values[prefix + lang] = _int(ca[lang])
+        elif tag in _FLAG_ELEMENTS:
+            values[_FLAG_ELEMENTS[tag]] = 1
+        elif tag == "UNDERLINE":
+            values["UnderlineType"] = _UNDERLINE_TYPES.get(ca.get("Type"), 1)
+            if "Color" in ca:
+                values["UnderlineColor"] = _int(ca["Color"])
+        elif tag == "OUTLINE":
+            values["OutlineType"] = _OUTLINE_TYPES.get(ca.get("Type"), 1)
+        elif tag == "SHADOW":
+            values["ShadowType"] = _SHADOW_TYPES.get(ca.get("Type"), 1)
+            for attr, key in (("Color", "ShadowColor"), ("OffsetX", "ShadowOffsetX"),
+                              ("OffsetY", "ShadowOffsetY")):
+                if attr in ca:
+                    values[key] = _int(ca[attr])
+        elif tag == "STRIKEOUT":
+            values["StrikeOutType"] = 1
+    return values
+
+
+def _parashape_values(elem) -> Dict[str, Any]:
+    a = elem.attrib
+    values: Dict[str, Any] = {
+        "AlignType": _ALIGN_TYPES.get(a.get("Align", ""), 0),
+        "HeadingType": _HEADING_TYPES.get(a.get("HeadingType", ""), 0),
+        "Level": _int(a.get("Level")),
+        "Condense": _int(a.get("Condense")),
+    }
+    for attr, key in _PARA_FLAGS.items():
+        values[key] = int(a.get(attr) == "true")
+    for child in elem:
+        if _local(child.tag) != "PARAMARGIN":
+            continue
+        ca = child.attrib
+        for attr, key in _PARA_MARGINS.items():
+            if attr in ca:
+                values[key] = _int(ca[attr])
+        if "LineSpacingType" in ca:
+            values["LineSpacingType"] = _LINE_SPACING_TYPES.get(ca["LineSpacingType"], 0)
+    return values
+
+
+def _char_text(elem) -> str:
+    parts = [elem.text or ""]
+    for child in elem:
+        parts.append(_INLINE_TEXT.get(_local(child.tag), ""))
+        parts.append(child.tail or "")
+    return "".join(parts)
+
+
+def _open_source(source: Union[str, bytes]):
+    if isinstance(source, str):
+        # ``GetTextFile`` returns an already decoded string whose XML
+        # declaration may still name UTF-16 — drop it and feed UTF-8.
+        if source.startswith("<?xml"):
+            source = source[source.find("?>") + 2:]
+        return io.BytesIO(source.encode("utf-8"))
+    return io.BytesIO(source)
+
+
+def parse_hwpml(source: Union[str, bytes], head_only: bool = False) -> HwpmlDocument:
+    """
+    Parse an HWPML 2.x document (string from ``GetTextFile`` or raw bytes).
+
+    Streams the XML, keeping only the shape / style tables and the span
+    list of each top-level paragraph; paragraph elements are discarded as
+    soon as they are read. ``head_only=True`` stops at ``</HEAD>``, so
+    the body is never parsed.
+
+    Raises
+    ------
+    xml.etree.ElementTree.ParseError
+        Malformed XML.
+    """
+    doc = HwpmlDocument()
+    faces: Dict[str, Dict[int, Tuple[str, int]]] = {}
+    lang: Optional[str] = None
+    section = -1
+    p_depth = 0
+    para: Optional[HwpmlParagraph] = None
+    shape_id = 0
+
+    for event, elem in ET.iterparse(_open_source(source), events=("start", "end")):
+        tag = _local(elem.tag)
+        if event == "start":
+            if tag == "P":
+                p_depth += 1
+                if p_depth == 1:
+                    para = HwpmlParagraph(section, _int(elem.get("Style")))
+            elif tag == "TEXT" and p_depth == 1:
+                shape_id = _int(elem.get("CharShape"))
+            elif tag == "SECTION":
+                section = _int(elem.get("Id"), section + 1)
+            elif tag == "FONTFACE":
+                lang = elem.get("Lang")
+            continue
+
+        if tag == "CHAR" and p_depth == 1 and para is not None:
+            text = _char_text(elem)
+            if text:
+                spans = para.spans
+                if spans and spans[-1][1] == shape_id:
+                    spans[-1] = (spans[-1][0] + text, shape_id)
+                else:
+                    spans.append((text, shape_id))
+        elif tag == "P":
+            if p_depth == 1 and para is not None:
+                doc.paragraphs.append(para)
+                para = None
+                elem.clear()
+            p_depth -= 1
+        elif tag == "FONT" and lang is not None:
+            faces.setdefault(lang, {})[_int(elem.get("Id"))] = (
+                elem.get("Name", ""), _FONT_TYPES.get(elem.get("Type", "").upper(), 0),
+            )
+        elif tag == "CHARSHAPE":
+            doc.charshapes[_int(elem.get("Id"))] = _charshape_values(elem, faces)
+            elem.clear()
+        elif tag == "PARASHAPE":
+            doc.parashapes[_int(elem.get("Id"))] = _parashape_values(elem)
+            elem.clear()
+        elif tag == "STYLE":
+            doc.styles.append(HwpmlStyle(
+                _int(elem.get("Id"), len(doc.styles)),
+                elem.get("Name", ""),
+                elem.get("EngName", ""),
+                elem.get("Type", "Para"),
+                _int(elem.get("ParaShape")),
+                _int(elem.get("CharShape")),
+                _int(elem.get("NextStyle")),
+            ))
+        elif tag == "HEAD" and head_only:
+            break
+    return doc
+
+
+def read_hwpml(path: Union[str, Path]) -> HwpmlDocument:
+    """Parse an ``.hml`` file from disk — no HWP runtime needed."""
+    return parse_hwpml(Path(path).read_bytes())
+
+
+# ── live export ──────────────────────────────────────────────────
+
+def export_hwpml(app: "App") -> str:
+    """Return the active document as an HWPML string (one COM call)."""
+    return str(app.engine.impl.GetTextFile("HWPML2X", ""))
+
+
+_views: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def hwpml_for(app: "App") -> Optional[HwpmlDocument]:
+    """
+    Parsed HWPML of ``app``'s active document, cached per App.
+
+    The cache is keyed on the edit epoch
+    (:func:`hwpapi.low.actions.edit_epoch`), so any hwpapi action,
+    :class:`~hwpapi.document.Document` call or collection edit
+    (``doc.fields[...] = ...``, ``cell.select()`` …) invalidates it;
+    edits made through raw ``app.api`` are not seen until the next one.
+    Returns ``None`` when the export or the parse fails.
+    """
+    from hwpapi.low.actions import edit_epoch
+
+    epoch = edit_epoch()
+    try:
+        cached = _views.get(app)
+    except TypeError:  # not weak-referenceable — no caching
+        cached = None
+    if cached is not None and cached[0] == epoch:
+        return cached[1]
+    try:
+        view = parse_hwpml(export_hwpml(app))
+    except Exception as exc:
+        logger.debug("HWPML export/parse failed: %r", exc)
+        return None
+    try:
+        _views[app] = (epoch, view)
+    except TypeError:
+        pass
+    return view
@@ -0,0 +1,389 @@
+"""
+:mod:`hwpapi.io.pages` — per-page image export (thumbnails).
+
+HWP renders one page to an image file with
+``HwpObject.CreatePageImage(path, pgno, resolution, depth, format)``
+(``pgno`` 0-based; hwpapi's page numbers are 1-based like the UI):
+
+* :func:`page_image` — one page of the active document
+  (``export_image(app, path, page=N)`` delegates here).
+* :func:`export_page_images` — a page range of the active document,
+  named by a template.
+* :func:`render_pages` — pages of many files, fanned out over
+  ``engines`` HWP instances, behind a content-addressed cache:
+
+      report = render_pages("portal/**/*.hwp", "thumbs", pages=1, engines=4)
+
+  Every rendered page is stored once under ``cache_dir`` as
+  ``<sha256>-p<page>-<dpi>dpi-<depth>b.<ext>``; a later request for the
+  same bytes + page is a file copy, and a file whose requested pages are
+  all cached is never opened. Batches of pages from one large document
+  are split into chunks so several engines can render it at once — with
+  ``pages=None`` and no cached page count, the first engine to open the
+  file reads the count and queues the remaining chunks for the others.
+  Two sources or pages that would write the same output name are not
+  both written: the first claim wins and the other is reported failed.
+
+Template fields: ``{stem}`` (source name without suffix), ``{name}``,
+``{rel}`` (path below the sources' common parent, no suffix), ``{page}``,
+``{ext}`` and ``{hash}`` (first 12 hex digits of the source SHA-256).
+"""
+from __future__ import annotations
+
+import queue
+import re
+import shutil
+import threading
+import time
+from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Dict, Iterable, List, Optional, Union
+
+from hwpapi import errors as _errors
+from hwpapi import tracing as _tracing
+from hwpapi.errors import FileIOError, InvalidArgumentError
+from hwpapi.io.convert import (
+    ConvertReport,
+    ConvertResult,
+    _atomic_write,
+    _common_root,
+    _fan_out,
+    _sources,
+    file_digest,
+)
+from hwpapi.logging import get_logger
+
+if TYPE_CHECKING:  # pragma: no cover
+    from hwpapi.core.app import App
+
+__all__ = ["IMAGE_FORMATS", "export_page_images", "page_image", "render_pages"]
+
+logger = get_logger("io.pages")
+
+#: ``CreatePageImage`` formats → file suffix.
+IMAGE_FORMATS = {"BMP": ".bmp", "GIF": ".gif", "PNG": ".png", "JPG": ".jpg"}
+
+DEFAULT_TEMPLATE = "{rel}-p{page}.{ext}"
+_CACHE_NAME = ".hwpapi-pages"
+_CHUNK_PAGES = 8
+
+
+def _image_format(format: Optional[str], path: Union[str, Path, None] = None) -> str:
+    if format is None:
+        suffix = Path(str(path or "")).suffix.lower()
+        format = {".jpeg": "JPG"}.get(suffix) or next(
+            (k for k, v in IMAGE_FORMATS.items() if v == suffix), "BMP"
+        )
+    format = format.upper()
+    if format not in IMAGE_FORMATS:
+        raise InvalidArgumentError(
+            f"unsupported image format {format!r} (expected one of {sorted(IMAGE_FORMATS)})"
+        )
+    return format
+
+
+def _parse_pages(spec, count: Optional[int] = None) -> List[int]:
+    """``None`` (all), ``3``, ``"1-3,7"`` or an iterable → sorted 1-based pages."""
+    if spec is None:
+        if count is None:
+            raise InvalidArgumentError("pages=None needs the page count")
+        return list(range(1, count + 1))
+    if isinstance(spec, int):
+        pages = [spec]
+    elif isinstance(spec, str):
+        pages = []
+        for part in filter(None, (p.strip() for p in spec.split(","))):
+            m = re.fullmatch(r"(\d+)(?:\s*-\s*(\d+))?", part)
+            if not m:
+                raise InvalidArgumentError(f"bad page range {part!r}")
+            lo = int(m.group(1))
+            pages.extend(range(lo, int(m.group(2) or lo) + 1))
+    else:
+        pages = [int(p) for p in spec]
+    if any(p < 1 for p in pages):
+        raise InvalidArgumentError(f"pages are 1-based, got {spec!r}")
+    return sorted(set(pages))
+
+
+def _page_count(app: "App") -> int:
+    return int(app.api.PageCount)
+
+
+def _create_page_image(app: "App", path: str, page: int, format: str,
+                       resolution: int, depth: int) -> str:
+    com_types = _errors._iter_com_error_types()
+    try:
+        with _tracing.span("page.image", page=page, format=format) as sp:
+            ok = sp.call(app.api.CreatePageImage, path, page - 1, resolution,
+                         depth, format.lower())
+    except com_types as exc:
+        raise FileIOError(f"page_image({path!r}, page={page}) failed: {exc!r}") from exc
+    if not ok:
+        raise FileIOError(f"page_image({path!r}, page={page}) was rejected by HWP")
+    return path
+
+
+def page_image(
+    app: "App",
+    path: Union[str, Path],
+    page: int = 1,
+    format: Optional[str] = None,
+    resolution: int = 96,
+    depth: int = 24,
+) -> str:
+    """Render page ``page`` (1-based) of the active document to ``path``.
+
+    ``format`` defaults from the suffix (``.png`` → ``PNG``, otherwise
+    ``BMP``). ``resolution`` is in DPI, ``depth`` in bits per pixel.
+
+    Raises
+    ------
+    InvalidArgumentError
+        Unknown format or page below 1.
+    FileIOError
+        HWP failed or refused to render the page.
+    """
+    page = _parse_pages(page)[0]
+    fmt = _image_format(format, path)
+    from hwpapi.functions import get_absolute_path
+    return _create_page_image(app, get_absolute_path(str(path)), page, fmt, resolution, depth)
+
+
+def export_page_images(
+    app: "App",
+    dst_dir: Union[str, Path],
+    pages=None,
+    template: str = DEFAULT_TEMPLATE,
+    format: str = "PNG",
+    resolution: int = 96,
+    depth: int = 24,
+) -> List[str]:
+    """Render ``pages`` (default all) of the active document into ``dst_dir``.
+
+    The ``{stem}`` / ``{name}`` / ``{rel}`` template fields come from the
+    document's path (``"untitled"`` when unsaved); ``{hash}`` is empty.
+    """
+    fmt = _image_format(format)
+    dst = Path(dst_dir).resolve()
+    doc_path = ""
+    try:
+        doc_path = app.docs.active.path or ""
+    except Exception:
+        pass
+    source = Path(doc_path or "untitled")
+    out = []
+    for page in _parse_pages(pages, _page_count(app) if pages is None else None):
+        target = dst / _render_name(template, source, source.stem, page, fmt, "")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        out.append(_create_page_image(app, str(target), page, fmt, resolution, depth))
+    return out
+
+
+# ── batch rendering ───────────────────────────────────────────────
+
+def _render_name(template: str, source: Path, rel: str, page: int, fmt: str,
+                 digest: str) -> str:
+    return template.format(
+        stem=source.stem, name=source.name, rel=rel, page=page,
+        ext=IMAGE_FORMATS[fmt].lstrip("."), hash=digest[:12],
+    )
+
+
+class _PageJob:
+    __slots__ = ("source", "digest", "rel", "pages")
+
+    def __init__(self, source: Path, digest: str, rel: str, pages: Optional[List[int]]) -> None:
+        self.source = source
+        self.digest = digest
+        self.rel = rel
+        self.pages = pages   # None → all pages, count unknown until opened
+
+
+def render_pages(
+    src: Union[str, Path, Iterable],
+    dst_dir: Union[str, Path],
+    pages=1,
+    *,
+    template: str = DEFAULT_TEMPLATE,
+    format: str = "PNG",
+    resolution: int = 96,
+    depth: int = 24,
+    engines: int = 1,
+    app: Optional["App"] = None,
+    app_factory: Optional[Callable[[], "App"]] = None,
+    cache_dir: Union[str, Path, None] = None,
+    chunk: int = _CHUNK_PAGES,
+) -> ConvertReport:
+    """
+    Render ``pages`` of every file matched by ``src`` into ``dst_dir``.
+
+    Parameters
+    ----------
+    src : str | Path | iterable of paths
+        Glob (``**`` recurses) or explicit file list.
+    dst_dir : str | Path
+        Output directory; file names come from ``template``.
+    pages : int | str | iterable | None, optional
+        1-based page(s) — ``1``, ``"1-3,7"``, ``[1, 2]`` — or ``None`` for
+        every page. Pages past the end are reported as failed.
+    template : str, optional
+        Output name relative to ``dst_dir`` (see the module docstring).
+    format, resolution, depth
+        ``CreatePageImage`` options (``format`` in :data:`IMAGE_FORMATS`).
+    engines, app, app_factory
+        As for :func:`~hwpapi.io.convert.convert`.
+    cache_dir : str | Path, optional
+        Content-addressed page cache (default ``dst_dir/.hwpapi-pages``).
+    chunk : int, optional
+        Pages per work item — smaller spreads one large document over
+        more engines at the cost of opening it more often. Applies to
+        ``pages=None`` too, once the first open has read the page count.
+
+    Returns
+    -------
+    ConvertReport
+        One result per output page; ``skipped`` means served from cache.
+    """
+    started_at = time.perf_counter()
+    fmt = _image_format(format)
+    if engines < 1 or chunk < 1:
+        raise InvalidArgumentError("render_pages: engines and chunk must be >= 1")
+    wanted = None if pages is None else _parse_pages(pages)
+    dst = Path(dst_dir).resolve()
+    cache = Path(cache_dir).resolve() if cache_dir else dst / _CACHE_NAME
+    cache.mkdir(parents=True, exist_ok=True)
+    variant = f"{resolution}dpi-{depth}b{IMAGE_FORMATS[fmt]}"
+
+    def cached(digest: str, page: int) -> Path:
+        return cache / f"{digest}-p{page}-{variant}"
+
+    def count_file(digest: str) -> Path:
+        return cache / f"{digest}.pages"
+
+    sources = _sources(src)
+    root = _common_root(sources)
+    results: Dict[tuple, ConvertResult] = {}
+    owners: Dict[Path, tuple] = {}   # output → (source, page) that writes it
+    lock = threading.Lock()
+
+    def record(job: _PageJob, page: int, status: str, seconds: float = 0.0,
+               error: Optional[str] = None, output: Optional[Path] = None) -> None:
+        if output is None:
+            output = dst / _render_name(template, job.source, job.rel, page, fmt, job.digest)
+        with lock:
+            results[(str(job.source), page)] = ConvertResult(
+                str(job.source), str(output), status, seconds, error)
+
+    def publish(job: _PageJob, page: int) -> Path:
+        output = dst / _render_name(template, job.source, job.rel, page, fmt, job.digest)
+        with lock:
+            owner = owners.setdefault(output, (str(job.source), page))
+        if owner != (str(job.source), page):
+            raise InvalidArgumentError(
+                f"output {output.name!r} collides with {owner[0]} p{owner[1]}")
+        output.parent.mkdir(parents=True, exist_ok=True)
+        _atomic_write(output, lambda name: shutil.copyfile(cached(job.digest, page), name))
+        return output
+
+    jobs: "queue.Queue[_PageJob]" = queue.Queue()
+    more = threading.Condition()
+    counting = [0]   # pages=None jobs whose page count is not known yet
+
+    def enqueue(job: _PageJob, pages: List[int]) -> None:
+        for i in range(0, len(pages), chunk):
+            jobs.put(_PageJob(job.source, job.digest, job.rel, pages[i:i + chunk]))
+            for page in pages[i:i + chunk]:
+                record(job, page, "failed", error="no engine available")
+
+    def counted() -> None:
+        with more:
+            counting[0] -= 1
+            more.notify_all()
+
+    def next_job() -> Optional[_PageJob]:
+        # Wait while a pages=None job may still queue chunks for this engine.
+        with more:
+            while True:
+                try:
+                    return jobs.get_nowait()
+                except queue.Empty:
+                    if not counting[0]:
+                        return None
+                    more.wait()
+
+    for source in sources:
+        digest = file_digest(source)
+        rel = source.relative_to(root).with_suffix("").as_posix()
+        job = _PageJob(source, digest, rel, wanted)
+        todo = wanted
+        if todo is None and count_file(digest).exists():
+            todo = list(range(1, int(count_file(digest).read_text()) + 1))
+        if todo is None:
+            jobs.put(job)
+            counting[0] += 1
+            record(job, 1, "failed", error="no engine available")
+            continue
+        missing = []
+        for page in todo:
+            if not cached(digest, page).exists():
+                missing.append(page)
+                continue
+            try:
+                record(job, page, "skipped", output=publish(job, page))
+            except InvalidArgumentError as exc:
+                record(job, page, "failed", error=repr(exc))
+        enqueue(job, missing)
+
+    def render(app: "App", job: _PageJob) -> None:
+        with _tracing.span("render.file", source=str(job.source), pages=job.pages):
+            render_pages_of(app, job)
+
+    def render_pages_of(app: "App", job: _PageJob) -> None:
+        t0 = time.perf_counter()
+        doc = app.docs.open(str(job.source))
+        try:
+            count = _page_count(app)
+            count_file(job.digest).write_text(str(count))
+            if job.pages is None:  # keep the first chunk, hand out the rest
+                pages = list(range(1, count + 1))
+                job.pages = pages[:chunk]
+                enqueue(job, pages[chunk:])
+                counted()
+            for page in job.pages:
+                try:
+                    if page > count:
+                        raise InvalidArgumentError(f"page {page} out of range ({count} pages)")
+                    target = cached(job.digest, page)
+                    if not target.exists():
+                        _atomic_write(target, lambda name: _create_page_image(
+                            app, name, page, fmt, resolution, depth))
+                    output = publish(job, page)
+                except Exception as exc:  # per-page capture
+                    logger.warning("render %s p%d failed: %r", job.source, page, exc)
+                    record(job, page, "failed", time.perf_counter() - t0, repr(exc))
+                else:
+                    record(job, page, "converted", time.perf_counter() - t0, output=output)
+                t0 = time.perf_counter()
+        finally:
+            doc.close(save=False)
+
+    def drain(app: "App") -> None:
+        while True:
+            job = next_job()
+            if job is None:
+                return
+            try:
+                render(app, job)
+            except Exception as exc:  # open failed — every page of the job
+                logger.warning("render %s failed: %r", job.source, exc)
+                for page in job.pages or [1]:
+                    record(job, page, "failed", error=repr(exc))
+            finally:
+                if job.pages is None:  # never got as far as the page count
+                    counted()
+
+    # A pages=None job may turn into many chunks, so give it every engine.
+    pending = max(jobs.qsize(), engines) if counting[0] else jobs.qsize()
+    started = _fan_out(drain, pending, engines, app, app_factory, "pages")
+    report = ConvertReport(list(results.values()), time.perf_counter() - started_at, started)
+    logger.info("render_pages: %r", report)
+    return report
@@ -1,4 +1,26 @@
-__all__ = ['HwpApiLogger', 'get_logger', 'configure_logging', 'setup_jupyter_logging']
+"""
+hwpapi logging — one ``hwpapi`` logger tree plus a ``TRACE`` level.
+
+Hot paths never format a message that will be dropped: messages use lazy
+``%``-style arguments (the stdlib checks the level before formatting),
+and per-COM-call events go to ``TRACE`` (5, below ``DEBUG``) behind the
+module flag :data:`TRACE_ON`::
+
+    from hwpapi import logging as _log
+
+    if _log.TRACE_ON:
+        logger.log(_log.TRACE, "Execute %s -> %r", key, result)
+
+``TRACE_ON`` is recomputed whenever the level changes through this module
+(``HWPAPI_LOG_LEVEL=TRACE``, :func:`set_level`, :func:`configure_logging`,
+:func:`setup_jupyter_logging`); changing the ``hwpapi`` logger's level
+directly through :mod:`logging` needs a :func:`refresh_trace` call.
+
+Log files are only written when asked for — ``configure_logging(file_path=...)``
+or ``HWPAPI_LOG_FILE``.
+"""
+__all__ = ['HwpApiLogger', 'get_logger', 'configure_logging', 'setup_jupyter_logging',
+           'TRACE', 'TRACE_ON', 'set_level', 'refresh_trace']
 
 import logging
 import sys
@@ -6,6 +28,47 @@ from pathlib import Path
 from typing import Optional, Union
 import os
 
+#: Per-COM-call events — below ``DEBUG``.
+TRACE = 5
+logging.addLevelName(TRACE, "TRACE")
+
+#: ``True`` when the ``hwpapi`` logger accepts :data:`TRACE` records.
+TRACE_ON = False
+
+
+def _parse_level(level: Union[str, int]) -> int:
+    if isinstance(level, int):
+        return level
+    name = str(level).upper()
+    if name == "TRACE":
+        return TRACE
+    value = logging.getLevelName(name)
+    if not isinstance(value, int):
+        raise ValueError(f"unknown log level {level!r}")
+    return value
+
+
+def refresh_trace() -> bool:
+    """Recompute :data:`TRACE_ON` from the ``hwpapi`` logger's level."""
+    global TRACE_ON
+    TRACE_ON = logging.getLogger('hwpapi').isEnabledFor(TRACE)
+    return TRACE_ON
+
+
+def _in_ipython() -> bool:
+    """True when running inside an IPython / Jupyter kernel.
+
+    Only looks at ``sys.modules`` — importing IPython just to ask costs
+    hundreds of milliseconds, and if it isn't loaded we aren't inside it.
+    """
+    ipython = sys.modules.get("IPython")
+    if ipython is None:
+        return False
+    try:
+        return ipython.get_ipython() is not None
+    except Exception:
+        return False
+
 
 class HwpApiLogger:
     """
@@ -48,43 +111,39 @@ class HwpApiLogger:
         """Initialize the logger with default configuration."""
         self.logger = logging.getLogger('hwpapi')
         
-        # Set default level from environment variable or WARNING
-                # Default to WARNING for production (only show warnings/errors to users)
-        # Set HWPAPI_LOG_LEVEL=DEBUG or INFO for detailed logging
-        level = os.environ.get('HWPAPI_LOG_LEVEL', 'WARNING').upper()
-        log_level = getattr(logging, level, logging.DEBUG)
+        # Default to WARNING for production (only show warnings/errors to users)
+        # Set HWPAPI_LOG_LEVEL=TRACE, DEBUG or INFO for detailed logging
+        level = os.environ.get('HWPAPI_LOG_LEVEL', 'WARNING')
+        try:
+            log_level, unknown = _parse_level(level), False
+        except ValueError:
+            log_level, unknown = logging.WARNING, True
         self.logger.setLevel(log_level)
-        
+
         # Create console handler if none exists
         if not self.logger.handlers:
-            # Check if running in Jupyter notebook
-            try:
-                from IPython import get_ipython
-                if get_ipython() is not None:
-                    # Use stderr for Jupyter notebooks for better visibility
-                    console_handler = logging.StreamHandler(sys.stderr)
-                else:
-                    console_handler = logging.StreamHandler(sys.stdout)
-            except ImportError:
-                # Not in Jupyter, use stdout
-                console_handler = logging.StreamHandler(sys.stdout)
-            
+            # Use stderr for Jupyter notebooks for better visibility
+            stream = sys.stderr if _in_ipython() else sys.stdout
+            console_handler = logging.StreamHandler(stream)
+
             # Create formatter
             formatter = logging.Formatter(
                 '%(asctime)s - %(name)s - %(levelname)s - %(message)s',
                 datefmt='%Y-%m-%d %H:%M:%S'
             )
             console_handler.setFormatter(formatter)
-            
+
             self.logger.addHandler(console_handler)
-            
-            # Automatically add file handler when level is DEBUG
-            if log_level == logging.DEBUG:
-                log_dir = Path('logs')
-                log_dir.mkdir(exist_ok=True)
-                log_file = log_dir / 'hwpapi_debug.log'
-                self.add_file_handler(log_file, logging.DEBUG)
-        
+
+            # File output only on request — never a surprise logs/ directory
+            log_file = os.environ.get('HWPAPI_LOG_FILE')
+            if log_file:
+                self.add_file_handler(log_file, log_level)
+
+        if unknown:
+            self.logger.warning("ignoring unknown HWPAPI_LOG_LEVEL=%r", level)
+        refresh_trace()
+
         # Prevent propagation to root logger
         self.logger.propagate = False
     
@@ -118,13 +177,13 @@ class HwpApiLogger:
         level : str or int
             Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
         """
-        if isinstance(level, str):
-            level = getattr(logging, level.upper())
+        level = _parse_level(level)
         self.logger.setLevel(level)
         
         # Update all child loggers
         for handler in self.logger.handlers:
             handler.setLevel(level)
+        refresh_trace()
     
     def add_file_handler(self, file_path: Union[str, Path], level: Optional[Union[str, int]] = None):
         """
@@ -143,9 +202,7 @@ class HwpApiLogger:
         file_handler = logging.FileHandler(file_path)
         
         if level is not None:
-            if isinstance(level, str):
-                level = getattr(logging, level.upper())
-            file_handler.setLevel(level)
+            file_handler.setLevel(_parse_level(level))
         
         # Create detailed formatter for file logs
         file_formatter = logging.Formatter(
@@ -165,7 +222,7 @@ class HwpApiLogger:
     def configure(self, 
                  level: Union[str, int] = 'INFO',
                  console: bool = True,
-                 file_path: Optional[Union[str, Path]] = "app.log",
+                 file_path: Optional[Union[str, Path]] = None,
                  format_string: Optional[str] = None):
         """
         Configure the logger with custom settings.
@@ -177,7 +234,7 @@ class HwpApiLogger:
         console : bool
             Whether to log to console
         file_path : str or Path, optional
-            Path to log file
+            Path to log file (no file output when omitted)
         format_string : str, optional
             Custom format string for log messages
         """
@@ -195,17 +252,9 @@ class HwpApiLogger:
         
         # Add console handler
         if console:
-            # Check if running in Jupyter notebook
-            try:
-                from IPython import get_ipython
-                if get_ipython() is not None:
-                    # Use stderr for Jupyter notebooks for better visibility
-                    console_handler = logging.StreamHandler(sys.stderr)
-                else:
-                    console_handler = logging.StreamHandler(sys.stdout)
-            except ImportError:
-                # Not in Jupyter, use stdout
-                console_handler = logging.StreamHandler(sys.stdout)
+            # Use stderr for Jupyter notebooks for better visibility
+            stream = sys.stderr if _in_ipython() else sys.stdout
+            console_handler = logging.StreamHandler(stream)
             
             console_handler.setFormatter(formatter)
             self.logger.addHandler(console_handler)
@@ -237,6 +286,18 @@ def get_logger(name: Optional[str] = None) -> logging.Logger:
     """
     return HwpApiLogger.get_logger(name)
 
+def set_level(level: Union[str, int]) -> None:
+    """
+    모든 hwpapi 로거의 레벨을 설정합니다 (``"TRACE"`` 포함).
+
+    사용 예시
+    --------
+    >>> from hwpapi.logging import set_level
+    >>> set_level('TRACE')   # COM 호출 단위 이벤트까지 출력
+    """
+    HwpApiLogger().set_level(level)
+
+
 def configure_logging(**kwargs):
     """
     hwpapi 로깅 시스템을 구성합니다.
@@ -5,11 +5,29 @@ Direct access to the raw building blocks:
 - `hwpapi.low.actions` — 900+ HWP action wrappers
 - `hwpapi.low.parametersets` — ParameterSet classes (CharShape, ParaShape, ...)
 - `hwpapi.low.engine` — Engine / Engines / Apps
+- `hwpapi.low.replay` — record COM traffic to a trace, replay it without HWP
+- `hwpapi.low.lifetime` — per-App registry of live COM proxies by document
 
 High-level users should prefer `hwpapi.App` (Phase 2+); this namespace
 is the escape hatch for dropping down to raw HWP automation calls.
+
+Submodules load on first attribute access (PEP 562) — ``engine`` pulls
+in pywin32 only when an engine is actually created, and
+``parametersets`` builds its classes only when first needed.
 """
 
-from . import actions, engine, parametersets
+import importlib
+
+__all__ = ["actions", "engine", "lifetime", "parametersets", "replay"]
+
+
+def __getattr__(name):
+    if name in __all__:
+        module = importlib.import_module(f"{__name__}.{name}")
+        globals()[name] = module
+        return module
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
-__all__ = ["actions", "engine", "parametersets"]
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,8 +1,61 @@
 __all__ = []
 
+import time
+
+from hwpapi import logging as _log
+from hwpapi import tracing as _tracing
 from hwpapi.logging import get_logger
+from hwpapi.low import lifetime as _lifetime
+
+
+_UNRESOLVED = object()
+
+# Bumped whenever hwpapi runs something that may move the cursor or change
+# its formatting (every ``_Action.run``, every ``Document`` call). The
+# formatting scopes in ``hwpapi.context.scopes`` compare it to decide
+# whether their cached cursor format is still trustworthy.
+_edit_epoch = 0
+
+
+def bump_edit_epoch() -> int:
+    """Mark the cursor state as possibly changed; returns the new epoch."""
+    global _edit_epoch
+    _edit_epoch += 1
+    return _edit_epoch
+
+
+def edit_epoch() -> int:
+    """Current edit epoch (see :func:`bump_edit_epoch`)."""
+    return _edit_epoch
+
 
-import hwpapi.low.parametersets as parametersets
+# Bumped when hwpapi runs an action that can change a document's style
+# table. ``hwpapi.collections.styles`` keys its cached style index on it.
+# ("Style" only applies a style to the cursor paragraph — not listed;
+# "StyleTemplate", 스타일 마당, replaces the whole table.)
+_style_epoch = 0
+_STYLE_TABLE_ACTIONS = frozenset(
+    {"StyleAdd", "StyleDelete", "StyleEdit", "StyleEx", "StyleTemplate"}
+)
+
+
+def bump_style_epoch() -> int:
+    """Mark style tables as possibly changed; returns the new epoch."""
+    global _style_epoch
+    _style_epoch += 1
+    return _style_epoch
+
+
+def style_epoch() -> int:
+    """Current style epoch (see :func:`bump_style_epoch`)."""
+    return _style_epoch
+
+
+def _pset_registry():
+    """``PARAMETERSET_REGISTRY`` — the parametersets package (hundreds of
+    classes) is only imported on the first registry lookup."""
+    from hwpapi.low.parametersets import PARAMETERSET_REGISTRY
+    return PARAMETERSET_REGISTRY
 
 
 # preset action data <Action key>: [<parameter key>, <description>]
@@ -903,43 +956,103 @@ class _Action:
     생성합니다. Public API 는 기존과 동일합니다.
     """
 
-    def __init__(self, app, action_key: str):
+    def __init__(self, app, action_key: str, defaults=None):
         self.app = app
         self.logger = get_logger("actions.Action")
         self.action_key = action_key
-        self.logger.debug(f"Action {action_key} initialized")
+        self.logger.debug("Action %s initialized", action_key)
 
         # Lazy caches keyed by document ID — populated by `act` / `pset` properties
         self._act_cache = {}   # {doc_id: IXHwpAction}
         self._pset_cache = {}  # {doc_id: wrapped ParameterSet}
+        # Closing a document purges its entries (hwpapi.low.lifetime)
+        _lifetime.track(app, self, "action", doc_id=None)
+
+        # Per-HWP-version GetDefault cache (hwpapi.low.defaults_cache) or None
+        self._defaults = defaults
 
         # Resolve static metadata (does not require an HWP call per-doc)
         pset_key, description = _action_info.get(action_key, (None, None))
         self.description = description if description else "Description is Not Available"
 
+        # A previous process already probed this action on this HWP version:
+        # trust its SetID and skip CreateAction/CreateSet/GetDefault here.
+        # `pset` re-checks it against the live pset and refreshes on mismatch.
+        entry = defaults.lookup(action_key) if defaults is not None else None
+        if entry is not None:
+            self.pset_key = entry.set_id
+            return
+
         # Determine pset_key using the FIRST active doc's pset (metadata-only).
         # If the initial CreateSet/GetDefault fails it's no big deal — run() will
         # retry at execution time.
+        self.pset_key = pset_key
         try:
             first_act = self.app.api.CreateAction(action_key)
             raw = first_act.CreateSet()
-            if raw:
-                first_act.GetDefault(raw)
-                hwp_setid = getattr(raw, "SetID", None)
-                if pset_key != hwp_setid:
-                    self.logger.warning(
-                        f"_action_info SetID mismatch for '{action_key}': "
-                        f"info={pset_key}, hwp={hwp_setid}. Using HWP value."
-                    )
-                pset_key = hwp_setid
-                # Seed the cache for the current doc
-                doc_id = self._current_doc_id()
-                self._act_cache[doc_id] = first_act
-                self._pset_cache[doc_id] = self._wrap_pset(raw)
+            if not raw:
+                if defaults is not None:
+                    defaults.record(action_key, None, {})
+                return
+            first_act.GetDefault(raw)
+            hwp_setid = getattr(raw, "SetID", None)
+            if pset_key != hwp_setid:
+                self.logger.warning(
+                    "_action_info SetID mismatch for '%s': info=%s, hwp=%s. "
+                    "Using HWP value.", action_key, pset_key, hwp_setid,
+                )
+            self.pset_key = hwp_setid
+            # Seed the cache for the current doc
+            doc_id = self._current_doc_id()
+            self._act_cache[doc_id] = first_act
+            self._pset_cache[doc_id] = self._load_pset(raw)
         except Exception as e:
-            self.logger.debug(f"initial CreateSet/GetDefault for '{action_key}': {e}")
+            self.logger.debug("initial CreateSet/GetDefault for '%s': %s", action_key, e)
 
-        self.pset_key = pset_key
+    @property
+    def defaults(self):
+        """
+        캐시된 GetDefault 결과 (``ActionDefaults``) — SetID, item 키, 타입,
+        기본값. 캐시가 없거나 아직 탐색 전이면 None.
+        """
+        return self._defaults.lookup(self.action_key) if self._defaults is not None else None
+
+    def _load_pset(self, raw):
+        """
+        GetDefault 가 끝난 raw pset 을 감싸고 defaults 캐시와 대조합니다.
+
+        캐시된 item 키로 ``reload`` 의 COM 읽기를 줄이고, SetID 가 다르거나
+        읽은 키가 캐시와 다르면 (HWP 업데이트 등) 이 pset 으로 항목을 다시
+        기록합니다. 프로세스마다 액션별 첫 pset 은 캐시된 키 목록 없이 전부
+        읽어, 캐시에서 빠진 키도 다시 확인합니다
+        (:meth:`~hwpapi.low.defaults_cache.DefaultsCache.reprobe`).
+        """
+        cache = self._defaults
+        entry = cache.lookup(self.action_key) if cache is not None else None
+        hwp_setid = getattr(raw, "SetID", None)
+        if isinstance(hwp_setid, str) and hwp_setid != self.pset_key:
+            self.logger.info(
+                "stale SetID for '%s': cached=%s, hwp=%s — refreshing",
+                self.action_key, self.pset_key, hwp_setid,
+            )
+            self.pset_key = hwp_setid
+            entry = None
+        if cache is not None and cache.reprobe(self.action_key):
+            item_keys = None
+        else:
+            item_keys = entry.keys if entry is not None else None
+        wrapped = self._wrap_pset(raw, item_keys=item_keys)
+        if cache is None or wrapped is None:
+            return wrapped
+        snapshot, absent = wrapped._snapshot, wrapped._absent_keys
+        present = {
+            desc.key: snapshot.get(desc.key)
+            for desc in wrapped._property_registry.values()
+            if desc.key not in absent
+        }
+        if entry is None or present.keys() != entry.keys:
+            cache.record(self.action_key, self.pset_key, present)
+        return wrapped
 
     def _current_doc_id(self) -> int:
         """현재 활성 문서의 고유 ID. 실패 시 0 (single-doc fallback)."""
@@ -974,11 +1087,13 @@ class _Action:
                 raw = self.act.CreateSet()
                 if raw:
                     self.act.GetDefault(raw)
-                self._pset_cache[doc_id] = self._wrap_pset(raw)
+                    self._pset_cache[doc_id] = self._load_pset(raw)
+                else:
+                    self._pset_cache[doc_id] = self._wrap_pset(raw)
             except Exception as e:
                 self.logger.debug(
-                    f"CreateSet/GetDefault failed for '{self.action_key}' "
-                    f"on doc {doc_id}: {e}"
+                    "CreateSet/GetDefault failed for '%s' on doc %s: %s",
+                    self.action_key, doc_id, e,
                 )
                 self._pset_cache[doc_id] = self._wrap_pset(None)
         return self._pset_cache[doc_id]
@@ -1007,9 +1122,28 @@ class _Action:
         Execute the action using pset-based approach.
         Direct execution with pset objects without HSet synchronization.
         """
-        # Use provided parameterset or default
-        pset = parameterset if parameterset else self.pset
-        
+        bump_edit_epoch()
+        if self.action_key in _STYLE_TABLE_ACTIONS:
+            bump_style_epoch()
+        if not (_log.TRACE_ON or _tracing.ENABLED):
+            # Use provided parameterset or default
+            return self._execute(parameterset if parameterset else self.pset)
+        with _tracing.span("action.run", action=self.action_key) as sp:
+            pset = parameterset if parameterset else self.pset
+            sp.set(set_id=self.pset_key)
+            t0 = time.perf_counter()
+            result = self._execute(pset)
+            elapsed = time.perf_counter() - t0
+            sp.com(elapsed)
+            if _log.TRACE_ON:
+                self.logger.log(
+                    _log.TRACE, "Execute %s -> %r (%.3f ms)",
+                    self.action_key, result, elapsed * 1e3,
+                )
+            return result
+
+    def _execute(self, pset):
+        """``HAction.Execute`` 에 넘길 raw 객체를 골라 실행합니다."""
         if pset is None:
             # No parameter set available, execute with None
             return self.act.Execute(None)
@@ -1057,22 +1191,24 @@ class _Action:
             return None
         hnode = getattr(self.app.api.HParameterSet, f"H{self.pset_key}")
         self.act.GetDefault(hnode.HSet)
-        pset_class = parametersets.PARAMETERSET_REGISTRY.get(self.pset_key)
+        pset_class = _pset_registry().get(self.pset_key)
         if not pset_class:
             return hnode
         return pset_class(hnode, app_instance=self.app)
 
-    def _wrap_pset(self, raw_pset):
+    def _wrap_pset(self, raw_pset, item_keys=None):
         """
         Wrap a raw pset COM object into a typed ParameterSet.
 
         Uses PARAMETERSET_REGISTRY as the single source of truth for
-        SetID → ParameterSet class mapping.
+        SetID → ParameterSet class mapping. ``item_keys`` (from the
+        defaults cache) limits which keys are read over COM.
         """
         if raw_pset is None or not self.pset_key:
             return None
-        pset_class = parametersets.PARAMETERSET_REGISTRY.get(self.pset_key) or parametersets.ParameterSet
-        return pset_class(raw_pset)
+        from hwpapi.low.parametersets import ParameterSet
+        pset_class = _pset_registry().get(self.pset_key) or ParameterSet
+        return pset_class(raw_pset, item_keys=item_keys)
 
     def _create_pset_parameterset(self):
         """
@@ -1084,7 +1220,7 @@ class _Action:
         if not self.pset_key:
             return None
         raw = self._create_pset()
-        return self._wrap_pset(raw)
+        return self._load_pset(raw)
 
 
     def __call__(self, pset=None):
@@ -1108,9 +1244,23 @@ class _Actions:
     def __init__(self, app):
         self._app = app
         self._cache = {}  # action_name → _Action instance
+        self._defaults = _UNRESOLVED  # DefaultsCache for this HWP version
         self.logger = get_logger("actions.Actions")
         self.logger.debug("Actions registry initialized")
 
+    @property
+    def defaults(self):
+        """
+        이 HWP 버전의 GetDefault 캐시 (``DefaultsCache``) 또는 None.
+
+        처음 접근할 때 ``app.api.Version`` 으로 한 번만 결정합니다.
+        """
+        if self._defaults is _UNRESOLVED:
+            from hwpapi.low.defaults_cache import defaults_cache_for
+            api = getattr(self._app, "api", None)
+            self._defaults = defaults_cache_for(api) if api is not None else None
+        return self._defaults
+
     def __getattr__(self, name):
         if name.startswith('_'):
             raise AttributeError(name)
@@ -1121,7 +1271,7 @@ class _Actions:
             # During early init, avoid caching
             return _Action(self._app, name)
         if name not in cache:
-            cache[name] = _Action(self._app, name)
+            cache[name] = _Action(self._app, name, defaults=self.defaults)
         return cache[name]
 
     def __dir__(self):
@@ -1170,7 +1320,7 @@ class _Actions:
         pset_key = _action_info[action_name][0]
         if not pset_key:
             return None
-        return parametersets.PARAMETERSET_REGISTRY.get(pset_key)
+        return _pset_registry().get(pset_key)
 
     def get_description(self, action_name):
         """Get action description without creating _Action."""
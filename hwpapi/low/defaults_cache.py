@@ -0,0 +1,323 @@
+"""
+HWP 버전별 GetDefault 캐시 — ``CreateAction → CreateSet → GetDefault``
+탐색 결과를 디스크에 남겨 다음 프로세스가 재사용합니다.
+
+액션마다 다음을 저장합니다 (``Engine.impl.Version`` 별 파일 하나)::
+
+    <get_appdata_path()>/pset_defaults/<version>.json
+    {"format": 1, "version": "11.0.0.1234",
+     "actions": {"CharShape": ["CharShape", {"Bold": ["bool", false], ...}],
+                 "BreakPara": [null, {}]}}
+
+- **SetID** — ``_Action`` 이 생성 시점에 COM 탐색 없이 ``pset_key`` 를 얻음.
+- **item 키** — ``ParameterSet.reload`` 가 이 SetID 에 없는 키를 COM 으로
+  읽지 않음 (없는 키 조회는 예외 왕복이라 가장 비쌈).
+- **타입 / 기본값** — ``HParamBackend._coerce_for_put`` 가 현재 값을 COM
+  에서 읽지 않고도 쓰기 타입을 정함.
+
+기본값은 문맥에 따라 달라질 수 있으므로 (``CharShape`` 의 GetDefault 는
+커서 위치의 글자 모양) 실시간 읽기를 대체하지 않고 참고용으로만
+보관합니다.
+
+캐시와 실제 HWP 가 어긋나면 (SetID 가 다르거나 캐시된 키를 읽을 수
+없으면) ``_Action`` 이 항목을 다시 기록하고, 파일 쓰기는 데몬 스레드가
+뒤에서 처리합니다. COM 객체는 STA 스레드에 묶여 있으므로 HWP 재탐색
+자체는 호출한 스레드에서 일어나는 기존 ``CreateSet`` 경로에 얹습니다.
+
+캐시 위치는 환경 변수 ``HWPAPI_DEFAULTS_CACHE`` 로 바꿉니다 — 디렉터리
+경로면 그 아래에 ``<version>.json`` 을 두고, ``0`` / ``off`` / ``false``
+(또는 빈 값) 면 캐시를 끄고 :func:`defaults_cache_for` 가 None 을
+돌려줍니다 (테스트, 읽기 전용 홈 디렉터리 등).
+
+항목에 없는 키는 "그 SetID 에 없는 키" 이지만, 기록하던 탐색에서 일시적
+으로 읽기가 실패한 키일 수도 있습니다. 그래서 프로세스마다 액션별 첫
+pset 은 (:meth:`DefaultsCache.reprobe`) 캐시된 키 목록 없이 전부 읽어
+항목을 확인하고, 이후 pset 만 캐시된 키로 COM 읽기를 줄입니다.
+"""
+from __future__ import annotations
+
+import atexit
+import json
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Dict, Mapping, Optional, Tuple
+
+from hwpapi.logging import get_logger
+
+__all__ = ["ActionDefaults", "DefaultsCache", "cache_dir", "defaults_cache_for"]
+
+logger = get_logger("low.defaults_cache")
+
+FORMAT_VERSION = 1
+
+ENV_VAR = "HWPAPI_DEFAULTS_CACHE"
+_OFF = frozenset({"", "0", "off", "false", "no"})
+
+# JSON 에 담을 수 있는 기본값 타입 ↔ 태그
+_TYPE_TAGS = {bool: "bool", int: "int", float: "float", str: "str", type(None): "none"}
+_TAG_TYPES = {tag: tp for tp, tag in _TYPE_TAGS.items()}
+
+
+def cache_dir() -> Optional[Path]:
+    """
+    캐시 파일을 둘 디렉터리 — ``HWPAPI_DEFAULTS_CACHE`` 를 매번 읽습니다.
+
+    설정하지 않으면 ``get_appdata_path()/pset_defaults``, 끄는 값이면 None.
+    """
+    value = os.environ.get(ENV_VAR)
+    if value is None:
+        from hwpapi.functions import get_appdata_path
+
+        return get_appdata_path() / "pset_defaults"
+    if value.strip().lower() in _OFF:
+        return None
+    return Path(value).expanduser()
+
+
+def _file_name(version: str) -> str:
+    return (re.sub(r"[^0-9A-Za-z._-]+", "_", version) or "unknown") + ".json"
+
+
+def _tag_value(value: Any) -> list:
+    """기본값 → ``[tag, json_value]``. 중첩 pset 등 나머지는 ``["set", null]``."""
+    tag = _TYPE_TAGS.get(type(value))
+    if tag is None:
+        return ["set", None]
+    return [tag, value]
+
+
+class ActionDefaults:
+    """캐시된 액션 하나 — SetID 와 ``{key: (tag, default)}``."""
+
+    __slots__ = ("set_id", "items")
+
+    def __init__(self, set_id: Optional[str], items: Mapping[str, Tuple[str, Any]]):
+        self.set_id = set_id
+        self.items = dict(items)
+
+    @property
+    def keys(self) -> frozenset:
+        """이 SetID 에 실제로 존재하는 item 키."""
+        return frozenset(self.items)
+
+    def types(self) -> Dict[str, type]:
+        """``{key: python type}`` — 원시 타입으로 기록된 키만."""
+        return {key: _TAG_TYPES[tag] for key, (tag, _) in self.items.items()
+                if tag in _TAG_TYPES and tag != "none"}
+
+    def defaults(self) -> Dict[str, Any]:
+        """``{key: default}`` — GetDefault 당시 값."""
+        return {key: value for key, (_, value) in self.items.items()}
+
+    def __repr__(self):
+        return f"<ActionDefaults {self.set_id!r}: {len(self.items)} items>"
+
+
+class DefaultsCache:
+    """
+    HWP 버전 하나에 대한 GetDefault 캐시.
+
+    Parameters
+    ----------
+    version : str
+        ``Engine.impl.Version`` 값. 파일 이름과 유효성 검사에 쓰입니다.
+    path : str or Path, optional
+        캐시 파일 경로. 기본값은 ``get_appdata_path()/pset_defaults/<version>.json``.
+
+    Notes
+    -----
+    파일은 첫 조회 때 읽고, :meth:`record` 후에는 데몬 스레드가 원자적으로
+    (임시 파일 + ``os.replace``) 다시 씁니다. 손상되었거나 포맷/버전이 다른
+    파일은 무시하고 빈 캐시로 시작합니다.
+    """
+
+    def __init__(self, version: str, path: Optional[os.PathLike] = None):
+        self.version = str(version)
+        self._path = Path(path) if path is not None else None
+        self._entries: Optional[Dict[str, ActionDefaults]] = None
+        self._lock = threading.Lock()
+        self._dirty = False
+        self._saver: Optional[threading.Thread] = None
+        self._probed: set = set()
+
+    @property
+    def path(self) -> Path:
+        if self._path is None:
+            from hwpapi.functions import get_appdata_path
+
+            self._path = get_appdata_path() / "pset_defaults" / _file_name(self.version)
+        return self._path
+
+    # ── 읽기 ────────────────────────────────────────────────────
+
+    def _load(self) -> Dict[str, ActionDefaults]:
+        if self._entries is not None:
+            return self._entries
+        entries: Dict[str, ActionDefaults] = {}
+        try:
+            with open(self.path, encoding="utf-8") as f:
+                data = json.load(f)
+            if data.get("format") == FORMAT_VERSION and data.get("version") == self.version:
+                for action, (set_id, items) in data.get("actions", {}).items():
+                    entries[action] = ActionDefaults(
+                        set_id, {k: tuple(v) for k, v in items.items()})
+            else:
+                logger.debug("ignoring defaults cache %s (format/version mismatch)", self.path)
+        except FileNotFoundError:
+            pass
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.debug("unreadable defaults cache %s: %s", self.path, e)
+            entries = {}
+        self._entries = entries
+        return entries
+
+    def lookup(self, action: str) -> Optional[ActionDefaults]:
+        """캐시된 ``action`` 항목, 없으면 None."""
+        with self._lock:
+            return self._load().get(action)
+
+    def types_for(self, set_id: str) -> Dict[str, type]:
+        """SetID 의 ``{key: type}`` — 그 SetID 를 쓰는 캐시된 액션들에서 합침."""
+        with self._lock:
+            entries = list(self._load().values())
+        types: Dict[str, type] = {}
+        for entry in entries:
+            if entry.set_id == set_id:
+                types.update(entry.types())
+        return types
+
+    def reprobe(self, action: str) -> bool:
+        """
+        이 프로세스에서 ``action`` 을 처음 묻는 경우에만 True.
+
+        True 면 호출한 쪽이 캐시된 키 목록 없이 pset 을 전부 읽어 항목을
+        확인합니다 — 이전 탐색에서 일시적으로 읽지 못해 빠진 키를 되찾는
+        기회는 프로세스당 한 번입니다.
+        """
+        with self._lock:
+            if action in self._probed:
+                return False
+            self._probed.add(action)
+            return True
+
+    def __contains__(self, action: str) -> bool:
+        return self.lookup(action) is not None
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._load())
+
+    # ── 쓰기 ────────────────────────────────────────────────────
+
+    def record(self, action: str, set_id: Optional[str],
+               defaults: Mapping[str, Any]) -> ActionDefaults:
+        """
+        ``action`` 의 GetDefault 결과를 기록하고 백그라운드 저장을 예약합니다.
+
+        ``defaults`` 는 ``{key: value}`` — 이 SetID 에 존재하는 키만 넘깁니다.
+        """
+        entry = ActionDefaults(set_id, {k: tuple(_tag_value(v)) for k, v in defaults.items()})
+        with self._lock:
+            entries = self._load()
+            old = entries.get(action)
+            if old is not None and old.set_id == entry.set_id and old.items == entry.items:
+                return old
+            entries[action] = entry
+            self._schedule_save()
+        return entry
+
+    def invalidate(self, action: Optional[str] = None) -> None:
+        """``action`` (None 이면 전체) 항목을 버립니다. 다음 탐색 때 다시 기록됩니다."""
+        with self._lock:
+            entries = self._load()
+            if action is None:
+                entries.clear()
+            else:
+                entries.pop(action, None)
+            self._schedule_save()
+
+    def _schedule_save(self) -> None:
+        # caller holds self._lock
+        self._dirty = True
+        if self._saver is None:
+            self._saver = threading.Thread(
+                target=self._save_loop, name="hwpapi-defaults-cache", daemon=True)
+            self._saver.start()
+
+    def _payload(self) -> str:
+        actions = {
+            name: [entry.set_id, {k: list(v) for k, v in entry.items.items()}]
+            for name, entry in sorted(self._entries.items())
+        }
+        return json.dumps(
+            {"format": FORMAT_VERSION, "version": self.version, "actions": actions},
+            ensure_ascii=False, separators=(",", ":"),
+        )
+
+    def _write(self, payload: str) -> None:
+        path = self.path
+        try:
+            path.parent.mkdir(parents=True, exist_ok=True)
+            tmp = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            tmp.write_text(payload, encoding="utf-8")
+            os.replace(tmp, path)
+        except OSError as e:
+            logger.debug("could not write defaults cache %s: %s", path, e)
+
+    def _save_loop(self) -> None:
+        while True:
+            with self._lock:
+                if not self._dirty:
+                    self._saver = None
+                    return
+                payload = self._payload()
+                self._dirty = False
+            self._write(payload)
+
+    def flush(self) -> None:
+        """보류 중인 변경을 지금 디스크에 씁니다 (백그라운드 저장 완료 대기 포함)."""
+        with self._lock:
+            saver = self._saver
+        if saver is not None:
+            saver.join()
+        with self._lock:
+            if not self._dirty:
+                return
+            payload = self._payload()
+            self._dirty = False
+        self._write(payload)
+
+    def __repr__(self):
+        return f"<DefaultsCache {self.version!r} at {self._path}>"
+
+
+_caches: Dict[str, DefaultsCache] = {}
+_caches_lock = threading.Lock()
+
+
+def defaults_cache_for(api: Any) -> Optional[DefaultsCache]:
+    """
+    ``api`` (``Engine.impl``) 의 HWP 버전에 해당하는 공유 캐시.
+
+    버전 문자열을 얻을 수 없거나 (엔진 미초기화, Mock 등) 캐시가 꺼져
+    있으면 (``HWPAPI_DEFAULTS_CACHE=0``) None 을 반환해 캐시 없이 기존처럼
+    동작하게 합니다.
+    """
+    try:
+        version = api.Version
+    except Exception:
+        return None
+    if not isinstance(version, str) or not version:
+        return None
+    directory = cache_dir()
+    if directory is None:
+        return None
+    path = directory / _file_name(version)
+    with _caches_lock:
+        cache = _caches.get(str(path))
+        if cache is None:
+            cache = _caches[str(path)] = DefaultsCache(version, path)
+            atexit.register(cache.flush)
+        return cache
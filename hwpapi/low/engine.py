@@ -17,17 +17,14 @@ import hwpapi.constants as const
 import sys
 import warnings
 from hwpapi.logging import get_logger
+from hwpapi import tracing as _tracing
 
-from hwpapi.low.actions import _Action, _Actions
-from hwpapi.low.parametersets import ParaShape
-import hwpapi.low.parametersets as parametersets
 from hwpapi.functions import (
     check_dll,
-    get_hwp_objects,
+    get_hwp_monikers,
+    invalidate_rot_cache,
     dispatch,
     get_absolute_path,
-    get_rgb_tuple,
-    set_pset,
 )
 
 
@@ -73,26 +70,73 @@ class Engine:
             Engine에 의해 캡슐화될 Hwp 객체. 기본값은 "HWPFrame.HwpObject"입니다.
         """
         self.logger = get_logger('core')
+        if not hwp_object:
+            hwp_object = "HWPFrame.HwpObject"
+            invalidate_rot_cache()  # 새 HWP 프로세스가 ROT에 등록됨
+        self._attach(hwp_object)
+
+    @classmethod
+    def from_rot(cls, entry):
+        """
+        ROT 항목에서 지연(lazy) Engine을 만듭니다.
+
+        ``impl`` 에 처음 접근할 때까지 ``GetObject`` / ``dispatch`` 를 하지
+        않으므로, 실행 중인 HWP가 여러 개여도 실제로 선택된 엔진만 비용을
+        냅니다.
+
+        매개변수
+        ----------
+        entry : RotEntry
+            :func:`~hwpapi.functions.get_hwp_monikers` 의 항목.
+        """
+        engine = cls.__new__(cls)
+        engine.logger = get_logger('core')
+        engine._rot_entry = entry
+        return engine
+
+    def __getattr__(self, name):
+        # 지연 Engine: 첫 ``impl`` 접근에서만 dispatch. 이후에는 인스턴스
+        # 속성이므로 여기를 다시 거치지 않음.
+        if name == "impl" and "_rot_entry" in self.__dict__:
+            entry = self.__dict__.pop("_rot_entry")
+            try:
+                hwp_object = entry.bind()
+            except Exception as e:
+                self.logger.error("Failed to bind %s: %s", entry.name, e)
+                invalidate_rot_cache()  # 항목이 낡았음 — 다음 조회는 새로
+                self.impl = None
+                return None
+            self._attach(hwp_object)
+            return self.impl
+        raise AttributeError(f"{type(self).__name__!r} object has no attribute {name!r}")
+
+    @property
+    def resolved(self):
+        """``impl`` 이 이미 dispatch 되었는지 (지연 Engine이면 ``False``)."""
+        return "_rot_entry" not in self.__dict__
+
+    def _attach(self, hwp_object):
         try:
-            if not hwp_object:
-                hwp_object = "HWPFrame.HwpObject"
-            self.logger.debug(f"Initializing Engine with hwp_object: {hwp_object}")
-            self.impl = dispatch(hwp_object)
+            self.logger.debug("Initializing Engine with hwp_object: %s", hwp_object)
+            with _tracing.span("engine.dispatch",
+                               launch=isinstance(hwp_object, str)) as sp:
+                self.impl = sp.call(dispatch, hwp_object)
             # v0.0.24+: Engine 식별 정보 INFO 로깅 — AI/디버깅 친화
             try:
                 import os
                 version = self.impl.Version if self.impl else "?"
                 clsid = self.impl.CLSID if self.impl else "None"
                 self.logger.info(
-                    f"Engine ready: PID={os.getpid()} version={version} clsid={clsid}"
+                    "Engine ready: PID=%s version=%s clsid=%s",
+                    os.getpid(), version, clsid,
                 )
             except Exception:
                 self.logger.info(
-                    f"Engine initialized successfully with CLSID: "
-                    f"{self.impl.CLSID if self.impl else 'None'}"
+                    "Engine initialized successfully with CLSID: %s",
+                    self.impl.CLSID if self.impl else "None",
                 )
         except Exception as e:
-            self.logger.error(f"Failed to initialize Hwp object: {e}")
+            self.logger.error("Failed to initialize Hwp object: %s", e)
             self.impl = None
 
     @property
@@ -116,6 +160,8 @@ class Engine:
         str
             Engine의 문자열 표현. 엔진이 초기화되지 않은 경우 'Uninitialized'로 표시됩니다.
         """
+        if not self.resolved:
+            return f"<Engine {self._rot_entry.name} (not dispatched)>"
         engine_name = self.name if self.name else "Uninitialized"
         return f"<Engine {engine_name}>"
 
@@ -156,11 +202,13 @@ class Engines:
 
     주의사항
     -----
-    `Engines` 클래스는 `get_hwp_objects()` 함수에서 검색된 각 객체에 대해 Engine 인스턴스를 생성하여 초기화됩니다.
-    `dll_path`가 제공된 경우 필요한 DLL을 확인합니다.
+    `Engines` 클래스는 `get_hwp_monikers()` 가 찾은 각 ROT 항목에 대해 지연 Engine
+    (:meth:`Engine.from_rot`)을 만듭니다 — 실제 dispatch는 선택된 엔진의 ``impl``
+    에 처음 접근할 때만 일어납니다. ROT 조회 결과는 잠시 캐시되며
+    (``refresh=True`` 로 무시), DLL 레지스트리 확인은 프로세스당 한 번입니다.
     """
 
-    def __init__(self, dll_path=None):
+    def __init__(self, dll_path=None, refresh=False):
         """
         사용 가능한 Hwp 객체로 Engines 컬렉션을 초기화합니다.
 
@@ -168,9 +216,12 @@ class Engines:
         ----------
         dll_path : str, optional
             초기화에 필요한 경우 DLL 파일의 경로.
+        refresh : bool, optional
+            캐시된 ROT 조회 결과를 무시하고 다시 조회합니다.
         """
         self.active = None
-        self.engines = [Engine(hwp_object) for hwp_object in get_hwp_objects()]
+        entries = get_hwp_monikers(max_age=0 if refresh else None)
+        self.engines = [Engine.from_rot(entry) for entry in entries]
         check_dll(dll_path)
 
     def add(self, engine):
@@ -0,0 +1,266 @@
+"""
+COM 프록시 수명 추적 — 문서별로 살아 있는 핸들을 세고 닫힐 때 놓아줌.
+
+hwpapi 가 만든 값 객체 (``Table._ctrl``, ``Image._ctrl``,
+``Paragraph._raw``, ``Document._raw``) 와 ``_Action`` 의 문서별
+``act`` / ``pset`` 캐시는 COM 핸들을 붙잡고 있습니다. 파이썬 쪽에서
+참조가 남아 있는 한 HWP 프로세스는 그 문서의 객체를 해제하지 못하므로,
+하루 종일 도는 서비스에서는 문서를 닫아도 HWP 메모리가 계속 늘어납니다.
+
+App 마다 :class:`LifetimeRegistry` 하나가 이런 프록시를 **약한 참조**
+로 (문서 ID, 종류) 별로 추적합니다. 문서를 닫으면
+(:meth:`hwpapi.document.Document.close`) 그 문서의 action/pset 캐시
+항목을 지우고 남은 프록시의 핸들을 ``None`` 으로 끊습니다. 프록시의
+문서 ID 는 만든 쪽이 실제로 읽은 ``DocumentID`` 입니다 — 컬렉션은 순회
+한 번에 활성 문서 ID 를 한 번 읽고, ``Document`` 는 처음 활성화할 때
+자기 ID 를 읽습니다. hwpapi 밖 (HWP UI, raw COM) 에서 활성 문서가 바뀔
+수 있으므로 "마지막으로 본 활성 문서" 같은 추정은 쓰지 않고, ID 를
+모르는 프록시는 ``None`` 으로 남아 문서를 닫아도 끊기지 않습니다.
+
+Examples
+--------
+>>> report = app.gc_report()
+>>> report["live"]            # {"paragraph": 200, "table": 3, "action": 12}
+>>> report["leaks"]           # 닫힌 문서를 가리키는 핸들 수
+"""
+from __future__ import annotations
+
+import collections
+import weakref
+from typing import Any, Dict, List, Optional
+
+from hwpapi.logging import get_logger
+
+__all__ = [
+    "LifetimeRegistry",
+    "active_document_id",
+    "bind_document",
+    "document_id",
+    "lifetime_registry",
+    "release_all",
+    "release_document",
+    "track",
+]
+
+logger = get_logger("low.lifetime")
+
+_registries: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+class LifetimeRegistry:
+    """
+    App 하나가 만든 COM 프록시의 약한 참조 목록.
+
+    ``_live`` 는 ``{weakref: [kind, doc_id, attr]}`` — ``attr`` 은 핸들을 담은 속성
+    이름이고 ``None`` 이면 (``_Action``) 문서별 캐시를 비웁니다. 핸들을
+    끊은 프록시는 목록에서 빠지므로 ``live`` 는 "아직 핸들을 쥔 프록시"
+    의 수입니다.
+    """
+
+    __slots__ = ("_live", "created", "collected", "released", "closed",
+                 "__weakref__")
+
+    def __init__(self) -> None:
+        self._live: Dict[weakref.ref, list] = {}
+        self.created = collections.Counter()
+        self.collected = collections.Counter()
+        self.released = collections.Counter()
+        self.closed = 0
+
+    def add(self, proxy, kind: str, attr: Optional[str] = None,
+            doc_id: Optional[int] = None) -> None:
+        """``proxy`` 를 문서 ``doc_id`` (모르면 ``None``) 의 ``kind`` 로 추적."""
+        self._live[weakref.ref(proxy, self._gone)] = [kind, doc_id, attr]
+        self.created[kind] += 1
+
+    def bind(self, proxy, doc_id: Optional[int]) -> None:
+        """추적 중인 ``proxy`` 의 문서 ID 를 고침 (추적 전이면 무시)."""
+        entry = self._live.get(weakref.ref(proxy))
+        if entry is not None:
+            entry[1] = doc_id
+
+    def _gone(self, ref) -> None:
+        entry = self._live.pop(ref, None)
+        if entry is not None:
+            self.collected[entry[0]] += 1
+
+    def _entries(self) -> List[tuple]:
+        """살아 있는 ``(proxy, entry)`` 목록 — 순회 중 GC 콜백에 안전."""
+        out = []
+        for ref, entry in list(self._live.items()):
+            proxy = ref()
+            if proxy is not None:
+                out.append((proxy, ref, entry))
+        return out
+
+    def _drop(self, proxy, ref, entry) -> None:
+        setattr(proxy, entry[2], None)
+        self._live.pop(ref, None)
+        self.released[entry[0]] += 1
+
+    def release(self, doc_id: Optional[int], raw=None) -> int:
+        """
+        문서 ``doc_id`` 의 핸들을 모두 놓음. 놓은 핸들 수를 반환.
+
+        ``raw`` (닫힌 ``IXHwpDocument``) 를 주면 같은 문서를 감싼 다른
+        ``Document`` 프록시의 핸들도 끊습니다.
+        """
+        n = 0
+        for proxy, ref, entry in self._entries():
+            kind, doc, attr = entry
+            if attr is None:
+                n += self._purge_action(proxy, doc_id)
+            elif doc is not None and doc == doc_id:
+                self._drop(proxy, ref, entry)
+                n += 1
+            elif kind == "document" and raw is not None:
+                try:
+                    same = getattr(proxy, attr) == raw
+                except Exception:
+                    same = False
+                if same:
+                    self._drop(proxy, ref, entry)
+                    n += 1
+        self.closed += 1
+        logger.debug("released %d handle(s) of document %s", n, doc_id)
+        return n
+
+    def release_all(self) -> int:
+        """모든 문서의 핸들을 놓음 (엔진 종료 시). 놓은 핸들 수를 반환."""
+        n = 0
+        for proxy, ref, entry in self._entries():
+            if entry[2] is None:
+                n += self._purge_action(proxy, None)
+            else:
+                self._drop(proxy, ref, entry)
+                n += 1
+        return n
+
+    def _purge_action(self, action, doc_id: Optional[int]) -> int:
+        """``_Action`` 의 문서별 캐시에서 ``doc_id`` (None 이면 전부) 를 제거."""
+        n = 0
+        for cache, kind in ((action._act_cache, "action"), (action._pset_cache, "pset")):
+            if doc_id is None:
+                keys = list(cache)
+            else:
+                keys = [doc_id] if doc_id in cache else []
+            for key in keys:
+                del cache[key]
+                self.released[kind] += 1
+                n += 1
+        return n
+
+    def report(self, open_documents: Optional[List[int]] = None) -> Dict[str, Any]:
+        """
+        현재 상태 요약 — :meth:`hwpapi.core.app.App.gc_report` 참고.
+
+        ``open_documents`` 를 주면 그 밖의 문서를 가리키는 핸들을
+        ``leaks`` 로 셉니다. 이때 ID 를 모르는 ``document`` 프록시는 핸들의
+        ``DocumentID`` 를 읽어 묶고, 그래도 모르는 프록시는 제외합니다.
+        """
+        live = collections.Counter()
+        by_document: Dict[Optional[int], collections.Counter] = {}
+        for proxy, _, entry in self._entries():
+            kind, doc, attr = entry
+            live[kind] += 1
+            if kind == "document" and doc is None and open_documents is not None:
+                doc = entry[1] = document_id(getattr(proxy, attr, None))
+            if attr is not None:
+                by_document.setdefault(doc, collections.Counter())[kind] += 1
+                continue
+            for cache, label in ((proxy._act_cache, "action"), (proxy._pset_cache, "pset")):
+                for doc in cache:
+                    by_document.setdefault(doc, collections.Counter())[label] += 1
+
+        leaks = None
+        if open_documents is not None:
+            open_set = set(open_documents)
+            leaks = collections.Counter()
+            for doc, kinds in by_document.items():
+                if doc is not None and doc not in open_set:
+                    leaks.update(kinds)
+            leaks = dict(leaks)
+        return {
+            "live": dict(live),
+            "by_document": {doc: dict(kinds) for doc, kinds in by_document.items()},
+            "created": dict(self.created),
+            "collected": dict(self.collected),
+            "released": dict(self.released),
+            "closed_documents": self.closed,
+            "open_documents": open_documents,
+            "leaks": leaks,
+        }
+
+
+def lifetime_registry(app, create: bool = True) -> Optional[LifetimeRegistry]:
+    """
+    ``app`` 의 :class:`LifetimeRegistry`.
+
+    ``create=False`` 면 없을 때 만들지 않고 ``None``. 약한 참조를 걸 수
+    없는 ``app`` 도 ``None``.
+    """
+    try:
+        registry = _registries.get(app)
+        if registry is None and create:
+            registry = _registries[app] = LifetimeRegistry()
+    except TypeError:
+        return None
+    return registry
+
+
+def track(app, proxy, kind: str, attr: Optional[str] = None,
+          doc_id: Optional[int] = None) -> None:
+    """``proxy`` 를 ``app`` 의 레지스트리에 추적. 실패는 조용히 무시."""
+    registry = lifetime_registry(app)
+    if registry is not None:
+        try:
+            registry.add(proxy, kind, attr, doc_id)
+        except TypeError:  # 약한 참조 불가 객체
+            pass
+
+
+def bind_document(app, proxy, doc_id: Optional[int]) -> None:
+    """추적 중인 ``proxy`` 가 문서 ``doc_id`` 를 감싼다고 기록."""
+    registry = lifetime_registry(app, create=False)
+    if registry is not None:
+        registry.bind(proxy, doc_id)
+
+
+def document_id(raw) -> Optional[int]:
+    """``IXHwpDocument`` 의 ``DocumentID`` (COM 1회). 읽지 못하면 ``None``."""
+    if raw is None:
+        return None
+    try:
+        return int(raw.DocumentID)
+    except Exception:
+        return None
+
+
+def active_document_id(app) -> Optional[int]:
+    """HWP 가 지금 활성으로 보는 문서의 ID. 읽지 못하면 ``None``."""
+    try:
+        raw = app.engine.impl.XHwpDocuments.Active_XHwpDocument
+    except Exception:
+        return None
+    return document_id(raw)
+
+
+def release_document(app, doc_id: Optional[int], raw=None) -> int:
+    """문서 ``doc_id`` 가 닫혔음을 알리고 그 핸들을 놓음. 놓은 수를 반환."""
+    registry = lifetime_registry(app, create=False)
+    return registry.release(doc_id, raw) if registry is not None else 0
+
+
+def release_all(app) -> int:
+    """
+    ``app`` 이 만든 모든 핸들을 놓음. 놓은 수를 반환.
+
+    추적하는 프록시 외에 App 별 ``HParameterSet`` backend
+    (:func:`~hwpapi.low.parametersets.backends.hparameterset_backend`) 의
+    node 캐시도 버립니다.
+    """
+    from hwpapi.low.parametersets.backends import release_hparameterset_backend
+
+    release_hparameterset_backend(app)
+    registry = lifetime_registry(app, create=False)
+    return registry.release_all() if registry is not None else 0
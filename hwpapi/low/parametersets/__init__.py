@@ -1,6 +1,5 @@
 from __future__ import annotations
 from hwpapi.functions import from_hwpunit, to_hwpunit, convert_hwp_color_to_hex, convert_to_hwp_color
-import pprint
 import re
 from typing import Any, Dict, List, Optional, Union, Callable, Type, Protocol, Literal, Iterable
 
@@ -38,8 +37,10 @@ __all__ = ['PARAMETERSET_REGISTRY', 'DIRECTION_MAP', 'CAP_FULL_SIZE_MAP', 'ALIGN
            'TableStrToTbl', 'TableSwap', 'TableTblToStr', 'TableTemplate', 'TextCtrl', 'TextVertical',
            'UserQCommandFile', 'VersionInfo', 'ViewProperties', 'ViewStatus']
 
-# Global registry for auto-wrapping ParameterSets
-PARAMETERSET_REGISTRY = {}
+# Global registry for auto-wrapping ParameterSets. Starts as an index of
+# class specs; each class is built on its first lookup (see registry.py).
+from .registry import LazyRegistry, _CLASS_INDEX
+PARAMETERSET_REGISTRY = LazyRegistry(_CLASS_INDEX)
 
 # Value mappings (string ↔ int) for MappedProperty — defined in mappings.py
 from .mappings import *  # noqa: F401,F403
@@ -91,18 +92,18 @@ def wrap_parameterset(pset_obj, pset_id=None):
     # Tier 1: Known type by pset_id
     if pset_id and pset_id in PARAMETERSET_REGISTRY:
         cls = PARAMETERSET_REGISTRY[pset_id]
-        logger.debug(f"Wrapping {pset_id} with {cls.__name__}")
+        logger.debug("Wrapping %s with %s", pset_id, cls.__name__)
         return cls(pset_obj)
 
     # Try by type name
     type_name = type(pset_obj).__name__
     if type_name in PARAMETERSET_REGISTRY:
         cls = PARAMETERSET_REGISTRY[type_name]
-        logger.debug(f"Wrapping {type_name} with {cls.__name__}")
+        logger.debug("Wrapping %s with %s", type_name, cls.__name__)
         return cls(pset_obj)
 
     # Tier 2: Generic wrapper
-    logger.debug(f"Wrapping unknown pset {pset_id} with GenericParameterSet")
+    logger.debug("Wrapping unknown pset %s with GenericParameterSet", pset_id)
     return GenericParameterSet(pset_obj, pset_id=pset_id)
 
 
@@ -170,26 +171,21 @@ from .base import (
 )
 
 # ── ParameterSet subclasses ─────────────────────────────────────────────
-# 143 subclasses organized by HWP functional domain. Each domain module
-# auto-registers its classes to PARAMETERSET_REGISTRY via ParameterSetMeta.
-from .sets import *  # noqa: F401,F403
-
-
-def _finalize_attr_lookups():
-    """Populate snake_case/lowercase entries in each class's _attr_lookup.
-
-    Must be called AFTER all ParameterSet subclasses are defined so that
-    PARAMETERSET_REGISTRY contains the full list.
-    """
-    for cls in list(PARAMETERSET_REGISTRY.values()):
-        if not hasattr(cls, '_all_properties'):
-            continue
-        lookup = cls.__dict__.get('_attr_lookup')
-        if lookup is None:
-            continue
-        for key in cls._all_properties:
-            snake = _pascal_to_snake(key)
-            lookup.setdefault(snake, key)
-            lookup.setdefault(snake.lower(), key)
-
-_finalize_attr_lookups()
+# 143 subclasses organized by HWP functional domain under ``sets/``. They
+# are NOT imported here: ``from hwpapi.low.parametersets import CharShape``
+# or any registry lookup builds the owning domain module on demand, and
+# its classes auto-register to PARAMETERSET_REGISTRY via ParameterSetMeta.
+# ``import hwpapi.low.parametersets.sets`` still builds everything eagerly.
+
+def __getattr__(name: str):
+    if name in PARAMETERSET_REGISTRY and not name.startswith("_"):
+        cls = PARAMETERSET_REGISTRY[name]
+        if cls.__name__ == name:
+            globals()[name] = cls
+            return cls
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    lazy = (n for names in _CLASS_INDEX.values() for n in names)
+    return sorted(set(globals()) | set(lazy))
@@ -22,7 +22,8 @@ All backends implement the ``ParameterBackend`` protocol:
 See ``hwpapi/parametersets/__init__.py :: make_backend()`` for auto-selection.
 """
 from __future__ import annotations
-from typing import Any, Protocol
+import weakref
+from typing import Any, Dict, Mapping, Optional, Protocol
 
 
 class ParameterBackend(Protocol):
@@ -146,10 +147,25 @@ class HParamBackend:
     Backend for HParameterSet objects (legacy HSet-based approach).
     Supports dotted key paths for accessing nested parameter set structures.
     Example: "HFindReplace.FindString" navigates to HFindReplace.FindString attribute.
+
+    Resolved parent nodes are cached per dotted prefix and each key's write
+    type is learned once (or seeded via ``types`` / :meth:`seed_types`), so
+    after the first write to a key ``set`` is exactly one COM ``setattr``.
+    Call :meth:`clear_cache` if the underlying nodes may have been replaced.
     """
-    def __init__(self, root: Any):
-        """Initialize with root HParameterSet or any child node."""
+    _COERCIBLE = (bool, int, float, str)
+
+    def __init__(self, root: Any, types: Optional[Mapping[str, type]] = None):
+        """Initialize with root HParameterSet or any child node.
+
+        ``types`` maps keys to their write type (e.g. from
+        ``ActionDefaults.types()`` in ``hwpapi.low.defaults_cache``); listed
+        keys are coerced without reading the current value over COM.
+        """
         self._root = root
+        self._types: Dict[str, type] = dict(types) if types else {}
+        self._nodes: Dict[str, Any] = {}  # dotted prefix → node proxy
+        self._seeded: set = set()
 
     def get(self, key: str) -> Any:
         """Get value using dotted key path."""
@@ -163,7 +179,10 @@ class HParamBackend:
         """Set value using dotted key path with type-aware coercion."""
         try:
             parent, leaf = self._resolve_parent_and_leaf(key)
-            coerced_value = self._coerce_for_put(parent, leaf, value)
+            current_type = self._types.get(key)
+            if current_type is None:
+                current_type = self._learn_type(key, parent, leaf)
+            coerced_value = self._coerce_for_put(parent, leaf, value, current_type)
             setattr(parent, leaf, coerced_value)
         except (AttributeError, KeyError) as e:
             raise KeyError(f"Cannot set '{key}': {e}") from e
@@ -195,22 +214,62 @@ class HParamBackend:
         except (AttributeError, KeyError):
             return False
 
+    def node(self, path: str) -> Any:
+        """Resolve (and cache) the node at dotted ``path`` below the root."""
+        if not path:
+            return self._root
+        try:
+            return self._nodes[path]
+        except KeyError:
+            parent_path, _, name = path.rpartition('.')
+            node = self._nodes[path] = getattr(self.node(parent_path), name)
+            return node
+
+    def seed_types(self, prefix: str, types: Mapping[str, type]) -> None:
+        """
+        Seed write types for the items under ``prefix`` (e.g.
+        ``"HFindReplace"`` with the ``FindReplace`` SetID's types). Each
+        prefix is seeded once; already-known keys are kept.
+        """
+        if prefix in self._seeded:
+            return
+        self._seeded.add(prefix)
+        for leaf, tp in types.items():
+            self._types.setdefault(f"{prefix}.{leaf}" if prefix else leaf, tp)
+
+    def clear_cache(self) -> None:
+        """Forget cached node proxies (write types stay valid).
+
+        Called by :func:`release_hparameterset_backend` when the engine
+        behind the nodes goes away (``App.reload`` / ``App.quit``).
+        """
+        self._nodes.clear()
+
+    def _learn_type(self, key: str, parent: Any, leaf: str) -> Optional[type]:
+        """One live read to learn ``key``'s write type; remembered if primitive."""
+        try:
+            current_type = type(getattr(parent, leaf))
+        except (AttributeError, TypeError):
+            return None
+        if current_type in self._COERCIBLE:
+            self._types[key] = current_type
+        return current_type
+
     def _resolve_parent_and_leaf(self, key: str):
         """Resolve dotted key path to (parent_object, leaf_attribute)."""
-        if '.' not in key:
-            return (self._root, key)
+        parent_path, _, leaf = key.rpartition('.')
+        return (self.node(parent_path), leaf)
 
-        parts = key.split('.')
-        current = self._root
-        for part in parts[:-1]:
-            current = getattr(current, part)
-        return (current, parts[-1])
+    def _coerce_for_put(self, parent: Any, leaf: str, value: Any,
+                        current_type: Optional[type] = None) -> Any:
+        """Type-aware coercion for HParameterSet attributes.
 
-    def _coerce_for_put(self, parent: Any, leaf: str, value: Any) -> Any:
-        """Type-aware coercion for HParameterSet attributes."""
+        ``current_type`` (known from the type table) skips the live
+        ``getattr`` that would otherwise discover it.
+        """
         try:
-            current = getattr(parent, leaf)
-            current_type = type(current)
+            if current_type is None:
+                current_type = type(getattr(parent, leaf))
 
             if isinstance(value, current_type):
                 return value
@@ -229,6 +288,44 @@ class HParamBackend:
             return value
 
 
+_app_backends: "weakref.WeakKeyDictionary" = weakref.WeakKeyDictionary()
+
+
+def hparameterset_backend(app: Any) -> HParamBackend:
+    """
+    Shared :class:`HParamBackend` over ``app.api.HParameterSet``.
+
+    One instance per App, so node proxies (``HCharShape``, ``HFindReplace``
+    …) and learned write types survive across calls instead of being
+    re-resolved by every ``_sync_hset_global_state`` / scope hop.
+    """
+    try:
+        backend = _app_backends.get(app)
+    except TypeError:  # not weak-referenceable
+        return HParamBackend(app.api.HParameterSet)
+    if backend is None:
+        backend = HParamBackend(app.api.HParameterSet)
+        _app_backends[app] = backend
+    return backend
+
+
+def release_hparameterset_backend(app: Any) -> None:
+    """
+    Drop ``app``'s shared :class:`HParamBackend` and its node proxies.
+
+    The cached root and nodes point into the engine the backend was made
+    for; :func:`hwpapi.low.lifetime.release_all` calls this when that
+    engine is quit or replaced, so the next :func:`hparameterset_backend`
+    call binds to the current ``app.api.HParameterSet``.
+    """
+    try:
+        backend = _app_backends.pop(app, None)
+    except TypeError:  # not weak-referenceable — never cached
+        return
+    if backend is not None:
+        backend.clear_cache()
+
+
 # ── COM object detection helpers ─────────────────────────────────────────
 
 def _is_com(obj: Any) -> bool:
@@ -283,6 +380,8 @@ __all__ = [
     "AttrBackend",
     "PsetBackend",
     "HParamBackend",
+    "hparameterset_backend",
+    "release_hparameterset_backend",
     "_is_com",
     "_looks_like_pset",
     "make_backend",
@@ -4,12 +4,16 @@ ParameterSet base class, metaclass, and GenericParameterSet.
 This module defines the foundational classes for the ParameterSet system:
 
 - ParameterSetMeta: Metaclass that auto-registers each subclass into
-  ``PARAMETERSET_REGISTRY`` and builds a case-insensitive ``_attr_lookup``
-  for O(1) snake_case ↔ PascalCase resolution.
+  ``PARAMETERSET_REGISTRY``, makes it slotted (no per-instance ``__dict__``),
+  numbers its item keys (``_key_index``) and exposes a case-insensitive
+  ``_attr_lookup`` (built on first use) for O(1) snake_case ↔ PascalCase
+  resolution.
 
 - ParameterSet: Base class for all typed parameter wrappers. Supports:
   - snake_case and PascalCase attribute access
-  - staged writes (``_staged``) and snapshot reads (``_snapshot``)
+  - staged writes (``_staged``) and snapshot reads (``_snapshot``); the
+    snapshot is a list indexed by key position and the staging structures
+    are only allocated once something is staged
   - auto-wrapping of nested ParameterSets
   - native COM methods: ``clone()``, ``is_equivalent()``, ``merge()``, ``item_exists()``
 
@@ -19,13 +23,14 @@ This module defines the foundational classes for the ParameterSet system:
   ``__str__``, and static property factory methods (``_typed_prop`` etc.).
 """
 from __future__ import annotations
-import pprint
 import re
 from typing import Any, Dict, List, Optional, Union, Callable, Type, Iterable
 
 from hwpapi.functions import from_hwpunit, to_hwpunit, convert_hwp_color_to_hex, convert_to_hwp_color
+from hwpapi.logging import get_logger
 from .backends import (
     ParameterBackend, PsetBackend, HParamBackend, ComBackend, AttrBackend,
+    hparameterset_backend,
     _is_com, _looks_like_pset, make_backend,
 )
 from .properties import (
@@ -54,7 +59,12 @@ from hwpapi.low.parametersets import PARAMETERSET_REGISTRY
 
 
 class ParameterSetMeta(type):
-    """Metaclass for automatic property registration and ParameterSet registration."""
+    """Metaclass for automatic property registration and ParameterSet registration.
+
+    Every class it creates is slotted: a subclass that does not declare
+    ``__slots__`` gets an empty one, so instances carry only the slots of
+    :class:`ParameterSet` (attributes outside them land in ``_extra``).
+    """
 
     def __new__(cls, name, bases, namespace):
         # Collect property descriptors
@@ -65,6 +75,7 @@ class ParameterSetMeta(type):
 
         # Store property registry
         namespace['_property_registry'] = properties
+        namespace.setdefault('__slots__', ())
 
         # Create the class
         new_class = super().__new__(cls, name, bases, namespace)
@@ -77,29 +88,47 @@ class ParameterSetMeta(type):
 
         new_class._all_properties = all_properties
 
-        # Build O(1) attribute lookup table: maps name variants to actual key.
-        # Used by ParameterSet.__getattr__/__setattr__ to avoid dir() iteration.
-        # Populated lazily to handle forward references to _pascal_to_snake.
-        attr_lookup = {}
-        for key in all_properties:
-            attr_lookup[key] = key               # exact match
-            attr_lookup[key.lower()] = key       # case-insensitive
-        new_class._attr_lookup = attr_lookup
-        # snake_case entries added after _pascal_to_snake is defined via
-        # ParameterSetMeta._finalize_lookup() called at module init.
-
-        # Auto-register all ParameterSet subclasses (NEW)
+        # Position of each item key in an instance's value list
+        key_index: Dict[str, int] = {}
+        for desc in all_properties.values():
+            key_index.setdefault(desc.key, len(key_index))
+        new_class._key_index = key_index
+
+        # Auto-register all ParameterSet subclasses
         if name not in ('ParameterSet', 'GenericParameterSet'):
             # Register by class name
-            PARAMETERSET_REGISTRY[name] = new_class
-            PARAMETERSET_REGISTRY[name.lower()] = new_class
+            PARAMETERSET_REGISTRY.register(name, new_class)
+            PARAMETERSET_REGISTRY.register(name.lower(), new_class)
 
             # Register by _pset_id if available
             if '_pset_id' in namespace:
-                PARAMETERSET_REGISTRY[namespace['_pset_id']] = new_class
+                PARAMETERSET_REGISTRY.register(namespace['_pset_id'], new_class)
 
         return new_class
 
+    @property
+    def _attr_lookup(cls) -> Dict[str, str]:
+        """O(1) attribute lookup table: name variant → property key.
+
+        Maps the exact key, its lowercase form, snake_case and lowercase
+        snake_case to the actual key. Used by ``ParameterSet.__getattr__``
+        / ``__setattr__`` to avoid ``dir()`` iteration. Built on first
+        access and cached per class — most classes are never touched, so
+        building the table at class creation is wasted work.
+        """
+        lookup = cls.__dict__.get('_attr_lookup_cache')
+        if lookup is None:
+            lookup = {}
+            for key in cls._all_properties:
+                lookup[key] = key                # exact match
+                lookup[key.lower()] = key        # case-insensitive
+            for key in cls._all_properties:
+                snake = _pascal_to_snake(key)
+                lookup.setdefault(snake, key)
+                lookup.setdefault(snake.lower(), key)
+            type.__setattr__(cls, '_attr_lookup_cache', lookup)
+        return lookup
+
 
 
 
@@ -134,10 +163,25 @@ class ParameterSet(metaclass=ParameterSetMeta):
         actions.FindReplace.run(pset)
 """
 
+    __slots__ = (
+        "_raw", "_backend", "_expected_setid", "_app_instance", "_item_keys",
+        "_values",       # last known backend value per key, by _key_index (None until bound)
+        "_absent",       # frozenset of keys the last reload could not read, or None
+        "_staged_map",   # key -> staged value; None until something is staged
+        "_deleted_set",  # keys marked for deletion; None until one is
+        "_wrappers",     # nested wrappers by key / descriptor cache name; None until used
+        "_spill",        # values of keys outside _key_index; None until used
+        "_extra",        # attributes outside the slots; None until set
+        "__weakref__",
+    )
+
     # Optional class-level expected SetID. Subclasses can override.
     REQUIRED_SETID: Optional[str] = None
 
+    logger = get_logger("parametersets.ParameterSet")
+
     _property_registry: Dict[str, PropertyDescriptor]  # populated by descriptors
+    _key_index: Dict[str, int]  # populated by ParameterSetMeta
 
     def __init__(
         self,
@@ -147,46 +191,42 @@ class ParameterSet(metaclass=ParameterSetMeta):
         initial: Optional[Dict[str, Any]] = None,
         expected_setid: Optional[str] = None,  # <-- new
         app_instance: Any = None,  # <-- new: reference to App instance
+        item_keys: Optional[Iterable[str]] = None,  # keys known to exist (defaults cache)
         **kwargs,
     ):
-        from hwpapi.logging import get_logger
-        self.logger = get_logger("parametersets.ParameterSet")
         if backend_factory is None:
             backend_factory = make_backend
 
         # Expected SetID (instance preference > class default)
-        self._expected_setid: Optional[str] = (
+        self._expected_setid = (
             expected_setid
             if expected_setid is not None
             else getattr(self.__class__, "REQUIRED_SETID", None)
         )
 
         # Store App instance reference for HSet synchronization
-        self._app_instance: Any = app_instance
+        self._app_instance = app_instance
 
         # Placeholders before binding
-        self._raw: Any = None
-        self._backend: Optional[ParameterBackend] = None
-        self._pset: Any = None
-        self._is_pset: bool = False
-
-        # A stable snapshot of current remote values (keyed by descriptor.key)
-        self._snapshot: Dict[str, Any] = {}
-        # Staged changes (key -> value) not yet applied
-        self._staged: Dict[str, Any] = {}
-        # Keys marked for deletion
-        self._deleted: set[str] = set()
-        # Cache of wrapped nested ParameterSets keyed by raw parameter key
-        self._wrapper_cache: Dict[str, ParameterSet] = {}
-
-        # Bind immediately if provided, otherwise start unbound
+        self._raw = None
+        self._backend = None
+
+        # Remote values, staging and caches are allocated on first use
+        self._values = None
+        self._absent = None
+        self._staged_map = None
+        self._deleted_set = None
+        self._wrappers = None
+        self._spill = None
+        self._extra = None
+        # Item keys the bound SetID is known to have (from the GetDefault
+        # cache); descriptor keys outside it are never read over COM.
+        self._item_keys = frozenset(item_keys) if item_keys is not None else None
+
+        # Bind immediately if provided (bind() loads the snapshot),
+        # otherwise start unbound with an empty snapshot
         if parameterset is not None:
             self.bind(parameterset, backend_factory=backend_factory)
-            # Take a snapshot of all current values for display/serialization
-            self._snapshot = self._take_initial_snapshot()
-        else:
-            # start empty; snapshot stays empty until bind+reload
-            pass
 
         # Stage initial values (do NOT send yet)
         if initial:
@@ -194,23 +234,95 @@ class ParameterSet(metaclass=ParameterSetMeta):
         if kwargs:
             self.update(kwargs)
 
-    def _take_initial_snapshot(self):
-        """
-        Take a snapshot of all current values from the COM object for display/serialization.
-        """
+    # ------ storage (slots + lazily allocated containers) ------
+    @property
+    def _pset(self):
+        """The bound raw parameterset (alias of ``_raw``)."""
+        return self._raw
+
+    @property
+    def _is_pset(self) -> bool:
+        return self._raw is not None
+
+    @property
+    def _snapshot(self) -> Dict[str, Any]:
+        """Last known backend values as ``{key: value}`` — a copy; assign to replace."""
         snapshot = {}
-        for name in self._property_registry:
-            try:
-                value = getattr(self, name, None)
-                if isinstance(value, ParameterSet):
-                    value = value.serialize()
-                elif hasattr(value, "_oleobj_"):
-                    value = _safe_com_serialize(value)
-                snapshot[name] = value
-            except Exception as e:
-                snapshot[name] = f"<COM error: {e}>"
+        values = self._values
+        if values is not None:
+            for key, i in self._key_index.items():
+                snapshot[key] = values[i]
+        if self._spill:
+            snapshot.update(self._spill)
         return snapshot
 
+    @_snapshot.setter
+    def _snapshot(self, mapping: Dict[str, Any]) -> None:
+        self._values = None
+        self._spill = None
+        for key, value in mapping.items():
+            self._store(key, value)
+
+    @property
+    def _staged(self) -> Dict[str, Any]:
+        """Staged changes (key -> value) not yet applied; allocated on access."""
+        staged = self._staged_map
+        if staged is None:
+            staged = self._staged_map = {}
+        return staged
+
+    @_staged.setter
+    def _staged(self, value: Dict[str, Any]) -> None:
+        self._staged_map = value
+
+    @property
+    def _deleted(self) -> set:
+        """Keys marked for deletion; allocated on access."""
+        deleted = self._deleted_set
+        if deleted is None:
+            deleted = self._deleted_set = set()
+        return deleted
+
+    @_deleted.setter
+    def _deleted(self, value: set) -> None:
+        self._deleted_set = value
+
+    @property
+    def _wrapper_cache(self) -> Dict[str, Any]:
+        """Wrapped nested ParameterSets (and descriptor caches); allocated on access."""
+        wrappers = self._wrappers
+        if wrappers is None:
+            wrappers = self._wrappers = {}
+        return wrappers
+
+    @property
+    def _absent_keys(self) -> frozenset:
+        """Descriptor keys the backend could not read on the last reload."""
+        return self._absent or frozenset()
+
+    def _stored(self, key: str) -> Any:
+        """Snapshot value of ``key`` (``None`` if never loaded)."""
+        values = self._values
+        if values is not None:
+            i = self._key_index.get(key)
+            if i is not None:
+                return values[i]
+        spill = self._spill
+        return spill.get(key) if spill else None
+
+    def _store(self, key: str, value: Any) -> None:
+        """Record ``value`` as the snapshot value of ``key``."""
+        i = self._key_index.get(key)
+        if i is None:
+            if self._spill is None:
+                self._spill = {}
+            self._spill[key] = value
+            return
+        values = self._values
+        if values is None:
+            values = self._values = [None] * len(self._key_index)
+        values[i] = value
+
     def bind(
         self,
         parameterset: Any,
@@ -247,8 +359,6 @@ class ParameterSet(metaclass=ParameterSetMeta):
         # Commit the binding
         self._raw = parameterset
         self._backend = backend_factory(parameterset)
-        self._pset = parameterset
-        self._is_pset = True
 
         # Refresh snapshot from the newly bound backend
         self.reload()
@@ -261,22 +371,41 @@ class ParameterSet(metaclass=ParameterSetMeta):
         return self._raw
 
     def reload(self):
-        """Refresh in-memory snapshot from backend and clear staged edits (but keep wrapper cache coherent)."""
-        self._snapshot.clear()
+        """Refresh in-memory snapshot from backend and clear staged edits (but keep wrapper cache coherent).
+
+        When ``item_keys`` is known (see ``hwpapi.low.defaults_cache``), keys
+        outside it are recorded as absent without a COM round-trip.
+        """
+        self._values = None
+        self._spill = None
+        self._staged_map = None
+        self._deleted_set = None
 
-        # If not yet bound, nothing to load; keep staged/deleted but clean them for safety.
+        # If not yet bound, nothing to load.
         if self._backend is None:
-            self._staged.clear()
-            self._deleted.clear()
             return self
 
-        for name, desc in self._property_registry.items():
+        index = self._key_index
+        values = self._values = [None] * len(index)
+        absent = set()
+        known = self._item_keys
+        get = self._backend.get
+        for desc in self._property_registry.values():
+            key = desc.key
+            if known is not None and key not in known:
+                absent.add(key)
+                continue
             try:
-                self._snapshot[desc.key] = self._backend.get(desc.key)
+                value = get(key)
             except Exception:
-                self._snapshot[desc.key] = None
-        self._staged.clear()
-        self._deleted.clear()
+                absent.add(key)
+                continue
+            i = index.get(key)
+            if i is None:
+                self._store(key, value)
+            else:
+                values[i] = value
+        self._absent = frozenset(absent) if absent else None
         return self
 
     def apply(
@@ -316,10 +445,10 @@ class ParameterSet(metaclass=ParameterSetMeta):
         saved_staged = None
         saved_deleted = None
         if only_overrides:
-            saved_staged = self._staged
-            saved_deleted = self._deleted
-            self._staged = {}
-            self._deleted = set()
+            saved_staged = self._staged_map
+            saved_deleted = self._deleted_set
+            self._staged_map = None
+            self._deleted_set = None
 
         # Add incoming values to staged
         if overrides:
@@ -334,22 +463,23 @@ class ParameterSet(metaclass=ParameterSetMeta):
                 msg = f"Missing required parameters: {', '.join(missing)}"
                 if require == "error":
                     if only_overrides:
-                        self._staged = saved_staged or {}
-                        self._deleted = saved_deleted or set()
+                        self._staged_map = saved_staged
+                        self._deleted_set = saved_deleted
                     raise MissingRequiredError(msg)
                 else:
                     print("[ParameterSet] WARN:", msg)
 
         # Deletes first
-        for key in list(self._deleted):
+        for key in list(self._deleted_set or ()):
             try:
                 self._backend.delete(key)
             finally:
-                self._snapshot[key] = None
-        self._deleted.clear()
+                self._store(key, None)
+        self._deleted_set = None
 
         # Writes next (cascade to nested ParameterSets and unwrap)
-        for key, value in list(self._staged.items()):
+        written: Dict[str, Any] = {}
+        for key, value in list((self._staged_map or {}).items()):
             if isinstance(value, ParameterSet):
                 # Ensure nested staged values are flushed first
                 # Only apply if the nested ParameterSet is bound
@@ -363,26 +493,27 @@ class ParameterSet(metaclass=ParameterSetMeta):
                     continue
             else:
                 raw_value = value
+                written[key] = raw_value
             self._backend.set(key, raw_value)
-            self._snapshot[key] = raw_value
-        self._staged.clear()
+            self._store(key, raw_value)
+        self._staged_map = None
 
         # Restore pre-existing staged edits if only_overrides=True
         if only_overrides:
             for k, v in (saved_staged or {}).items():
-                if k not in self._snapshot or self._snapshot[k] != v:
+                if self._stored(k) != v:
                     self._staged[k] = v
 
         # Special handling for HSet-based parameter sets (e.g., FindReplace, FindDlg, FindAll)
         # These actions use global HParameterSet state instead of local parameter sets
-        self._sync_hset_global_state()
+        self._sync_hset_global_state(written)
 
         return self
 
     def discard(self):
         """Drop staged edits and deletions (keep snapshot)."""
-        self._staged.clear()
-        self._deleted.clear()
+        self._staged_map = None
+        self._deleted_set = None
         return self
 
 
@@ -392,9 +523,11 @@ class ParameterSet(metaclass=ParameterSetMeta):
         Uses O(1) lookup table built by ParameterSetMeta.
         """
         if name.startswith('_'):
+            if name != '_extra' and self._extra and name in self._extra:
+                return self._extra[name]
             raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
 
-        lookup = type(self).__dict__.get('_attr_lookup') or getattr(type(self), '_attr_lookup', {})
+        lookup = type(self)._attr_lookup
         # Try: exact → lowercase → snake_case lookup
         actual_key = lookup.get(name) or lookup.get(name.lower())
         if actual_key is None:
@@ -407,6 +540,8 @@ class ParameterSet(metaclass=ParameterSetMeta):
             if descriptor is not None:
                 return descriptor.__get__(self, type(self))
 
+        if self._extra and name in self._extra:
+            return self._extra[name]
         raise AttributeError(
             f"'{type(self).__name__}' object has no attribute '{name}'. "
             f"Available attributes: {', '.join(sorted(self.attributes_names)[:5])}..."
@@ -418,10 +553,13 @@ class ParameterSet(metaclass=ParameterSetMeta):
         Uses O(1) lookup table built by ParameterSetMeta.
         """
         if name.startswith('_'):
-            object.__setattr__(self, name, value)
+            try:
+                object.__setattr__(self, name, value)
+            except AttributeError:
+                self._set_extra(name, value)
             return
 
-        lookup = type(self).__dict__.get('_attr_lookup') or getattr(type(self), '_attr_lookup', {})
+        lookup = type(self)._attr_lookup
         actual_key = lookup.get(name) or lookup.get(name.lower())
         if actual_key is None:
             pascal_name = _snake_to_pascal(name)
@@ -433,8 +571,14 @@ class ParameterSet(metaclass=ParameterSetMeta):
                 descriptor.__set__(self, value)
                 return
 
-        # Unknown property: set as regular attribute (backward compat)
-        object.__setattr__(self, name, value)
+        # Unknown property: keep it as a plain attribute (backward compat)
+        self._set_extra(name, value)
+
+    def _set_extra(self, name: str, value: Any) -> None:
+        """Store an attribute that has no slot (instances have no ``__dict__``)."""
+        if self._extra is None:
+            self._extra = {}
+        self._extra[name] = value
 
     def create_itemset(self, key: str, setid: str) -> "ParameterSet":
         """
@@ -474,13 +618,14 @@ class ParameterSet(metaclass=ParameterSetMeta):
             except KeyError:
                 raise NotImplementedError(f"Cannot create nested parameter set '{key}' with {type(self._backend)} backend")
 
-    def _sync_hset_global_state(self):
+    def _sync_hset_global_state(self, values: Dict[str, Any]):
         """
-        Synchronize staged changes with global HParameterSet state for HSet-based actions.
+        Synchronize applied changes with global HParameterSet state for HSet-based actions.
 
         The core issue: HSet-based actions use the GLOBAL HParameterSet state, but the
         simplified API creates LOCAL copies via HAction.GetDefault(). This method bridges
-        that gap by copying staged values to the global HParameterSet using dotted key paths.
+        that gap by copying the values ``apply()`` just wrote (``{key: value}``) to the
+        global HParameterSet using dotted key paths.
         """
         # Only apply to HParamBackend instances with App reference
         if not (
@@ -491,25 +636,27 @@ class ParameterSet(metaclass=ParameterSetMeta):
             return
 
         try:
-            # Get the global HParameterSet
-            global_hparam = self._app_instance.api.HParameterSet
-            if global_hparam is None:
-                return
-
-            # Create a backend for the global HParameterSet
-            global_backend = HParamBackend(global_hparam)
-
             # Determine the HParam node prefix based on the local parameter set type
             hparam_prefix = self._get_hparam_prefix()
             if not hparam_prefix:
                 return
 
-            # Sync all staged values to the global HParameterSet using dotted paths
-            for property_key, value in self._staged.items():
-                # Skip nested ParameterSet objects for now
-                if isinstance(value, ParameterSet):
-                    continue
+            # Shared per-App backend over the global HParameterSet: node
+            # proxies and write types are resolved once, not per apply().
+            global_backend = hparameterset_backend(self._app_instance)
+            # Already bound to the global node (``_Action.get_pset()``):
+            # apply() wrote there, a second copy would write every value twice.
+            root = self._backend._root
+            global_node = global_backend.node(hparam_prefix)
+            if root is global_node or root == global_node:
+                return
+            defaults = getattr(getattr(self._app_instance, "actions", None), "defaults", None)
+            from hwpapi.low.defaults_cache import DefaultsCache
+            if isinstance(defaults, DefaultsCache):
+                global_backend.seed_types(hparam_prefix, defaults.types_for(hparam_prefix[1:]))
 
+            # Sync applied values to the global HParameterSet using dotted paths
+            for property_key, value in values.items():
                 try:
                     # Create the full dotted path: "HFindReplace.FindString"
                     global_key = f"{hparam_prefix}.{property_key}"
@@ -527,39 +674,52 @@ class ParameterSet(metaclass=ParameterSetMeta):
             )
 
 
+    def _get_hparam_prefix(self) -> Optional[str]:
+        """``HParameterSet`` node name for this set — ``"H" + SetID``."""
+        set_id = self._expected_setid or getattr(self._raw, "SetID", None)
+        if not isinstance(set_id, str) and type(self).__name__ in PARAMETERSET_REGISTRY:
+            set_id = type(self).__name__
+        return f"H{set_id}" if isinstance(set_id, str) and set_id else None
+
     # ------ descriptor hooks (staged-aware) ------
     def _ps_get(self, desc: PropertyDescriptor):
         key = desc.key
-        if key in self._deleted:
+        deleted = self._deleted_set
+        if deleted and key in deleted:
             return None
-        if key in self._staged:
-            return self._staged[key]
+        staged = self._staged_map
+        if staged and key in staged:
+            return staged[key]
 
         # For pset backends, try to get live value first
-        if isinstance(self._backend, PsetBackend):
+        if isinstance(self._backend, PsetBackend) and not (
+            self._item_keys is not None and key not in self._item_keys
+        ):
             try:
                 live_value = self._backend.get(key)
                 # Update snapshot with live value
-                self._snapshot[key] = live_value
+                self._store(key, live_value)
                 return live_value
             except Exception:
                 # Fall back to snapshot if live read fails
                 pass
 
-        return self._snapshot.get(key, None)
+        return self._stored(key)
 
     def _ps_set(self, desc: PropertyDescriptor, value: Any):
         key = desc.key
-        self._deleted.discard(key)
+        if self._deleted_set:
+            self._deleted_set.discard(key)
 
         # For pset backends, apply immediately (no staging)
         if isinstance(self._backend, PsetBackend):
             try:
                 self._backend.set(key, value)
                 # Update snapshot to reflect the change
-                self._snapshot[key] = value
+                self._store(key, value)
                 # Clear from staged since it's already applied
-                self._staged.pop(key, None)
+                if self._staged_map:
+                    self._staged_map.pop(key, None)
             except Exception as e:
                 # If immediate set fails, fall back to staging
                 self._staged[key] = value
@@ -573,10 +733,12 @@ class ParameterSet(metaclass=ParameterSetMeta):
 
     def _ps_del(self, desc: PropertyDescriptor):
         key = desc.key
-        self._staged.pop(key, None)
+        if self._staged_map:
+            self._staged_map.pop(key, None)
         self._deleted.add(key)
         # Deleting clears any cached wrapper for that key
-        self._wrapper_cache.pop(key, None)
+        if self._wrappers:
+            self._wrappers.pop(key, None)
         return True
 
     # ------ conveniences ------
@@ -622,7 +784,8 @@ class ParameterSet(metaclass=ParameterSetMeta):
                     out[n] = val
                 else:
                     desc = self._property_registry[n]
-                    is_staged = desc.key in self._staged or desc.key in self._deleted
+                    is_staged = (desc.key in (self._staged_map or ())
+                                 or desc.key in (self._deleted_set or ()))
                     if is_staged or (desc.default is None or val != desc.default):
                         out[n] = val
         return out
@@ -645,7 +808,7 @@ class ParameterSet(metaclass=ParameterSetMeta):
         """Return staged changes as {attr_name: value}, excluding deletions."""
         rev = {d.key: name for name, d in self._property_registry.items()}
         pretty = {}
-        for k, v in self._staged.items():
+        for k, v in (self._staged_map or {}).items():
             name = rev.get(k, k)
             pretty[name] = v.to_dict() if isinstance(v, ParameterSet) else v
         return pretty
@@ -653,7 +816,7 @@ class ParameterSet(metaclass=ParameterSetMeta):
     def deleted(self) -> set[str]:
         """Return attribute names marked for deletion."""
         rev = {d.key: name for name, d in self._property_registry.items()}
-        return {rev.get(k, k) for k in self._deleted if k in rev}
+        return {rev.get(k, k) for k in self._deleted_set or () if k in rev}
 
     def __repr__(self):
         """Return human-readable representation of ParameterSet with all properties."""
@@ -1017,6 +1180,7 @@ def _str_impl(self):
         "name": self.__class__.__name__,
         "values": self.serialize()
     }
+    import pprint
     return pprint.pformat(data, indent=4, width=60)
 
 # Attach the implementations to the class
@@ -1115,6 +1279,8 @@ class GenericParameterSet(ParameterSet):
     a dedicated ParameterSet subclass defined.
     """
 
+    __slots__ = ("_pset_id",)
+
     def __init__(self, parameterset, pset_id=None):
         super().__init__(parameterset)
         self._pset_id = pset_id or "Unknown"
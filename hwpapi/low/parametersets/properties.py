@@ -562,7 +562,8 @@ class NestedProperty(PropertyDescriptor):
         setid (str): SetID for CreateItemSet call (e.g., "CharShape")
         param_class (Type[ParameterSet]): ParameterSet class to wrap
         doc (str): Documentation string
-        _cache_attr (str): Internal cache attribute name
+        _cache_attr (str): Key of the cached wrapper in the instance's
+            ``_wrapper_cache``
 
     Example:
         >>> class FindReplace(ParameterSet):
@@ -594,8 +595,9 @@ class NestedProperty(PropertyDescriptor):
             return self
 
         # Check cache first (subsequent access)
-        if hasattr(instance, self._cache_attr):
-            return getattr(instance, self._cache_attr)
+        cached = instance._wrapper_cache.get(self._cache_attr)
+        if cached is not None:
+            return cached
 
         # Verify backend is available
         if instance._backend is None:
@@ -619,7 +621,7 @@ class NestedProperty(PropertyDescriptor):
                 nested_wrapped = self.param_class()
 
         # Cache for subsequent access
-        setattr(instance, self._cache_attr, nested_wrapped)
+        instance._wrapper_cache[self._cache_attr] = nested_wrapped
         return nested_wrapped
 
     def __set__(self, instance: "ParameterSet", value: "ParameterSet"):
@@ -640,7 +642,7 @@ class NestedProperty(PropertyDescriptor):
             )
 
         # Cache the provided instance
-        setattr(instance, self._cache_attr, value)
+        instance._wrapper_cache[self._cache_attr] = value
 
         # Stage for apply()
         instance._staged[self.key] = value
@@ -658,7 +660,8 @@ class ArrayProperty(PropertyDescriptor):
         doc (str): Documentation string
         min_length (Optional[int]): Minimum array length
         max_length (Optional[int]): Maximum array length
-        _cache_attr (str): Internal cache attribute name
+        _cache_attr (str): Key of the cached wrapper in the instance's
+            ``_wrapper_cache``
 
     Example:
         >>> class TabDef(ParameterSet):
@@ -687,8 +690,9 @@ class ArrayProperty(PropertyDescriptor):
             return self
 
         # Check cache first
-        if hasattr(instance, self._cache_attr):
-            return getattr(instance, self._cache_attr)
+        cached = instance._wrapper_cache.get(self._cache_attr)
+        if cached is not None:
+            return cached
 
         # Try to get existing HArray from backend
         if instance._backend is not None:
@@ -697,14 +701,14 @@ class ArrayProperty(PropertyDescriptor):
                 if harray_com is not None:
                     wrapper = HArrayWrapper(harray_com, self.item_type,
                                            instance._backend, self.key)
-                    setattr(instance, self._cache_attr, wrapper)
+                    instance._wrapper_cache[self._cache_attr] = wrapper
                     return wrapper
             except (KeyError, AttributeError):
                 pass
 
         # Return empty wrapper (will create HArray on modification)
         wrapper = HArrayWrapper(None, self.item_type, instance._backend, self.key)
-        setattr(instance, self._cache_attr, wrapper)
+        instance._wrapper_cache[self._cache_attr] = wrapper
         return wrapper
 
     def __set__(self, instance: "ParameterSet", value: Union[List, Tuple, None]):
@@ -721,7 +725,7 @@ class ArrayProperty(PropertyDescriptor):
         if value is None:
             # Clear array
             wrapper = HArrayWrapper(None, self.item_type, instance._backend, self.key)
-            setattr(instance, self._cache_attr, wrapper)
+            instance._wrapper_cache[self._cache_attr] = wrapper
             instance._staged[self.key] = []
             return
 
@@ -749,7 +753,7 @@ class ArrayProperty(PropertyDescriptor):
         # Create wrapper with initial values
         wrapper = HArrayWrapper(None, self.item_type, instance._backend, self.key,
                                 initial_values=value_list)
-        setattr(instance, self._cache_attr, wrapper)
+        instance._wrapper_cache[self._cache_attr] = wrapper
         instance._staged[self.key] = value_list
 
 class HArrayWrapper:
@@ -0,0 +1,196 @@
+"""
+Lazy ``PARAMETERSET_REGISTRY`` — class specs now, classes on first lookup.
+
+The registry starts out holding only a static index: *class name → domain
+module* under :mod:`hwpapi.low.parametersets.sets`. Nothing in ``sets/``
+is executed until a key is actually looked up (``PARAMETERSET_REGISTRY
+.get(...)``, ``[...]``, :func:`wrap_parameterset`, ``_Action._wrap_pset``
+or ``from hwpapi.low.parametersets import CharShape``). The lookup imports
+only the owning domain module; its classes register themselves through
+:class:`~hwpapi.low.parametersets.base.ParameterSetMeta` as before.
+
+Each built class further defers its ``_attr_lookup`` table (the
+snake_case/lowercase alias map) until the first attribute access on an
+instance — see ``ParameterSetMeta._attr_lookup``.
+
+Membership tests (``"CharShape" in PARAMETERSET_REGISTRY``) are answered
+from the index without building anything. Whole-registry views
+(``len``, iteration, ``items()`` …) build every class first so they keep
+their eager-dict semantics.
+
+:data:`_CLASS_INDEX` must list every class defined under ``sets/`` —
+``tests/test_architecture.py`` checks that it stays in sync.
+"""
+from __future__ import annotations
+
+import importlib
+from typing import Dict, Iterator
+
+__all__ = ["LazyRegistry"]
+
+
+# domain module (under ``sets/``) → ParameterSet classes it defines
+_CLASS_INDEX: Dict[str, tuple] = {
+    "primitives": (
+        "BorderFill", "Caption", "CharShape", "ParaShape", "Cell",
+        "CtrlData", "Password", "Style",
+    ),
+    "document": (
+        "ColDef", "DocumentInfo", "FileInfo", "FootnoteShape",
+        "EndnoteShape", "GridInfo", "HeaderFooter", "MasterPage",
+        "PageBorderFill", "PageDef", "PageHiding", "PageNumCtrl",
+        "PageNumPos", "SecDef", "SectionApply", "SummaryInfo",
+        "VersionInfo",
+    ),
+    "drawing": (
+        "DrawFillAttr", "ShapeObject", "DrawArcType", "DrawCoordInfo",
+        "DrawCtrlHyperlink", "DrawEditDetail", "DrawImageAttr",
+        "DrawImageScissoring", "DrawLayout", "DrawLineAttr",
+        "DrawRectType", "DrawResize", "DrawRotate", "DrawScAction",
+        "DrawShadow", "DrawShear", "DrawTextart", "DropCap",
+        "ShapeCopyPaste", "ShapeObjectCopyPaste", "CCLMark",
+        "ChartObjShape", "DrawObjTemplateSave", "FindImagePath",
+        "ShapeObjSaveAsPicture",
+    ),
+    "file_ops": (
+        "EngineProperties", "FileConvert", "FileOpen", "FileSaveAs",
+        "FileSaveBlock", "FileSendMail", "FileSetSecurity",
+        "InsertFile", "Preference", "Presentation", "Print",
+        "PrintToImage", "PrintWatermark", "FileOpenSave",
+    ),
+    "find_edit": (
+        "FindReplace", "ActionCrossRef", "BookMark", "DeleteCtrls",
+        "DocFilters", "DocFindInfo", "ExchangeFootnoteEndNote",
+        "GotoE", "IndexMark", "MakeContents", "RevisionDef",
+        "SaveFootnote", "SelectionOpt",
+    ),
+    "formatting": (
+        "BorderFillExt", "StyleDelete", "StyleTemplate",
+    ),
+    "media_misc": (
+        "AutoNum", "CaptureEnd", "EqEdit", "FieldCtrl",
+        "FlashProperties", "FtpDownload", "FtpUpload", "HyperLink",
+        "HyperlinkJump", "Idiom", "InputDateStyle",
+        "InsertFieldTemplate", "Internet", "KeyMacro", "LinkDocument",
+        "MailMergeGenerate", "MemoShape", "MousePos",
+        "MovieProperties", "OleCreation", "ScriptMacro", "Sort",
+        "Sum", "UserQCommandFile", "ViewProperties", "ViewStatus",
+        "Label",
+    ),
+    "paragraph": (
+        "ListProperties", "NumberingShape", "TabDef", "ListParaPos",
+    ),
+    "table": (
+        "Table", "AutoFill", "CellBorderFill", "TableCreation",
+        "TableDeleteLine", "TableDrawPen", "TableInsertLine",
+        "TableSplitCell", "TableStrToTbl", "TableSwap",
+        "TableTblToStr", "TableTemplate",
+    ),
+    "text": (
+        "BulletShape", "InsertText", "ChCompose", "ChangeRome",
+        "CodeTable", "ConvertCase", "ConvertFullHalf",
+        "ConvertHiraToGata", "ConvertJianFan", "ConvertToHangul",
+        "Dutmal", "MarkpenShape", "QCorrect", "TextCtrl",
+        "TextVertical", "AddHanjaWord", "InputHanja",
+        "InputHanjaBusu", "InputHanjaMean", "SpellingCheck",
+    ),
+}
+
+_SETS_PACKAGE = "hwpapi.low.parametersets.sets"
+
+
+class LazyRegistry(dict):
+    """
+    ``dict`` of registry key → ParameterSet class, filled on demand.
+
+    Keys are the class name, its lowercase form and (if declared) the
+    class ``_pset_id`` — the same keys the eager registry used.
+    """
+
+    def __init__(self, index: Dict[str, tuple]) -> None:
+        super().__init__()
+        self._pending: Dict[str, str] = {}
+        for module, names in index.items():
+            for name in names:
+                self._pending[name] = module
+                self._pending.setdefault(name.lower(), module)
+
+    # ── building ────────────────────────────────────────────────
+
+    def register(self, key: str, cls) -> None:
+        """Called by ``ParameterSetMeta`` for every class it creates."""
+        dict.__setitem__(self, key, cls)
+        self._pending.pop(key, None)
+
+    def _build(self, key) -> bool:
+        """Import the domain module owning ``key``; ``True`` if it did."""
+        module = self._pending.get(key) if isinstance(key, str) else None
+        if module is None:
+            return False
+        importlib.import_module(f"{_SETS_PACKAGE}.{module}")
+        # A stale index entry must not trigger the import again.
+        self._pending.pop(key, None)
+        return True
+
+    def load_all(self) -> None:
+        """Build every indexed class (used by whole-registry views)."""
+        for module in sorted(set(self._pending.values())):
+            importlib.import_module(f"{_SETS_PACKAGE}.{module}")
+        self._pending.clear()
+
+    @property
+    def pending(self) -> int:
+        """Number of index keys whose class has not been built yet."""
+        return len(self._pending)
+
+    # ── lookups ─────────────────────────────────────────────────
+
+    def __getitem__(self, key):
+        try:
+            return dict.__getitem__(self, key)
+        except KeyError:
+            if not self._build(key):
+                raise
+        return dict.__getitem__(self, key)
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key) -> bool:
+        return dict.__contains__(self, key) or key in self._pending
+
+    def __setitem__(self, key, value) -> None:
+        self.register(key, value)
+
+    # ── whole-registry views (build everything first) ───────────
+
+    def __len__(self) -> int:
+        self.load_all()
+        return dict.__len__(self)
+
+    def __iter__(self) -> Iterator[str]:
+        self.load_all()
+        return dict.__iter__(self)
+
+    def keys(self):
+        self.load_all()
+        return dict.keys(self)
+
+    def values(self):
+        self.load_all()
+        return dict.values(self)
+
+    def items(self):
+        self.load_all()
+        return dict.items(self)
+
+    def copy(self) -> dict:
+        self.load_all()
+        return dict(dict.items(self))
+
+    def __repr__(self) -> str:
+        return (f"<LazyRegistry built={dict.__len__(self)} "
+                f"pending={len(self._pending)}>")
@@ -1,25 +1,33 @@
 """
 ParameterSet subclasses organized by HWP functional domain.
 
-Import order respects the dependency graph:
+Domain modules:
 1. primitives.py  — foundation classes (CharShape, ParaShape, etc.)
 2. All other domains (each may import from primitives)
 
-All classes are auto-registered to ``PARAMETERSET_REGISTRY`` via
-``ParameterSetMeta`` at definition time, regardless of import order.
+Nothing is imported eagerly: a domain module is executed the first time
+one of its classes is looked up — through ``PARAMETERSET_REGISTRY``, the
+``hwpapi.low.parametersets`` package, or this package
+(``from hwpapi.low.parametersets.sets import PageDef``). All classes
+auto-register to ``PARAMETERSET_REGISTRY`` via ``ParameterSetMeta`` at
+definition time, regardless of import order.
 """
 from __future__ import annotations
 
-# Import primitives FIRST (other domains depend on them)
-from .primitives import *  # noqa: F401,F403
-
-# Domain modules (alphabetical after primitives)
-from .document import *    # noqa: F401,F403
-from .drawing import *     # noqa: F401,F403
-from .file_ops import *    # noqa: F401,F403
-from .find_edit import *   # noqa: F401,F403 (imports CharShape/ParaShape from primitives)
-from .formatting import *  # noqa: F401,F403
-from .media_misc import *  # noqa: F401,F403
-from .paragraph import *   # noqa: F401,F403
-from .table import *       # noqa: F401,F403
-from .text import *        # noqa: F401,F403
+
+def __getattr__(name: str):
+    from hwpapi.low.parametersets import PARAMETERSET_REGISTRY
+    from hwpapi.low.parametersets.registry import _CLASS_INDEX
+
+    if any(name in names for names in _CLASS_INDEX.values()):
+        cls = PARAMETERSET_REGISTRY[name]
+        globals()[name] = cls
+        return cls
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    from hwpapi.low.parametersets.registry import _CLASS_INDEX
+
+    lazy = (n for names in _CLASS_INDEX.values() for n in names)
+    return sorted(set(globals()) | set(lazy))
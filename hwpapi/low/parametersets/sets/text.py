@@ -150,8 +150,3 @@ class InputHanjaMean(ParameterSet):
 
 class SpellingCheck(ParameterSet):
     """SpellingCheck ParameterSet - 맞춤법 검사."""
-
-
-# ── Finalize attribute lookup tables ──────────────────────────────────────
-# Populate snake_case entries in each class's _attr_lookup.
-# This runs once at module import after all classes are defined.
@@ -0,0 +1,551 @@
+"""
+:mod:`hwpapi.low.replay` — record COM traffic, replay it without HWP.
+
+Slow workloads tend to need real documents, which can't go to CI. The
+recorder proxies ``Engine.impl`` and logs every COM member access — the
+object it was made on, get / set / call, arguments, the returned value
+(or its shape) and the latency — into a compact trace file::
+
+    from hwpapi.low.replay import record
+
+    with record(app, "merge.hwptrace.gz", redact=True):
+        run_merge_job(app)
+
+The replayer serves the same sequence back from a simulated engine, so
+the same hwpapi code path (presets, collections, merge jobs ...) runs
+deterministically with the recorded latencies::
+
+    from hwpapi.low.replay import replay_app
+
+    app = replay_app("merge.hwptrace.gz", latency="sampled", seed=1)
+    run_merge_job(app)
+    print(app.engine.stats)      # events, misses, simulated seconds
+
+Traces are JSON lines (gzip when the name ends in ``.gz``): a header,
+then ``[obj, op, name, args, result, dur_us]`` per event — ``op`` is
+``"g"`` (get), ``"s"`` (set), ``"c"`` (call) or ``"m"`` (first lookup of
+a method, so ``hasattr`` probes replay too); COM objects are
+``{"o": id}`` references (``0`` is ``Engine.impl``), tuples ``{"t": [...]}``,
+errors ``{"e": [type, message]}``.
+
+``redact=True`` replaces every letter in recorded strings with ``x``
+(digits, separators like ``\\x02`` and path punctuation kept, so parsing
+code still sees the same structure); pass a callable for custom rules.
+Recorded error messages are redacted the same way. Bytes are stored as
+their length only.
+
+Both :func:`record` and :func:`replay_app` turn the per-version
+GetDefault disk cache (:mod:`hwpapi.low.defaults_cache`) off for their
+App: whether that cache is warm changes which COM calls run, so a trace
+always holds — and replays — the uncached sequence.
+
+Replay matches events per ``(object, op, member)`` in recorded order.
+A member called more often than recorded repeats its last result
+(``reused``); one never recorded is a ``miss`` — gets raise
+:class:`AttributeError`, calls return ``None``.
+"""
+from __future__ import annotations
+
+import collections
+import contextlib
+import gzip
+import json
+import math
+import random
+import re
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple, Union
+
+from hwpapi.errors import InvalidArgumentError
+from hwpapi.logging import get_logger
+
+__all__ = ["ComTrace", "ReplayEngine", "ReplayStats", "record", "replay_app"]
+
+logger = get_logger("low.replay")
+
+TRACE_FORMAT = "hwpapi-com-trace"
+TRACE_VERSION = 1
+
+_LETTERS = re.compile(r"[^\W\d_]")
+_LATENCY_MODES = ("recorded", "sampled", "none")
+
+
+def _redact_letters(value: str) -> str:
+    return _LETTERS.sub("x", value)
+
+
+def _is_com(value: Any) -> bool:
+    return not isinstance(value, (_ComProxy, _SimObject)) and hasattr(value, "_oleobj_")
+
+
+# ── trace container ───────────────────────────────────────────────
+
+class ComTrace:
+    """Recorded COM events (``[obj, op, name, args, result, dur_us]``)."""
+
+    def __init__(self, events: Optional[List[list]] = None, redacted: bool = False,
+                 meta: Optional[Dict[str, Any]] = None) -> None:
+        self.events = events if events is not None else []
+        self.redacted = redacted
+        self.meta = meta or {}
+
+    def __len__(self) -> int:
+        return len(self.events)
+
+    def __repr__(self) -> str:
+        return f"ComTrace({len(self.events)} events, redacted={self.redacted})"
+
+    def save(self, path: Union[str, Path]) -> Path:
+        """Write the trace (gzip when ``path`` ends in ``.gz``)."""
+        path = Path(path)
+        header = {"format": TRACE_FORMAT, "version": TRACE_VERSION,
+                  "redacted": self.redacted, "meta": self.meta}
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "wt", encoding="utf-8") as f:
+            for row in [header, *self.events]:
+                f.write(json.dumps(row, ensure_ascii=False, separators=(",", ":")))
+                f.write("\n")
+        return path
+
+    @classmethod
+    def load(cls, path: Union[str, Path]) -> "ComTrace":
+        """Read a trace written by :meth:`save`."""
+        path = Path(path)
+        opener = gzip.open if path.suffix == ".gz" else open
+        with opener(path, "rt", encoding="utf-8") as f:
+            rows = [json.loads(line) for line in f if line.strip()]
+        if not rows or not isinstance(rows[0], dict) or rows[0].get("format") != TRACE_FORMAT:
+            raise InvalidArgumentError(f"{path} is not an hwpapi COM trace")
+        if rows[0].get("version") != TRACE_VERSION:
+            raise InvalidArgumentError(
+                f"{path}: unsupported trace version {rows[0].get('version')!r}"
+            )
+        return cls(rows[1:], rows[0].get("redacted", False), rows[0].get("meta"))
+
+    def summary(self) -> Dict[str, Dict[str, float]]:
+        """Per-member ``count`` / ``total_ms`` / ``p50_ms`` / ``p99_ms``, slowest first."""
+        durations: Dict[str, List[int]] = collections.defaultdict(list)
+        for obj, op, name, _args, _result, dur_us in self.events:
+            if op != "m":
+                durations[name].append(dur_us)
+        out = {}
+        for name, values in durations.items():
+            values.sort()
+            out[name] = {
+                "count": len(values),
+                "total_ms": sum(values) / 1e3,
+                "p50_ms": values[max(math.ceil(0.5 * len(values)) - 1, 0)] / 1e3,
+                "p99_ms": values[max(math.ceil(0.99 * len(values)) - 1, 0)] / 1e3,
+            }
+        return dict(sorted(out.items(), key=lambda kv: -kv[1]["total_ms"]))
+
+
+# ── recording ─────────────────────────────────────────────────────
+
+class _Recorder:
+    def __init__(self, redact: Union[bool, Callable[[str], str]]) -> None:
+        self.redact = _redact_letters if redact is True else (redact or None)
+        self.trace = ComTrace(redacted=bool(redact))
+        self._proxies: Dict[int, "_ComProxy"] = {}
+        self._methods: set = set()
+        self._lock = threading.Lock()
+
+    def proxy(self, target: Any) -> "_ComProxy":
+        with self._lock:
+            proxy = self._proxies.get(id(target))
+            if proxy is None:
+                proxy = _ComProxy(target, self, len(self._proxies))
+                self._proxies[id(target)] = proxy
+            return proxy
+
+    def method(self, obj: int, name: str) -> None:
+        with self._lock:
+            if (obj, name) in self._methods:
+                return
+            self._methods.add((obj, name))
+            self.trace.events.append([obj, "m", name, [], None, 0])
+
+    def encode(self, value: Any) -> Any:
+        if isinstance(value, _ComProxy):
+            return {"o": value._id}
+        if value is None or isinstance(value, (bool, int, float)):
+            return value
+        if isinstance(value, str):
+            return self.redact(value) if self.redact else value
+        if isinstance(value, (tuple, list)):
+            return {"t": [self.encode(v) for v in value]}
+        if isinstance(value, (bytes, bytearray, memoryview)):
+            return {"b": len(value)}
+        return {"r": type(value).__name__}
+
+    def wrap(self, value: Any) -> Any:
+        if _is_com(value):
+            return self.proxy(value)
+        if isinstance(value, tuple) and any(_is_com(v) for v in value):
+            return tuple(self.wrap(v) for v in value)
+        return value
+
+    def add(self, obj: int, op: str, name: str, args: tuple, result: Any,
+            t0: int, error: Optional[BaseException] = None) -> None:
+        dur_us = (time.perf_counter_ns() - t0) // 1000
+        if error is not None:
+            message = str(error)[:200]
+            encoded = {"e": [type(error).__name__,
+                             self.redact(message) if self.redact else message]}
+        else:
+            encoded = self.encode(result)
+        row = [obj, op, name, [self.encode(a) for a in args], encoded, dur_us]
+        with self._lock:
+            self.trace.events.append(row)
+
+
+def _unwrap(value: Any) -> Any:
+    if isinstance(value, _ComProxy):
+        return value._target
+    if isinstance(value, tuple):
+        return tuple(_unwrap(v) for v in value)
+    return value
+
+
+class _ComProxy:
+    """Stands in for a COM object while recording."""
+
+    __slots__ = ("_target", "_recorder", "_id")
+
+    def __init__(self, target: Any, recorder: _Recorder, obj_id: int) -> None:
+        object.__setattr__(self, "_target", target)
+        object.__setattr__(self, "_recorder", recorder)
+        object.__setattr__(self, "_id", obj_id)
+
+    def __getattr__(self, name: str) -> Any:
+        rec = self._recorder
+        t0 = time.perf_counter_ns()
+        try:
+            value = getattr(self._target, name)
+        except Exception as exc:
+            rec.add(self._id, "g", name, (), None, t0, exc)
+            raise
+        if callable(value) and not _is_com(value):
+            rec.method(self._id, name)
+            return _RecordedMethod(self, name, value)
+        value = rec.wrap(value)
+        rec.add(self._id, "g", name, (), value, t0)
+        return value
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        t0 = time.perf_counter_ns()
+        try:
+            setattr(self._target, name, _unwrap(value))
+        except Exception as exc:
+            self._recorder.add(self._id, "s", name, (value,), None, t0, exc)
+            raise
+        self._recorder.add(self._id, "s", name, (value,), None, t0)
+
+    def __repr__(self) -> str:
+        return f"<recording #{self._id} {self._target!r}>"
+
+
+class _RecordedMethod:
+    __slots__ = ("_owner", "_name", "_fn")
+
+    def __init__(self, owner: _ComProxy, name: str, fn: Callable) -> None:
+        self._owner = owner
+        self._name = name
+        self._fn = fn
+
+    def __call__(self, *args: Any) -> Any:
+        rec = self._owner._recorder
+        t0 = time.perf_counter_ns()
+        try:
+            result = self._fn(*(_unwrap(a) for a in args))
+        except Exception as exc:
+            rec.add(self._owner._id, "c", self._name, args, None, t0, exc)
+            raise
+        result = rec.wrap(result)
+        rec.add(self._owner._id, "c", self._name, args, result, t0)
+        return result
+
+
+def _engine_of(target: Any) -> Any:
+    return getattr(target, "engine", target)
+
+
+def _forget_handles(target: Any) -> None:
+    """
+    Drop the COM handles an App cached, so none bypasses (or outlives) the proxy.
+
+    Without this, ``_Action`` / document / collection handles made before
+    the block skip the recorder, and the ones made inside keep pointing
+    at the recording proxy after it. Same reset as :meth:`App.reload`.
+    """
+    if target is _engine_of(target):  # a bare Engine caches nothing above impl
+        return
+    from hwpapi.context.scopes import invalidate_cursor_format
+    from hwpapi.low.lifetime import release_all
+
+    release_all(target)
+    actions = getattr(target, "actions", None)
+    if actions is not None:
+        actions.refresh()
+    if getattr(target, "_docs_cache", None) is not None:
+        target._docs_cache = None
+    invalidate_cursor_format(target)  # cached reads would be missing from the trace
+
+
+def _pin_defaults(app: Any) -> Any:
+    """Run ``app`` without the GetDefault disk cache; return the previous setting."""
+    actions = getattr(app, "actions", None)
+    if actions is None:
+        return None
+    previous = vars(actions).get("_defaults")
+    actions._defaults = None
+    return previous
+
+
+@contextlib.contextmanager
+def record(
+    target: Any,
+    path: Union[str, Path, None] = None,
+    *,
+    redact: Union[bool, Callable[[str], str]] = False,
+) -> Iterator[ComTrace]:
+    """
+    Record every COM access made through ``target``'s engine.
+
+    Parameters
+    ----------
+    target : App | Engine
+        Anything with ``.engine.impl`` or ``.impl``; the impl is swapped
+        for a recording proxy for the duration of the block. An App's
+        cached handles (actions, documents, collection proxies) are
+        dropped on entry and on exit, and rebuilt on next use.
+    path : str | Path, optional
+        Where to save the trace on exit (also on error).
+    redact : bool | callable, optional
+        ``True`` masks letters in recorded strings; a callable maps each
+        recorded string.
+
+    Yields
+    ------
+    ComTrace
+        Filled as the block runs.
+    """
+    engine = _engine_of(target)
+    recorder = _Recorder(redact)
+    original = engine.impl
+    _forget_handles(target)
+    pinned = target is not engine
+    if pinned:
+        previous = _pin_defaults(target)
+    engine.impl = recorder.proxy(original)
+    try:
+        yield recorder.trace
+    finally:
+        engine.impl = original
+        if pinned and previous is not None:
+            target.actions._defaults = previous
+        _forget_handles(target)
+        if path is not None:
+            recorder.trace.save(path)
+            logger.info("recorded %d COM events to %s", len(recorder.trace), path)
+
+
+# ── replay ────────────────────────────────────────────────────────
+
+class ReplayStats:
+    """Replay counters — ``simulated`` is the modelled COM time in seconds."""
+
+    __slots__ = ("events", "misses", "reused", "simulated")
+
+    def __init__(self) -> None:
+        self.events = 0
+        self.misses = 0
+        self.reused = 0
+        self.simulated = 0.0
+
+    def __repr__(self) -> str:
+        return (f"ReplayStats(events={self.events}, misses={self.misses}, "
+                f"reused={self.reused}, simulated={self.simulated:.3f}s)")
+
+
+class _ReplayError(Exception):
+    """A COM error recorded in the trace, raised again on replay."""
+
+
+def _replayed_error(kind: str, message: str) -> Exception:
+    if kind == "AttributeError":
+        return AttributeError(message)
+    from hwpapi import errors as _errors
+    com_type = _errors._iter_com_error_types()[0]
+    if com_type is Exception:
+        return _ReplayError(f"{kind}: {message}")
+    return com_type(-2147352567, message, None, None)
+
+
+class ReplayEngine:
+    """
+    Simulated engine serving a :class:`ComTrace` — ``impl`` is the root object.
+
+    Parameters
+    ----------
+    trace : ComTrace | str | Path
+    latency : {"recorded", "sampled", "none"}
+        ``recorded`` delays each event by its own recorded time;
+        ``sampled`` draws from that member's recorded distribution with a
+        ``seed``-ed RNG; ``none`` runs at full speed.
+    scale : float
+        Multiplier on every delay.
+    sleep : bool
+        ``False`` only accumulates :attr:`stats` ``.simulated`` (virtual
+        time, for fast deterministic CI checks).
+    """
+
+    def __init__(self, trace: Union[ComTrace, str, Path], *, latency: str = "recorded",
+                 scale: float = 1.0, seed: int = 0, sleep: bool = True) -> None:
+        if latency not in _LATENCY_MODES:
+            raise InvalidArgumentError(
+                f"latency must be one of {_LATENCY_MODES}, got {latency!r}"
+            )
+        self.trace = trace if isinstance(trace, ComTrace) else ComTrace.load(trace)
+        self.latency = latency
+        self.scale = scale
+        self.sleep = sleep
+        self.stats = ReplayStats()
+        self._rng = random.Random(seed)
+        self._queues: Dict[Tuple[int, str, str], Deque[list]] = collections.defaultdict(
+            collections.deque)
+        self._last: Dict[Tuple[int, str, str], list] = {}
+        self._samples: Dict[Tuple[str, str], List[int]] = collections.defaultdict(list)
+        for event in self.trace.events:
+            obj, op, name = event[0], event[1], event[2]
+            self._queues[(obj, op, name)].append(event)
+            if op != "m":
+                self._samples[(op, name)].append(event[5])
+        self._objects: Dict[int, _SimObject] = {}
+        self._lock = threading.Lock()
+        self._debt = 0.0
+        self.impl = self.object(0)
+
+    def __repr__(self) -> str:
+        return f"<ReplayEngine {self.trace!r} latency={self.latency} {self.stats!r}>"
+
+    def object(self, obj_id: int) -> "_SimObject":
+        sim = self._objects.get(obj_id)
+        if sim is None:
+            sim = self._objects[obj_id] = _SimObject(self, obj_id)
+        return sim
+
+    def has(self, obj_id: int, op: str, name: str) -> bool:
+        return (obj_id, op, name) in self._queues
+
+    def next(self, obj_id: int, op: str, name: str) -> Optional[list]:
+        key = (obj_id, op, name)
+        with self._lock:
+            queue = self._queues.get(key)
+            if queue is None:
+                self.stats.misses += 1
+                return None
+            if queue:
+                event = self._last[key] = queue.popleft()
+            else:
+                event = self._last[key]
+                self.stats.reused += 1
+            self.stats.events += 1
+            delay = self._delay(event)
+        if delay:
+            time.sleep(delay)
+        return event
+
+    def _delay(self, event: list) -> float:
+        if self.latency == "none":
+            return 0.0
+        if self.latency == "sampled":
+            dur_us = self._rng.choice(self._samples[(event[1], event[2])])
+        else:
+            dur_us = event[5]
+        seconds = dur_us / 1e6 * self.scale
+        self.stats.simulated += seconds
+        if not self.sleep:
+            return 0.0
+        # Sleeping per µs-scale event overshoots; pay the debt in >= 1 ms slices.
+        self._debt += seconds
+        if self._debt < 1e-3:
+            return 0.0
+        debt, self._debt = self._debt, 0.0
+        return debt
+
+    def result(self, event: list) -> Any:
+        value = event[4]
+        if isinstance(value, dict) and "e" in value:
+            raise _replayed_error(*value["e"])
+        return self.decode(value)
+
+    def decode(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            if "o" in value:
+                return self.object(value["o"])
+            if "t" in value:
+                return tuple(self.decode(v) for v in value["t"])
+            if "b" in value:
+                return bytes(value["b"])
+            return None
+        return value
+
+    def quit(self) -> None:
+        """Nothing to terminate — present for :class:`Engine` parity."""
+
+
+class _SimObject:
+    """A recorded COM object; members come from the trace."""
+
+    __slots__ = ("_engine", "_id")
+
+    def __init__(self, engine: ReplayEngine, obj_id: int) -> None:
+        object.__setattr__(self, "_engine", engine)
+        object.__setattr__(self, "_id", obj_id)
+
+    def __getattr__(self, name: str) -> Any:
+        engine = self._engine
+        if engine.has(self._id, "m", name) and not engine.has(self._id, "g", name):
+            return _SimMethod(self, name)
+        event = engine.next(self._id, "g", name)
+        if event is None:
+            raise AttributeError(f"replayed COM object #{self._id} has no recorded {name!r}")
+        return engine.result(event)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if self._engine.has(self._id, "s", name):
+            event = self._engine.next(self._id, "s", name)
+            if isinstance(event[4], dict) and "e" in event[4]:
+                self._engine.result(event)
+
+    def __repr__(self) -> str:
+        return f"<replayed COM object #{self._id}>"
+
+
+class _SimMethod:
+    __slots__ = ("_owner", "_name")
+
+    def __init__(self, owner: _SimObject, name: str) -> None:
+        self._owner = owner
+        self._name = name
+
+    def __call__(self, *args: Any) -> Any:
+        engine = self._owner._engine
+        event = engine.next(self._owner._id, "c", self._name)
+        return None if event is None else engine.result(event)
+
+
+def replay_app(trace: Union[ComTrace, str, Path], **options: Any):
+    """
+    An :class:`~hwpapi.core.app.App` on a :class:`ReplayEngine` (``options`` pass through).
+
+    Like :func:`record`, the App runs without the GetDefault disk cache.
+    """
+    from hwpapi.core.app import App
+
+    app = App._adopt(ReplayEngine(trace, **options))
+    _pin_defaults(app)
+    return app
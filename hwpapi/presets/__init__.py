@@ -169,7 +169,7 @@ class Presets:
             pset.SetItem("HeightValue", to_hwpunit(height))
             act.Execute(pset)
         except Exception as e:
-            app.logger.warning(f"title_box: table create failed: {e}")
+            app.logger.warning("title_box: table create failed: %s", e)
             return app
 
         # 1단계: 전체 표 배경색 칠하기 — 전체 셀 선택 후 CellFill
@@ -180,7 +180,7 @@ class Presets:
             _apply_cell_bg(app, bg_color)
             app.api.Run("Cancel")
         except Exception as e:
-            app.logger.debug(f"title_box bg: {e}")
+            app.logger.debug("title_box bg: %s", e)
 
         # 2단계: 첫 셀로 돌아와 title 삽입 — cell_addr 로 진행 추적
         try:
@@ -199,7 +199,7 @@ class Presets:
             if subtitle:
                 app.styled_text(subtitle, height=font_size - 200, text_color=title_color)
         except Exception as e:
-            app.logger.debug(f"title_box text insertion: {e}")
+            app.logger.debug("title_box text insertion: %s", e)
 
         # 4단계: 표 밖으로 이동 → 이후 호출되는 preset 은 표 밖 위치에서 시작
         _exit_table(app)
@@ -237,7 +237,7 @@ class Presets:
             # 다음 콘텐츠는 표 밖에서 이어지도록
             _exit_table(app)
         except Exception as e:
-            app.logger.warning(f"subtitle_bar: {e}")
+            app.logger.warning("subtitle_bar: %s", e)
         return app
 
     # ═════════════════════════════════════════════════════════════
@@ -317,7 +317,7 @@ class Presets:
                     if new is None or new == prev:
                         break
         except Exception as e:
-            app.logger.debug(f"table_header: {e}")
+            app.logger.debug("table_header: %s", e)
         return app
 
     def table_footer(
@@ -375,7 +375,7 @@ class Presets:
                     if new is None or new == prev:
                         break
         except Exception as e:
-            app.logger.debug(f"table_footer: {e}")
+            app.logger.debug("table_footer: %s", e)
         return app
 
     # ═════════════════════════════════════════════════════════════
@@ -424,7 +424,7 @@ class Presets:
             pset.SetItem("RightAlign", 1)
             act.Execute(pset)
         except Exception as e:
-            app.logger.warning(f"toc: MakeIndex failed: {e}")
+            app.logger.warning("toc: MakeIndex failed: %s", e)
             return app
 
         # 책갈피 추가 — 각 제목 문단에
@@ -481,7 +481,7 @@ class Presets:
             pset.SetItem("NewNum", 1)
             act.Execute(pset)
         except Exception as e:
-            app.logger.debug(f"page_numbers: {e}")
+            app.logger.debug("page_numbers: %s", e)
 
         if header_filename:
             try:
@@ -529,7 +529,7 @@ class Presets:
             # 바탕쪽 닫기
             app.api.Run("Close")
         except Exception as e:
-            app.logger.debug(f"page_border: {e}")
+            app.logger.debug("page_border: %s", e)
         return app
 
     def highlight_yellow(self, toggle: bool = True) -> "App":
@@ -556,7 +556,7 @@ class Presets:
                 # Use `app.styled_text("text", shade_color="#FFFF00")` for
                 # bleed-safe highlighting (snapshot/restore pattern).
         except Exception as e:
-            app.logger.debug(f"highlight_yellow: {e}")
+            app.logger.debug("highlight_yellow: %s", e)
         return app
 
     def summary_box(self, text: str = "", variant: str = "rounded",
@@ -595,7 +595,7 @@ class Presets:
             # 다음 콘텐츠는 표 밖에서 이어지도록
             _exit_table(app)
         except Exception as e:
-            app.logger.debug(f"summary_box: {e}")
+            app.logger.debug("summary_box: %s", e)
         return app
 
 
@@ -677,4 +677,4 @@ def _apply_cell_bg(app, hex_color: str) -> None:
 
         app.api.HAction.Execute("CellBorderFill", hpset.HSet)
     except Exception as e:
-        app.logger.debug(f"_apply_cell_bg failed: {e}")
+        app.logger.debug("_apply_cell_bg failed: %s", e)
@@ -0,0 +1,510 @@
+"""
+:mod:`hwpapi.search` — scan-based find / replace planning (pure Python).
+
+:class:`hwpapi.Document` 의 ``replace_many`` 는 문서 전체를 매 규칙마다
+``AllReplace`` 로 훑는 대신, **한 번의 TEXT export** 를 Python 에서
+분석해 실제로 필요한 ``AllReplace`` 실행만 계획합니다. 이 모듈은 그
+계획 로직을 담당하며 COM 을 전혀 건드리지 않습니다 — 단위 테스트에서
+문자열만으로 검증 가능.
+
+``find_all`` 역시 같은 스캔 위에서 동작합니다 — 여러 literal 패턴은
+Aho–Corasick automaton (:class:`PatternMatcher`) 한 번의 통과로,
+정규식은 :mod:`re` 로 찾고, 결과 offset 을 ``(list, para, pos)`` 로
+되돌립니다. 매치당 COM 호출은 없습니다.
+
+Public names::
+
+    TextScan            # 한 번 export 한 문서 텍스트 + 단락 offset 인덱스
+    ReplacePlan         # 실행할 (find, replace) 단계 + 규칙별 정확한 개수
+    plan_replacements   # rules → ReplacePlan
+    PatternMatcher      # 다중 literal 패턴 Aho–Corasick automaton
+    Match               # find_all 결과 — (list, para, pos) 범위 + select()
+    iter_matches        # TextScan + patterns → Match generator
+
+Ordering rules
+--------------
+규칙을 순서대로 실행하면 앞 규칙의 치환 결과를 뒤 규칙이 다시 바꾸는
+*cascading rewrite* 가 생길 수 있습니다 (``{a}→{b}``, ``{b}→X``).
+:func:`plan_replacements` 는 다음 제약으로 위상 정렬합니다.
+
+* ``B.find`` 가 ``A.replace`` 안에 있으면 → B 를 A 보다 먼저.
+* ``B.find`` 가 ``A.find`` 의 부분 문자열이면 → A (긴 쪽) 를 먼저.
+
+순환 (``a↔b`` swap 등) 은 private-use sentinel 을 경유해 두 단계로
+풀어냅니다. sentinel 에 "주차" 하는 단계도 같은 제약으로 나머지 규칙과
+함께 정렬되므로 (``xab`` 가 ``ab`` 의 주차보다 먼저) 긴 find 우선
+규칙이 깨지지 않습니다. 계획은 스캔 텍스트 위에서 그대로 시뮬레이션되므로 반환되는
+개수는 HWP 가 실제로 바꾸는 개수와 같습니다 (단락 경계를 넘는 패턴은
+HWP 가 찾지 못하므로 예외).
+"""
+from __future__ import annotations
+
+import heapq
+import re
+from bisect import bisect_right
+from collections import deque
+from typing import (
+    TYPE_CHECKING, Dict, Iterable, Iterator, List, Mapping, Optional, Tuple,
+    Union,
+)
+
+if TYPE_CHECKING:
+    from hwpapi.document import Document
+
+__all__ = [
+    "TextScan", "ReplacePlan", "plan_replacements",
+    "PatternMatcher", "Match", "iter_matches",
+]
+
+
+Rules = Union[Mapping[str, str], Iterable[Tuple[str, str]]]
+
+# Private-use code points — never produced by HWP's TEXT export.
+_SENTINEL_OPEN = ""
+_SENTINEL_CLOSE = ""
+
+
+class TextScan:
+    """
+    One-shot snapshot of a document's plain text.
+
+    ``GetTextFile("TEXT", "")`` separates paragraphs with ``"\\r\\n"``;
+    the scan normalises that to ``"\\n"`` and keeps a sorted list of
+    paragraph start offsets so any character offset maps back to a
+    ``(para, pos)`` pair in ``O(log n)``.
+
+    Parameters
+    ----------
+    raw : str
+        Raw TEXT export of the document.
+    """
+
+    __slots__ = ("text", "_starts")
+
+    def __init__(self, raw: str) -> None:
+        text = (raw or "").replace("\r\n", "\n").replace("\r", "\n")
+        self.text = text
+        starts = [0]
+        i = text.find("\n")
+        while i != -1:
+            starts.append(i + 1)
+            i = text.find("\n", i + 1)
+        self._starts = starts
+
+    @property
+    def paragraph_count(self) -> int:
+        """Number of paragraphs in the scan (at least 1)."""
+        return len(self._starts)
+
+    def paragraph(self, index: int) -> str:
+        """Text of paragraph ``index`` without its trailing break."""
+        start = self._starts[index]
+        end = (self._starts[index + 1] - 1
+               if index + 1 < len(self._starts) else len(self.text))
+        return self.text[start:end]
+
+    def locate(self, offset: int) -> Tuple[int, int]:
+        """Map a character offset in :attr:`text` to ``(para, pos)``."""
+        para = bisect_right(self._starts, offset) - 1
+        return para, offset - self._starts[para]
+
+    def __len__(self) -> int:
+        return len(self.text)
+
+    def __repr__(self) -> str:
+        return f"TextScan(paragraphs={self.paragraph_count}, chars={len(self.text)})"
+
+
+class ReplacePlan:
+    """
+    Result of :func:`plan_replacements`.
+
+    Attributes
+    ----------
+    steps : list of (str, str)
+        ``(find, replace)`` pairs to execute **in order** — each one is a
+        single ``AllReplace`` run. Rules with no matches never appear.
+    counts : dict
+        ``{find: n}`` — exact number of replacements per input rule, in
+        input order. Rules without matches map to ``0``.
+    regex : list of bool
+        Per step — run it with ``FindRegExp``. Sentinel → replacement
+        steps are always literal.
+    """
+
+    __slots__ = ("steps", "counts", "regex", "_credits")
+
+    def __init__(self, steps: List[Tuple[str, str]], counts: Dict[str, int],
+                 credits: Optional[List[Tuple[Optional[str], int]]] = None,
+                 regex: Optional[List[bool]] = None) -> None:
+        self.steps = steps
+        self.counts = counts
+        self.regex = regex if regex is not None else [False] * len(steps)
+        # Per step: (rule credited, hits) — sentinel→value steps credit None.
+        self._credits = credits or []
+
+    def counts_through(self, n_steps: int) -> Dict[str, int]:
+        """Counts as if only the first ``n_steps`` steps had run.
+
+        A rule routed through a sentinel is credited when its matches are
+        parked, i.e. before its final replacement lands.
+        """
+        out = {find: 0 for find in self.counts}
+        for owner, hits in self._credits[:n_steps]:
+            if owner is not None:
+                out[owner] += hits
+        return out
+
+    @property
+    def total(self) -> int:
+        """Sum of all replacements."""
+        return sum(self.counts.values())
+
+    def __repr__(self) -> str:
+        return f"ReplacePlan(steps={len(self.steps)}, total={self.total})"
+
+
+def _normalise_rules(rules: Rules) -> List[Tuple[str, str]]:
+    """``dict`` or ``(find, replace)`` pairs → de-duplicated pair list.
+
+    Later duplicates override earlier ones (dict semantics) but keep the
+    first position; empty find strings are dropped.
+    """
+    items = rules.items() if isinstance(rules, Mapping) else rules
+    merged: Dict[str, str] = {}
+    for find, replace in items:
+        find = str(find)
+        if not find:
+            continue
+        merged[find] = "" if replace is None else str(replace)
+    return list(merged.items())
+
+
+def _order(pairs: List[Tuple[str, str]], regex: bool,
+           compiled: Dict[str, "re.Pattern"],
+           parked: frozenset = frozenset()) -> Tuple[List[int], List[int]]:
+    """Topologically order rule indices; return ``(ordered, cyclic)``.
+
+    Edge ``u → v`` means "u must run before v". Ties keep input order.
+    Rules in ``parked`` write a sentinel instead of their replacement, so
+    nothing can rewrite their output. Indices that can't be ordered
+    (cycles and anything downstream of them) come back in ``cyclic``.
+    """
+    n = len(pairs)
+    succ: List[List[int]] = [[] for _ in range(n)]
+    indeg = [0] * n
+
+    def _occurs(i: int, haystack: str) -> bool:
+        if regex:
+            return compiled[pairs[i][0]].search(haystack) is not None
+        return pairs[i][0] in haystack
+
+    for a in range(n):
+        find_a, repl_a = pairs[a]
+        if a in parked:
+            repl_a = ""
+        for b in range(n):
+            if a == b:
+                continue
+            # b's pattern would rewrite a's output → b first.
+            if repl_a and _occurs(b, repl_a):
+                succ[b].append(a)
+                indeg[a] += 1
+            # b's find is a substring of a's find → a (longer) first.
+            # Regex containment isn't decidable cheaply; keep input order.
+            if not regex and pairs[b][0] in find_a and len(find_a) > len(pairs[b][0]):
+                succ[a].append(b)
+                indeg[b] += 1
+
+    heap = [i for i in range(n) if indeg[i] == 0]
+    heapq.heapify(heap)
+    ordered: List[int] = []
+    while heap:
+        u = heapq.heappop(heap)
+        ordered.append(u)
+        for v in succ[u]:
+            indeg[v] -= 1
+            if indeg[v] == 0:
+                heapq.heappush(heap, v)
+    done = set(ordered)
+    cyclic = [i for i in range(n) if i not in done]
+    return ordered, cyclic
+
+
+def _sentinel(index: int, taken: str) -> str:
+    """Private-use token guaranteed absent from ``taken``."""
+    salt = 0
+    while True:
+        token = f"{_SENTINEL_OPEN}{index}.{salt}{_SENTINEL_CLOSE}"
+        if token not in taken:
+            return token
+        salt += 1
+
+
+def plan_replacements(text: str, rules: Rules, regex: bool = False) -> ReplacePlan:
+    """
+    Plan the minimal ordered set of ``AllReplace`` runs for ``rules``.
+
+    Parameters
+    ----------
+    text : str
+        Document text from a single scan (see :class:`TextScan`).
+    rules : dict | iterable of (str, str)
+        ``{find: replace}`` mapping or pairs.
+    regex : bool, optional
+        Treat every ``find`` as a regular expression. Python's :mod:`re`
+        is used for the simulation, so stick to the syntax subset HWP's
+        ``FindRegExp`` shares with it (classes, quantifiers, anchors).
+        Replacement strings are always literal.
+
+    Returns
+    -------
+    ReplacePlan
+        Steps to execute and exact per-rule counts.
+
+    Examples
+    --------
+    >>> plan = plan_replacements("{a} {b}", {"{a}": "{b}", "{b}": "B"})
+    >>> plan.steps
+    [('{b}', 'B'), ('{a}', '{b}')]
+    >>> plan.counts
+    {'{a}': 1, '{b}': 1}
+    """
+    pairs = _normalise_rules(rules)
+    counts: Dict[str, int] = {find: 0 for find, _ in pairs}
+
+    compiled: Dict[str, "re.Pattern"] = {}
+    if regex:
+        compiled = {find: re.compile(find) for find, _ in pairs}
+
+    # Prefilter: rules that never match the scan cost nothing. A rule
+    # absent now could only appear through another rule's output, which
+    # the ordering below runs *after* it anyway.
+    if regex:
+        live = [p for p in pairs if compiled[p[0]].search(text)]
+    else:
+        live = [p for p in pairs if p[0] in text]
+    if not live:
+        return ReplacePlan([], counts)
+
+    # Rules caught in a cycle park their matches on a sentinel instead;
+    # re-order with those parking steps in the same graph, so they still
+    # respect "longer find first" and "don't rewrite earlier output".
+    # Parking only removes edges, so this settles within len(live) rounds.
+    parked: set = set()
+    while True:
+        ordered, cyclic = _order(live, regex, compiled, frozenset(parked))
+        if not cyclic:
+            break
+        parked.update(cyclic)
+
+    taken = text + "".join(f + r for f, r in live)
+    sentinels = {i: _sentinel(i, taken) for i in parked}
+
+    # (find, replace, owning rule or None, is_regex)
+    schedule: List[Tuple[str, str, Union[str, None], bool]] = []
+    for i in ordered:
+        target = sentinels[i] if i in parked else live[i][1]
+        schedule.append((live[i][0], target, live[i][0], regex))
+    # Parked rules emit their real replacement last, when nothing can
+    # rewrite it — a literal search for the sentinel even in regex mode.
+    for i in sorted(parked):
+        schedule.append((sentinels[i], live[i][1], None, False))
+
+    steps: List[Tuple[str, str]] = []
+    step_regex: List[bool] = []
+    credits: List[Tuple[Optional[str], int]] = []
+    current = text
+    for find, replace, owner, is_regex in schedule:
+        if is_regex:
+            current, n = compiled[find].subn(lambda _m, _r=replace: _r, current)
+        else:
+            n = current.count(find)
+            if n:
+                current = current.replace(find, replace)
+        if not n:
+            continue
+        steps.append((find, replace))
+        step_regex.append(is_regex)
+        credits.append((owner, n))
+        if owner is not None:
+            counts[owner] += n
+    return ReplacePlan(steps, counts, credits, step_regex)
+
+
+# ── find_all — multi-pattern matching ─────────────────────────────
+
+class PatternMatcher:
+    """
+    Aho–Corasick automaton over a fixed set of literal patterns.
+
+    Built once in ``O(total pattern length)``; :meth:`finditer` then
+    scans a text in ``O(len(text) + matches)`` regardless of how many
+    patterns there are — 10k dictionary terms cost one pass.
+
+    Parameters
+    ----------
+    patterns : iterable of str
+        Literal patterns. Empty strings and duplicates are ignored.
+
+    Examples
+    --------
+    >>> m = PatternMatcher(["he", "she", "hers"])
+    >>> [(s, e, p) for s, e, p in m.finditer("ushers")]
+    [(1, 4, 'she'), (2, 4, 'he'), (2, 6, 'hers')]
+    """
+
+    __slots__ = ("patterns", "_goto", "_fail", "_out")
+
+    def __init__(self, patterns: Iterable[str]) -> None:
+        self.patterns: List[str] = list(dict.fromkeys(p for p in patterns if p))
+        goto: List[Dict[str, int]] = [{}]
+        out: List[List[int]] = [[]]
+        for index, pattern in enumerate(self.patterns):
+            state = 0
+            for ch in pattern:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    out.append([])
+                state = nxt
+            out[state].append(index)
+
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                target = goto[f].get(ch, 0)
+                fail[nxt] = target if target != nxt else 0
+                # Inherit outputs of the fail state (suffix matches).
+                out[nxt].extend(out[fail[nxt]])
+        self._goto = goto
+        self._fail = fail
+        self._out = out
+
+    def __len__(self) -> int:
+        return len(self.patterns)
+
+    def finditer(self, text: str) -> Iterator[Tuple[int, int, str]]:
+        """Yield ``(start, end, pattern)`` for every (overlapping) hit.
+
+        Hits are produced in order of ``end``; for the same ``end`` the
+        longer pattern comes first.
+        """
+        goto, fail, out, patterns = self._goto, self._fail, self._out, self.patterns
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if out[state]:
+                end = i + 1
+                for index in out[state]:
+                    pattern = patterns[index]
+                    yield end - len(pattern), end, pattern
+
+
+class Match:
+    """
+    One ``find_all`` hit, mapped back to HWP coordinates.
+
+    Attributes
+    ----------
+    pattern : str
+        The pattern (literal or regex source) that matched.
+    text : str
+        Matched text.
+    start, end : tuple of int
+        ``(list, para, pos)`` — ``end`` is exclusive. ``list`` is always
+        ``0`` (본문) since the TEXT scan only covers the body.
+    """
+
+    __slots__ = ("pattern", "text", "start", "end", "_doc")
+
+    def __init__(self, pattern: str, text: str,
+                 start: Tuple[int, int, int], end: Tuple[int, int, int],
+                 doc: Optional["Document"] = None) -> None:
+        self.pattern = pattern
+        self.text = text
+        self.start = start
+        self.end = end
+        self._doc = doc
+
+    def select(self) -> "Match":
+        """Owning 문서에서 이 범위를 선택 (``SetPos`` + ``SelectText``)."""
+        if self._doc is None:
+            raise RuntimeError("Match is not bound to a Document")
+        self._doc.activate()
+        api = self._doc._app.api
+        list_id, spara, spos = self.start
+        _, epara, epos = self.end
+        api.SetPos(list_id, spara, spos)
+        api.SelectText(spara, spos, epara, epos)
+        return self
+
+    def __iter__(self):
+        # ``start, end = match`` 언패킹 지원.
+        yield self.start
+        yield self.end
+
+    def __eq__(self, other) -> bool:
+        if not isinstance(other, Match):
+            return NotImplemented
+        return (self.pattern, self.start, self.end) == (other.pattern, other.start, other.end)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"Match({self.text!r}, start={self.start}, end={self.end})"
+
+
+def iter_matches(scan: TextScan, patterns: Union[str, Iterable[str]],
+                 regex: bool = False,
+                 doc: Optional["Document"] = None) -> Iterator[Match]:
+    """
+    Stream :class:`Match` records for ``patterns`` over ``scan``.
+
+    Parameters
+    ----------
+    scan : TextScan
+        Document text from a single export.
+    patterns : str | iterable of str
+        One pattern or many.
+    regex : bool, optional
+        Treat patterns as regular expressions. Each pattern runs through
+        :meth:`re.Pattern.finditer` and the streams are merged by start
+        offset. Otherwise all patterns share one :class:`PatternMatcher`
+        pass (overlapping hits included, ordered by end offset).
+    doc : Document, optional
+        Bound to each record so :meth:`Match.select` works.
+
+    Yields
+    ------
+    Match
+    """
+    if isinstance(patterns, str):
+        patterns = [patterns]
+    text = scan.text
+
+    if regex:
+        compiled = [re.compile(p) for p in dict.fromkeys(patterns) if p]
+        streams = [
+            ((m.start(), m.end(), rx.pattern) for m in rx.finditer(text) if m.end() > m.start())
+            for rx in compiled
+        ]
+        hits: Iterable[Tuple[int, int, str]] = heapq.merge(*streams)
+    else:
+        hits = PatternMatcher(patterns).finditer(text)
+
+    locate = scan.locate
+    for start, end, pattern in hits:
+        spara, spos = locate(start)
+        epara, epos = locate(end)
+        yield Match(pattern, text[start:end], (0, spara, spos), (0, epara, epos), doc)
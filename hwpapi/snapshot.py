@@ -0,0 +1,142 @@
+"""
+:mod:`hwpapi.snapshot` — 메모리 스냅샷과 트랜잭션 롤백.
+
+``GetTextFile(format, "")`` 로 문서 전체를 메모리에 받아 두었다가
+``SetTextFile(data, format, "")`` 로 되돌립니다 — 파일 시스템을 거치지
+않으므로 다단계 배치 편집의 실패 시 원본을 다시 열고 재실행할 필요가
+없습니다.
+
+- :class:`DocumentSnapshot` — 불변 스냅샷 (선택적 zlib 압축, 크기 상한).
+- :class:`Transaction` — ``with doc.transaction():`` 블록. 첫 편집 직전에
+  한 번만 스냅샷을 뜨고, 예외가 나면 복원 후 예외를 다시 올림. 읽기
+  (``doc.text``, ``find_all`` …) 는 편집이 아니므로 스냅샷을 뜨지 않고,
+  안쪽 블록은 바깥 스냅샷 이후 편집이 없었다면 그 스냅샷을 공유.
+
+    with doc.transaction():
+        doc.replace_all("2025", "2026")
+        doc.fields["total"] = compute_total()   # 실패하면 전부 롤백
+
+``Document`` 를 거치지 않은 raw ``app.api`` 편집은 "첫 편집" 감지에
+잡히지 않습니다 — 그런 블록은 :meth:`Transaction.begin` 으로 미리
+스냅샷을 뜨세요.
+"""
+from __future__ import annotations
+
+import zlib
+from typing import TYPE_CHECKING, Optional
+
+from hwpapi.logging import get_logger
+
+if TYPE_CHECKING:
+    from hwpapi.document import Document
+
+__all__ = ["DocumentSnapshot", "Transaction", "SNAPSHOT_FORMATS"]
+
+logger = get_logger("snapshot")
+
+#: ``GetTextFile`` / ``SetTextFile`` 가 문서 전체를 손실 없이 왕복하는 포맷.
+SNAPSHOT_FORMATS = ("HWP", "HWPML2X")
+
+
+class DocumentSnapshot:
+    """
+    문서 한 개의 메모리 스냅샷 — :meth:`Document.snapshot` 이 생성.
+
+    Attributes
+    ----------
+    format : str
+        ``"HWP"`` 또는 ``"HWPML2X"``.
+    compressed : bool
+        본문이 zlib 압축되어 있는지.
+    size : int
+        압축 전 크기 (bytes, UTF-8).
+    """
+
+    __slots__ = ("format", "compressed", "size", "_data")
+
+    def __init__(self, format: str, data: str, compress: bool = True) -> None:
+        raw = data.encode("utf-8", "surrogatepass")
+        self.format = format
+        self.size = len(raw)
+        self.compressed = bool(compress)
+        self._data = zlib.compress(raw, 1) if compress else raw
+
+    @property
+    def nbytes(self) -> int:
+        """메모리에 실제로 들고 있는 크기 (압축 후)."""
+        return len(self._data)
+
+    def text(self) -> str:
+        """``SetTextFile`` 에 넘길 원문."""
+        raw = zlib.decompress(self._data) if self.compressed else self._data
+        return raw.decode("utf-8", "surrogatepass")
+
+    def __repr__(self) -> str:
+        return (
+            f"DocumentSnapshot({self.format}, size={self.size}, "
+            f"nbytes={self.nbytes})"
+        )
+
+
+class Transaction:
+    """
+    ``with doc.transaction():`` 가 돌려주는 핸들.
+
+    첫 편집 (``Document`` 의 편집 메서드) 직전에 한 번만 스냅샷을
+    뜹니다. 블록이 예외로 끝나면 스냅샷으로 복원하고 예외를 다시
+    올립니다. 스냅샷 전에 실패하면 복원할 것도 없습니다.
+
+    중첩되면 안쪽의 첫 편집이 바깥 스냅샷도 뜨게 합니다. 바깥 스냅샷
+    이후 아직 편집이 없으면 문서 상태가 같으므로 안쪽은 그 스냅샷을
+    그대로 씁니다 — ``GetTextFile`` 은 한 번뿐입니다.
+    """
+
+    __slots__ = ("_doc", "_outer", "_options", "snapshot", "_pending", "_edited")
+
+    def __init__(self, doc: "Document", outer: Optional["Transaction"] = None, **options) -> None:
+        self._doc = doc
+        self._outer = outer
+        self._options = options
+        self.snapshot: Optional[DocumentSnapshot] = None
+        self._pending = True
+        self._edited = False  # 스냅샷 이후 편집이 있었는지
+
+    def begin(self) -> "Transaction":
+        """아직 안 떴다면 지금 스냅샷을 뜸 (raw ``app.api`` 편집 전에).
+
+        이후 편집이 있는 것으로 간주합니다 — 이 뒤에 열린 안쪽 트랜잭션은
+        자기 스냅샷을 새로 뜹니다.
+        """
+        self._take()
+        txn: Optional[Transaction] = self
+        while txn is not None:
+            txn._edited = True
+            txn = txn._outer
+        return self
+
+    def _take(self) -> None:
+        if not self._pending:
+            return
+        self._pending = False
+        outer = self._outer
+        if outer is not None:
+            outer._take()  # 바깥 트랜잭션도 편집 전 상태를 잡아야 함
+            if not outer._edited:
+                self.snapshot = outer.snapshot  # 같은 상태 — 공유
+                return
+        self.snapshot = self._doc.snapshot(**self._options)
+
+    def _before_edit(self) -> None:
+        self.begin()
+
+    def rollback(self) -> bool:
+        """스냅샷으로 복원. 복원할 스냅샷이 없으면 ``False``."""
+        if self.snapshot is None:
+            return False
+        self._pending = False
+        self._doc.restore(self.snapshot)
+        return True
+
+    def __repr__(self) -> str:
+        state = "pending" if self._pending else repr(self.snapshot)
+        return f"Transaction({state})"
@@ -0,0 +1,297 @@
+"""
+:mod:`hwpapi.tracing` — opt-in nested spans for "where did the time go".
+
+Entry points that talk to HWP (``_Action.run``, ``FieldCollection.update``,
+``Document.save``, ``docs.open``, engine startup, batch conversion and
+page rendering) open a :class:`Span` carrying attributes (action key,
+SetID, document, ...) and the number and total latency of the COM calls
+made inside it. Finished spans go to an in-process ring buffer, which
+exports as JSON lines or as a Chrome trace (``chrome://tracing``,
+Perfetto, speedscope) — no external service::
+
+    from hwpapi import tracing
+
+    tracing.enable()
+    run_nightly_job()
+    tracing.export_chrome("nightly.trace.json")
+
+or without code changes: ``HWPAPI_TRACE=nightly.trace.json`` enables
+tracing on import and writes the buffer at exit (``.json`` → Chrome
+trace, anything else → JSON lines).
+
+Disabled, :func:`span` returns one shared no-op span — a flag check and
+a function call. The no-op span is falsy, so attributes that cost a COM
+call are only computed when tracing is on::
+
+    with tracing.span("document.save", format=fmt) as sp:
+        if sp:
+            sp.set(document=self.path)
+        sp.call(self._app.api.Save)
+
+COM counts are inclusive: a span's ``com_calls`` / ``com_ms`` include
+its children. Spans nest per thread; engine worker threads show up as
+separate tracks.
+"""
+from __future__ import annotations
+
+import atexit
+import collections
+import functools
+import itertools
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional, Union
+
+__all__ = [
+    "ENABLED", "Span", "clear", "disable", "enable", "export_chrome",
+    "export_jsonl", "record_com", "span", "spans", "traced",
+]
+
+#: Finished spans kept by default (oldest dropped first).
+DEFAULT_CAPACITY = 10_000
+
+#: ``True`` while spans are being recorded — read it, don't assign it.
+ENABLED = False
+
+_buffer: Deque["Span"] = collections.deque(maxlen=DEFAULT_CAPACITY)
+_local = threading.local()
+_ids = itertools.count(1)
+
+
+class Span:
+    """One timed region; use through :func:`span` as a context manager."""
+
+    __slots__ = ("name", "attrs", "span_id", "parent_id", "thread", "start_ns",
+                 "end_ns", "com_calls", "com_ns", "error")
+
+    def __init__(self, name: str, attrs: Dict[str, Any]) -> None:
+        self.name = name
+        self.attrs = attrs
+        self.span_id = next(_ids)
+        self.parent_id: Optional[int] = None
+        self.thread = threading.get_ident()
+        self.start_ns = 0
+        self.end_ns = 0
+        self.com_calls = 0
+        self.com_ns = 0
+        self.error: Optional[str] = None
+
+    def __bool__(self) -> bool:
+        return True
+
+    def set(self, **attrs: Any) -> "Span":
+        """Add or overwrite attributes."""
+        self.attrs.update(attrs)
+        return self
+
+    def com(self, seconds: float, calls: int = 1) -> None:
+        """Count ``calls`` COM calls that took ``seconds`` in total."""
+        self.com_calls += calls
+        self.com_ns += int(seconds * 1e9)
+
+    def call(self, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        """Run one COM call ``fn(*args, **kwargs)`` and count it."""
+        t0 = time.perf_counter_ns()
+        try:
+            return fn(*args, **kwargs)
+        finally:
+            self.com_calls += 1
+            self.com_ns += time.perf_counter_ns() - t0
+
+    @property
+    def duration(self) -> float:
+        """Seconds between enter and exit (0 while open)."""
+        return max(self.end_ns - self.start_ns, 0) / 1e9
+
+    def __enter__(self) -> "Span":
+        stack = _stack()
+        if stack:
+            self.parent_id = stack[-1].span_id
+        stack.append(self)
+        self.start_ns = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.end_ns = time.perf_counter_ns()
+        if exc_type is not None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        stack = _stack()
+        if stack and stack[-1] is self:
+            stack.pop()
+        if stack:
+            stack[-1].com_calls += self.com_calls
+            stack[-1].com_ns += self.com_ns
+        _buffer.append(self)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready record (times in µs from the perf-counter origin)."""
+        return {
+            "name": self.name,
+            "id": self.span_id,
+            "parent": self.parent_id,
+            "pid": os.getpid(),
+            "tid": self.thread,
+            "ts_us": self.start_ns / 1e3,
+            "dur_us": (self.end_ns - self.start_ns) / 1e3,
+            "com_calls": self.com_calls,
+            "com_ms": self.com_ns / 1e6,
+            "error": self.error,
+            "attrs": {k: _jsonable(v) for k, v in self.attrs.items()},
+        }
+
+    def __repr__(self) -> str:
+        return (f"Span({self.name!r}, {self.duration * 1e3:.3f} ms, "
+                f"com={self.com_calls}, attrs={self.attrs!r})")
+
+
+class _NoopSpan:
+    """Shared stand-in returned while tracing is off."""
+
+    __slots__ = ()
+
+    def __bool__(self) -> bool:
+        return False
+
+    def __enter__(self) -> "_NoopSpan":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        return None
+
+    def set(self, **attrs: Any) -> "_NoopSpan":
+        return self
+
+    def com(self, seconds: float, calls: int = 1) -> None:
+        return None
+
+    def call(self, fn: Callable, *args: Any, **kwargs: Any) -> Any:
+        return fn(*args, **kwargs)
+
+
+_NOOP = _NoopSpan()
+
+
+def _stack() -> List[Span]:
+    stack = getattr(_local, "stack", None)
+    if stack is None:
+        stack = _local.stack = []
+    return stack
+
+
+def _jsonable(value: Any) -> Any:
+    if value is None or isinstance(value, (bool, int, float, str)):
+        return value
+    return str(value)
+
+
+def span(name: str, **attrs: Any) -> Union[Span, _NoopSpan]:
+    """
+    Open a span named ``name`` (``with tracing.span(...) as sp:``).
+
+    Returns the shared falsy no-op span while tracing is disabled.
+    """
+    if not ENABLED:
+        return _NOOP
+    return Span(name, attrs)
+
+
+def traced(name: Optional[str] = None, **attrs: Any) -> Callable:
+    """Decorator — run the function inside ``span(name or qualname)``."""
+    def decorate(fn: Callable) -> Callable:
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            if not ENABLED:
+                return fn(*args, **kwargs)
+            with Span(label, dict(attrs)):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def record_com(seconds: float, calls: int = 1) -> None:
+    """Count COM time against the innermost open span of this thread."""
+    if ENABLED:
+        stack = _stack()
+        if stack:
+            stack[-1].com(seconds, calls)
+
+
+def enable(capacity: Optional[int] = None) -> None:
+    """Start recording; ``capacity`` resizes the ring buffer (keeps newest)."""
+    global ENABLED, _buffer
+    if capacity is not None:
+        if capacity < 1:
+            from hwpapi.errors import InvalidArgumentError
+            raise InvalidArgumentError(f"tracing capacity must be >= 1, got {capacity}")
+        _buffer = collections.deque(_buffer, maxlen=capacity)
+    ENABLED = True
+
+
+def disable() -> None:
+    """Stop recording; the buffer is kept until :func:`clear`."""
+    global ENABLED
+    ENABLED = False
+
+
+def clear() -> None:
+    """Drop every recorded span."""
+    _buffer.clear()
+
+
+def spans(name: Optional[str] = None) -> List[Span]:
+    """Finished spans, oldest first (optionally only those named ``name``)."""
+    items = list(_buffer)
+    if name is not None:
+        items = [s for s in items if s.name == name]
+    return items
+
+
+def export_jsonl(path: Union[str, Path], items: Optional[List[Span]] = None) -> int:
+    """Write one JSON object per span to ``path``; returns the count."""
+    import json
+
+    items = spans() if items is None else items
+    with open(path, "w", encoding="utf-8") as f:
+        for s in items:
+            f.write(json.dumps(s.to_dict(), ensure_ascii=False))
+            f.write("\n")
+    return len(items)
+
+
+def export_chrome(path: Union[str, Path], items: Optional[List[Span]] = None) -> int:
+    """Write a Chrome trace-event file (``"X"`` events); returns the count."""
+    import json
+
+    items = spans() if items is None else items
+    events = []
+    for s in items:
+        record = s.to_dict()
+        args = dict(record["attrs"], com_calls=s.com_calls, com_ms=record["com_ms"])
+        if s.error:
+            args["error"] = s.error
+        events.append({
+            "name": s.name, "cat": "hwpapi", "ph": "X",
+            "ts": record["ts_us"], "dur": record["dur_us"],
+            "pid": record["pid"], "tid": s.thread, "args": args,
+        })
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"traceEvents": events, "displayTimeUnit": "ms"}, f,
+                  ensure_ascii=False)
+    return len(items)
+
+
+def _export_at_exit(path: str) -> None:
+    if path.lower().endswith(".json"):
+        export_chrome(path)
+    else:
+        export_jsonl(path)
+
+
+_env_path = os.environ.get("HWPAPI_TRACE")
+if _env_path:
+    enable()
+    atexit.register(_export_at_exit, _env_path)
@@ -0,0 +1,138 @@
+"""
+Benchmark — upload → document → response bytes, temp files vs in memory.
+
+"tempfile" is what an HTTP service had to do before: write the upload to a
+temp file, ``app.docs.open`` it, ``doc.save`` to a second temp file and read
+that back (four disk round trips). "memory" is ``app.docs.open_bytes`` +
+``doc.to_bytes`` — ``SetTextFile`` / ``GetTextFile`` with base64 on the COM
+side. The fake engine really reads and writes the files it is given, every
+COM call burns ``--call-us`` and every file create / open / delete an extra
+``--file-op-ms`` (antivirus scan, network-backed temp dirs — 0 by default,
+i.e. a warm local page cache).
+
+    python tests/bench_bytes_io.py [--size-kb 512] [--requests 50] [--file-op-ms 0]
+"""
+from __future__ import annotations
+
+import argparse
+import base64
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from hwpapi.collections.documents import DocumentCollection  # noqa: E402
+
+
+class _Cost:
+    call = 50e-6
+    file_op = 0.0
+
+    @staticmethod
+    def spin(seconds=None):
+        end = time.perf_counter() + (_Cost.call if seconds is None else seconds)
+        while time.perf_counter() < end:
+            pass
+
+
+class _Docs:
+    Active_XHwpDocument = None
+
+
+class FakeApi:
+    """Holds one document's bytes; file methods hit the real disk."""
+
+    def __init__(self):
+        self.content = b""
+        self.XHwpDocuments = _Docs()
+
+    def Open(self, name, *args):
+        _Cost.spin()
+        _Cost.spin(_Cost.file_op)
+        with open(name, "rb") as f:
+            self.content = f.read()
+
+    def SaveAs(self, name, *args):
+        _Cost.spin()
+        _Cost.spin(_Cost.file_op)
+        with open(name, "wb") as f:
+            f.write(self.content)
+
+    def Run(self, name):
+        _Cost.spin()
+
+    def GetTextFile(self, fmt, option):
+        _Cost.spin()
+        return base64.b64encode(self.content).decode("ascii")
+
+    def SetTextFile(self, data, fmt, option):
+        _Cost.spin()
+        self.content = base64.b64decode(data)
+        return True
+
+
+class FakeApp:
+    def __init__(self):
+        self.api = FakeApi()
+        self.docs = DocumentCollection(self)
+
+
+def via_tempfiles(app, upload):
+    fd, src = tempfile.mkstemp(suffix=".hwp")
+    _Cost.spin(_Cost.file_op)
+    with os.fdopen(fd, "wb") as f:
+        f.write(upload)
+    out = src + ".out.hwp"
+    try:
+        doc = app.docs.open(src)
+        doc.save(out)
+        _Cost.spin(_Cost.file_op)
+        with open(out, "rb") as f:
+            return f.read()
+    finally:
+        os.unlink(src)
+        if os.path.exists(out):
+            os.unlink(out)
+
+
+def via_memory(app, upload):
+    return app.docs.open_bytes(upload, format="HWP").to_bytes("HWP")
+
+
+def measure(size, requests):
+    upload = b"\xd0\xcf\x11\xe0" + os.urandom(size - 4)
+    results = {}
+    for label, fn in (("tempfile", via_tempfiles), ("memory", via_memory)):
+        app = FakeApp()
+        assert fn(app, upload) == upload
+        t0 = time.perf_counter()
+        for _ in range(requests):
+            fn(app, upload)
+        results[label] = (time.perf_counter() - t0) / requests
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--size-kb", type=int, default=512)
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--call-us", type=float, default=_Cost.call * 1e6)
+    parser.add_argument("--file-op-ms", type=float, default=0.0)
+    args = parser.parse_args(argv)
+    _Cost.call = args.call_us / 1e6
+    _Cost.file_op = args.file_op_ms / 1e3
+
+    size = args.size_kb * 1024
+    results = measure(size, args.requests)
+    print(f"{args.size_kb} KiB document, {args.requests} requests, "
+          f"{args.file_op_ms} ms per file op")
+    print(f"{'':10} {'ms/request':>12} {'MiB/s':>10}")
+    for label, seconds in results.items():
+        print(f"{label:10} {seconds * 1e3:12.3f} {size / seconds / 2**20:10.1f}")
+    print(f"speed-up: {results['tempfile'] / results['memory']:.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,127 @@
+"""
+Benchmark — App acquisition latency: cold launch vs warm standby pool.
+
+The fake engine sleeps ``--launch-ms`` to start (HWP process + DLL
+registration) and ``--call-ms`` per COM call (health check, document
+reset). Requests arrive every ``--interval-ms`` and hold the App for
+``--hold-ms``; ``--burst`` concurrent requests at the end exceed the pool
+so the miss path shows up in p99.
+
+    python tests/bench_engine_pool.py [--requests 50] [--size 2] [--launch-ms 800]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import threading
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from hwpapi.core.app import App  # noqa: E402
+from hwpapi.core.pool import EnginePool, _percentile  # noqa: E402
+
+
+class _Cost:
+    launch = 0.8
+    call = 0.001
+
+
+class _Docs:
+    @property
+    def Count(self):
+        time.sleep(_Cost.call)
+        return 1
+
+    def Item(self, i):
+        return self
+
+    def Close(self, save):
+        time.sleep(_Cost.call)
+
+
+class _Window:
+    Visible = False
+
+
+class FakeImpl:
+    XHwpDocuments = _Docs()
+
+    class XHwpWindows:
+        @staticmethod
+        def Item(i):
+            return _Window
+
+    def Run(self, name):
+        time.sleep(_Cost.call)
+
+
+class FakeEngine:
+    def __init__(self):
+        time.sleep(_Cost.launch)
+        self.impl = FakeImpl()
+
+
+def cold(requests, interval, hold):
+    latencies = []
+    for _ in range(requests):
+        t0 = time.perf_counter()
+        app = App._adopt(FakeEngine())
+        latencies.append(time.perf_counter() - t0)
+        time.sleep(hold)
+        app.quit()
+        time.sleep(interval)
+    return latencies
+
+
+def pooled(requests, interval, hold, size, burst):
+    with EnginePool(size, launch=FakeEngine) as pool:
+        pool.fill()
+        for _ in range(requests):
+            app = pool.acquire()
+            time.sleep(hold)
+            pool.release(app)
+            time.sleep(interval)
+
+        def one():
+            app = pool.acquire()
+            time.sleep(hold)
+            pool.release(app)
+
+        threads = [threading.Thread(target=one) for _ in range(burst)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+        return pool.stats()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=50)
+    parser.add_argument("--size", type=int, default=2)
+    parser.add_argument("--burst", type=int, default=4)
+    parser.add_argument("--launch-ms", type=float, default=_Cost.launch * 1e3)
+    parser.add_argument("--call-ms", type=float, default=_Cost.call * 1e3)
+    parser.add_argument("--hold-ms", type=float, default=20.0)
+    parser.add_argument("--interval-ms", type=float, default=5.0)
+    args = parser.parse_args(argv)
+    _Cost.launch = args.launch_ms / 1e3
+    _Cost.call = args.call_ms / 1e3
+    hold, interval = args.hold_ms / 1e3, args.interval_ms / 1e3
+
+    cold_lat = cold(min(args.requests, 5), interval, hold)
+    stats = pooled(args.requests, interval, hold, args.size, args.burst)
+
+    print(f"launch {args.launch_ms} ms, pool size {args.size}, "
+          f"{args.requests} sequential + {args.burst} concurrent requests")
+    print(f"{'':8} {'p50 ms':>10} {'p99 ms':>10}")
+    print(f"{'cold':8} {_percentile(cold_lat, 0.5) * 1e3:10.2f} "
+          f"{_percentile(cold_lat, 0.99) * 1e3:10.2f}")
+    print(f"{'pool':8} {stats.p50 * 1e3:10.2f} {stats.p99 * 1e3:10.2f}")
+    print(stats)
+
+
+if __name__ == "__main__":
+    main()
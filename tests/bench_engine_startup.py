@@ -0,0 +1,130 @@
+"""
+Benchmark — ``App()`` engine selection with N running HWP instances.
+
+"eager" is the old path: walk the ROT, bind + ``dispatch`` every running
+instance (``Version`` / ``CLSID`` logged for each), read the registry in
+``Engines()`` and again in ``App._load``. "lazy" is the current
+``Engines()[-1].impl`` + ``check_dll``: cached ROT walk, one dispatch,
+memoised registry check. The fake COM layer sleeps ``--moniker-ms`` per
+ROT entry, ``--bind-ms`` per ``GetObject``, ``--dispatch-ms`` per
+``EnsureDispatch``, ``--call-ms`` per property read and ``--registry-ms``
+per registry lookup.
+
+    python tests/bench_engine_startup.py [--running 8] [--startups 10]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from hwpapi import functions  # noqa: E402
+from hwpapi.low import engine as engine_mod  # noqa: E402
+from hwpapi.low.engine import Engine, Engines  # noqa: E402
+
+
+class _Cost:
+    moniker = 0.0005
+    bind = 0.005
+    dispatch = 0.030
+    call = 0.001
+    registry = 0.002
+
+
+class FakeImpl:
+    @property
+    def Version(self):
+        time.sleep(_Cost.call)
+        return "12.0"
+
+    @property
+    def CLSID(self):
+        time.sleep(_Cost.call)
+        return "{2291CF00-64A1-4877-A9B4-68CFE89612D6}"
+
+
+class FakeEntry:
+    def __init__(self, name):
+        self.name = name
+
+    def bind(self):
+        time.sleep(_Cost.bind)
+        return object()
+
+
+def install(running):
+    def walk():
+        time.sleep(_Cost.moniker * running)
+        return [FakeEntry(f"!HwpObject.120.{i}") for i in range(running)]
+
+    def dispatch(obj):
+        time.sleep(_Cost.dispatch)
+        return FakeImpl()
+
+    def registry(key_path, value_name=functions.VALUE_NAME):
+        time.sleep(_Cost.registry)
+        return "C:/hwpapi/FilePathCheckerModuleExample.dll"
+
+    functions._enumerate_rot = walk
+    engine_mod.dispatch = dispatch
+    functions.get_registry_value = registry
+    functions.get_hwp_dll_path = lambda: "C:/hwpapi/FilePathCheckerModuleExample.dll"
+
+
+def eager():
+    engines = [Engine(e.bind()) for e in functions.get_hwp_monikers(max_age=0)]
+    functions.check_dll(refresh=True)       # Engines()
+    functions.check_dll(refresh=True)       # App._load
+    return engines[-1].impl
+
+
+def lazy():
+    engine = Engines()[-1]
+    functions.check_dll()
+    return engine.impl
+
+
+def measure(fn, startups):
+    functions.invalidate_rot_cache()
+    functions._dll_checked.clear()
+    times = []
+    for _ in range(startups):
+        t0 = time.perf_counter()
+        fn()
+        times.append(time.perf_counter() - t0)
+    return times
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--running", type=int, default=8)
+    parser.add_argument("--startups", type=int, default=10)
+    parser.add_argument("--moniker-ms", type=float, default=_Cost.moniker * 1e3)
+    parser.add_argument("--bind-ms", type=float, default=_Cost.bind * 1e3)
+    parser.add_argument("--dispatch-ms", type=float, default=_Cost.dispatch * 1e3)
+    parser.add_argument("--call-ms", type=float, default=_Cost.call * 1e3)
+    parser.add_argument("--registry-ms", type=float, default=_Cost.registry * 1e3)
+    args = parser.parse_args(argv)
+    _Cost.moniker = args.moniker_ms / 1e3
+    _Cost.bind = args.bind_ms / 1e3
+    _Cost.dispatch = args.dispatch_ms / 1e3
+    _Cost.call = args.call_ms / 1e3
+    _Cost.registry = args.registry_ms / 1e3
+    install(args.running)
+
+    print(f"{args.running} running HWP instances, {args.startups} startups")
+    print(f"{'':8} {'first ms':>10} {'repeat ms':>10}")
+    results = {}
+    for label, fn in (("eager", eager), ("lazy", lazy)):
+        times = measure(fn, args.startups)
+        rest = times[1:] or times
+        results[label] = times
+        print(f"{label:8} {times[0] * 1e3:10.1f} {sum(rest) / len(rest) * 1e3:10.1f}")
+    print(f"speed-up (first): {results['eager'][0] / results['lazy'][0]:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
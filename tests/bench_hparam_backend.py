@@ -0,0 +1,93 @@
+"""
+Micro-benchmark — ``HParamBackend.set`` per-key cost, cold vs warm.
+
+"cold" builds a fresh backend per write, which is what every
+``_sync_hset_global_state`` call did before backends were shared per App:
+walk the dotted path, read the current value for its type, then write.
+"warm" reuses one backend, so node proxies and write types are cached
+and each write is a single ``setattr``.
+
+A fake node stands in for the COM proxy; every attribute access burns
+``--latency-us`` to mimic an IDispatch round-trip.
+
+    python tests/bench_hparam_backend.py [--keys 20] [--rounds 2000] [--latency-us 5]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from hwpapi.low.parametersets.backends import HParamBackend  # noqa: E402
+
+
+class FakeNode:
+    latency = 5e-6
+    ops = 0
+
+    def __init__(self, **items):
+        object.__setattr__(self, "_items", items)
+
+    @staticmethod
+    def _spin():
+        FakeNode.ops += 1
+        end = time.perf_counter() + FakeNode.latency
+        while time.perf_counter() < end:
+            pass
+
+    def __getattr__(self, name):
+        self._spin()
+        try:
+            return self._items[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        self._spin()
+        self._items[name] = value
+
+
+def run(keys: int, rounds: int) -> dict:
+    names = [f"Item{i}" for i in range(keys)]
+    root = FakeNode(HFindReplace=FakeNode(**{n: 0 for n in names}))
+    writes = keys * rounds
+    results = {}
+
+    FakeNode.ops = 0
+    t0 = time.perf_counter()
+    for r in range(rounds):
+        for n in names:
+            HParamBackend(root).set(f"HFindReplace.{n}", r)
+    results["cold"] = ((time.perf_counter() - t0) / writes, FakeNode.ops / writes)
+
+    backend = HParamBackend(root)
+    FakeNode.ops = 0
+    t0 = time.perf_counter()
+    for r in range(rounds):
+        for n in names:
+            backend.set(f"HFindReplace.{n}", r)
+    results["warm"] = ((time.perf_counter() - t0) / writes, FakeNode.ops / writes)
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--keys", type=int, default=20)
+    parser.add_argument("--rounds", type=int, default=2000)
+    parser.add_argument("--latency-us", type=float, default=5.0)
+    args = parser.parse_args(argv)
+    FakeNode.latency = args.latency_us / 1e6
+
+    results = run(args.keys, args.rounds)
+    print(f"{'':6} {'µs/key':>10} {'COM ops/key':>12}")
+    for label, (seconds, ops) in results.items():
+        print(f"{label:6} {seconds * 1e6:10.2f} {ops:12.2f}")
+    cold, warm = results["cold"][0], results["warm"][0]
+    print(f"speed-up: {cold / warm:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+"""
+Benchmark — ``Document.insert_text`` paths across text sizes.
+
+Times ``mode="lines"`` / ``"chunked"`` / ``"file"`` for growing line counts
+and reports which path wins at each size; the crossover points are what the
+``_INSERT_*`` thresholds in :mod:`hwpapi.document` are set from.
+
+With the default fake engine every COM round trip burns ``--call-us``;
+``InsertText`` costs ``--insert-char-ns`` per character (action + reflow),
+``SetTextFile`` ``--file-char-ns`` per character plus a fixed ``--file-us``
+(import filter + undo record). ``--engine hwp`` runs against a live HWP
+instead (Windows).
+
+    python tests/bench_insert_text.py [--engine fake|hwp] [--line-chars 40]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from hwpapi.document import Document  # noqa: E402
+
+SIZES = (1, 2, 4, 8, 16, 64, 256, 1024, 2048, 4096)
+MODES = ("lines", "chunked", "file")
+
+
+class _Cost:
+    call = 30e-6
+    insert_char = 100e-9
+    file_char = 20e-9
+    file = 5e-3
+
+    @staticmethod
+    def spin(seconds):
+        end = time.perf_counter() + seconds
+        while time.perf_counter() < end:
+            pass
+
+
+class _Pset:
+    Text = ""
+
+
+class _InsertText:
+    def __init__(self):
+        self.pset = _Pset()
+
+    def run(self, pset=None):
+        _Cost.spin(_Cost.call + _Cost.insert_char * len(self.pset.Text))
+
+
+class _Api:
+    def Run(self, name):
+        _Cost.spin(_Cost.call)
+
+    def SetTextFile(self, text, fmt, option):
+        _Cost.spin(_Cost.call + _Cost.file + _Cost.file_char * len(text))
+        return True
+
+
+class FakeApp:
+    def __init__(self):
+        self.api = _Api()
+        self.actions = type("Actions", (), {})()
+        self.actions.InsertText = _InsertText()
+
+
+class _FakeDoc(Document):
+    def activate(self):
+        return self
+
+
+def _fake_doc():
+    return _FakeDoc(FakeApp(), _raw=object())
+
+
+def _hwp_doc():
+    from hwpapi import App
+
+    app = App()
+    return app.docs.add()
+
+
+def measure(make_doc, line_chars, repeat):
+    rows = []
+    for lines in SIZES:
+        text = "\n".join("가" * line_chars for _ in range(lines))
+        row = {}
+        for mode in MODES:
+            best = float("inf")
+            for _ in range(repeat):
+                doc = make_doc()
+                t0 = time.perf_counter()
+                doc.insert_text(text, mode=mode)
+                best = min(best, time.perf_counter() - t0)
+            row[mode] = best
+        rows.append((lines, len(text), row))
+    return rows
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--engine", choices=("fake", "hwp"), default="fake")
+    parser.add_argument("--line-chars", type=int, default=40)
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--call-us", type=float, default=_Cost.call * 1e6)
+    parser.add_argument("--insert-char-ns", type=float, default=_Cost.insert_char * 1e9)
+    parser.add_argument("--file-char-ns", type=float, default=_Cost.file_char * 1e9)
+    parser.add_argument("--file-us", type=float, default=_Cost.file * 1e6)
+    args = parser.parse_args(argv)
+    _Cost.call = args.call_us / 1e6
+    _Cost.insert_char = args.insert_char_ns / 1e9
+    _Cost.file_char = args.file_char_ns / 1e9
+    _Cost.file = args.file_us / 1e6
+
+    make_doc = _fake_doc if args.engine == "fake" else _hwp_doc
+    rows = measure(make_doc, args.line_chars, args.repeat)
+    print(f"{'lines':>6} {'chars':>8}" + "".join(f"{m + ' ms':>12}" for m in MODES) + "  fastest")
+    for lines, chars, row in rows:
+        fastest = min(row, key=row.get)
+        print(f"{lines:6} {chars:8}" + "".join(f"{row[m] * 1e3:12.3f}" for m in MODES)
+              + f"  {fastest}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""
+Benchmark — per-call logging overhead on hot helpers (WARNING / DEBUG / TRACE).
+
+"eager" is the old style: an f-string ``logger.debug`` on entry ("X
+called") plus one per branch, formatted whether or not the level lets it
+through. "lazy" is the current code path (``%``-style arguments, no entry
+messages) and ``_Action.run`` on a zero-cost fake ``HAction``, whose
+per-call ``TRACE`` event is skipped by a module flag unless enabled.
+Handlers write to a null stream so only the logging cost is measured.
+
+    python tests/bench_logging.py [--calls 200000]
+"""
+from __future__ import annotations
+
+import argparse
+import io
+import logging
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from hwpapi import logging as hlog  # noqa: E402
+from hwpapi.functions import mili2unit  # noqa: E402
+from hwpapi.low.actions import _Action  # noqa: E402
+
+logger = hlog.get_logger("bench")
+
+
+def eager_mili2unit(value):
+    logger.debug(f"mili2unit called")
+    logger.debug(f"Calling mili2unit")
+    result = int(round(value * 283.465))
+    logger.debug(f"mili2unit({value!r}) -> {result}")
+    return result
+
+
+class _Act:
+    def Execute(self, pset):
+        return True
+
+    def CreateSet(self):
+        return None
+
+    def GetDefault(self, pset):
+        return None
+
+
+class _Api:
+    def CreateAction(self, key):
+        return _Act()
+
+
+class _App:
+    api = _Api()
+
+
+def per_call(fn, calls):
+    t0 = time.perf_counter()
+    for _ in range(calls):
+        fn()
+    return (time.perf_counter() - t0) / calls
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=200_000)
+    args = parser.parse_args(argv)
+
+    root = hlog.HwpApiLogger().logger
+    root.handlers[:] = [logging.StreamHandler(io.StringIO())]
+    action = _Action(_App(), "BreakPara")
+    action.pset = None
+    cases = [
+        ("mili2unit eager", lambda: eager_mili2unit(10)),
+        ("mili2unit lazy", lambda: mili2unit(10)),
+        ("_Action.run", action.run),
+    ]
+
+    print(f"{args.calls} calls per cell, ns/call")
+    print(f"{'':18}" + "".join(f"{lvl:>10}" for lvl in ("WARNING", "DEBUG", "TRACE")))
+    for label, fn in cases:
+        row = []
+        for level in ("WARNING", "DEBUG", "TRACE"):
+            hlog.set_level(level)
+            row.append(per_call(fn, args.calls) * 1e9)
+        print(f"{label:18}" + "".join(f"{ns:10.0f}" for ns in row))
+    hlog.set_level("WARNING")
+
+
+if __name__ == "__main__":
+    main()
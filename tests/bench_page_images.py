@@ -0,0 +1,103 @@
+"""
+Benchmark — thumbnail latency for ``render_pages`` (cold, fanned out, cached).
+
+HWP runs out of process, so a COM call is a wait, not Python work: the
+fake engine sleeps ``--open-ms`` per document open and ``--render-ms`` per
+``CreatePageImage`` (both released from the GIL like a real COM call) and
+writes a small file. Three runs over the same ``--files`` sources:
+
+* cold, 1 engine — what a serial exporter costs;
+* cold, ``--engines`` engines — work fanned out over engine threads;
+* warm — every page already in the hash + page cache (file copies only).
+
+    python tests/bench_page_images.py [--files 200] [--pages 1] [--engines 4]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from hwpapi.io.pages import render_pages  # noqa: E402
+
+
+class _Cost:
+    open = 0.040
+    render = 0.025
+
+
+class _Doc:
+    def close(self, save=False):
+        return True
+
+
+class FakeApi:
+    PageCount = 50
+
+    def CreatePageImage(self, path, pgno, resolution, depth, fmt):
+        time.sleep(_Cost.render)
+        Path(path).write_bytes(b"\x89PNG" + bytes(1024))
+        return True
+
+
+class FakeApp:
+    def __init__(self):
+        self.api = FakeApi()
+        self.docs = self
+
+    def open(self, path):
+        time.sleep(_Cost.open)
+        return _Doc()
+
+    def quit(self):
+        pass
+
+
+def run(src, out, pages, engines):
+    report = render_pages(str(Path(src) / "*.hwp"), out, pages=pages,
+                          engines=engines, app_factory=FakeApp)
+    assert report.ok, report.failed[:3]
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--files", type=int, default=200)
+    parser.add_argument("--pages", default="1")
+    parser.add_argument("--engines", type=int, default=4)
+    parser.add_argument("--open-ms", type=float, default=_Cost.open * 1e3)
+    parser.add_argument("--render-ms", type=float, default=_Cost.render * 1e3)
+    args = parser.parse_args(argv)
+    _Cost.open = args.open_ms / 1e3
+    _Cost.render = args.render_ms / 1e3
+
+    with tempfile.TemporaryDirectory() as tmp:
+        src = Path(tmp) / "src"
+        src.mkdir()
+        for i in range(args.files):
+            (src / f"doc{i:05d}.hwp").write_bytes(os.urandom(4096))
+        rows = [
+            ("cold x1", run(src, Path(tmp) / "o1", args.pages, 1)),
+            (f"cold x{args.engines}", run(src, Path(tmp) / "o2", args.pages, args.engines)),
+            ("warm", run(src, Path(tmp) / "o2", args.pages, args.engines)),
+        ]
+
+    print(f"{args.files} files, pages={args.pages}, open {args.open_ms} ms, "
+          f"render {args.render_ms} ms")
+    print(f"{'':10} {'thumbs/s':>10} {'p50 ms':>8} {'p95 ms':>8} {'wall s':>8}")
+    for label, report in rows:
+        n = len(report.results)
+        per = report.elapsed / n * 1e3
+        p50 = report.latency(0.5) * 1e3 if report.converted else per
+        p95 = report.latency(0.95) * 1e3 if report.converted else per
+        print(f"{label:10} {n / report.elapsed:10.1f} {p50:8.1f} {p95:8.1f} "
+              f"{report.elapsed:8.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+"""
+Benchmark — COM round trips for a paragraph of differently formatted runs.
+
+Compares, against a counting fake engine:
+
+- ``styled_text`` per run with the cursor-format cache dropped before
+  every call (the original snapshot → apply → InsertText → restore cost)
+- ``styled_text`` per run with the cursor-format cache
+- one ``styled_runs`` call
+
+    python tests/bench_styled_runs.py [--runs 40]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+from collections import Counter
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from hwpapi.context import invalidate_cursor_format, styled_runs, styled_text  # noqa: E402
+
+
+class _Node:
+    """HParameterSet node — every attribute read/write is one round trip."""
+
+    def __init__(self, calls, **items):
+        object.__setattr__(self, "_calls", calls)
+        object.__setattr__(self, "_items", items)
+
+    def __getattr__(self, name):
+        self._calls["node get"] += 1
+        if name not in self._items:
+            raise AttributeError(name)
+        return self._items[name]
+
+    def __setattr__(self, name, value):
+        self._calls["node set"] += 1
+        self._items[name] = value
+
+
+class _HAction:
+    def __init__(self, calls):
+        self._calls = calls
+
+    def GetDefault(self, name, hset):
+        self._calls["HAction.GetDefault"] += 1
+
+    def Execute(self, name, hset):
+        self._calls["HAction.Execute"] += 1
+
+
+class _Api:
+    def __init__(self, calls):
+        self._calls = calls
+        self.pos = 0
+        self.HAction = _HAction(calls)
+        self.HParameterSet = _Node(calls, HCharShape=_Node(
+            calls, HSet=object(), Bold=False, Italic=False, TextColor=0, Height=1000,
+        ))
+
+    def GetPos(self):
+        self._calls["GetPos"] += 1
+        return (0, 0, self.pos)
+
+
+class _InsertText:
+    def __init__(self, api, calls):
+        self._api = api
+        self._calls = calls
+        self.pset = type("Pset", (), {"Text": ""})()
+
+    def run(self, pset=None):
+        self._calls["InsertText"] += 1
+        self._api.pos += len(pset.Text)
+
+
+class FakeApp:
+    def __init__(self):
+        self.calls = Counter()
+        self.api = _Api(self.calls)
+        self.actions = type("Actions", (), {})()
+        self.actions.CharShape = object()
+        self.actions.InsertText = _InsertText(self.api, self.calls)
+
+
+def paragraph(n):
+    """Alternating plain / bold / coloured runs, like a highlighted report line."""
+    fmts = [{}, {"bold": True}, {"color": 0x0000FF}, {"bold": True, "color": 0x0000FF}]
+    return [(f"run{i} ", fmts[i % len(fmts)]) for i in range(n)]
+
+
+def measure(n):
+    runs = paragraph(n)
+    results = {}
+
+    app = FakeApp()
+    for text, fmt in runs:
+        invalidate_cursor_format(app)
+        styled_text(app, text, **fmt)
+    results["styled_text (no cache)"] = app.calls
+
+    app = FakeApp()
+    for text, fmt in runs:
+        styled_text(app, text, **fmt)
+    results["styled_text"] = app.calls
+
+    app = FakeApp()
+    styled_runs(app, runs)
+    results["styled_runs"] = app.calls
+    return results
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=40)
+    args = parser.parse_args(argv)
+
+    results = measure(args.runs)
+    columns = ["HAction.GetDefault", "HAction.Execute", "InsertText", "GetPos",
+               "node get", "node set"]
+    print(f"{args.runs} runs")
+    print(f"{'':24}" + "".join(f"{c:>20}" for c in columns) + f"{'HAction total':>16}")
+    for label, calls in results.items():
+        haction = calls["HAction.GetDefault"] + calls["HAction.Execute"]
+        print(f"{label:24}" + "".join(f"{calls[c]:>20}" for c in columns) + f"{haction:>16}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,19 +1,23 @@
 """Shared pytest fixtures for the hwpapi test suite.
 
-The only cross-cutting fixture here is :func:`_autoyes_hwp_dialogs`, which
-patches :class:`hwpapi.App` so that every ``App()`` instantiated during a
-pytest run auto-answers **Yes / OK / Abort** (the first button) for every
-HWP dialog category.
+:func:`_autoyes_hwp_dialogs` patches :class:`hwpapi.App` so that every
+``App()`` instantiated during a pytest run auto-answers **Yes / OK /
+Abort** (the first button) for every HWP dialog category.
 
 Without this, HWP-integration tests (``smoke_*.py``, ``test_all_*.py``)
 would block indefinitely on modal dialogs such as save-prompts or
-overwrite-confirmations.
+overwrite-confirmations. The patch is scoped to the test session only —
+production ``App`` users keep their normal interactive dialog behaviour.
 
-The patch is scoped to the test session only — production ``App`` users
-keep their normal interactive dialog behaviour.
+:func:`_private_appdata` points :func:`hwpapi.functions.get_appdata_path`
+at a directory of the test's own, and ``HWPAPI_DEFAULTS_CACHE`` (the
+GetDefault cache switch) below it, so no test reads or writes the real
+``~/AppData/Roaming/hwpapi``.
 """
 from __future__ import annotations
 
+import re
+
 import pytest
 
 
@@ -56,3 +60,24 @@ def _autoyes_hwp_dialogs():
         yield
     finally:
         App.__init__ = original_init
+
+
+@pytest.fixture(autouse=True)
+def _private_appdata(tmp_path_factory, monkeypatch, request):
+    """Give every test its own ``get_appdata_path()`` directory.
+
+    It lives beside the test's ``tmp_path`` (not inside it, so tests that
+    list ``tmp_path`` are unaffected) and is created only on first use —
+    most tests never ask for it.
+    """
+    appdata = (tmp_path_factory.getbasetemp() / "appdata"
+               / re.sub(r"\W+", "_", request.node.nodeid)[-120:])
+
+    def get_appdata_path():
+        appdata.mkdir(parents=True, exist_ok=True)
+        return appdata
+
+    monkeypatch.setattr("hwpapi.functions.get_appdata_path", get_appdata_path)
+    # The GetDefault cache follows its own switch; keep it per test as well.
+    monkeypatch.setenv("HWPAPI_DEFAULTS_CACHE", str(appdata / "pset_defaults"))
+    return appdata
@@ -115,6 +115,71 @@ class TestBackendInvariants:
         backend.set("child.value", "world")
         assert backend.get("child.value") == "world"
 
+    def test_hparam_backend_set_is_one_com_write_once_warm(self):
+        """Cached nodes + learned write type → a warm set is a single setattr."""
+        root = _CountingNode(HFindReplace=_CountingNode(FindString="", Direction=0))
+        backend = HParamBackend(root)
+        backend.set("HFindReplace.Direction", "1")       # cold: walk + type probe
+        assert root.HFindReplace.Direction == 1
+        _CountingNode.ops.clear()
+
+        backend.set("HFindReplace.Direction", 2.0)
+        backend.set("HFindReplace.Direction", True)
+        assert _CountingNode.ops == [("set", "Direction"), ("set", "Direction")]
+        assert root.HFindReplace.Direction == 1
+
+    def test_hparam_backend_seeded_types_skip_first_probe(self):
+        root = _CountingNode(HFindReplace=_CountingNode(FindString=""))
+        backend = HParamBackend(root)
+        backend.seed_types("HFindReplace", {"FindString": str})
+        backend.node("HFindReplace")
+        _CountingNode.ops.clear()
+        backend.set("HFindReplace.FindString", 42)
+        assert _CountingNode.ops == [("set", "FindString")]
+        assert root.HFindReplace.FindString == "42"
+
+    def test_hset_sync_reuses_app_backend(self):
+        """apply() mirrors written keys into HParameterSet — warm: one write per key."""
+        from unittest.mock import MagicMock
+
+        class SyncPS(ParameterSet):
+            find_string = StringProperty("FindString", "")
+
+        class Local:
+            SetID = "FindReplace"
+            FindString = ""
+
+        app = MagicMock()
+        app.api.HParameterSet = _CountingNode(HFindReplace=_CountingNode(FindString=""))
+        ps = SyncPS(Local(), backend_factory=HParamBackend, app_instance=app)
+        ps.find_string = "a"
+        ps.apply()
+        assert app.api.HParameterSet.HFindReplace.FindString == "a"
+
+        _CountingNode.ops.clear()
+        ps.find_string = "b"
+        ps.apply()
+        assert _CountingNode.ops == [("set", "FindString")]
+
+
+class _CountingNode:
+    """HParameterSet node stand-in recording every attribute read/write."""
+    ops: list = []
+
+    def __init__(self, **items):
+        object.__setattr__(self, "_items", items)
+
+    def __getattr__(self, name):
+        _CountingNode.ops.append(("get", name))
+        try:
+            return self._items[name]
+        except KeyError:
+            raise AttributeError(name) from None
+
+    def __setattr__(self, name, value):
+        _CountingNode.ops.append(("set", name))
+        self._items[name] = value
+
 
 # ── 3. Property descriptor invariants ────────────────────────────────────
 
@@ -230,6 +295,73 @@ class TestParameterSetLifecycle:
         assert dst.b == 20
 
 
+class _FakePset:
+    """Minimal ``CreateSet()`` stand-in (looks like a pset to make_backend)."""
+    _oleobj_ = object()
+    SetID = "CharShape"
+
+    def __init__(self, **items):
+        self.items = dict(items)
+
+    def Item(self, key):
+        return self.items[key]
+
+    def SetItem(self, key, value):
+        self.items[key] = value
+
+    def CreateItemSet(self, key, setid):
+        child = _FakePset()
+        child.SetID = setid
+        self.items[key] = child
+        return child
+
+
+class TestCompactInstances:
+    """Instances are slotted; values live in a key-indexed list, staging is lazy."""
+
+    def test_instances_have_no_dict(self):
+        for name, cls in ALL_PS_CLASSES + [("ParameterSet", ParameterSet)]:
+            assert not hasattr(cls(), "__dict__"), name
+            assert sorted(cls._key_index.values()) == list(range(len(cls._key_index)))
+            assert {d.key for d in cls._all_properties.values()} == set(cls._key_index)
+
+    def test_bound_values_are_indexed_and_staging_is_lazy(self):
+        from hwpapi.low.parametersets import CharShape
+        raw = _FakePset(Height=1000, Bold=0)
+        ps = CharShape(raw)
+        assert ps._staged_map is None and ps._deleted_set is None and ps._wrappers is None
+        assert ps._values[CharShape._key_index["Height"]] == 1000
+        assert ps._snapshot["Height"] == 1000
+        assert "Italic" in ps._absent_keys
+
+        ps.height = 1200                      # pset backend writes through
+        assert raw.items["Height"] == 1200 and ps._staged_map is None
+
+        ps._backend = AttrBackend(raw.items)  # staged path
+        ps.bold = True
+        assert ps._staged == {"Bold": 1}
+        ps.apply(require="skip")
+        assert ps._staged_map is None and ps._stored("Bold") == 1
+
+    def test_extra_attributes_and_nested_cache(self):
+        from hwpapi.low.parametersets import CharShape
+
+        class Outer(ParameterSet):
+            inner = NestedProperty("Inner", "CharShape", CharShape)
+
+            def __init__(self, raw=None):
+                super().__init__(raw)
+                self._note = "private"
+
+        ps = Outer(_FakePset())
+        ps.custom = 1
+        assert (ps._note, ps.custom) == ("private", 1)
+        assert ps.inner is ps.inner
+        assert ps._wrapper_cache["_nested_cache_Inner"] is ps.inner
+        with pytest.raises(AttributeError):
+            ps._missing
+
+
 # ── 5. Cross-class structural checks ─────────────────────────────────────
 
 class TestCrossClassStructure:
@@ -258,3 +390,43 @@ class TestCrossClassStructure:
     def test_registry_has_no_base_parameterset(self):
         """ParameterSet base class should not be in registry."""
         assert "ParameterSet" not in PARAMETERSET_REGISTRY
+
+
+# ── 6. Lazy registry ─────────────────────────────────────────────────────
+
+class TestLazyRegistry:
+    """The static class index must match what ``sets/`` actually defines."""
+
+    def test_class_index_matches_sets_modules(self):
+        import importlib
+        from hwpapi.low.parametersets.registry import _CLASS_INDEX
+
+        for module_name, names in _CLASS_INDEX.items():
+            module = importlib.import_module(
+                f"hwpapi.low.parametersets.sets.{module_name}")
+            defined = {
+                n for n, c in vars(module).items()
+                if inspect.isclass(c) and issubclass(c, ParameterSet)
+                and c.__module__ == module.__name__
+            }
+            assert defined == set(names), module_name
+
+    def test_contains_does_not_require_build(self):
+        from hwpapi.low.parametersets.registry import LazyRegistry, _CLASS_INDEX
+
+        registry = LazyRegistry(_CLASS_INDEX)
+        assert "CharShape" in registry
+        assert "charshape" in registry
+        assert "NoSuchSet" not in registry
+        assert registry.pending == 2 * sum(len(v) for v in _CLASS_INDEX.values())
+
+    def test_attr_lookup_built_on_first_use(self):
+        class LazyLookupPS(ParameterSet):
+            FindString = StringProperty("FindString", "text")
+
+        assert "_attr_lookup_cache" not in LazyLookupPS.__dict__
+        ps = LazyLookupPS()
+        ps.find_string = "x"
+        assert ps.FindString == "x"
+        assert LazyLookupPS._attr_lookup["find_string"] == "FindString"
+        assert "_attr_lookup_cache" in LazyLookupPS.__dict__
@@ -0,0 +1,72 @@
+"""Benchmark suite — ``benchmarks/`` runs on the simulated engine and gates (no HWP required)."""
+from __future__ import annotations
+
+import copy
+import json
+
+from benchmarks.cases import CASES
+from benchmarks.run import compare, main, run_case, run_cases
+from benchmarks.sim import LatencyModel
+
+NO_LATENCY = LatencyModel(0.0)
+
+
+def test_every_case_runs_and_counts_are_deterministic():
+    first = run_cases(CASES, NO_LATENCY, time_ops=False)["cases"]
+    again = run_cases(CASES, NO_LATENCY, time_ops=False)["cases"]
+    assert {n: r["calls"] for n, r in first.items()} == {n: r["calls"] for n, r in again.items()}
+    assert first["actions.getattr"]["calls"] == 0
+    assert first["hparam.set"]["calls"] == 1
+    assert first["document.insert_text.file"]["members"]["SetTextFile"] == 1
+
+
+def test_latency_model_charges_per_member():
+    latency = LatencyModel(0.0, {"GetFieldList": 2000.0})
+    result = run_case(CASES["fields.len"], latency, repeat=1, min_time=0.0)
+    assert result["calls"] == 1 and result["us"] >= 2000
+
+
+def test_compare_flags_count_and_time_regressions():
+    results = run_cases(["fields.len", "action.run"], NO_LATENCY, repeat=1, min_time=0.0)
+    assert compare(results, results) == []
+
+    worse = copy.deepcopy(results)
+    worse["cases"]["action.run"]["calls"] += 1
+    worse["cases"]["fields.len"]["min_us"] = results["cases"]["fields.len"]["min_us"] * 2 + 100
+    problems = compare(results, worse)
+    assert [p.split(":")[0] for p in problems] == ["fields.len", "action.run"]
+    assert compare(results, worse, check_time=False) == [problems[1]]
+
+    worse["latency"] = {"call_us": 5.0, "members": {}}
+    assert compare(results, worse) == [problems[1]]   # other latency: counts only
+
+
+def test_memory_cases_report_retained_bytes():
+    results = run_cases(["pset.construct", "pset.construct.unbound", "fields.len"],
+                        NO_LATENCY, time_ops=False)
+    cases = results["cases"]
+    assert cases["fields.len"]["bytes"] is None
+    assert 0 < cases["pset.construct.unbound"]["bytes"] < cases["pset.construct"]["bytes"]
+    assert compare(results, results) == []
+
+    worse = copy.deepcopy(results)
+    worse["cases"]["pset.construct"]["bytes"] *= 2
+    assert compare(results, worse, check_time=False) == [
+        f"pset.construct: retained bytes/op {cases['pset.construct']['bytes']} "
+        f"-> {worse['cases']['pset.construct']['bytes']}"
+    ]
+    worse["python"] = "2.7.18"   # other Python: object sizes differ
+    assert compare(results, worse, check_time=False) == []
+
+
+def test_main_saves_and_exits_nonzero_on_regression(tmp_path, capsys):
+    path = tmp_path / "baseline.json"
+    argv = ["-k", "fields.len", "--latency-us", "0", "--no-time"]
+    assert main(argv + ["--save", str(path)]) == 0
+    assert main(argv + ["--compare", str(path)]) == 0
+
+    data = json.loads(path.read_text(encoding="utf-8"))
+    data["cases"]["fields.len"]["calls"] = 0
+    path.write_text(json.dumps(data), encoding="utf-8")
+    assert main(argv + ["--compare", str(path)]) == 1
+    assert "REGRESSION fields.len" in capsys.readouterr().out
@@ -0,0 +1,183 @@
+"""COM trace record / replay — ``hwpapi.low.replay`` (no HWP required)."""
+from __future__ import annotations
+
+import time
+
+import pytest
+
+from hwpapi.collections.fields import FieldCollection
+from hwpapi.core.app import App
+from hwpapi.errors import InvalidArgumentError
+from hwpapi.low.replay import ComTrace, ReplayEngine, record, replay_app
+
+
+class FakePset:
+    _oleobj_ = object()
+    SetID = "InsertText"
+
+    def __init__(self):
+        self.items = {}
+
+    def Item(self, key):
+        return self.items[key]
+
+    def SetItem(self, key, value):
+        self.items[key] = value
+
+
+class FakeAction:
+    _oleobj_ = object()
+
+    def __init__(self, log):
+        self.log = log
+
+    def CreateSet(self):
+        return FakePset()
+
+    def GetDefault(self, pset):
+        pset.SetItem("Text", "")
+
+    def Execute(self, pset):
+        self.log.append(pset.Item("Text"))
+        return True
+
+
+class FakeImpl:
+    _oleobj_ = object()
+    Version = "12.0.0.0"
+
+    def __init__(self):
+        self.fields = {"이름": "홍길동", "주소": "Seoul 1"}
+        self.inserted = []
+
+    def GetFieldList(self, opt):
+        time.sleep(0.001)
+        return "\x02".join(self.fields)
+
+    def GetFieldText(self, name):
+        return self.fields[name]
+
+    def PutFieldText(self, name, value):
+        self.fields[name] = value
+
+    def CreateAction(self, key):
+        return FakeAction(self.inserted)
+
+
+class FakeEngine:
+    def __init__(self):
+        self.impl = FakeImpl()
+
+
+def _job(app):
+    fields = FieldCollection(app)
+    before = fields.to_dict()
+    fields.update({"이름": "김철수"})
+    action = app.actions.InsertText
+    action.pset.Text = "hello"
+    action.pset.apply()
+    action.run()
+    return before, fields.to_dict(), app.api.Version
+
+
+def test_record_then_replay_drives_the_same_code_path(tmp_path):
+    app = App._adopt(FakeEngine())
+    with record(app, tmp_path / "job.hwptrace.gz") as trace:
+        expected = _job(app)
+    assert isinstance(app.api, FakeImpl)          # impl restored
+    assert app.engine.impl.inserted == ["hello"]
+    assert len(trace) > 5
+
+    replayed = replay_app(tmp_path / "job.hwptrace.gz", latency="none")
+    assert _job(replayed) == expected
+    stats = replayed.engine.stats
+    assert stats.misses == 0 and stats.reused == 0
+    assert stats.events == sum(e[1] != "m" for e in trace.events)
+
+
+def test_a_warm_defaults_cache_does_not_change_the_trace():
+    _job(App._adopt(FakeEngine()))                # warms the 12.0.0.0 GetDefault cache
+    app = App._adopt(FakeEngine())
+    with record(app) as trace:
+        expected = _job(app)
+    replayed = replay_app(trace, latency="none")
+    assert _job(replayed) == expected
+    assert replayed.engine.stats.misses == 0 and replayed.engine.stats.reused == 0
+    assert app.actions.defaults is not None       # cache back on after the block
+
+
+def test_redaction_keeps_structure_only(tmp_path):
+    app = App._adopt(FakeEngine())
+    with record(app, redact=True) as trace:
+        FieldCollection(app).to_dict()
+    strings = [e[4] for e in trace.events if isinstance(e[4], str)]
+    assert strings[0] == "xx\x02xx"
+    assert "xxxxx 1" in strings
+    assert not any("홍" in s or "Seoul" in s for s in strings)
+    assert trace.redacted
+
+
+def test_record_drops_cached_handles_on_entry_and_exit():
+    app = App._adopt(FakeEngine())
+    warm = app.actions.InsertText
+    warm.act                                      # cached before recording
+    with record(app) as trace:
+        inside = app.actions.InsertText
+        inside.act
+    assert inside is not warm and warm._act_cache == {}
+    assert [0, "c", "CreateAction"] in [e[:3] for e in trace.events]
+    assert inside._act_cache == {}                # no recording proxy left behind
+    assert isinstance(app.actions.InsertText.act, FakeAction)
+
+
+def test_redaction_covers_error_messages():
+    app = App._adopt(FakeEngine())
+    with record(app, redact=True) as trace:
+        with pytest.raises(KeyError):
+            app.api.GetFieldText("홍길동")
+    (error,) = [e[4]["e"] for e in trace.events if isinstance(e[4], dict) and "e" in e[4]]
+    assert error[0] == "KeyError" and "홍" not in error[1]
+
+
+def test_latency_models_are_deterministic(tmp_path):
+    app = App._adopt(FakeEngine())
+    with record(app) as trace:
+        for _ in range(5):
+            FieldCollection(app).names()
+    recorded = ReplayEngine(trace, sleep=False)
+    for _ in range(5):
+        FieldCollection(App._adopt(recorded)).names()
+    assert recorded.stats.simulated >= 0.005
+
+    a, b = (ReplayEngine(trace, latency="sampled", seed=3, sleep=False) for _ in range(2))
+    for engine in (a, b):
+        for _ in range(5):
+            engine.impl.GetFieldList("")
+    assert a.stats.simulated == b.stats.simulated
+
+
+def test_misses_reuse_and_recorded_errors():
+    trace = ComTrace([
+        [0, "m", "Run", [], None, 0],
+        [0, "c", "Run", [{"r": "x"}], True, 10],
+        [0, "m", "Boom", [], None, 0],
+        [0, "g", "Missing", [], {"e": ["AttributeError", "Missing"]}, 1],
+        [0, "c", "Boom", [], {"e": ["com_error", "rejected"]}, 1],
+    ])
+    engine = ReplayEngine(trace, latency="none")
+    assert engine.impl.Run("FileNew") is True
+    assert engine.impl.Run("FileNew") is True      # beyond the recording
+    assert not hasattr(engine.impl, "Missing")
+    assert not hasattr(engine.impl, "NeverSeen")
+    with pytest.raises(Exception, match="rejected"):
+        engine.impl.Boom()
+    assert engine.stats.reused == 1 and engine.stats.misses == 1
+
+
+def test_load_rejects_foreign_files(tmp_path):
+    path = tmp_path / "x.jsonl"
+    path.write_text('{"format": "other"}\n', encoding="utf-8")
+    with pytest.raises(InvalidArgumentError):
+        ComTrace.load(path)
+    with pytest.raises(InvalidArgumentError):
+        ReplayEngine(ComTrace(), latency="fast")
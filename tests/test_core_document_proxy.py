@@ -0,0 +1,123 @@
+"""Legacy ``hwpapi.core.document.Document`` → App proxy (no HWP required)."""
+from __future__ import annotations
+
+import pytest
+
+from hwpapi.core.app import App
+from hwpapi.core.document import Document, Documents, _app_member
+
+
+class FakeDoc:
+    def __init__(self, docs, doc_id):
+        self.docs = docs
+        self.DocumentID = doc_id
+
+    def SetActive_XHwpDocument(self):
+        self.docs.active = self
+        self.docs.switches += 1
+
+
+class FakeDocs:
+    def __init__(self):
+        self.items = [FakeDoc(self, 1), FakeDoc(self, 2)]
+        self.active = self.items[0]
+        self.switches = 0
+
+    @property
+    def Count(self):
+        return len(self.items)
+
+    def Item(self, i):
+        return self.items[i]
+
+    @property
+    def Active_XHwpDocument(self):
+        return self.active
+
+    def Add(self, is_tab):
+        doc = FakeDoc(self, len(self.items) + 1)
+        self.items.append(doc)
+        self.active = doc
+        return doc
+
+
+class FakeImpl:
+    def __init__(self):
+        self.XHwpDocuments = FakeDocs()
+
+
+class FakeEngine:
+    def __init__(self):
+        self.impl = FakeImpl()
+
+
+class _App(App):
+    label = "plain"
+
+    @property
+    def title(self):
+        return f"doc {self.api.XHwpDocuments.active.DocumentID}"
+
+    @title.setter
+    def title(self, value):
+        self.titles.append((self.api.XHwpDocuments.active.DocumentID, value))
+
+    def echo(self, value):
+        """Return ``value`` and the active document ID."""
+        return value, self.api.XHwpDocuments.active.DocumentID
+
+
+@pytest.fixture
+def app(monkeypatch):
+    monkeypatch.setattr("time.sleep", lambda s: None)
+    app = _App._adopt(FakeEngine())
+    app.titles = []
+    return app
+
+
+def test_method_proxy_is_cached_and_activates_only_on_switch(app):
+    first, second = Documents(app)
+    docs = app.api.XHwpDocuments
+
+    assert first.echo(1) == (1, 1)
+    proxied = first.echo
+    assert vars(first)["echo"] is proxied          # later lookups skip __getattr__
+    assert "Return ``value``" in proxied.__doc__ and proxied.__name__ == "echo"
+    first.echo(2)
+    assert docs.switches == 0                        # already active
+
+    assert second.echo(3) == (3, 2)
+    assert first.echo(4) == (4, 1)
+    assert docs.switches == 2
+
+
+def test_proxied_calls_follow_switches_made_outside_the_proxy(app):
+    documents = Documents(app)
+    first = documents[0]
+    assert first.echo("a") == ("a", 1)
+    documents.add()                                  # new document becomes active
+    assert first.echo("b") == ("b", 1)
+    app.api.XHwpDocuments.items[1].SetActive_XHwpDocument()   # raw COM switch
+    assert first.echo("c") == ("c", 1)
+
+
+def test_properties_and_accessors_follow_the_document(app):
+    first, second = Documents(app)
+    assert second.title == "doc 2"
+    first.title = "one"
+    assert app.titles == [(1, "one")]
+    assert second.label == "plain"
+    assert app.api.XHwpDocuments.active.DocumentID == 2
+
+    with pytest.raises(AttributeError, match="App also does not have it"):
+        first.no_such_member
+    with pytest.raises(AttributeError):
+        Document(object()).echo
+
+
+def test_members_are_classified_once_per_app_type():
+    member = _app_member(_App, "echo")
+    assert member.kind == "method" and _app_member(_App, "echo") is member
+    assert _app_member(_App, "title").kind == "property"
+    assert _app_member(_App, "label").kind == "attribute"
+    assert _app_member(App, "echo").kind == "attribute"   # resolved per type
@@ -0,0 +1,148 @@
+"""hwpapi.low.defaults_cache — GetDefault 영구 캐시 (Mock, no COM)."""
+from __future__ import annotations
+
+import json
+from unittest.mock import MagicMock
+
+from hwpapi.low.actions import _Action
+from hwpapi.low.defaults_cache import DefaultsCache, defaults_cache_for
+from hwpapi.low.parametersets.backends import HParamBackend
+
+
+class FakePset:
+    """CreateSet() 결과 흉내 — 없는 키는 COM 처럼 예외."""
+    _oleobj_ = object()
+
+    def __init__(self, set_id="FindReplace", **items):
+        self.SetID = set_id
+        self.items = items or {"FindString": "", "ReplaceString": "", "Direction": 0}
+        self.reads = []
+
+    def Item(self, key):
+        self.reads.append(key)
+        return self.items[key]
+
+    def SetItem(self, key, value):
+        self.items[key] = value
+
+    def CreateItemSet(self, key, setid):
+        raise KeyError(key)
+
+
+def _app(pset_factory=FakePset):
+    act = MagicMock(name="IXHwpAction")
+    act.CreateSet.side_effect = lambda: pset_factory()
+    app = MagicMock(name="app")
+    app.api.CreateAction.return_value = act
+    return app
+
+
+def test_record_round_trips_compactly(tmp_path):
+    path = tmp_path / "11.0.json"
+    cache = DefaultsCache("11.0", path)
+    cache.record("AllReplace", "FindReplace",
+                 {"FindString": "", "Direction": 0, "IgnoreMessage": True})
+    cache.record("BreakPara", None, {})
+    cache.flush()
+
+    raw = path.read_text(encoding="utf-8")
+    assert " " not in raw
+    entry = DefaultsCache("11.0", path).lookup("AllReplace")
+    assert entry.set_id == "FindReplace"
+    assert entry.keys == {"FindString", "Direction", "IgnoreMessage"}
+    assert entry.types() == {"FindString": str, "Direction": int, "IgnoreMessage": bool}
+    assert DefaultsCache("11.0", path).lookup("BreakPara").set_id is None
+
+
+def test_other_version_or_corrupt_file_is_ignored(tmp_path):
+    path = tmp_path / "cache.json"
+    cache = DefaultsCache("11.0", path)
+    cache.record("AllReplace", "FindReplace", {"FindString": ""})
+    cache.flush()
+    assert DefaultsCache("12.0", path).lookup("AllReplace") is None
+
+    path.write_text("{not json", encoding="utf-8")
+    assert len(DefaultsCache("11.0", path)) == 0
+
+
+def test_cache_only_for_real_version_strings():
+    api = MagicMock()
+    assert defaults_cache_for(api) is None
+
+
+def test_first_process_probes_and_records(tmp_path):
+    cache = DefaultsCache("11.0", tmp_path / "c.json")
+    app = _app()
+    action = _Action(app, "AllReplace", defaults=cache)
+    assert action.pset_key == "FindReplace"
+    app.api.CreateAction.assert_called_once()
+    assert action.defaults.keys == {"FindString", "ReplaceString", "Direction"}
+
+
+def test_cached_action_skips_probe_and_absent_keys(tmp_path):
+    path = tmp_path / "c.json"
+    seed = DefaultsCache("11.0", path)
+    _Action(_app(), "AllReplace", defaults=seed)
+    seed.flush()
+
+    app = _app()
+    action = _Action(app, "AllReplace", defaults=DefaultsCache("11.0", path))
+    app.api.CreateAction.assert_not_called()
+    assert action.pset_key == "FindReplace"
+
+    action.pset                      # first pset this process re-checks every key
+    action._pset_cache.clear()
+    pset = action.pset
+    raw = pset._raw
+    assert set(raw.reads) <= {"FindString", "ReplaceString", "Direction"}
+    assert pset._absent_keys >= {"MatchCase", "WholeWordOnly"}
+
+
+def test_keys_missing_from_the_cache_are_reprobed_once_per_process(tmp_path):
+    path = tmp_path / "c.json"
+    seed = DefaultsCache("11.0", path)
+    seed.record("AllReplace", "FindReplace", {"FindString": ""})   # probe lost keys
+    seed.flush()
+
+    cache = DefaultsCache("11.0", path)
+    action = _Action(_app(), "AllReplace", defaults=cache)
+    assert "Direction" in action.pset._raw.reads
+    assert cache.lookup("AllReplace").keys == {"FindString", "ReplaceString", "Direction"}
+
+    action._pset_cache.clear()
+    assert "MatchCase" not in action.pset._raw.reads
+
+
+def test_setid_mismatch_refreshes_entry(tmp_path):
+    cache = DefaultsCache("11.0", tmp_path / "c.json")
+    cache.record("AllReplace", "OldSetID", {"FindString": ""})
+    action = _Action(_app(), "AllReplace", defaults=cache)
+    assert action.pset_key == "OldSetID"
+
+    action.pset
+    assert action.pset_key == "FindReplace"
+    assert cache.lookup("AllReplace").set_id == "FindReplace"
+    cache.flush()
+    data = json.loads((tmp_path / "c.json").read_text(encoding="utf-8"))
+    assert data["actions"]["AllReplace"][0] == "FindReplace"
+
+
+def test_hparam_backend_uses_cached_types():
+    node = MagicMock()
+    node.Direction = "not-an-int"   # would mislead a live type probe
+    backend = HParamBackend(node, types={"Direction": int})
+    backend.set("Direction", "2")
+    assert node.Direction == 2
+
+
+def test_env_switch_disables_or_redirects(tmp_path, monkeypatch):
+    api = MagicMock(Version="12.0.0.0")
+    monkeypatch.setenv("HWPAPI_DEFAULTS_CACHE", "0")
+    assert defaults_cache_for(api) is None
+
+    monkeypatch.setenv("HWPAPI_DEFAULTS_CACHE", str(tmp_path / "defaults"))
+    cache = defaults_cache_for(api)
+    assert cache.path == tmp_path / "defaults" / "12.0.0.0.json"
+    cache.record("BreakPara", None, {})
+    cache.flush()
+    assert cache.path.exists()
@@ -203,12 +203,209 @@ def test_document_insert_text_with_newlines():
     assert break_count == 2
 
 
+def test_document_insert_text_chunked_joins_lines():
+    app, raws = _mock_app()
+    doc = Document(app, _raw=raws[0])
+    texts = []
+    app.actions.InsertText.run.side_effect = (
+        lambda *a: texts.append(app.actions.InsertText.pset.Text)
+    )
+    doc.insert_text("\n".join(f"line{i}" for i in range(20)) + "\n")
+    # 줄 수와 무관하게 InsertText 한 번, BreakPara 없음
+    assert texts == ["".join(f"line{i}\r\n" for i in range(20))]
+    assert not any(c.args[:1] == ("BreakPara",) for c in app.api.Run.call_args_list)
+
+
+def test_text_chunks_split_on_line_boundaries():
+    from hwpapi.document import _text_chunks
+
+    chunks = list(_text_chunks("aaaa\nbbbb\ncccc", 12))
+    assert chunks == ["aaaa\r\nbbbb\r\n", "cccc"]
+    assert "".join(_text_chunks("x" * 30 + "\n", 8)) == "x" * 30 + "\r\n"
+
+
+def test_document_insert_text_file_mode():
+    app, raws = _mock_app()
+    app.api.SetTextFile.return_value = True
+    doc = Document(app, _raw=raws[0])
+    doc.insert_text("a\nb", mode="file")
+    app.api.SetTextFile.assert_called_once_with("a\r\nb", "TEXT", "insertfile")
+    app.actions.InsertText.run.assert_not_called()
+
+
+def test_document_insert_text_file_mode_falls_back():
+    app, raws = _mock_app()
+    app.api.SetTextFile.return_value = False
+    doc = Document(app, _raw=raws[0])
+    doc.insert_text("a\nb", mode="file")
+    assert app.actions.InsertText.run.call_count == 1
+
+
+def test_document_insert_text_auto_picks_file_for_large_text():
+    from hwpapi.document import _INSERT_FILE_MIN_CHARS
+
+    app, raws = _mock_app()
+    app.api.SetTextFile.return_value = True
+    doc = Document(app, _raw=raws[0])
+    doc.insert_text("x" * _INSERT_FILE_MIN_CHARS)
+    app.api.SetTextFile.assert_called_once()
+
+
+def test_document_insert_text_rejects_unknown_mode():
+    from hwpapi.errors import InvalidArgumentError
+
+    app, raws = _mock_app()
+    doc = Document(app, _raw=raws[0])
+    with pytest.raises(InvalidArgumentError):
+        doc.insert_text("x", mode="fast")
+
+
 def test_document_text_property_reads_via_api():
     app, raws = _mock_app()
     doc = Document(app, _raw=raws[0])
     assert doc.text == "mock-text"
 
 
+# ── snapshot / transaction ───────────────────────────────────────
+
+def _snapshot_app():
+    """GetTextFile/SetTextFile 가 메모리상의 '문서 내용' 을 주고받는 mock."""
+    app, raws = _mock_app()
+    state = {"content": "v1 " * 200}
+    app.api.GetTextFile = MagicMock(side_effect=lambda fmt, opt: state["content"])
+    app.api.SetTextFile.side_effect = (
+        lambda data, fmt, opt: state.__setitem__("content", data) or True
+    )
+    app.actions.InsertText.run.side_effect = (
+        lambda *a: state.__setitem__("content", state["content"] + "edit")
+    )
+    return app, raws, state
+
+
+def test_snapshot_round_trip_compressed():
+    app, raws, state = _snapshot_app()
+    doc = Document(app, _raw=raws[0])
+    snap = doc.snapshot()
+    assert snap.format == "HWP" and snap.compressed
+    assert snap.nbytes < snap.size
+    state["content"] = "changed"
+    doc.restore(snap)
+    assert state["content"] == "v1 " * 200
+    app.api.SetTextFile.assert_called_once_with("v1 " * 200, "HWP", "")
+
+
+def test_snapshot_rejects_bad_format_and_size():
+    from hwpapi.errors import FileIOError, InvalidArgumentError
+
+    app, raws, _ = _snapshot_app()
+    doc = Document(app, _raw=raws[0])
+    with pytest.raises(InvalidArgumentError):
+        doc.snapshot(format="PDF")
+    with pytest.raises(FileIOError):
+        doc.snapshot(compress=False, max_bytes=10)
+
+
+def test_transaction_rolls_back_on_error():
+    app, raws, state = _snapshot_app()
+    doc = Document(app, _raw=raws[0])
+    with pytest.raises(RuntimeError):
+        with doc.transaction():
+            doc.insert_text("x")
+            assert state["content"].endswith("edit")
+            raise RuntimeError("step 2 failed")
+    assert state["content"] == "v1 " * 200
+    assert app.api.GetTextFile.call_count == 1
+
+
+def test_transaction_snapshots_lazily():
+    app, raws, state = _snapshot_app()
+    doc = Document(app, _raw=raws[0])
+    with doc.transaction() as txn:
+        assert txn.snapshot is None  # 편집 전에는 스냅샷 없음
+    app.api.GetTextFile.assert_not_called()
+
+    with pytest.raises(KeyError):
+        with doc.transaction() as txn:
+            raise KeyError("before any edit")
+    app.api.SetTextFile.assert_not_called()
+
+
+def test_nested_transaction_outer_rolls_back_inner_commit():
+    app, raws, state = _snapshot_app()
+    doc = Document(app, _raw=raws[0])
+    with pytest.raises(RuntimeError):
+        with doc.transaction():
+            with doc.transaction():
+                doc.insert_text("x")
+            raise RuntimeError
+    assert state["content"] == "v1 " * 200
+
+
+def test_transaction_rolls_back_collection_writes():
+    app, raws, state = _snapshot_app()
+    app.engine.impl.PutFieldText.side_effect = (
+        lambda name, value: state.__setitem__("content", f"{name}={value}")
+    )
+    app.engine.impl.GetFieldList.return_value = "date"
+    doc = Document(app, _raw=raws[0])
+    with pytest.raises(RuntimeError):
+        with doc.transaction() as txn:
+            doc.fields["date"] = "today"
+            assert state["content"] == "date=today"
+            raise RuntimeError("step 2 failed")
+    assert txn.snapshot is not None
+    assert state["content"] == "v1 " * 200
+
+    with doc.transaction() as txn:
+        doc.fields["date"].value = "later"  # Field 객체를 거쳐도 동일
+        assert txn.snapshot is not None
+
+
+def test_collection_edit_hook_does_not_keep_the_document_alive():
+    import weakref
+
+    app, raws = _mock_app()
+    doc = Document(app, _raw=raws[0])
+    fields = doc.fields
+    ref = weakref.ref(doc)
+    del doc
+    assert ref() is None
+    fields["date"] = "today"  # 문서가 사라진 뒤에도 안전
+
+
+def test_transaction_ignores_reads():
+    app, raws, state = _snapshot_app()
+    doc = Document(app, _raw=raws[0])
+    with doc.transaction() as txn:
+        doc.text
+        doc.find_all("v1")
+        assert txn.snapshot is None
+    assert app.api.GetTextFile.call_count == 2   # the reads only
+
+
+def test_nested_transactions_share_an_unedited_snapshot():
+    app, raws, state = _snapshot_app()
+    doc = Document(app, _raw=raws[0])
+    with doc.transaction() as outer:
+        with doc.transaction() as inner:
+            doc.insert_text("x")
+        assert inner.snapshot is outer.snapshot
+    assert app.api.GetTextFile.call_count == 1
+
+
+def test_inner_transaction_after_outer_edit_rolls_back_to_its_start():
+    app, raws, state = _snapshot_app()
+    doc = Document(app, _raw=raws[0])
+    with doc.transaction() as outer:
+        doc.insert_text("a")
+        with pytest.raises(RuntimeError):
+            with doc.transaction() as inner:
+                doc.insert_text("b")
+                raise RuntimeError
+        assert inner.snapshot is not outer.snapshot
+        assert state["content"] == "v1 " * 200 + "edit"
+
+
 # ── _DocActions proxy ────────────────────────────────────────────
 
 def test_doc_actions_attr_triggers_activate():
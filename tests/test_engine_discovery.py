@@ -0,0 +1,121 @@
+"""Engine discovery — lazy ROT engines, ROT walk cache, check_dll memo (no HWP required)."""
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+import pytest
+
+from hwpapi import functions
+from hwpapi.core import app as app_mod
+from hwpapi.core.app import App
+from hwpapi.low import engine as engine_mod
+from hwpapi.low.engine import Engine, Engines
+
+
+class FakeEntry:
+    def __init__(self, name):
+        self.name = name
+        self.bound = 0
+
+    def bind(self):
+        self.bound += 1
+        return f"dispatch:{self.name}"
+
+
+@pytest.fixture
+def rot(monkeypatch):
+    entries = [FakeEntry(f"!HwpObject.120.{i}") for i in range(8)]
+    walks = MagicMock(side_effect=lambda: list(entries))
+    monkeypatch.setattr(functions, "_enumerate_rot", walks)
+    monkeypatch.setattr(engine_mod, "dispatch", lambda obj: MagicMock(CLSID=obj))
+    monkeypatch.setattr(engine_mod, "check_dll", lambda dll_path=None: True)
+    functions.invalidate_rot_cache()
+    yield entries, walks
+    functions.invalidate_rot_cache()
+
+
+def test_engines_dispatch_only_the_selected_one(rot):
+    entries, _ = rot
+    engines = Engines()
+    assert len(engines) == 8
+    assert not any(e.resolved for e in engines)
+    assert "not dispatched" in repr(engines[0])
+    assert engines[-1].impl.CLSID == "dispatch:!HwpObject.120.7"
+    assert [e.bound for e in entries] == [0] * 7 + [1]
+    engines[-1].impl  # resolved once, then a plain attribute
+    assert entries[-1].bound == 1
+
+
+def test_failed_bind_leaves_impl_none(rot):
+    entries, _ = rot
+    entries[0].bind = MagicMock(side_effect=OSError("gone"))
+    assert Engines()[0].impl is None
+    with pytest.raises(AttributeError):
+        Engines()[0].missing
+
+
+def _loaded_app(monkeypatch) -> App:
+    monkeypatch.setattr(app_mod, "check_dll", lambda dll_path=None: True)
+    app = App.__new__(App)
+    app._logger = engine_mod.get_logger("core")
+    app._load(dll_path="x.dll")
+    return app
+
+
+def test_app_falls_back_to_the_previous_engine_when_bind_fails(rot, monkeypatch):
+    entries, walks = rot
+    entries[-1].bind = MagicMock(side_effect=OSError("exited"))
+    app = _loaded_app(monkeypatch)
+    assert app.api.CLSID == "dispatch:!HwpObject.120.6"
+    assert [e.bound for e in entries[:-1]] == [0] * 6 + [1]
+    Engines()                                # stale entry → ROT walked again
+    assert walks.call_count == 2
+
+
+def test_app_starts_a_new_engine_when_none_binds(rot, monkeypatch):
+    entries, _ = rot
+    for entry in entries:
+        entry.bind = MagicMock(side_effect=OSError("exited"))
+    app = _loaded_app(monkeypatch)
+    assert app.api.CLSID == "HWPFrame.HwpObject"
+
+
+def test_rot_walk_cached_until_ttl_or_refresh(rot, monkeypatch):
+    _, walks = rot
+    Engines()
+    Engines()
+    assert walks.call_count == 1
+    Engines(refresh=True)
+    assert walks.call_count == 2
+    monkeypatch.setattr(functions, "ROT_CACHE_TTL", 0.0)
+    Engines()
+    assert walks.call_count == 3
+
+
+def test_new_engine_invalidates_rot_cache(rot):
+    _, walks = rot
+    Engines()
+    Engine()  # starts a new HWP → new ROT entry
+    Engines()
+    assert walks.call_count == 2
+
+
+def test_check_dll_memoised(monkeypatch, tmp_path):
+    dll = tmp_path / "x.dll"
+    lookups = MagicMock(return_value=str(dll))
+    monkeypatch.setattr(functions, "get_registry_value", lookups)
+    monkeypatch.setattr(functions, "_dll_checked", {})
+    assert functions.check_dll(dll) and functions.check_dll(dll)
+    assert lookups.call_count == 1
+    functions.check_dll(dll, refresh=True)
+    assert lookups.call_count == 2
+
+
+def test_check_dll_not_memoised_when_registry_write_fails(monkeypatch, tmp_path):
+    monkeypatch.setattr(functions, "get_registry_value", MagicMock(return_value=None))
+    writes = MagicMock(return_value=False)
+    monkeypatch.setattr(functions, "add_dll_to_registry", writes)
+    monkeypatch.setattr(functions, "_dll_checked", {})
+    functions.check_dll(tmp_path / "x.dll")
+    functions.check_dll(tmp_path / "x.dll")
+    assert writes.call_count == 2
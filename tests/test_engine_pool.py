@@ -0,0 +1,109 @@
+"""Warm standby engine pool — ``EnginePool`` / ``App.acquire`` (no HWP required)."""
+from __future__ import annotations
+
+import time
+from unittest.mock import MagicMock
+
+import pytest
+
+from hwpapi.core import pool as pool_mod
+from hwpapi.core.app import App
+from hwpapi.core.pool import EnginePool, configure_pool
+from hwpapi.errors import InvalidArgumentError
+
+
+class FakeEngine:
+    launched = 0
+
+    def __init__(self, docs=1):
+        FakeEngine.launched += 1
+        self.impl = MagicMock()
+        self.impl.XHwpDocuments.Count = docs
+        self.quit = self.impl.Run
+
+
+def _pool(size=2, **kw):
+    kw.setdefault("replenish", False)
+    return EnginePool(size, launch=FakeEngine, **kw)
+
+
+def test_acquire_hands_out_standby_engines():
+    pool = _pool().fill()
+    assert pool.idle == 2
+    app = pool.acquire()
+    assert isinstance(app, App) and pool.idle == 1
+    stats = pool.stats()
+    assert (stats.hits, stats.misses, stats.launched) == (1, 0, 2)
+    assert stats.p50 > 0
+
+
+def test_empty_pool_launches_inline():
+    pool = _pool(size=0)
+    pool.acquire()
+    assert (pool.stats().misses, pool.stats().launched) == (1, 1)
+
+
+def test_unhealthy_standby_is_discarded():
+    pool = _pool(health_check=lambda e: e.impl.XHwpDocuments.Count != "dead").fill()
+    pool._idle[0].engine.impl.XHwpDocuments.Count = "dead"
+    app = pool.acquire()
+    assert app.api.XHwpDocuments.Count == 1
+    assert pool.stats().discarded == 1
+    assert pool.idle == 0
+
+
+def test_release_resets_documents_and_returns_engine():
+    pool = _pool(size=1)
+    app = pool.acquire()
+    docs = app.api.XHwpDocuments
+    docs.Count = 3
+    closed = []
+    docs.Item.side_effect = lambda i: MagicMock(Close=lambda save: closed.append((i, save)))
+    pool.release(app)
+    assert closed == [(2, False), (1, False), (0, False)]
+    assert pool.idle == 1 and pool.acquire().engine is app.engine
+    with pytest.raises(InvalidArgumentError):
+        pool.release(App._adopt(FakeEngine()))
+
+
+def test_failed_reset_or_full_pool_quits_engine():
+    pool = _pool(size=1, reset=MagicMock(side_effect=RuntimeError("hung")))
+    app = pool.acquire()
+    pool.release(app)
+    app.api.Run.assert_called_with("FileQuit")
+    assert pool.idle == 0 and pool.stats().discarded == 1
+
+    pool = _pool(size=0, reset=lambda app: None)
+    app = pool.acquire()
+    pool.release(app)
+    app.api.Run.assert_called_with("FileQuit")
+
+
+def test_background_replenishment():
+    with EnginePool(2, launch=FakeEngine) as pool:
+        deadline = time.monotonic() + 2
+        while pool.idle < 2 and time.monotonic() < deadline:
+            time.sleep(0.005)
+        assert pool.idle == 2
+        pool.acquire()
+        app = pool.acquire(wait=2.0)
+        assert pool.stats().hits == 2
+        while pool.idle < 2 and time.monotonic() < deadline:
+            time.sleep(0.005)
+        assert pool.idle == 2
+    assert "closed" in repr(pool)
+    with pytest.raises(InvalidArgumentError):
+        pool.acquire()
+
+
+def test_app_acquire_release_use_default_pool(monkeypatch):
+    monkeypatch.setattr(pool_mod, "_default", None)
+    pool = configure_pool(1, launch=FakeEngine, replenish=False, reset=lambda app: None)
+    try:
+        with App.acquire() as app:
+            assert app._pool is pool
+        assert pool.idle == 1  # __exit__ released instead of quitting
+        with pytest.raises(InvalidArgumentError):
+            app.release()
+    finally:
+        pool.close()
@@ -0,0 +1,121 @@
+"""
+Import-cost guard — ``import hwpapi`` 은 가볍고 pywin32 없이 동작해야 함.
+
+``python -X importtime`` 을 별도 프로세스로 실행해 (캐시된 sys.modules
+영향 없이) 어떤 모듈이 로드되는지와 누적 import 시간을 측정합니다.
+로드 여부는 실행 후 ``sys.modules`` 로, 시간은 importtime 출력으로 판단.
+"""
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Generous ceilings (µs) — typical warm numbers are ~4ms / ~40ms; the
+# budget only trips when something heavy creeps back into the import path.
+IMPORT_BUDGET_US = {
+    "import hwpapi": 50_000,
+    "from hwpapi import App": 250_000,
+}
+
+PLATFORM_MODULES = ("winreg", "win32com", "pythoncom", "pywintypes", "win32api")
+
+
+def _importtime(statement: str):
+    """Run ``statement`` under ``-X importtime`` in a fresh interpreter.
+
+    Returns ``(timings, modules)`` — ``timings`` is
+    ``{module: (depth, cumulative_us)}`` where ``depth`` 0 is a top-level
+    import triggered directly by ``statement``; ``modules`` is the set of
+    ``sys.modules`` names afterwards.
+    """
+    env = dict(os.environ)
+    env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(ROOT), env.get("PYTHONPATH")]))
+    env.pop("HWPAPI_LOG_LEVEL", None)
+    script = statement + "\nimport json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", script],
+        capture_output=True, text=True, env=env, cwd=str(ROOT),
+    )
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    timings = {}
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.split("|")
+        depth = (len(name) - len(name.lstrip()) - 1) // 2
+        timings[name.strip()] = (depth, int(cumulative))
+    modules = set(json.loads(proc.stdout.strip().splitlines()[-1]))
+    return timings, modules
+
+
+def _hwpapi_cost_us(timings: dict) -> int:
+    """Total µs spent in top-level ``hwpapi*`` imports."""
+    return sum(us for name, (depth, us) in timings.items()
+               if depth == 0 and (name == "hwpapi" or name.startswith("hwpapi.")))
+
+
+def _loaded(modules, prefix: str) -> list:
+    return sorted(m for m in modules if m == prefix or m.startswith(prefix + "."))
+
+
+def test_import_hwpapi_is_lazy():
+    _, modules = _importtime("import hwpapi")
+    hwpapi_modules = _loaded(modules, "hwpapi")
+    assert hwpapi_modules == ["hwpapi"], hwpapi_modules
+    for platform_module in PLATFORM_MODULES:
+        assert not _loaded(modules, platform_module)
+
+
+def test_app_import_defers_pywin32_and_parametersets():
+    _, modules = _importtime("from hwpapi import App")
+    assert "hwpapi.low.actions" in modules
+    assert not _loaded(modules, "hwpapi.low.parametersets")
+    assert not _loaded(modules, "IPython")
+    for platform_module in PLATFORM_MODULES:
+        assert not _loaded(modules, platform_module)
+
+
+def test_parametersets_load_on_first_registry_lookup():
+    _, modules = _importtime(
+        "from hwpapi import App\n"
+        "from hwpapi.low.actions import _Actions\n"
+        "assert _Actions(None).get_pset_class('CharShape').__name__ == 'CharShape'"
+    )
+    assert "hwpapi.low.parametersets" in modules
+
+
+@pytest.mark.parametrize("statement", sorted(IMPORT_BUDGET_US))
+def test_import_time_budget(statement):
+    cumulative = _hwpapi_cost_us(_importtime(statement)[0])
+    assert cumulative < IMPORT_BUDGET_US[statement], (
+        f"{statement!r} took {cumulative / 1000:.1f} ms "
+        f"(budget {IMPORT_BUDGET_US[statement] / 1000:.0f} ms)"
+    )
+
+
+def test_lazy_attributes_resolve():
+    import hwpapi
+
+    assert "App" in dir(hwpapi)
+    assert hwpapi.Document.__module__ == "hwpapi.document"
+    with pytest.raises(AttributeError):
+        hwpapi.does_not_exist
+
+
+def test_registry_lookup_builds_only_owning_domain():
+    _, modules = _importtime(
+        "from hwpapi.low.parametersets import PARAMETERSET_REGISTRY\n"
+        "assert PARAMETERSET_REGISTRY.get('FindReplace').__name__ == 'FindReplace'"
+    )
+    domains = sorted(m.rsplit(".", 1)[1]
+                     for m in _loaded(modules, "hwpapi.low.parametersets.sets")
+                     if m != "hwpapi.low.parametersets.sets")
+    # FindReplace nests CharShape / ParaShape from primitives.
+    assert domains == ["find_edit", "primitives"]
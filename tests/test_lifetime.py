@@ -0,0 +1,214 @@
+"""COM proxy lifetime registry — ``hwpapi.low.lifetime`` (no HWP required)."""
+from __future__ import annotations
+
+import gc
+
+from hwpapi.collections.paragraphs import Paragraph
+from hwpapi.collections.tables import Table, TableCollection
+from hwpapi.core.app import App
+from hwpapi.document import Document
+from hwpapi.low.parametersets import PARAMETERSET_REGISTRY
+from hwpapi.low.parametersets.backends import HParamBackend, hparameterset_backend
+
+
+class FakeAction:
+    def CreateSet(self):
+        return None
+
+
+class FakeDoc:
+    def __init__(self, docs, doc_id):
+        self.docs = docs
+        self.DocumentID = doc_id
+
+    def SetActive_XHwpDocument(self):
+        self.docs.active = self
+
+    def Close(self, save):
+        self.docs.items.remove(self)
+        if self.docs.active is self:
+            self.docs.active = self.docs.items[0] if self.docs.items else None
+
+
+class FakeDocs:
+    def __init__(self, *ids):
+        self.items = []
+        self.items.extend(FakeDoc(self, i) for i in ids)
+        self.active = self.items[0]
+
+    @property
+    def Count(self):
+        return len(self.items)
+
+    def Item(self, i):
+        return self.items[i]
+
+    @property
+    def Active_XHwpDocument(self):
+        return self.active
+
+
+class FakeCtrl:
+    CtrlID = "tbl "
+    Next = None
+
+
+class FakeImpl:
+    def __init__(self):
+        self.XHwpDocuments = FakeDocs(1, 2)
+        self.HParameterSet = object()
+        self.ran = []
+
+    @property
+    def HeadCtrl(self):
+        return FakeCtrl()
+
+    def CreateAction(self, key):
+        return FakeAction()
+
+    def Run(self, name):
+        self.ran.append(name)
+
+
+class FakeEngine:
+    def __init__(self):
+        self.impl = FakeImpl()
+
+
+def _open(app):
+    docs = app.api.XHwpDocuments
+    return [Document(app, _raw=raw) for raw in list(docs.items)]
+
+
+def test_close_purges_only_that_documents_handles():
+    app = App._adopt(FakeEngine())
+    first, second = _open(app)
+    action = app.actions.InsertText
+
+    first.activate()
+    action.act, action.pset
+    (table,) = TableCollection(app)
+    para = Paragraph(app, 0, object(), doc_id=1)
+    second.activate()
+    action.act
+    (other,) = TableCollection(app)
+
+    report = app.gc_report()
+    assert report["live"] == {"document": 2, "action": 1, "table": 2, "paragraph": 1}
+    assert report["by_document"][1] == {"document": 1, "table": 1, "paragraph": 1,
+                                        "action": 1, "pset": 1}
+    assert report["leaks"] == {}
+
+    assert first.close()
+    assert table._ctrl is None and para._raw is None and first.raw is None
+    assert other._ctrl is not None and second.raw is not None
+    assert list(action._act_cache) == [2] and action._pset_cache == {}
+
+    report = app.gc_report()
+    assert report["open_documents"] == [2]
+    assert report["released"] == {"document": 1, "table": 1, "paragraph": 1,
+                                  "action": 1, "pset": 1}
+    assert report["closed_documents"] == 1
+    assert 1 not in report["by_document"] and report["leaks"] == {}
+
+
+def test_proxies_are_tagged_with_the_real_active_document():
+    app = App._adopt(FakeEngine())
+    first, second = _open(app)
+    first.activate()
+    docs = app.api.XHwpDocuments
+    docs.active = docs.items[1]     # switched behind hwpapi's back (open/add/UI)
+    (table,) = TableCollection(app)
+    untagged = Table(app, object(), 0)
+
+    first.close()
+    assert table._ctrl is not None and untagged._ctrl is not None
+    second.close()
+    assert table._ctrl is None and untagged._ctrl is not None
+
+
+def test_documents_closed_behind_hwpapis_back_show_up_as_leaks():
+    app = App._adopt(FakeEngine())
+    first, _ = _open(app)
+    (table,) = TableCollection(app)
+    first.raw.Close(False)          # raw COM close — registry not told
+
+    report = app.gc_report()
+    assert report["leaks"] == {"document": 1, "table": 1}
+    assert app.gc_report(verify=False)["leaks"] is None
+    assert table._ctrl is not None
+
+
+def test_collected_proxies_and_quit():
+    app = App._adopt(FakeEngine())
+    docs = _open(app)
+    Table(app, object(), 0)         # dropped at once
+    gc.collect()
+    keep = Paragraph(app, 0, object())
+
+    report = app.gc_report()
+    assert report["created"] == {"document": 2, "table": 1, "paragraph": 1}
+    assert report["collected"] == {"table": 1}
+
+    app.quit()
+    assert app.api.ran == ["FileQuit"]
+    assert keep._raw is None and all(d.raw is None for d in docs)
+    assert app.gc_report(verify=False)["live"] == {}
+
+
+def test_untracked_apps_report_empty():
+    app = App._adopt(FakeEngine())
+    report = app.gc_report()
+    assert report["live"] == {} and report["leaks"] == {}
+    assert report["open_documents"] == [1, 2]
+    Paragraph(app, 0)               # no handle, not tracked
+    assert app.gc_report()["created"] == {}
+
+
+def test_release_all_drops_the_hparameterset_backend():
+    app = App._adopt(FakeEngine())
+    backend = hparameterset_backend(app)
+    backend._nodes["HFindReplace"] = object()
+    assert hparameterset_backend(app) is backend
+
+    app.quit()
+    assert backend._nodes == {}
+    fresh = hparameterset_backend(app)
+    assert fresh is not backend and fresh._root is app.api.HParameterSet
+
+
+class LoggingNode:
+    """An ``HParameterSet.HFindReplace``-like node that logs every write."""
+
+    SetID = "FindReplace"
+
+    def __init__(self, log, name):
+        object.__setattr__(self, "_log", log)
+        object.__setattr__(self, "_name", name)
+        object.__setattr__(self, "FindString", "")
+
+    def __setattr__(self, key, value):
+        self._log.append((self._name, key, value))
+        object.__setattr__(self, key, value)
+
+
+def test_hset_sync_skips_psets_bound_to_the_global_node():
+    engine = FakeEngine()
+    log = []
+    engine.impl.HParameterSet = type("HPS", (), {})()
+    engine.impl.HParameterSet.HFindReplace = LoggingNode(log, "global")
+    app = App._adopt(engine)
+    FindReplace = PARAMETERSET_REGISTRY["FindReplace"]
+
+    pset = FindReplace(app.api.HParameterSet.HFindReplace, app_instance=app,
+                       backend_factory=HParamBackend)   # get_pset()-style
+    pset.FindString = "x"
+    pset.apply()
+    assert log == [("global", "FindString", "x")]       # written once
+
+    log.clear()
+    local = FindReplace(LoggingNode(log, "local"), app_instance=app,
+                        backend_factory=HParamBackend)
+    local.FindString = "y"
+    local.apply()
+    assert log == [("local", "FindString", "y"), ("global", "FindString", "y")]
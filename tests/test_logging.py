@@ -0,0 +1,85 @@
+"""Logging — ``TRACE`` level, opt-in file output, lazy messages (no HWP required)."""
+from __future__ import annotations
+
+import logging
+from unittest.mock import MagicMock
+
+import pytest
+
+from hwpapi import logging as hlog
+from hwpapi.low.actions import _Action
+
+
+@pytest.fixture
+def hwpapi_logger():
+    """Root ``hwpapi`` logger with its level / handlers restored afterwards."""
+    instance = hlog.HwpApiLogger()
+    logger = instance.logger
+    level, handlers = logger.level, [(h, h.level) for h in logger.handlers]
+    yield instance
+    logger.handlers[:] = [h for h, _ in handlers]
+    for h, h_level in handlers:
+        h.setLevel(h_level)
+    logger.setLevel(level)
+    hlog.refresh_trace()
+
+
+class _Capture(logging.Handler):
+    def __init__(self):
+        super().__init__(level=0)
+        self.records = []
+
+    def emit(self, record):
+        self.records.append(record)
+
+
+def test_trace_level_is_registered():
+    assert hlog.TRACE < logging.DEBUG
+    assert logging.getLevelName(hlog.TRACE) == "TRACE"
+    assert hlog._parse_level("trace") == hlog.TRACE
+    with pytest.raises(ValueError):
+        hlog._parse_level("LOUD")
+
+
+def test_set_level_toggles_trace_flag(hwpapi_logger):
+    hlog.set_level("TRACE")
+    assert hlog.TRACE_ON
+    hlog.set_level("DEBUG")
+    assert not hlog.TRACE_ON
+    hwpapi_logger.logger.setLevel(hlog.TRACE)   # plain stdlib call
+    assert hlog.refresh_trace() and hlog.TRACE_ON
+
+
+def test_no_log_file_unless_requested(hwpapi_logger, tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    hwpapi_logger.configure(level="DEBUG")
+    hwpapi_logger.logger.handlers.clear()
+    hwpapi_logger._setup_logger()
+    assert not any(isinstance(h, logging.FileHandler) for h in hwpapi_logger.logger.handlers)
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_env_log_file_and_unknown_level(hwpapi_logger, tmp_path, monkeypatch):
+    monkeypatch.setenv("HWPAPI_LOG_FILE", str(tmp_path / "hwpapi.log"))
+    monkeypatch.setenv("HWPAPI_LOG_LEVEL", "chatty")
+    hwpapi_logger.logger.handlers.clear()
+    hwpapi_logger._setup_logger()
+    assert hwpapi_logger.logger.level == logging.WARNING
+    assert any(isinstance(h, logging.FileHandler) for h in hwpapi_logger.logger.handlers)
+    for h in hwpapi_logger.logger.handlers:
+        h.close()
+
+
+def test_action_run_traces_only_when_enabled(hwpapi_logger):
+    capture = _Capture()
+    hwpapi_logger.logger.addHandler(capture)
+    action = _Action(MagicMock(), "BreakPara")
+
+    hlog.set_level("DEBUG")
+    action.run()
+    assert not [r for r in capture.records if r.levelno == hlog.TRACE]
+
+    hlog.set_level("TRACE")
+    action.run()
+    traced = [r for r in capture.records if r.levelno == hlog.TRACE]
+    assert len(traced) == 1 and traced[0].args[0] == "BreakPara"
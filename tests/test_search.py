@@ -0,0 +1,126 @@
+"""hwpapi.search — scan / replace planner (pure Python, no COM)."""
+from __future__ import annotations
+
+from hwpapi.search import PatternMatcher, TextScan, iter_matches, plan_replacements
+
+
+def _apply(text, steps):
+    for find, replace in steps:
+        text = text.replace(find, replace)
+    return text
+
+
+# ── TextScan ─────────────────────────────────────────────────────
+
+def test_scan_normalises_crlf_and_indexes_paragraphs():
+    scan = TextScan("첫째\r\n둘째 줄\r\n")
+    assert scan.text == "첫째\n둘째 줄\n"
+    assert scan.paragraph_count == 3
+    assert scan.paragraph(1) == "둘째 줄"
+
+
+def test_scan_locate_maps_offset_to_para_pos():
+    scan = TextScan("ab\r\ncde")
+    assert scan.locate(0) == (0, 0)
+    assert scan.locate(1) == (0, 1)
+    assert scan.locate(3) == (1, 0)
+    assert scan.locate(5) == (1, 2)
+
+
+# ── plan_replacements ───────────────────────────────────────────
+
+def test_plan_drops_absent_rules():
+    plan = plan_replacements("{a} {a}", {"{a}": "A", "{zzz}": "Z"})
+    assert plan.steps == [("{a}", "A")]
+    assert plan.counts == {"{a}": 2, "{zzz}": 0}
+
+
+def test_plan_orders_to_avoid_cascading_rewrite():
+    text = "{a} {b}"
+    plan = plan_replacements(text, {"{a}": "{b}", "{b}": "B"})
+    # {b} must run first, otherwise {a}'s output is rewritten to "B".
+    assert plan.steps == [("{b}", "B"), ("{a}", "{b}")]
+    assert _apply(text, plan.steps) == "{b} B"
+    assert plan.counts == {"{a}": 1, "{b}": 1}
+
+
+def test_plan_runs_longer_overlapping_find_first():
+    plan = plan_replacements("{name} {name_full}",
+                             {"{name": "X", "{name_full}": "Y"})
+    assert plan.steps[0] == ("{name_full}", "Y")
+    assert plan.counts == {"{name": 1, "{name_full}": 1}
+
+
+def test_plan_resolves_swap_cycle_with_sentinels():
+    text = "a b a"
+    plan = plan_replacements(text, [("a", "b"), ("b", "a")])
+    assert _apply(text, plan.steps) == "b a b"
+    assert plan.counts == {"a": 2, "b": 1}
+
+
+def test_plan_keeps_longer_find_ahead_of_a_parked_cycle():
+    text = "xab ab ba"
+    plan = plan_replacements(text, {"ab": "ba", "ba": "ab", "xab": "Q"})
+    assert ("xab", "Q") in plan.steps
+    assert _apply(text, plan.steps) == "Q ba ab"
+    assert plan.counts == {"ab": 1, "ba": 1, "xab": 1}
+
+
+def test_plan_runs_sentinel_steps_literally_in_regex_mode():
+    text = "a b a"
+    plan = plan_replacements(text, [("a", "b"), ("b", "a")], regex=True)
+    assert _apply(text, plan.steps) == "b a b"
+    parked = {replace for _, replace in plan.steps[:2]}
+    assert [find in parked for find, _ in plan.steps] == [not r for r in plan.regex]
+
+
+def test_plan_regex_counts():
+    plan = plan_replacements("v1 v22 x", {r"v\d+": "V"}, regex=True)
+    assert plan.counts == {r"v\d+": 2}
+    assert plan.steps == [(r"v\d+", "V")]
+
+
+def test_plan_counts_through_partial_execution():
+    plan = plan_replacements("{a} {b} {b}", {"{a}": "A", "{b}": "B"})
+    assert plan.counts_through(1) == {"{a}": 1, "{b}": 0}
+    assert plan.counts_through(len(plan.steps)) == plan.counts
+
+
+# ── PatternMatcher / iter_matches ───────────────────────────────
+
+def test_matcher_reports_overlapping_hits():
+    m = PatternMatcher(["he", "she", "hers", "he"])
+    assert len(m) == 3
+    assert list(m.finditer("ushers")) == [
+        (1, 4, "she"), (2, 4, "he"), (2, 6, "hers"),
+    ]
+
+
+def test_matcher_many_patterns_single_pass():
+    terms = [f"term{i:05d}" for i in range(10_000)]
+    m = PatternMatcher(terms)
+    text = "x term00042 y term09999 z"
+    assert [p for _, _, p in m.finditer(text)] == ["term00042", "term09999"]
+
+
+def test_iter_matches_maps_to_list_para_pos():
+    scan = TextScan("가나다\r\n다라")
+    hits = list(iter_matches(scan, ["다", "나다"]))
+    assert [(h.text, h.start, h.end) for h in hits] == [
+        ("나다", (0, 0, 1), (0, 0, 3)),
+        ("다", (0, 0, 2), (0, 0, 3)),
+        ("다", (0, 1, 0), (0, 1, 1)),
+    ]
+
+
+def test_iter_matches_regex_merges_by_start():
+    scan = TextScan("a1 b2\r\na3")
+    hits = list(iter_matches(scan, [r"b\d", r"a\d"], regex=True))
+    assert [h.text for h in hits] == ["a1", "b2", "a3"]
+    assert hits[2].start == (0, 1, 0)
+
+
+def test_match_unpacks_to_start_end():
+    (start, end), = [tuple(m) for m in iter_matches(TextScan("xy"), "y")]
+    assert start == (0, 0, 1)
+    assert end == (0, 0, 2)
@@ -0,0 +1,105 @@
+"""Span tracing — ``hwpapi.tracing`` buffer, nesting and exporters (no HWP required)."""
+from __future__ import annotations
+
+import json
+import threading
+from unittest.mock import MagicMock
+
+import pytest
+
+from hwpapi import tracing
+from hwpapi.collections.fields import FieldCollection
+from hwpapi.low.actions import _Action
+
+
+@pytest.fixture
+def recording():
+    tracing.clear()
+    tracing.enable()
+    yield tracing
+    tracing.disable()
+    tracing.clear()
+    tracing.enable(capacity=tracing.DEFAULT_CAPACITY)
+    tracing.disable()
+
+
+def test_disabled_span_is_a_shared_falsy_noop():
+    assert not tracing.ENABLED
+    sp = tracing.span("x", a=1)
+    assert sp is tracing.span("y") and not sp
+    with sp as inner:
+        assert inner.call(lambda v: v * 2, 21) == 42
+    assert tracing.spans() == []
+
+
+def test_spans_nest_and_roll_up_com_counts(recording):
+    with tracing.span("outer", job="nightly") as outer:
+        outer.call(lambda: None)
+        with tracing.span("inner") as inner:
+            inner.com(0.002, calls=3)
+    inner_rec, outer_rec = tracing.spans()
+    assert (inner_rec.name, outer_rec.name) == ("inner", "outer")
+    assert inner_rec.parent_id == outer_rec.span_id and outer_rec.parent_id is None
+    assert inner_rec.com_calls == 3 and outer_rec.com_calls == 4
+    assert outer_rec.com_ns >= 2_000_000
+    assert outer_rec.attrs == {"job": "nightly"}
+
+
+def test_error_is_recorded_and_threads_do_not_nest(recording):
+    with pytest.raises(ValueError):
+        with tracing.span("boom"):
+            raise ValueError("bad")
+
+    def worker():
+        with tracing.span("worker"):
+            pass
+
+    t = threading.Thread(target=worker)
+    with tracing.span("main"):
+        t.start()
+        t.join()
+    by_name = {s.name: s for s in tracing.spans()}
+    assert by_name["boom"].error == "ValueError: bad"
+    assert by_name["worker"].parent_id is None
+    assert by_name["worker"].thread != by_name["main"].thread
+
+
+def test_ring_buffer_keeps_newest(recording):
+    @tracing.traced()
+    def step():
+        return "done"
+
+    tracing.enable(capacity=3)
+    for i in range(5):
+        with tracing.span(f"s{i}"):
+            pass
+    assert [s.name for s in tracing.spans()] == ["s2", "s3", "s4"]
+    assert step() == "done"
+    assert tracing.spans()[-1].name.endswith("step")
+
+
+def test_action_and_fields_entry_points(recording):
+    app = MagicMock()
+    _Action(app, "BreakPara").run()
+    FieldCollection(app).update({"a": 1}, b=2)
+    run, = tracing.spans("action.run")
+    assert run.attrs["action"] == "BreakPara" and run.com_calls == 1
+    update, = tracing.spans("fields.update")
+    assert update.attrs["fields"] == 2 and update.com_calls == 2
+    assert app.engine.impl.PutFieldText.call_count == 2
+
+
+def test_exporters_write_jsonl_and_chrome_trace(recording, tmp_path):
+    with tracing.span("outer", document="a.hwp"):
+        with tracing.span("inner", pset=object()):
+            pass
+    assert tracing.export_jsonl(tmp_path / "t.jsonl") == 2
+    lines = [json.loads(l) for l in (tmp_path / "t.jsonl").read_text("utf-8").splitlines()]
+    assert lines[0]["name"] == "inner" and lines[0]["parent"] == lines[1]["id"]
+    assert isinstance(lines[0]["attrs"]["pset"], str)
+
+    assert tracing.export_chrome(tmp_path / "t.json") == 2
+    events = json.loads((tmp_path / "t.json").read_text("utf-8"))["traceEvents"]
+    assert {e["ph"] for e in events} == {"X"}
+    outer = next(e for e in events if e["name"] == "outer")
+    assert outer["args"]["document"] == "a.hwp" and outer["dur"] >= 0
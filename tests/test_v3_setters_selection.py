@@ -144,16 +144,107 @@ def test_range_set_charshape(monkeypatch):
 
 # ── find_all / replace_brackets ──────────────────────────────────
 
-def test_replace_brackets_calls_replace_all_per_key():
+def test_replace_brackets_delegates_to_replace_many():
     app, raw = _mock_app()
     doc = Document(app, _raw=raw)
-    # Stub replace_all to count
     calls = []
-    doc.replace_all = lambda find, replace: calls.append((find, replace)) or 1
+    doc.replace_many = lambda rules: calls.append(dict(rules)) or {
+        "{name}": 2, "{date}": 1,
+    }
     n = doc.replace_brackets({
         "{name}": "홍길동",
         "{date}": "2026-04-29",
     })
-    assert n == 2
-    assert ("{name}", "홍길동") in calls
-    assert ("{date}", "2026-04-29") in calls
+    assert n == 3
+    assert calls == [{"{name}": "홍길동", "{date}": "2026-04-29"}]
+
+
+def _replace_app(text):
+    app, raw = _mock_app()
+    app.api.GetTextFile = lambda *a, **k: text
+    act = MagicMock(name="AllReplace")
+    seen = []
+    act.run.side_effect = lambda: seen.append(
+        (act.pset.FindString, act.pset.ReplaceString))
+    app.actions.AllReplace = act
+    return app, raw, act, seen
+
+
+def test_replace_many_counts_and_runs_unscanned_rules_blind():
+    app, raw, act, seen = _replace_app("{name} 님, {name}\r\n{date}")
+    doc = Document(app, _raw=raw)
+    counts = doc.replace_many({
+        "{name}": "홍길동", "{date}": "오늘", "{missing}": "x",
+    })
+    # not in the TEXT export (text box, header ...) — run anyway, count unknown
+    assert counts == {"{name}": 2, "{date}": 1, "{missing}": None}
+    assert seen == [("{missing}", "x"), ("{name}", "홍길동"), ("{date}", "오늘")]
+    # pset 은 한 번만 준비 — 전체 방향, 메시지 억제
+    assert act.pset.Direction == 2
+    assert act.pset.IgnoreMessage == 1
+
+
+def test_replace_all_runs_allreplace_when_the_scan_fails():
+    app, raw, act, seen = _replace_app("")
+    app.api.GetTextFile = MagicMock(side_effect=RuntimeError("export failed"))
+    doc = Document(app, _raw=raw)
+    assert doc.replace_all("{name}", "X") is None
+    assert seen == [("{name}", "X")]
+    assert doc.replace_brackets({"{a}": "A"}) == 0   # unknown counts add nothing
+
+
+def test_replace_many_runs_sentinel_steps_without_regex():
+    app, raw, act, seen = _replace_app("a b a")
+    modes = []
+    act.run.side_effect = lambda: modes.append(act.pset.FindRegExp)
+    doc = Document(app, _raw=raw)
+    assert doc.replace_many([("a", "b"), ("b", "a")], regex=True) == {"a": 2, "b": 1}
+    assert modes == [1, 1, 0, 0]
+
+
+def test_replace_many_stops_on_com_error():
+    app, raw, act, seen = _replace_app("{a} {b}")
+    act.run.side_effect = [None, RuntimeError("com")]
+    doc = Document(app, _raw=raw)
+    assert doc.replace_many({"{a}": "A", "{b}": "B"}) == {"{a}": 1, "{b}": 0}
+
+
+def test_replace_all_returns_exact_count():
+    app, raw, act, seen = _replace_app("x x x")
+    doc = Document(app, _raw=raw)
+    assert doc.replace_all("x", "y") == 3
+
+
+def test_find_all_returns_list_without_per_hit_com():
+    app, raw = _mock_app()
+    app.api.GetTextFile = MagicMock(return_value="핵심 문장\r\n또 핵심")
+    doc = Document(app, _raw=raw)
+    hits = doc.find_all("핵심")
+    assert isinstance(hits, list)
+    assert [(h.start, h.end) for h in hits] == [
+        ((0, 0, 0), (0, 0, 2)), ((0, 1, 2), (0, 1, 4)),
+    ]
+    assert app.api.GetTextFile.call_count == 1
+    app.api.Run.assert_not_called()
+
+
+def test_find_all_max_matches_and_select():
+    app, raw = _mock_app()
+    app.api.GetTextFile = lambda *a, **k: "a b a b"
+    doc = Document(app, _raw=raw)
+    hits = doc.find_all(["a", "b"], 3)                 # positional, as before
+    assert len(hits) == 3
+    hits[1].select()
+    app.api.SetPos.assert_called_with(0, 0, 2)
+    app.api.SelectText.assert_called_with(0, 2, 0, 3)
+
+
+def test_iter_matches_streams_lazily():
+    app, raw = _mock_app()
+    app.api.GetTextFile = MagicMock(return_value="a1 b2 a3")
+    doc = Document(app, _raw=raw)
+    hits = doc.iter_matches(r"[ab]\d", regex=True, max_matches=2)
+    assert not isinstance(hits, list)
+    app.api.GetTextFile.assert_not_called()
+    assert [h.text for h in hits] == ["a1", "b2"]
+    assert [h.text for h in doc.find_all(r"a\d", regex=True)] == ["a1", "a3"]
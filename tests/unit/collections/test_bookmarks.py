@@ -63,3 +63,15 @@ def test_contains_delegates_to_exist_bookmark():
 
 def test_bookmark_eq_with_string():
     assert Bookmark(make_app(MagicMock()), "ch1") == "ch1"
+
+
+def test_writes_call_on_edit_first():
+    app, impl = _empty_app()
+    calls = []
+    impl.HAction.Execute.side_effect = lambda *a: calls.append("execute") or True
+    impl.DeleteBookMark.side_effect = lambda name: calls.append("delete") or True
+    coll = BookmarkCollection(app, on_edit=lambda: calls.append("on_edit"))
+    coll.add("b1")
+    coll.remove("b1")
+    Bookmark(app, "b2", coll._on_edit).remove()
+    assert calls == ["on_edit", "execute", "on_edit", "delete", "on_edit", "delete"]
@@ -65,3 +65,73 @@ def test_getitem_by_ordinal():
     assert isinstance(p, Paragraph)
     assert p.index == 0
     assert p.text == "para-0"
+
+
+def _app_with_sections(*counts: int):
+    """Active document with ``len(counts)`` sections; paragraphs count reads."""
+    impl = MagicMock()
+    doc = impl.XHwpDocuments.Active_XHwpDocument
+    doc.SectionCount = len(counts)
+    resolved = []
+    sections = []
+    for s, n in enumerate(counts):
+        sec = MagicMock(spec=["Paragraphs", "Paragraph"])
+        sec.Paragraphs = n
+        sec.Paragraph.side_effect = lambda i, s=s: MagicMock(
+            spec=["Text", "StyleName"], Text=f"s{s}-p{i}", StyleName="바탕글",
+        )
+        sections.append(sec)
+
+    def _section(s):
+        resolved.append(s)
+        return sections[s]
+
+    doc.Section.side_effect = _section
+    return make_app(impl), resolved
+
+
+def test_iter_spans_all_sections():
+    app, resolved = _app_with_sections(2, 3)
+    coll = ParagraphCollection(app)
+    paras = [p for p in coll]  # list() 는 __len__ 도 부름
+    assert [p.index for p in paras] == [0, 1, 2, 3, 4]
+    assert [p.text for p in paras] == ["s0-p0", "s0-p1", "s1-p0", "s1-p1", "s1-p2"]
+    assert resolved == [0, 1]  # 섹션 handle 은 섹션당 한 번
+    assert len(coll) == 5
+    del resolved[:]
+    assert coll[3].text == "s1-p1"
+    assert resolved == [0, 1]  # count 와 위치 찾기가 섹션 순회 한 번을 공유
+    assert coll[-1].text == "s1-p2"
+    assert "4" in coll and "5" not in coll
+
+
+def test_records_stream_one_paragraph_at_a_time():
+    from hwpapi.collections.paragraphs import ParagraphRecord
+
+    app, resolved = _app_with_sections(3, 2)
+    records = ParagraphCollection(app).records()
+    first = next(records)
+    assert isinstance(first, ParagraphRecord)
+    assert (first.index, first.section, first.text, first.style) == (0, 0, "s0-p0", "바탕글")
+    assert resolved == [0]  # 첫 섹션만 읽음
+    rest = list(records)
+    assert [(r.index, r.section) for r in rest] == [(1, 0), (2, 0), (3, 1), (4, 1)]
+    assert not hasattr(first, "__dict__")
+
+
+def test_attr_probe_memoises_supported_name():
+    from hwpapi.collections.paragraphs import _AttrProbe
+
+    probe = _AttrProbe("Text", "GetText")
+    raw = MagicMock(spec=["GetText"])
+    raw.GetText.return_value = "hi"
+    assert probe(raw) == "hi"
+    assert probe._hit == "GetText"
+
+    class Strict:
+        def __getattr__(self, name):
+            if name != "GetText":
+                raise AssertionError(f"probed {name}")
+            return lambda: "again"
+
+    assert probe(Strict()) == "again"
@@ -1,8 +1,8 @@
 """Unit tests for :class:`hwpapi.collections.styles.StyleCollection`.
 
-Styles are a Phase 3 stub — enumeration requires a live HWP runtime
-(HWPML export + XML parse). Tests validate Protocol compliance and
-the stable lookup paths (``__getitem__`` by name, ``current``).
+Enumeration comes from one HWPML head export, cached per document
+until a style-table action runs. Without a runtime the collection is
+empty; tests cover both the empty Protocol surface and a fake export.
 """
 from __future__ import annotations
 
@@ -12,6 +12,7 @@ import pytest
 
 from hwpapi.collections import Collection
 from hwpapi.collections.styles import Style, StyleCollection
+from hwpapi.low.actions import bump_style_epoch
 
 from ._helpers import is_collection_shaped, make_app
 
@@ -54,3 +55,108 @@ def test_getitem_out_of_range_raises():
     app, _ = _empty_app()
     with pytest.raises(IndexError):
         StyleCollection(app)[0]
+
+
+HEAD = """<?xml version="1.0" encoding="UTF-16" standalone="no" ?>
+<HWPML Version="2.8"><HEAD><MAPPINGTABLE>
+  <CHARSHAPELIST Count="2">
+    <CHARSHAPE Id="0" Height="1000"/>
+    <CHARSHAPE Id="1" Height="1600"><BOLD/></CHARSHAPE>
+  </CHARSHAPELIST>
+  <PARASHAPELIST Count="2">
+    <PARASHAPE Id="0" Align="Justify"><PARAMARGIN Left="0" LineSpacing="160"/></PARASHAPE>
+    <PARASHAPE Id="1" Align="Center" HeadingType="Outline" Level="0"/>
+  </PARASHAPELIST>
+  <STYLELIST Count="3">
+    <STYLE Id="0" Type="Para" Name="바탕글" EngName="Normal" ParaShape="0" CharShape="0"/>
+    <STYLE Id="1" Type="Para" Name="개요 1" EngName="Outline 1" ParaShape="1" CharShape="1"/>
+    <STYLE Id="2" Type="Char" Name="강조" EngName="Emphasis" ParaShape="0" CharShape="1"/>
+  </STYLELIST>
+</MAPPINGTABLE></HEAD>
+<BODY><SECTION Id="0"><P Style="0"><TEXT CharShape="0"><CHAR>x</CHAR></TEXT></P></SECTION></BODY>
+</HWPML>
+"""
+
+
+def _styled_app():
+    impl = MagicMock()
+    impl.GetTextFile.return_value = HEAD
+    impl.HParameterSet.HStyle.Apply = 1
+    return make_app(impl), impl
+
+
+def test_enumerates_from_single_export():
+    app, impl = _styled_app()
+    bump_style_epoch()
+    coll = StyleCollection(app, MagicMock(name="doc"))
+    assert coll.names() == ["바탕글", "개요 1", "강조"]
+    assert len(coll) == 3
+    assert "개요 1" in coll and "없음" not in coll
+    assert [s.name for s in coll.filter(lambda s: s.kind == "Char")] == ["강조"]
+    assert coll[1].name == "개요 1" and coll[1].eng_name == "Outline 1"
+    assert coll["강조"].index == 2
+    impl.GetTextFile.assert_called_once_with("HWPML2X", "")
+
+
+def test_style_shapes_and_current_without_extra_export():
+    app, impl = _styled_app()
+    bump_style_epoch()
+    coll = StyleCollection(app, MagicMock(name="doc"))
+    outline = coll["개요 1"]
+    assert outline.charshape.Bold == 1 and outline.charshape.Height == 1600
+    assert outline.parashape.AlignType == 3
+    assert coll.current.name == "개요 1"
+    impl.GetTextFile.assert_called_once()
+
+
+def test_style_table_actions_invalidate_index():
+    app, impl = _styled_app()
+    raw = MagicMock(name="doc")
+    bump_style_epoch()
+    coll = StyleCollection(app, raw)
+    coll.names()
+    coll.names()
+    assert impl.GetTextFile.call_count == 1
+    bump_style_epoch()  # _Action.run("StyleAdd" / "StyleEdit" / ...)
+    coll.names()
+    assert impl.GetTextFile.call_count == 2
+    coll.refresh()
+    assert impl.GetTextFile.call_count == 3
+
+
+def test_only_style_table_actions_bump_style_epoch():
+    from hwpapi.low.actions import _Action, style_epoch
+
+    app = MagicMock()
+    before = style_epoch()
+    _Action(app, "BreakPara").run()
+    _Action(app, "Style").run()          # applies a style, table unchanged
+    assert style_epoch() == before
+    _Action(app, "StyleDelete").run()
+    assert style_epoch() == before + 1
+    _Action(app, "StyleTemplate").run()  # 스타일 마당 — replaces the table
+    assert style_epoch() == before + 2
+
+
+class _Doc:
+    def __init__(self, docs, doc_id):
+        self.docs, self.DocumentID = docs, doc_id
+
+    def SetActive_XHwpDocument(self):
+        self.docs.Active_XHwpDocument = self
+        self.docs.switches.append(self.DocumentID)
+
+
+def test_export_of_a_background_document_restores_the_active_one():
+    app, impl = _styled_app()
+    docs = impl.XHwpDocuments
+    docs.switches = []
+    front, back = _Doc(docs, 1), _Doc(docs, 2)
+    docs.Active_XHwpDocument = front
+    bump_style_epoch()
+
+    assert StyleCollection(app, back).names()[0] == "바탕글"
+    assert docs.switches == [2, 1] and docs.Active_XHwpDocument is front
+
+    StyleCollection(app, front).refresh()        # already active — no switch
+    assert docs.switches == [2, 1]
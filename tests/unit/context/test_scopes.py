@@ -199,3 +199,175 @@ def test_styled_text_assigns_text_to_pset(fake_app):
 
     # Either Text or text was set on the pset; the scope tries both.
     assert pset_mock.Text == "abc" or pset_mock.text == "abc"
+
+
+# ---------------------------------------------------------------------
+# Cursor-format cache / nested coalescing
+# ---------------------------------------------------------------------
+
+@pytest.fixture
+def applied(fake_app, monkeypatch):
+    """Record every ``_apply`` hop as ``(slot, dict(values))``."""
+    import hwpapi.context.scopes as scopes
+
+    hops = []
+    real_apply = scopes._apply
+
+    def recording_apply(app, action_name, slot, values, **kwargs):
+        hops.append((slot, dict(values)))
+        return real_apply(app, action_name, slot, values, **kwargs)
+
+    monkeypatch.setattr(scopes, "_apply", recording_apply)
+    return hops
+
+
+def test_nested_scope_with_same_format_issues_no_execute(fake_app, applied):
+    with charshape_scope(fake_app, bold=True):
+        with charshape_scope(fake_app, bold=True):
+            pass
+    assert applied == [
+        ("CharShape", {"Bold": True}),
+        ("CharShape", {"Bold": False}),
+    ]
+    assert fake_app.api.HAction.Execute.call_count == 2
+
+
+def test_nested_scope_applies_and_restores_only_its_delta(fake_app, applied):
+    with charshape_scope(fake_app, bold=True, size=1400):
+        with charshape_scope(fake_app, bold=True, italic=True):
+            pass
+    assert applied == [
+        ("CharShape", {"Bold": True, "Height": 1400}),
+        ("CharShape", {"Italic": True}),
+        ("CharShape", {"Italic": False}),
+        ("CharShape", {"Bold": False, "Height": 1000}),
+    ]
+
+
+def test_scope_skips_keys_already_in_effect(fake_app, applied):
+    with charshape_scope(fake_app, bold=True, italic=False):
+        pass
+    assert applied == [
+        ("CharShape", {"Bold": True}),
+        ("CharShape", {"Bold": False}),
+    ]
+
+
+def test_repeated_styled_text_reads_cursor_format_once(fake_app):
+    styled_text(fake_app, "a", bold=True)
+    first = fake_app.api.HAction.GetDefault.call_count
+    styled_text(fake_app, "b", bold=True)
+    # apply + restore only — the snapshot GetDefault is served from cache
+    assert fake_app.api.HAction.GetDefault.call_count - first == 2
+
+
+def test_cursor_move_invalidates_cached_format(fake_app):
+    styled_text(fake_app, "a", bold=True)
+    first = fake_app.api.HAction.GetDefault.call_count
+    fake_app.api.GetPos.return_value = (0, 3, 0)
+    styled_text(fake_app, "b", bold=True)
+    assert fake_app.api.HAction.GetDefault.call_count - first == 3
+
+
+def test_invalidate_cursor_format_forces_reread(fake_app):
+    from hwpapi.context import invalidate_cursor_format
+
+    styled_text(fake_app, "a", bold=True)
+    first = fake_app.api.HAction.GetDefault.call_count
+    invalidate_cursor_format(fake_app)
+    styled_text(fake_app, "b", bold=True)
+    assert fake_app.api.HAction.GetDefault.call_count - first == 3
+
+
+def test_untracked_move_inside_scope_restores_everything(fake_app, applied):
+    with charshape_scope(fake_app, bold=True, size=1400):
+        fake_app.api.GetPos.return_value = (0, 9, 9)
+    assert applied[-1] == ("CharShape", {"Bold": False, "Height": 1000})
+
+
+def _failing_execute(app):
+    """Execute reports failure; GetDefault reloads the unchanged cursor format."""
+    hchar = app.api.HParameterSet.HCharShape
+    app.api.HAction.Execute.return_value = False
+    app.api.HAction.GetDefault.side_effect = lambda *a: setattr(hchar, "Bold", False)
+
+
+def test_failed_execute_is_not_cached(fake_app, applied):
+    _failing_execute(fake_app)
+    with charshape_scope(fake_app, bold=True):
+        with charshape_scope(fake_app, bold=True):
+            pass
+    # the outer apply did not go through, so the inner scope re-applies it
+    assert applied[:2] == [("CharShape", {"Bold": True})] * 2
+
+
+@pytest.mark.parametrize("edit", ["style", "hyperlink", "bookmark"])
+def test_raw_collection_edits_invalidate_cached_format(fake_app, edit):
+    from hwpapi.collections.bookmarks import BookmarkCollection
+    from hwpapi.collections.hyperlinks import HyperlinkCollection
+    from hwpapi.collections.styles import Style
+
+    styled_text(fake_app, "a", bold=True)
+    first = fake_app.api.HAction.GetDefault.call_count
+    if edit == "style":
+        Style(fake_app, "본문", index=0).apply()
+    elif edit == "hyperlink":
+        HyperlinkCollection(fake_app).add("hwpapi", "https://example.com")
+    else:
+        BookmarkCollection(fake_app).add("here")
+    styled_text(fake_app, "b", bold=True)
+    assert fake_app.api.HAction.GetDefault.call_count - first == 3
+
+
+# ---------------------------------------------------------------------
+# styled_runs
+# ---------------------------------------------------------------------
+
+def test_styled_runs_applies_only_deltas_and_restores_once(fake_app, applied):
+    from hwpapi.context import styled_runs
+
+    inserted = []
+    insert_action = fake_app.actions.InsertText
+    insert_action.run.side_effect = lambda pset=None: inserted.append(pset.Text)
+
+    styled_runs(fake_app, [
+        ("a", {}),
+        ("b", {"bold": True}),
+        ("c", {"bold": True, "color": 0xFF}),
+        ("d", {"bold": True}),
+        ("e", {}),
+        ("f", {"italic": True}),
+    ])
+
+    assert inserted == ["a", "b", "c", "d", "e", "f"]
+    assert applied == [
+        ("CharShape", {"Bold": True}),
+        ("CharShape", {"TextColor": 0xFF}),
+        ("CharShape", {"TextColor": 0}),   # c → d: only the colour reverts
+        ("CharShape", {"Bold": False}),
+        ("CharShape", {"Italic": True}),
+        ("CharShape", {"Italic": False}),  # single baseline restore
+    ]
+
+
+def test_styled_runs_reuses_one_insert_pset(fake_app):
+    from hwpapi.context import styled_runs
+
+    styled_runs(fake_app, [("x", {"bold": True})] * 10)
+    assert fake_app.api.HAction.Execute.call_count == 2   # apply once, restore once
+    assert fake_app.api.HAction.GetDefault.call_count == 1  # snapshot only
+    assert fake_app.actions.InsertText.run.call_count == 10
+
+
+def test_styled_runs_does_not_cache_a_failed_delta(fake_app, applied):
+    from hwpapi.context import styled_runs
+
+    _failing_execute(fake_app)
+    styled_runs(fake_app, [("a", {"bold": True}), ("b", {"bold": True})])
+    # nothing went through: each run re-reads and re-applies, and the
+    # unknown end state is restored to the baseline
+    assert applied == [
+        ("CharShape", {"Bold": True}),
+        ("CharShape", {"Bold": True}),
+        ("CharShape", {"Bold": False}),
+    ]
@@ -0,0 +1,227 @@
+"""Unit tests for :mod:`hwpapi.io.convert` — incremental batch conversion."""
+from __future__ import annotations
+
+import json
+import os
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+from hwpapi.errors import InvalidArgumentError
+from hwpapi.io.convert import MANIFEST_NAME, convert
+
+
+class FakeDoc:
+    def __init__(self, app, path):
+        self.app = app
+        self.path = path
+
+    def save(self, name, format=None):
+        if Path(self.path).name in self.app.crash:
+            self.app.dead = True
+            raise RuntimeError("RPC server unavailable")
+        if Path(self.path).name in self.app.fail:
+            raise RuntimeError("SaveAs failed")
+        assert ".part" in name  # written beside the target, then renamed
+        Path(name).write_text(f"{format}:{Path(self.path).read_text()}")
+        return name
+
+    def close(self, save=False):
+        self.app.closed += 1
+        return True
+
+
+class FakeApp:
+    def __init__(self, fail=(), crash=(), relaunch=True):
+        self.fail = set(fail)
+        self.crash = set(crash)
+        self.dead = False
+        self.relaunch = relaunch
+        self.reloads = 0
+        self.on_open = None
+        self.opened = []
+        self.closed = 0
+        self.quit_called = False
+        self.thread = threading.get_ident()
+        self.docs = self
+
+    def open(self, path):
+        assert threading.get_ident() == self.thread  # never crosses threads
+        assert not self.dead
+        if self.on_open is not None:
+            self.on_open(Path(path).name)
+        self.opened.append(Path(path).name)
+        return FakeDoc(self, path)
+
+    @property
+    def api(self):
+        if self.dead:
+            raise RuntimeError("RPC server unavailable")
+        return self
+
+    @property
+    def XHwpDocuments(self):
+        return self
+
+    Count = 1
+
+    def reload(self, new_app=False):
+        assert new_app
+        if not self.relaunch:
+            raise RuntimeError("HWP not installed")
+        self.reloads += 1
+        self.dead = False
+
+    def quit(self):
+        self.quit_called = True
+
+
+@pytest.fixture
+def tree(tmp_path):
+    src = tmp_path / "src"
+    (src / "sub").mkdir(parents=True)
+    (src / "a.hwp").write_text("A")
+    (src / "b.hwp").write_text("B")
+    (src / "sub" / "c.hwp").write_text("C")
+    return src, tmp_path / "out"
+
+
+def test_converts_then_skips_unchanged(tree):
+    src, out = tree
+    app = FakeApp()
+    report = convert(str(src / "**" / "*.hwp"), out, format="pdf", app=app)
+    assert sorted(app.opened) == ["a.hwp", "b.hwp", "c.hwp"]
+    assert (out / "sub" / "c.pdf").read_text() == "PDF:C"
+    assert len(report.converted) == 3 and report.ok
+    assert app.closed == 3 and not app.quit_called  # caller owns the app
+    assert not [p for p in out.rglob("*") if ".part" in p.name]
+
+    entries = json.loads((out / MANIFEST_NAME).read_text(encoding="utf-8"))["entries"]
+    assert set(entries) == {"a.pdf", "b.pdf", "sub/c.pdf"}
+
+    app = FakeApp()
+    report = convert(str(src / "**" / "*.hwp"), out, format="PDF", app=app)
+    assert app.opened == [] and len(report.skipped) == 3
+
+
+def test_reconverts_only_changed_content(tree):
+    src, out = tree
+    convert(str(src / "**" / "*.hwp"), out, app=FakeApp())
+    (src / "a.hwp").write_text("A2")
+    os.utime(src / "b.hwp")  # touched, same bytes → hash matches, no COM
+    app = FakeApp()
+    report = convert(str(src / "**" / "*.hwp"), out, app=app)
+    assert app.opened == ["a.hwp"]
+    assert (out / "a.pdf").read_text() == "PDF:A2"
+    assert len(report.skipped) == 2
+
+
+def test_missing_output_or_force_reconverts(tree):
+    src, out = tree
+    convert(str(src / "*.hwp"), out, app=FakeApp())
+    (out / "b.pdf").unlink()
+    app = FakeApp()
+    convert(str(src / "*.hwp"), out, app=app)
+    assert app.opened == ["b.hwp"]
+    app = FakeApp()
+    convert(str(src / "*.hwp"), out, app=app, force=True)
+    assert sorted(app.opened) == ["a.hwp", "b.hwp"]
+
+
+def test_failure_is_captured_and_retried(tree):
+    src, out = tree
+    report = convert(str(src / "*.hwp"), out, app=FakeApp(fail={"b.hwp"}))
+    assert [r.status for r in report.results] == ["converted", "failed"]
+    assert "SaveAs failed" in report.failed[0].error
+    assert not (out / "b.pdf").exists()
+    app = FakeApp()
+    convert(str(src / "*.hwp"), out, app=app)
+    assert app.opened == ["b.hwp"]
+
+
+def test_engines_fan_out_one_app_per_thread(tree):
+    src, out = tree
+    apps = []
+    lock = threading.Lock()
+
+    def factory():
+        app = FakeApp()
+        with lock:
+            apps.append(app)
+        return app
+
+    report = convert(str(src / "**" / "*.hwp"), out, format="HWPX",
+                     engines=2, app_factory=factory)
+    assert len(apps) == 2 and report.engines == 2
+    assert sorted(sum((a.opened for a in apps), [])) == ["a.hwp", "b.hwp", "c.hwp"]
+    assert all(a.quit_called for a in apps)
+    assert report.throughput > 0
+    assert 0 <= report.latency(0.5) <= report.latency(0.95)
+
+
+def test_no_engine_marks_pending_failed(tree):
+    src, out = tree
+
+    def factory():
+        raise RuntimeError("HWP not installed")
+
+    report = convert(str(src / "*.hwp"), out, app_factory=factory)
+    assert report.engines == 0
+    assert [r.error for r in report.failed] == ["no engine available"] * 2
+
+
+def test_rejects_bad_arguments(tree):
+    src, out = tree
+    with pytest.raises(InvalidArgumentError):
+        convert(str(src / "*.hwp"), out, format="XYZ")
+    with pytest.raises(InvalidArgumentError):
+        convert(str(src / "*.hwp"), out, engines=0)
+
+
+def test_dead_engine_is_relaunched(tree):
+    src, out = tree
+    app = FakeApp(crash={"a.hwp"})
+    report = convert(str(src / "**" / "*.hwp"), out, app=app)
+    assert [r.status for r in report.results] == ["failed", "converted", "converted"]
+    assert app.reloads == 1 and app.opened == ["a.hwp", "b.hwp", "c.hwp"]
+
+    app = FakeApp(fail={"a.hwp"})     # plain file error — the engine is fine
+    convert(str(src / "**" / "*.hwp"), out, app=app, force=True)
+    assert app.reloads == 0
+
+
+def test_failed_relaunch_stops_the_worker(tree):
+    src, out = tree
+    app = FakeApp(crash={"a.hwp"}, relaunch=False)
+    report = convert(str(src / "**" / "*.hwp"), out, app=app)
+    assert app.opened == ["a.hwp"]
+    assert [r.error for r in report.failed[1:]] == ["no engine available"] * 2
+
+
+def test_manifest_is_checkpointed_mid_run(tree, monkeypatch):
+    src, out = tree
+    monkeypatch.setattr(sys.modules["hwpapi.io.convert"], "_CHECKPOINT_FILES", 2)
+    seen = {}
+
+    def peek(name):
+        path = out / MANIFEST_NAME
+        entries = json.loads(path.read_text(encoding="utf-8"))["entries"] if path.exists() else {}
+        seen[name] = sorted(entries)
+
+    app = FakeApp()
+    app.on_open = peek
+    convert(str(src / "**" / "*.hwp"), out, app=app)
+    assert seen == {"a.hwp": [], "b.hwp": [], "c.hwp": ["a.pdf", "b.pdf"]}
+
+
+def test_colliding_outputs_are_rejected(tree):
+    src, out = tree
+    (src / "a.hwpx").write_text("AX")
+    app = FakeApp()
+    report = convert(str(src / "*.hwp*"), out, app=app)
+    assert app.opened == ["a.hwp", "b.hwp"]
+    assert (out / "a.pdf").read_text() == "PDF:A"
+    (failed,) = report.failed
+    assert failed.source.endswith("a.hwpx") and "collides" in failed.error
@@ -0,0 +1,125 @@
+"""Unit tests for :mod:`hwpapi.io.hwpml` and HWPML-backed paragraph runs."""
+from __future__ import annotations
+
+from unittest.mock import MagicMock
+
+from hwpapi.collections.fields import Field, FieldCollection
+from hwpapi.collections.paragraphs import Paragraph, ParagraphCollection
+from hwpapi.collections.tables import Cell
+from hwpapi.io.hwpml import hwpml_for, parse_hwpml, read_hwpml
+from hwpapi.low.actions import bump_edit_epoch
+
+HWPML = """<?xml version="1.0" encoding="UTF-16" standalone="no" ?>
+<HWPML Version="2.8">
+<HEAD SecCnt="1"><MAPPINGTABLE>
+  <FACENAMELIST>
+    <FONTFACE Lang="Hangul" Count="1"><FONT Id="0" Type="ttf" Name="함초롬바탕"/></FONTFACE>
+    <FONTFACE Lang="Latin" Count="1"><FONT Id="0" Type="ttf" Name="함초롬돋움"/></FONTFACE>
+  </FACENAMELIST>
+  <CHARSHAPELIST Count="2">
+    <CHARSHAPE Id="0" Height="1000" TextColor="0">
+      <FONTID Hangul="0" Latin="0"/><RATIO Hangul="100" Latin="90"/>
+    </CHARSHAPE>
+    <CHARSHAPE Id="1" Height="1200" TextColor="255">
+      <FONTID Hangul="0" Latin="0"/><BOLD/><UNDERLINE Type="Bottom" Shape="Solid" Color="0"/>
+    </CHARSHAPE>
+  </CHARSHAPELIST>
+</MAPPINGTABLE></HEAD>
+<BODY><SECTION Id="0">
+  <P ParaShape="0" Style="0">
+    <TEXT CharShape="0"><CHAR>보통 </CHAR></TEXT>
+    <TEXT CharShape="1"><CHAR>굵게<TAB/>탭</CHAR></TEXT>
+    <TEXT CharShape="1"><CHAR>!</CHAR></TEXT>
+  </P>
+  <P ParaShape="0" Style="1">
+    <TEXT CharShape="0"><TABLE><ROW><CELL><PARALIST>
+      <P><TEXT CharShape="1"><CHAR>셀</CHAR></TEXT></P>
+    </PARALIST></CELL></ROW></TABLE><CHAR>표 뒤</CHAR></TEXT>
+  </P>
+  <P ParaShape="0" Style="0"/>
+</SECTION></BODY>
+</HWPML>
+"""
+
+
+def _app(source=HWPML):
+    impl = MagicMock()
+    impl.GetTextFile.return_value = source
+    app = MagicMock()
+    app.engine.impl = impl
+    return app, impl
+
+
+def test_parse_spans_and_charshapes():
+    view = parse_hwpml(HWPML)
+    assert [p.text for p in view.paragraphs] == ["보통 굵게\t탭!", "표 뒤", ""]
+    # 같은 CharShape 의 인접 TEXT 는 한 span, 표 셀 문단은 건너뜀
+    assert view.paragraphs[0].spans == [("보통 ", 0), ("굵게\t탭!", 1)]
+    assert view.paragraphs[1].style == 1
+    bold = view.charshapes[1]
+    assert (bold["Bold"], bold["Height"], bold["TextColor"], bold["UnderlineType"]) == (1, 1200, 255, 1)
+    plain = view.charshapes[0]
+    assert plain["Bold"] == 0
+    assert (plain["FaceNameHangul"], plain["FaceNameLatin"]) == ("함초롬바탕", "함초롬돋움")
+    assert plain["RatioLatin"] == 90
+    assert plain["FontTypeHangul"] == 1
+
+
+def test_read_hwpml_from_file(tmp_path):
+    path = tmp_path / "doc.hml"
+    path.write_bytes(HWPML.replace('encoding="UTF-16"', 'encoding="UTF-8"').encode("utf-8"))
+    assert read_hwpml(path).paragraphs[0].text == "보통 굵게\t탭!"
+
+
+def test_export_cached_until_next_edit():
+    app, impl = _app()
+    assert hwpml_for(app) is hwpml_for(app)
+    impl.GetTextFile.assert_called_once_with("HWPML2X", "")
+    bump_edit_epoch()
+    hwpml_for(app)
+    assert impl.GetTextFile.call_count == 2
+
+
+def test_collection_edits_invalidate_the_export():
+    app, impl = _app()
+    hwpml_for(app)
+    FieldCollection(app)["f"] = "x"
+    hwpml_for(app)
+    assert impl.GetTextFile.call_count == 2
+    Field(app, "f").value = "y"
+    hwpml_for(app)
+    assert impl.GetTextFile.call_count == 3
+    Cell(app, MagicMock(), 1, 1).select()
+    hwpml_for(app)
+    assert impl.GetTextFile.call_count == 4
+
+
+def test_paragraph_runs_split_on_charshape():
+    app, impl = _app()
+    runs = Paragraph(app, 0).runs
+    assert [(r.start, r.end, r.text) for r in runs] == [(0, 3, "보통 "), (3, 8, "굵게\t탭!")]
+    cs = runs[1].charshape
+    assert cs.Bold == 1 and cs.Height == 1200
+    assert runs[0].charshape.Bold == 0
+    app.actions.CharShape.assert_not_called()
+
+
+def test_document_runs_one_export():
+    app, impl = _app()
+    bump_edit_epoch()
+    runs = list(ParagraphCollection(app).runs())
+    assert [(r.paragraph.index, r.text) for r in runs] == [
+        (0, "보통 "), (0, "굵게\t탭!"), (1, "표 뒤"), (2, ""),
+    ]
+    impl.GetTextFile.assert_called_once()
+
+
+def test_runs_fall_back_when_export_fails():
+    app, impl = _app()
+    impl.GetTextFile.side_effect = Exception("no document")
+    bump_edit_epoch()
+    raw = MagicMock()
+    raw.Text = "전체"
+    runs = Paragraph(app, 0, raw).runs
+    assert len(runs) == 1 and runs[0].text == "전체"
+    assert list(ParagraphCollection(app).runs()) == []
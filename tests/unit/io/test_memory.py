@@ -0,0 +1,157 @@
+"""Unit tests for :mod:`hwpapi.io.memory` — ``to_bytes`` / ``open_bytes``."""
+from __future__ import annotations
+
+import base64
+import os
+from unittest.mock import MagicMock
+
+import pytest
+
+from hwpapi.collections.documents import DocumentCollection
+from hwpapi.document import Document
+from hwpapi.errors import FileIOError, InvalidArgumentError
+from hwpapi.io import memory
+from hwpapi.io.memory import document_to_bytes, sniff_format
+
+HWP_BYTES = b"\xd0\xcf\x11\xe0\xa1\xb1\x1a\xe1" + bytes(range(256))
+
+
+def _app():
+    app = MagicMock()
+    app.api.GetTextFile.return_value = base64.b64encode(HWP_BYTES).decode()
+    app.api.SetTextFile.return_value = True
+    return app
+
+
+def test_to_bytes_streams_hwp_without_disk(monkeypatch):
+    monkeypatch.setattr(memory, "_scratch_path", MagicMock(side_effect=AssertionError))
+    app = _app()
+    data = Document(app, _raw=MagicMock()).to_bytes()
+    assert data == HWP_BYTES
+    app.api.GetTextFile.assert_called_once_with("HWP", "")
+
+
+def test_to_bytes_hwpml_redeclares_encoding():
+    app = _app()
+    app.api.GetTextFile.return_value = '<?xml version="1.0" encoding="UTF-16"?><HWPML>가</HWPML>'
+    data = document_to_bytes(app, "hwpml2x")
+    assert data == '<?xml version="1.0" encoding="UTF-8"?><HWPML>가</HWPML>'.encode("utf-8")
+
+
+def test_to_bytes_falls_back_to_scratch_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("HWPAPI_RAMDISK", str(tmp_path))
+    app = _app()
+    docs = app.api.XHwpDocuments
+    original, copy = docs.Active_XHwpDocument, docs.Add.return_value
+    app.api.SaveAs.side_effect = lambda name, fmt, arg: open(name, "wb").write(b"%PDF-1.7")
+    assert document_to_bytes(app, "PDF") == b"%PDF-1.7"
+    assert os.listdir(tmp_path) == []  # scratch file removed
+    # SaveAs ran on an untitled copy — the original keeps its path
+    app.api.SetTextFile.assert_called_once_with(app.api.GetTextFile.return_value, "HWP", "")
+    copy.Close.assert_called_once_with(False)
+    original.SetActive_XHwpDocument.assert_called_once()
+
+
+def test_to_bytes_failed_save_raises_and_closes_the_copy(tmp_path, monkeypatch):
+    monkeypatch.setenv("HWPAPI_RAMDISK", str(tmp_path))
+    app = _app()
+    app.api.SaveAs.return_value = False
+    with pytest.raises(FileIOError, match="returned False"):
+        document_to_bytes(app, "HWPX")
+    app.api.XHwpDocuments.Add.return_value.Close.assert_called_once_with(False)
+    assert os.listdir(tmp_path) == []
+
+
+def test_open_bytes_streams_into_new_document():
+    app = _app()
+    doc = DocumentCollection(app).open_bytes(memoryview(HWP_BYTES))
+    assert isinstance(doc, Document)
+    app.api.Run.assert_called_with("FileNew")
+    app.api.SetTextFile.assert_called_once_with(
+        base64.b64encode(HWP_BYTES).decode(), "HWP", "",
+    )
+    app.api.Open.assert_not_called()
+
+
+def test_open_bytes_hwpx_uses_scratch_file(tmp_path, monkeypatch):
+    monkeypatch.setenv("HWPAPI_RAMDISK", str(tmp_path))
+    app = _app()
+    seen = {}
+    app.api.Open.side_effect = lambda name, fmt, arg: seen.update(
+        data=open(name, "rb").read(), fmt=fmt,
+    ) or True
+    docs = app.api.XHwpDocuments
+    opened, untitled = MagicMock(name="opened"), MagicMock(name="untitled")
+    active = iter([opened, untitled, untitled])
+    type(docs).Active_XHwpDocument = property(lambda self: next(active))
+
+    doc = DocumentCollection(app).open_bytes(b"PK\x03\x04rest")
+    assert seen == {"data": b"PK\x03\x04rest", "fmt": "HWPX"}
+    assert os.listdir(tmp_path) == []
+    # content copied into an untitled document; the scratch-bound one closed
+    app.api.Run.assert_called_with("FileNew")
+    app.api.SetTextFile.assert_called_once_with(app.api.GetTextFile.return_value, "HWP", "")
+    opened.Close.assert_called_once_with(False)
+    assert doc.raw is untitled
+
+
+def test_open_bytes_scratch_open_failure_raises(tmp_path, monkeypatch):
+    monkeypatch.setenv("HWPAPI_RAMDISK", str(tmp_path))
+    app = _app()
+    app.api.Open.return_value = False
+    with pytest.raises(FileIOError, match="rejected"):
+        DocumentCollection(app).open_bytes(b"%PDF-1.7")
+    app.api.Run.assert_not_called()
+    assert os.listdir(tmp_path) == []
+
+
+def test_open_bytes_scratch_file_removed_after_close(tmp_path, monkeypatch):
+    monkeypatch.setenv("HWPAPI_RAMDISK", str(tmp_path))
+    app = _app()
+    app.api.Open.return_value = True
+    seen = []
+    opened = app.api.XHwpDocuments.Active_XHwpDocument
+    opened.Close.side_effect = lambda save: seen.append(os.listdir(tmp_path))
+    DocumentCollection(app).open_bytes(b"PK\x03\x04rest")
+    assert len(seen[0]) == 1  # HWP 가 열고 있는 동안은 지우지 않음
+    assert os.listdir(tmp_path) == []
+
+
+@pytest.mark.parametrize("data", [b"<html><body>x</body></html>", b"PK\x03\x04rest"])
+def test_open_bytes_rejected_copy_closes_the_new_document(tmp_path, monkeypatch, data):
+    monkeypatch.setenv("HWPAPI_RAMDISK", str(tmp_path))
+    app = _app()
+    app.api.Open.return_value = True
+    docs = app.api.XHwpDocuments
+    opened, blank = MagicMock(name="opened"), MagicMock(name="blank")
+    active = [opened]
+    type(docs).Active_XHwpDocument = property(lambda self: active[-1])
+    app.api.Run.side_effect = lambda name: active.append(blank)
+    app.api.SetTextFile.return_value = False
+    with pytest.raises(FileIOError):
+        DocumentCollection(app).open_bytes(data)
+    blank.Close.assert_called_once_with(False)
+    assert os.listdir(tmp_path) == []
+
+
+def test_scratch_dir_uses_ramdisk_only_when_configured(tmp_path, monkeypatch):
+    import tempfile
+
+    monkeypatch.delenv("HWPAPI_RAMDISK", raising=False)
+    assert memory.scratch_dir() == tempfile.gettempdir()
+    monkeypatch.setenv("HWPAPI_RAMDISK", str(tmp_path))
+    assert memory.scratch_dir() == str(tmp_path)
+
+
+def test_open_bytes_rejected_content_raises():
+    app = _app()
+    app.api.SetTextFile.return_value = False
+    with pytest.raises(FileIOError):
+        DocumentCollection(app).open_bytes(b"<html><body>x</body></html>")
+
+
+def test_sniff_format():
+    assert sniff_format(b'\xef\xbb\xbf<?xml version="1.0"?><HWPML>') == "HWPML2X"
+    assert sniff_format(b"<!DOCTYPE html><html>") == "HTML"
+    with pytest.raises(InvalidArgumentError):
+        sniff_format(b"plain words")
@@ -118,10 +118,14 @@ def test_export_image_defaults_to_bmp():
     app.docs.active.save.assert_called_once_with("img.bmp", format="BMP")
 
 
-def test_export_image_ignores_page_for_now():
+def test_export_image_page_renders_that_page_only():
     app = _mock_app_with_active_doc("C:/img.png")
-    export_image(app, "img.png", page=2)
-    app.docs.active.save.assert_called_once()
+    app.api.CreatePageImage.return_value = True
+    result = export_image(app, "img.png", page=2)
+    app.docs.active.save.assert_not_called()
+    name, pgno, dpi, depth, fmt = app.api.CreatePageImage.call_args[0]
+    assert name == result and name.endswith("img.png")
+    assert (pgno, fmt) == (1, "png")  # 0-based on the COM side
 
 
 def test_export_text_saves_with_text_format():
@@ -0,0 +1,166 @@
+"""Unit tests for :mod:`hwpapi.io.pages` — per-page image export."""
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+from unittest.mock import MagicMock
+
+import pytest
+
+from hwpapi.errors import FileIOError, InvalidArgumentError
+from hwpapi.io.pages import _parse_pages, export_page_images, page_image, render_pages
+
+
+class FakeApi:
+    def __init__(self, app):
+        self.app = app
+
+    @property
+    def PageCount(self):
+        return int(Path(self.app.current).read_text())
+
+    def CreatePageImage(self, path, pgno, resolution, depth, fmt):
+        self.app.rendered.append((Path(self.app.current).name, pgno + 1))
+        Path(path).write_text(f"{Path(self.app.current).name}:{pgno + 1}:{resolution}:{fmt}")
+        return True
+
+
+class FakeApp:
+    """Each source file holds its page count as text."""
+
+    def __init__(self):
+        self.current = None
+        self.opened = []
+        self.rendered = []
+        self.api = FakeApi(self)
+        self.docs = self
+
+    def open(self, path):
+        self.current = path
+        self.opened.append(Path(path).name)
+        doc = MagicMock()
+        return doc
+
+    def quit(self):
+        pass
+
+
+@pytest.fixture
+def src(tmp_path):
+    d = tmp_path / "src"
+    d.mkdir()
+    (d / "a.hwp").write_text("3")
+    (d / "b.hwp").write_text("1")
+    return d
+
+
+def test_parse_pages():
+    assert _parse_pages("3, 1-2,2") == [1, 2, 3]
+    assert _parse_pages(None, 2) == [1, 2]
+    with pytest.raises(InvalidArgumentError):
+        _parse_pages(0)
+    with pytest.raises(InvalidArgumentError):
+        _parse_pages("x-1")
+
+
+def test_page_image_single_page(tmp_path):
+    app = MagicMock()
+    app.api.CreatePageImage.return_value = True
+    page_image(app, tmp_path / "t.jpg", 3, resolution=150)
+    app.api.CreatePageImage.assert_called_once_with(
+        str(tmp_path / "t.jpg"), 2, 150, 24, "jpg")
+    app.api.CreatePageImage.return_value = False
+    with pytest.raises(FileIOError):
+        page_image(app, tmp_path / "t.png", 1)
+
+
+def test_export_page_images_template(tmp_path, src):
+    app = FakeApp()
+    app.current = str(src / "a.hwp")
+    app.docs.active = MagicMock(path=str(src / "a.hwp"))
+    out = export_page_images(app, tmp_path / "out", template="{stem}/{page:02d}.{ext}")
+    assert [Path(p).relative_to(tmp_path / "out").as_posix() for p in out] == [
+        "a/01.png", "a/02.png", "a/03.png"]
+
+
+def test_render_pages_uses_cache(tmp_path, src):
+    out = tmp_path / "thumbs"
+    app = FakeApp()
+    report = render_pages(str(src / "*.hwp"), out, pages="1-2", app=app)
+    assert sorted(app.rendered) == [("a.hwp", 1), ("a.hwp", 2), ("b.hwp", 1)]
+    assert (out / "a-p2.png").read_text() == "a.hwp:2:96:png"
+    assert [r.error for r in report.failed] == ["InvalidArgumentError('page 2 out of range (1 pages)')"]
+    assert len(report.converted) == 3
+
+    # Same bytes → served from cache, documents never opened.
+    (out / "a-p1.png").unlink()
+    app = FakeApp()
+    report = render_pages(str(src / "a.hwp"), out, pages=[1, 2], app=app)
+    assert app.opened == [] and len(report.skipped) == 2
+    assert (out / "a-p1.png").exists()
+
+    # Changed content → new hash → rendered again.
+    (src / "a.hwp").write_text("4")
+    app = FakeApp()
+    render_pages(str(src / "a.hwp"), out, pages=1, app=app)
+    assert app.rendered == [("a.hwp", 1)]
+
+
+def test_render_all_pages_remembers_count(tmp_path, src):
+    out = tmp_path / "thumbs"
+    app = FakeApp()
+    render_pages(str(src / "a.hwp"), out, pages=None, template="{hash}-{page}.{ext}", app=app)
+    assert len(app.rendered) == 3
+    app = FakeApp()
+    report = render_pages(str(src / "a.hwp"), out, pages=None, app=app)
+    assert app.opened == [] and len(report.skipped) == 3
+
+
+def test_render_pages_fans_out_chunks(tmp_path, src):
+    (src / "a.hwp").write_text("20")
+    apps, lock = [], threading.Lock()
+
+    def factory():
+        app = FakeApp()
+        with lock:
+            apps.append(app)
+        return app
+
+    report = render_pages(str(src / "a.hwp"), tmp_path / "out", pages="1-20",
+                          engines=3, app_factory=factory, chunk=5)
+    assert len(report.converted) == 20 and report.ok
+    assert len(apps) == 3
+    assert sorted(p for a in apps for _, p in a.rendered) == list(range(1, 21))
+    assert sum(len(a.opened) for a in apps) == 4  # one open per chunk
+
+
+def test_render_all_pages_cold_is_split_into_chunks(tmp_path, src):
+    (src / "a.hwp").write_text("20")
+    apps, lock = [], threading.Lock()
+
+    def factory():
+        app = FakeApp()
+        with lock:
+            apps.append(app)
+        return app
+
+    report = render_pages(str(src / "a.hwp"), tmp_path / "out", pages=None,
+                          engines=3, app_factory=factory, chunk=5)
+    assert len(report.converted) == 20 and report.ok
+    assert len(apps) == 3
+    assert sorted(p for a in apps for _, p in a.rendered) == list(range(1, 21))
+    assert sum(len(a.opened) for a in apps) == 4  # counted once, then chunked
+
+
+def test_default_template_keeps_directories_apart(tmp_path):
+    for sub in ("x", "y"):
+        (tmp_path / "src" / sub).mkdir(parents=True)
+        (tmp_path / "src" / sub / "a.hwp").write_text("1")
+    out = tmp_path / "out"
+    report = render_pages(str(tmp_path / "src" / "**" / "*.hwp"), out, app=FakeApp())
+    assert report.ok and (out / "x" / "a-p1.png").exists() and (out / "y" / "a-p1.png").exists()
+
+    report = render_pages(str(tmp_path / "src" / "**" / "*.hwp"), out,
+                          template="{stem}-p{page}.{ext}", app=FakeApp())
+    (failed,) = report.failed
+    assert "collides" in failed.error and (out / "a-p1.png").read_text() == "a.hwp:1:96:png"